@@ -5,6 +5,7 @@ from typing import Literal
 import semver
 from fastapi import Response
 
+from ayon_server.addons.settings_layers import invalidate_settings_layers
 from ayon_server.api.dependencies import CurrentUser
 from ayon_server.exceptions import (
     AyonException,
@@ -12,6 +13,7 @@ from ayon_server.exceptions import (
     ForbiddenException,
 )
 from ayon_server.lib.postgres import Postgres
+from ayon_server.lib.redis import Redis
 from ayon_server.types import Field, OPModel
 
 from .router import router
@@ -85,6 +87,8 @@ async def copy_addon_variant(
         copy_to,
         target_settings,
     )
+    await invalidate_settings_layers(addon_name, source_version, copy_to)
+    await Redis.delete_ns("all-settings")
 
 
 class VariantCopyRequest(OPModel):
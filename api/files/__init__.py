@@ -1,4 +1,4 @@
-__all__ = ["files", "router"]
+__all__ = ["files", "uploads", "router"]
 
-from . import files
+from . import files, uploads
 from .router import router
@@ -311,6 +311,7 @@ async def get_project_file_still(
             path,
             timestamp=timestamp,
             thumbnail=False,
+            key=f"{project_name}/{file_id}",
         )
     except Exception as e:
         logger.error(f"Failed to create video thumbnail: {e}")
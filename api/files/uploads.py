@@ -0,0 +1,163 @@
+from fastapi import Query, Request
+
+from ayon_server.api.dependencies import AllowGuests, CurrentUser, FileID, ProjectName
+from ayon_server.api.responses import EmptyResponse
+from ayon_server.entities import UserEntity
+from ayon_server.exceptions import BadRequestException, ForbiddenException
+from ayon_server.files.upload_sessions import (
+    UploadSession,
+    abort_upload_session,
+    create_upload_session,
+    finalize_upload_session,
+    get_upload_session,
+    write_upload_chunk,
+)
+from ayon_server.types import Field, OPModel
+
+from .files import CreateFileResponseModel
+from .router import router
+
+
+class CreateUploadSessionRequestModel(OPModel):
+    file_name: str = Field(..., title="File name", example="review.mov")
+    size: int = Field(..., title="File size in bytes", gt=0, example=1073741824)
+    content_type: str | None = Field(None, title="MIME type", example="video/mp4")
+    file_id: str | None = Field(None, title="File ID (generated if not set)")
+    activity_id: str | None = Field(None, title="Activity ID")
+
+
+class UploadSessionModel(OPModel):
+    id: str = Field(..., title="Upload session ID (same as the file ID)")
+    size: int = Field(..., title="File size in bytes")
+    chunk_size: int = Field(..., title="Chunk size in bytes")
+    received: int = Field(..., title="Number of received bytes")
+    missing_offsets: list[int] = Field(
+        default_factory=list,
+        title="Missing chunks",
+        description="Offsets of the chunks that were not received yet",
+    )
+    expires_in: int = Field(
+        ...,
+        title="Expiration",
+        description="Seconds until the session expires unless used",
+    )
+
+    @classmethod
+    def from_session(cls, session: UploadSession) -> "UploadSessionModel":
+        return cls(
+            id=session.id,
+            size=session.size,
+            chunk_size=session.chunk_size,
+            received=session.received,
+            missing_offsets=session.missing_offsets,
+            expires_in=session.expires_in,
+        )
+
+
+async def _get_user_session(
+    project_name: str,
+    file_id: str,
+    user: UserEntity,
+) -> UploadSession:
+    await user.ensure_project_access(project_name)
+    session = await get_upload_session(project_name, file_id)
+    if session.user_name != user.name:
+        raise ForbiddenException("Upload session belongs to another user")
+    return session
+
+
+async def _read_chunk(request: Request, max_size: int) -> bytes:
+    buff = bytearray()
+    async for chunk in request.stream():
+        buff += chunk
+        if len(buff) > max_size:
+            raise BadRequestException(f"Chunk is larger than {max_size} bytes")
+    return bytes(buff)
+
+
+@router.post("/uploads", status_code=201, dependencies=[AllowGuests])
+async def create_project_file_upload(
+    project_name: ProjectName,
+    user: CurrentUser,
+    payload: CreateUploadSessionRequestModel,
+) -> UploadSessionModel:
+    """Start a resumable upload of a project file.
+
+    Use this instead of a single request upload for large files.
+
+    - Send the file in chunks of `chunkSize` bytes using
+      `PUT /uploads/{fileId}?offset=...` (the last chunk may be shorter).
+      Chunks may be sent in any order and in parallel.
+    - When the connection drops, use `GET /uploads/{fileId}`
+      to get the offsets of the missing chunks and send only those.
+    - Call `POST /uploads/{fileId}/finalize` when all chunks are sent.
+
+    Sessions which are not used for 24 hours expire and their data
+    is removed. `fileId` must not belong to an existing file.
+    """
+
+    await user.ensure_project_access(project_name)
+    session = await create_upload_session(
+        project_name,
+        payload.file_name,
+        payload.size,
+        user_name=user.name,
+        content_type=payload.content_type,
+        file_id=payload.file_id,
+        activity_id=payload.activity_id,
+    )
+    return UploadSessionModel.from_session(session)
+
+
+@router.get("/uploads/{file_id}", dependencies=[AllowGuests])
+async def get_project_file_upload(
+    project_name: ProjectName,
+    file_id: FileID,
+    user: CurrentUser,
+) -> UploadSessionModel:
+    """Return the progress of a resumable upload"""
+
+    session = await _get_user_session(project_name, file_id, user)
+    return UploadSessionModel.from_session(session)
+
+
+@router.put("/uploads/{file_id}", dependencies=[AllowGuests])
+async def upload_project_file_chunk(
+    project_name: ProjectName,
+    file_id: FileID,
+    user: CurrentUser,
+    request: Request,
+    offset: int = Query(..., title="Byte offset of the chunk", ge=0),
+) -> UploadSessionModel:
+    """Upload a chunk of a file using the raw request body"""
+
+    session = await _get_user_session(project_name, file_id, user)
+    data = await _read_chunk(request, session.chunk_size)
+    session = await write_upload_chunk(session, offset, data)
+    return UploadSessionModel.from_session(session)
+
+
+@router.post("/uploads/{file_id}/finalize", dependencies=[AllowGuests])
+async def finalize_project_file_upload(
+    project_name: ProjectName,
+    file_id: FileID,
+    user: CurrentUser,
+) -> CreateFileResponseModel:
+    """Finish a resumable upload and create the file"""
+
+    session = await _get_user_session(project_name, file_id, user)
+    file_id = await finalize_upload_session(session)
+    return CreateFileResponseModel(id=file_id)
+
+
+@router.delete("/uploads/{file_id}", dependencies=[AllowGuests])
+async def abort_project_file_upload(
+    project_name: ProjectName,
+    file_id: FileID,
+    user: CurrentUser,
+) -> EmptyResponse:
+    """Cancel a resumable upload and discard the received data"""
+
+    session = await _get_user_session(project_name, file_id, user)
+    await abort_upload_session(session)
+    return EmptyResponse()
@@ -1,69 +1,81 @@
 import asyncio
 import datetime
 import time
-from concurrent.futures import ThreadPoolExecutor
+from collections.abc import AsyncGenerator
 from typing import Any
 
 from fastapi import Query, Response
+from fastapi.responses import StreamingResponse
 
 from ayon_server.access.utils import AccessChecker
 from ayon_server.api.dependencies import AllowGuests, CurrentUser, ProjectName
-from ayon_server.helpers.hierarchy_cache import rebuild_hierarchy_cache
-from ayon_server.lib.redis import Redis
+from ayon_server.exceptions import ServiceUnavailableException
+from ayon_server.helpers.hierarchy_cache import (
+    CachedFolderList,
+    get_cached_folder_list,
+    rebuild_hierarchy_cache,
+)
 from ayon_server.logging import logger
 from ayon_server.types import OPModel
-from ayon_server.utils import camelize, json_dumps, json_loads
+from ayon_server.utils import json_dumps, json_loads
 
 from .router import router
 
-# This model is only used for the API documentaion,
-# it is not actually used in the code as we stream the json response
-# that is generated on the fly.
+RESPONSE_CHUNK_SIZE = 1000
+EMPTY_ATTRIB_FRAGMENT = b'"attrib":{},"ownAttrib":[]'
 
 
-def _build_response(
-    folder_list: list[dict[str, Any]],
+async def _stream_response(
+    folder_list: CachedFolderList,
     access_checker: AccessChecker,
     attrib_whitelist: set[str] | None = None,
-) -> Response:
-    def acl_checker(folder: dict[str, Any]) -> bool:
-        return access_checker[folder["path"]]
-
-    def attr_parser(folder: dict[str, Any]) -> dict[str, Any]:
-        if attrib_whitelist is None:
-            return folder
-
-        # folder_list must not be mutated as it could be used
-        # by other requests at the same time. therefore, if we
-        # pop or filter attributes, we need to do that on a copy
-
-        if attrib_whitelist == set():
-            # sligthly faster than copying
-            return {k: v for k, v in folder.items() if k not in ("attrib", "ownAttrib")}
-
-        _filtered_attribs = {
-            k: v for k, v in folder["attrib"].items() if k in attrib_whitelist
-        }
-        _filtered_own_attribs = [
-            k for k in folder["ownAttrib"] if k in attrib_whitelist
-        ]
-
-        _folder = folder.copy()
-        _folder["attrib"] = _filtered_attribs
-        _folder["ownAttrib"] = _filtered_own_attribs
-        return _folder
-
-    return Response(
-        json_dumps(
-            # {"folders": list(map(attr_parser, filter(acl_checker, folder_list)))},
-            {
-                "folders": [
-                    attr_parser(folder) for folder in folder_list if acl_checker(folder)
-                ]
-            },
-        ),
-        media_type="application/json",
-    )
+) -> AsyncGenerator[bytes]:
+    """Stream the cached records as a JSON document.
+
+    Records are stored in the final format, so we only splice the bytes
+    together. Attributes are parsed only when they need to be filtered.
+    """
+    yield b'{"folders":['
+    first = True
+    chunk: list[bytes] = []
+    for folder_id, base in folder_list.base.items():
+        if folder_list.paths is not None:
+            path = folder_list.paths.get(folder_id)
+            if path is None or not access_checker[path.decode()]:
+                continue
+
+        if folder_list.attrib is not None:
+            fragment = folder_list.attrib.get(folder_id, EMPTY_ATTRIB_FRAGMENT)
+            if attrib_whitelist is not None:
+                attrs = json_loads(b"{" + fragment + b"}")
+                fragment = json_dumps(
+                    {
+                        "attrib": {
+                            k: v
+                            for k, v in attrs["attrib"].items()
+                            if k in attrib_whitelist
+                        },
+                        "ownAttrib": [
+                            k for k in attrs["ownAttrib"] if k in attrib_whitelist
+                        ],
+                    }
+                ).encode()[1:-1]
+            base = base[:-1] + b"," + fragment + b"}"
+
+        chunk.append(base)
+        if len(chunk) >= RESPONSE_CHUNK_SIZE:
+            yield (b"" if first else b",") + b",".join(chunk)
+            first = False
+            chunk = []
+
+    if chunk:
+        yield (b"" if first else b",") + b",".join(chunk)
+    yield b"]}"
+
+
+# This model is only used for the API documentaion,
+# it is not actually used in the code as we stream the json response
+# that is generated on the fly.
 
 
 class FolderListItem(OPModel):
@@ -93,64 +105,47 @@ class FolderListModel(OPModel):
 
 
 class FolderListLoader:
-    _current_futures: dict[str, asyncio.Task[list[dict[str, Any]]]]
+    """Load cached folder lists, rebuilding the cache when needed.
+
+    Concurrent rebuilds of the same project are coalesced.
+    """
+
+    _current_futures: dict[str, asyncio.Task[Any]]
     _lock: asyncio.Lock
-    _executor: ThreadPoolExecutor
 
     def __init__(self):
         self._current_futures = {}
         self._lock = asyncio.Lock()
-        self._executor = ThreadPoolExecutor(max_workers=10)
 
-    async def get_folder_list(self, project_name: str) -> list[dict[str, Any]]:
+    async def _rebuild(self, project_name: str) -> None:
         async with self._lock:
             if project_name not in self._current_futures:
                 self._current_futures[project_name] = asyncio.create_task(
-                    self._load_folders(project_name)
+                    rebuild_hierarchy_cache(project_name)
                 )
 
-        data = await self._current_futures[project_name]
-
-        async with self._lock:
-            self._current_futures.pop(project_name, None)
-
-        return data
-
-    async def _load_folders(self, project_name: str) -> list[dict[str, Any]]:
-        logger.trace(f"Loading folders for project {project_name}")
-        camelize_memo = {}
-
-        def camelize_memoized(src: str) -> str:
-            if src not in camelize_memo:
-                camelize_memo[src] = camelize(src)
-            return camelize_memo[src]
+        try:
+            await self._current_futures[project_name]
+        finally:
+            async with self._lock:
+                self._current_futures.pop(project_name, None)
 
-        def process_record(record: dict[str, Any]) -> dict[str, Any]:
-            return {camelize_memoized(k): v for k, v in record.items()}
-
-        entities_data = await Redis.get("project-folders", project_name)
-        if entities_data is None:
-            folder_list = await rebuild_hierarchy_cache(project_name)
-        else:
-            folder_list = json_loads(entities_data)
-
-        assert isinstance(folder_list, list)
-        return [process_record(record) for record in folder_list]
-
-    async def build_response(
+    async def get_folder_list(
         self,
-        folder_list: list[dict[str, Any]],
-        access_checker: AccessChecker,
-        attrib_whitelist: set[str] | None = None,
-    ) -> Response:
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            _build_response,
-            folder_list,
-            access_checker,
-            attrib_whitelist,
-        )
+        project_name: str,
+        *,
+        attrib: bool = False,
+        paths: bool = False,
+    ) -> CachedFolderList:
+        logger.trace(f"Loading folders for project {project_name}")
+        for _ in range(2):
+            folder_list = await get_cached_folder_list(
+                project_name, attrib=attrib, paths=paths
+            )
+            if folder_list is not None:
+                return folder_list
+            await self._rebuild(project_name)
+        raise ServiceUnavailableException("Unable to load the folder list")
 
 
 folder_list_loader = FolderListLoader()
@@ -184,13 +179,14 @@ async def get_folder_list(
     # several megabytes in size, so we need to be careful  not to block other
     # requests while fetching the list and processing the result.
     #
-    # Folder list is fetched from redis, where it is stored as JSON in a
-    # very similar manner we need to return, but:
+    # Folder list is fetched from redis, where every folder is stored
+    # as a serialized JSON record in the very same format we need to return,
+    # along with its path and (separately) its attributes, so we only need to:
+    #
+    # - filter out the folders the user does not have access to (using the paths)
+    # - splice the attributes to the records if requested
     #
-    # - for top level keys, it uses snake_case notation as used in the database
-    #   instead of camelCase as used in the frontend.
-    # - all folders are stored there, so we need to filter out the ones the user
-    #   does not have access to. So we cannot avoid parsing the JSON, solving the ACL
+    # The response is streamed without parsing the records.
 
     if user.is_guest:
         # We allow access to this endpoint for guest users
@@ -213,24 +209,26 @@ async def get_folder_list(
     elapsed_time = time.perf_counter() - start_time
     logger.trace(f"Loaded folder access list in {elapsed_time:.3f} seconds")
 
-    start_time = time.perf_counter()
-    entities = await folder_list_loader.get_folder_list(project_name)
-    elapsed_time = time.perf_counter() - start_time
-    ent_count = len(entities)
-    me = f"{ent_count} folders {'with' if attrib else 'without'} attr of {project_name}"
-    detail = f"{me} fetched in {elapsed_time:.3f} seconds"
-    logger.trace(detail)
-
     attrib_whitelist: set[str] | None = None
-    if not attrib:
-        attrib_whitelist = set()
-
-    elif not user.is_manager:
+    if attrib and not user.is_manager:
         perms = user.permissions(project_name=project_name)
         if perms.attrib_read.enabled:
             attrib_whitelist = set(perms.attrib_read.attributes)
             logger.debug(f"{user} {project_name} attrib whitelist {attrib_whitelist}")
 
-    return await folder_list_loader.build_response(
-        entities, access_checker, attrib_whitelist
+    start_time = time.perf_counter()
+    folder_list = await folder_list_loader.get_folder_list(
+        project_name,
+        attrib=attrib,
+        paths=not access_checker.is_none,
+    )
+    elapsed_time = time.perf_counter() - start_time
+    ent_count = len(folder_list.base)
+    me = f"{ent_count} folders {'with' if attrib else 'without'} attr of {project_name}"
+    detail = f"{me} fetched in {elapsed_time:.3f} seconds"
+    logger.trace(detail)
+
+    return StreamingResponse(
+        _stream_response(folder_list, access_checker, attrib_whitelist),
+        media_type="application/json",
     )
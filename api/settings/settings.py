@@ -1,12 +1,27 @@
 import asyncio
+import functools
 import time
 import traceback
-
-from fastapi import Depends, Query
-
-from ayon_server.addons import AddonLibrary
-from ayon_server.addons.settings_caching import AddonSettingsCache, load_all_settings
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from fastapi import Depends, Header, Query, Response
+
+from ayon_server.addons import AddonLibrary, BaseServerAddon
+from ayon_server.addons.settings_caching import (
+    AddonKey,
+    AddonSettingsCache,
+    SettingsCache,
+    load_all_settings,
+    load_site_settings,
+)
+from ayon_server.addons.settings_layers import (
+    apply_site_overrides,
+    get_compiled_settings,
+    uses_layered_settings,
+)
 from ayon_server.api.dependencies import CurrentUser, SiteID
+from ayon_server.api.responses import EmptyResponse
 from ayon_server.exceptions import NotFoundException
 from ayon_server.lib.redis import Redis
 from ayon_server.logging import log_traceback, logger
@@ -29,6 +44,76 @@ async def get_semaphore(limit: int = 30) -> asyncio.Semaphore:
     return _semaphores[loop]
 
 
+async def _get_addon_settings(
+    addon: BaseServerAddon,
+    variant: str,
+    project_name: str | None,
+    user_name: str,
+    site_id: str | None,
+    site_cache: AddonSettingsCache,
+    settings_cache: Callable[[], Awaitable[AddonSettingsCache]],
+) -> tuple[dict[str, Any] | None, dict[str, bool | None]]:
+    """Return the resolved addon settings and their override flags.
+
+    Studio and project settings are served from compiled settings layers.
+    Project site overrides of the requesting site are applied on top.
+    Addons with their own settings resolution are resolved as a whole
+    using the preloaded `settings_cache`.
+    """
+
+    if not uses_layered_settings(addon):
+        cache = await settings_cache()
+        settings: BaseSettingsModel | None
+        if project_name is None:
+            # Studio level settings (studio level does not have
+            # site overrides per se but it can have site settings)
+            settings = await addon.get_studio_settings(
+                variant,
+                settings_cache=cache,
+            )
+        elif site_id:
+            # Project and site is requested, so we are returning
+            # project level settings WITH site overrides
+            settings = await addon.get_project_site_settings(
+                project_name,
+                user_name,
+                site_id,
+                variant,
+                settings_cache=cache,
+            )
+        else:
+            # Project level settings (no site overrides)
+            settings = await addon.get_project_settings(
+                project_name,
+                variant,
+                settings_cache=cache,
+            )
+
+        if settings is None:
+            return None, {}
+        return settings.dict(), {
+            "has_studio_overrides": settings._has_studio_overrides,
+            "has_project_overrides": settings._has_project_overrides,
+            "has_project_site_overrides": settings._has_site_overrides,
+        }
+
+    layer = await get_compiled_settings(addon, variant, project_name)
+    if layer.settings is None:
+        return None, {}
+
+    data = layer.settings
+    has_site_overrides = None
+    if project_name and site_id and site_cache.project_site:
+        data = apply_site_overrides(addon, layer, site_cache.project_site)
+        has_site_overrides = True
+
+    return data, {
+        "has_studio_overrides": layer.has_studio_overrides,
+        "has_project_overrides": layer.has_project_overrides,
+        "has_project_site_overrides": has_site_overrides,
+    }
+
+
 async def _get_all_settings(
     user_name: str,
     site_id: str | None,
@@ -38,7 +123,8 @@ async def _get_all_settings(
     variant: str,
     summary: bool,
     semaphore: asyncio.Semaphore,
-) -> AllSettingsResponseModel:
+) -> tuple[AllSettingsResponseModel, str]:
+    """Return all settings and their ETag"""
     start_time = time.perf_counter()
     cache_key = hash_data(
         (
@@ -52,13 +138,12 @@ async def _get_all_settings(
         )
     )
 
-    cached = await Redis.get_json("all-settings", cache_key)
-    if cached:
-        try:
-            return AllSettingsResponseModel(**cached)
-        except Exception:
-            logger.trace("Invalid cached settings data, reloading from DB")
-            pass
+    try:
+        cached = await Redis.get_json("all-settings", cache_key)
+        if cached:
+            return AllSettingsResponseModel(**cached["result"]), cached["etag"]
+    except Exception:
+        logger.trace("Invalid cached settings data, reloading from DB")
 
     addon_list = await get_addon_list_for_settings(
         bundle_name=bundle_name,
@@ -67,13 +152,40 @@ async def _get_all_settings(
         variant=variant,
     )
 
-    all_settings = await load_all_settings(
-        addons=addon_list["addons"],
-        variant=variant,
-        project_name=project_name,
-        user_name=user_name,
-        site_id=site_id,
-    )
+    addon_versions = {
+        addon_name: addon_version
+        for addon_name, addon_version in addon_list["addons"].items()
+        if addon_version is not None
+    }
+
+    # Site specific settings are loaded for every request.
+    # Everything else comes from the compiled settings layers
+
+    site_settings_cache: SettingsCache = {}
+    if site_id:
+        site_settings_cache = await load_site_settings(
+            addons=addon_versions,
+            user_name=user_name,
+            site_id=site_id,
+            project_name=project_name,
+        )
+
+    # All overrides are only needed for addons that resolve
+    # their settings on their own, so load them lazily
+
+    all_settings: SettingsCache | None = None
+
+    async def get_settings_cache(key: AddonKey) -> AddonSettingsCache:
+        nonlocal all_settings
+        if all_settings is None:
+            all_settings = await load_all_settings(
+                addons=addon_versions,
+                variant=variant,
+                project_name=project_name,
+                user_name=user_name,
+                site_id=site_id,
+            )
+        return all_settings.get(key, AddonSettingsCache())
 
     elapsed_time = time.perf_counter() - start_time
     logger.trace(f"Settings preloaded in {elapsed_time:.02f} seconds")
@@ -85,10 +197,7 @@ async def _get_all_settings(
     async with semaphore:
         start_time = time.perf_counter()
         addon_result = []
-        for addon_name, addon_version in addon_list["addons"].items():
-            if addon_version is None:
-                continue
-
+        for addon_name, addon_version in addon_versions.items():
             try:
                 addon = AddonLibrary.addon(addon_name, addon_version)
             except NotFoundException:
@@ -144,49 +253,29 @@ async def _get_all_settings(
             # Load settings for the addon
 
             site_settings = None
-            settings: BaseSettingsModel | None = None
+            settings: dict[str, Any] | None = None
+            overrides: dict[str, bool | None] = {}
 
             try:
                 key = addon.name, addon_version
-                settings_cache = all_settings.get(key, AddonSettingsCache())
+                site_cache = site_settings_cache.get(key, AddonSettingsCache())
 
                 if site_id:
                     site_settings = await addon.get_site_settings(
                         user_name,
                         site_id,
-                        settings_cache=settings_cache,
+                        settings_cache=site_cache,
                     )
 
-                    if project_name is None:
-                        # Studio level settings (studio level does not have)
-                        # site overrides per se but it can have site settings
-                        settings = await addon.get_studio_settings(
-                            variant,
-                            settings_cache=settings_cache,
-                        )
-                    else:
-                        # Project and site is requested, so we are returning
-                        # project level settings WITH site overrides
-                        settings = await addon.get_project_site_settings(
-                            project_name,
-                            user_name,
-                            site_id,
-                            variant,
-                            settings_cache=settings_cache,
-                        )
-                elif project_name:
-                    # Project level settings (no site overrides)
-                    settings = await addon.get_project_settings(
-                        project_name,
-                        variant,
-                        settings_cache=settings_cache,
-                    )
-                else:
-                    # Just studio level settings (no project, no site)
-                    settings = await addon.get_studio_settings(
-                        variant,
-                        settings_cache=settings_cache,
-                    )
+                settings, overrides = await _get_addon_settings(
+                    addon,
+                    variant,
+                    project_name,
+                    user_name,
+                    site_id,
+                    site_cache,
+                    functools.partial(get_settings_cache, key),
+                )
 
             except Exception:
                 log_traceback(f"Unable to load {addon_name} {addon_version} settings")
@@ -221,16 +310,8 @@ async def _get_all_settings(
                     has_site_settings=has_site_settings,
                     # Has overrides means that addon has overrides for the requested
                     # project/site
-                    has_studio_overrides=settings._has_studio_overrides
-                    if settings
-                    else None,
-                    has_project_overrides=settings._has_project_overrides
-                    if settings
-                    else None,
-                    has_project_site_overrides=settings._has_site_overrides
-                    if settings
-                    else None,
-                    settings=settings.dict() if (settings and not summary) else {},
+                    **overrides,
+                    settings=settings if (settings and not summary) else {},
                     site_settings=site_settings,
                     is_project_bundle=addon_list["is_project_bundle"]
                     and (addon_name not in addon_list.get("inherited_addons", [])),
@@ -251,21 +332,39 @@ async def _get_all_settings(
             inherited_addons=list(addon_list.get("inherited_addons", set())),
         )
 
-        # Cache the result
-        await Redis.set(
+        # Cache the result along with its ETag
+
+        data = result.dict()
+        etag = hash_data(data)
+        await Redis.set_json(
             "all-settings",
             cache_key,
-            result.json(),
+            {"etag": etag, "result": data},
             ttl=60 * 60,  # Cache for 1 hour
         )
 
-        return result
+        return result, etag
+
 
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip().removeprefix("W/").strip('"')
+        if candidate in (etag, "*"):
+            return True
+    return False
 
-@router.get("/settings", response_model_exclude_none=True)
+
+@router.get(
+    "/settings",
+    response_model=AllSettingsResponseModel,
+    response_model_exclude_none=True,
+)
 async def get_all_settings(
     user: CurrentUser,
     site_id: SiteID,
+    response: Response,
     bundle_name: str | None = Query(
         None,
         title="Bundle name",
@@ -310,8 +409,9 @@ async def get_all_settings(
             "in the specified bundles"
         ),
     ),
+    if_none_match: str | None = Header(None, include_in_schema=False),
     semaphore: asyncio.Semaphore = Depends(get_semaphore),
-) -> AllSettingsResponseModel:
+) -> AllSettingsResponseModel | Response:
     """Return all addon settings
 
     ## Studio settings
@@ -327,10 +427,16 @@ async def get_all_settings(
     It is also possible to specify project_bundle_name to set the project
     bundle explicitly (for renderfarms)
 
+    ## Caching
+
+    The response carries an `ETag` header. When the client sends it back
+    in `If-None-Match` and the settings did not change, the endpoint
+    responds with `304 Not Modified` and an empty body.
+
     """
 
     coalesce = RequestCoalescer()
-    return await coalesce(
+    result, etag = await coalesce(
         _get_all_settings,
         user_name=user.name,
         site_id=site_id,
@@ -341,3 +447,9 @@ async def get_all_settings(
         summary=summary,
         semaphore=semaphore,
     )
+
+    headers = {"ETag": f'"{etag}"'}
+    if _etag_matches(if_none_match, etag):
+        return EmptyResponse(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return result
@@ -32,6 +32,11 @@ from ayon_server.helpers.thumbnails import (
     store_project_skeleton_thumbnail,
     store_thumbnail,
 )
+from ayon_server.helpers.thumbnails.batch import (
+    THUMBNAIL_BATCH_MEDIA_TYPE,
+    ThumbnailBatchItem,
+    get_thumbnail_batch,
+)
 from ayon_server.helpers.thumbnails.invalidate_thumbnail import AffectedEntity
 from ayon_server.lib.postgres import Postgres
 from ayon_server.logging import logger
@@ -208,6 +213,54 @@ async def get_thumbnail(
     )
 
 
+#
+# Batch access
+#
+
+
+class ThumbnailBatchRequestModel(OPModel):
+    items: list[ThumbnailBatchItem] = Field(
+        ...,
+        title="Requested thumbnails",
+        max_items=1000,
+    )
+
+
+@router.post(
+    "/projects/{project_name}/thumbnails/batch",
+    response_class=Response,
+    dependencies=[NoTraces, AllowGuests],
+)
+async def get_thumbnail_batch_response(
+    user: CurrentUser,
+    project_name: ProjectName,
+    payload: ThumbnailBatchRequestModel,
+) -> Response:
+    """Get thumbnails of multiple entities in a single request.
+
+    Items which include the `etag` returned by a previous request
+    are not sent again when the thumbnail did not change.
+
+    The response body is packed as follows:
+
+    - 4 bytes: length of the header (big-endian unsigned int)
+    - header: JSON list with an object per requested item
+      (`entityType`, `entityId`, `status`, `etag`, `mime`, `size`)
+    - payloads of items with status 200, concatenated in the order
+      of the header
+
+    Item status is 200 (payload included), 304 (not modified),
+    403 (no access) or 404 (no thumbnail).
+    """
+
+    content = await get_thumbnail_batch(project_name, payload.items, user)
+    return Response(
+        content=content,
+        media_type=THUMBNAIL_BATCH_MEDIA_TYPE,
+        headers={"Cache-Control": "no-store"},
+    )
+
+
 #
 # Folder endpoints
 #
@@ -48,6 +48,8 @@ class AssignedTaskFolderPathsCache(TypedDict):
     "assigned-task-folder-paths",
     "{project_name}:{user_name}",
     ttl=120,
+    local_ttl=30,
+    stale_ttl=60,
 )
 async def get_assigned_task_folder_paths(
     project_name: str,
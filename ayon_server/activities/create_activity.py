@@ -34,7 +34,10 @@ from ayon_server.exceptions import (
     ForbiddenException,
     NotFoundException,
 )
-from ayon_server.helpers.hierarchy_cache import rebuild_hierarchy_cache
+from ayon_server.helpers.hierarchy_cache import (
+    rebuild_hierarchy_cache,
+    update_hierarchy_cache,
+)
 from ayon_server.lib.postgres import Postgres
 from ayon_server.logging import logger
 from ayon_server.utils import create_uuid
@@ -296,7 +299,23 @@ async def create_activity(
         # Publishing reviewables must invalidate the hierarchy cache
 
         if activity_type == "reviewable":
-            await rebuild_hierarchy_cache(project_name)
+            if entity_type == "version":
+                res = await Postgres.fetch(
+                    f"""
+                    SELECT p.folder_id FROM project_{project_name}.versions v
+                    INNER JOIN project_{project_name}.products p
+                    ON p.id = v.product_id
+                    WHERE v.id = $1
+                    """,
+                    entity_id,
+                )
+                await update_hierarchy_cache(
+                    project_name,
+                    {row["folder_id"] for row in res},
+                    subtree=False,
+                )
+            else:
+                await rebuild_hierarchy_cache(project_name)
 
     # Notify the front-end about the new activity
 
@@ -4,6 +4,7 @@ from typing import Any
 
 from ayon_server.addons.addon import BaseServerAddon
 from ayon_server.addons.definition import ServerAddonDefinition
+from ayon_server.addons.settings_layers import clear_compiled_settings
 from ayon_server.config import ayonconfig
 from ayon_server.exceptions import NotFoundException
 from ayon_server.lib.postgres import Postgres
@@ -18,7 +19,7 @@ class AddonLibrary:
     @staticmethod
     async def clear_addon_list_cache():
         await Redis.delete_ns("addon-list")
-        await Redis.delete_ns("all-settings")
+        await clear_compiled_settings()
 
     @classmethod
     def getinstance(cls) -> "AddonLibrary":
@@ -1,4 +1,10 @@
-__all__ = ["AddonSettingsCache", "AddonKey", "SettingsCache"]
+__all__ = [
+    "AddonSettingsCache",
+    "AddonKey",
+    "SettingsCache",
+    "load_all_settings",
+    "load_site_settings",
+]
 
 import time
 from dataclasses import dataclass
@@ -52,21 +58,6 @@ async def load_all_settings(
         key = row["addon_name"], row["addon_version"]
         result[key] = AddonSettingsCache(studio=row["data"])
 
-    if site_id and user_name:
-        query = """
-            SELECT addon_name, addon_version, data
-            FROM public.site_settings
-            WHERE
-                addon_name || '-' || addon_version = ANY($1)
-            AND site_id = $2
-            AND user_name = $3
-        """
-        async for row in Postgres.iterate(query, hashes, site_id, user_name):
-            key = row["addon_name"], row["addon_version"]
-            if key not in result:
-                result[key] = AddonSettingsCache()
-            result[key].site = row["data"]
-
     # Project level settings
 
     if project_name:
@@ -84,23 +75,74 @@ async def load_all_settings(
                 result[key] = AddonSettingsCache()
             result[key].project = row["data"]
 
-        # Project site level settings
-
-        if site_id and user_name and project_name:
-            query = f"""
-                SELECT addon_name, addon_version, data
-                FROM project_{project_name}.project_site_settings
-                WHERE
-                    addon_name || '-' || addon_version = ANY($1)
-                AND site_id = $2
-                AND user_name = $3
-            """
-            async for row in Postgres.iterate(query, hashes, site_id, user_name):
-                key = row["addon_name"], row["addon_version"]
-                if key not in result:
-                    result[key] = AddonSettingsCache()
-                result[key].project_site = row["data"]
+    # Site and project site level settings
+
+    if site_id and user_name:
+        await _load_site_settings(result, hashes, project_name, user_name, site_id)
 
     logger.trace(f"Settings cache loaded in {time.time() - start_time:.2f} seconds")
 
     return result
+
+
+async def load_site_settings(
+    addons: dict[str, str],
+    user_name: str,
+    site_id: str,
+    project_name: str | None = None,
+) -> SettingsCache:
+    """Load only the site and project site settings of the given addons.
+
+    Unlike `load_all_settings`, the returned cache has `site` and
+    `project_site` set to an empty dict when there are no stored values,
+    so it can be used to tell that there is nothing to apply.
+    """
+    hashes = [f"{name}-{version}" for name, version in addons.items()]
+    result: SettingsCache = {
+        (name, version): AddonSettingsCache(
+            site={},
+            project_site={} if project_name else None,
+        )
+        for name, version in addons.items()
+    }
+    await _load_site_settings(result, hashes, project_name, user_name, site_id)
+    return result
+
+
+async def _load_site_settings(
+    result: SettingsCache,
+    hashes: list[str],
+    project_name: str | None,
+    user_name: str,
+    site_id: str,
+) -> None:
+    query = """
+        SELECT addon_name, addon_version, data
+        FROM public.site_settings
+        WHERE
+            addon_name || '-' || addon_version = ANY($1)
+        AND site_id = $2
+        AND user_name = $3
+    """
+    async for row in Postgres.iterate(query, hashes, site_id, user_name):
+        key = row["addon_name"], row["addon_version"]
+        if key not in result:
+            result[key] = AddonSettingsCache()
+        result[key].site = row["data"]
+
+    if not project_name:
+        return
+
+    query = f"""
+        SELECT addon_name, addon_version, data
+        FROM project_{project_name}.project_site_settings
+        WHERE
+            addon_name || '-' || addon_version = ANY($1)
+        AND site_id = $2
+        AND user_name = $3
+    """
+    async for row in Postgres.iterate(query, hashes, site_id, user_name):
+        key = row["addon_name"], row["addon_version"]
+        if key not in result:
+            result[key] = AddonSettingsCache()
+        result[key].project_site = row["data"]
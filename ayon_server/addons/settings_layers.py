@@ -0,0 +1,228 @@
+"""Compiled settings layers.
+
+Resolving addon settings means building the default settings model,
+applying studio and project overrides and re-validating the result.
+This module caches the compiled result of each step in Redis, so it is
+shared by all requests regardless of the user and site that ask for it:
+
+- default: addon defaults (per addon version)
+- studio: defaults with studio overrides (per addon version and variant)
+- project: studio layer with project overrides (per project)
+
+Site settings and project site overrides are specific to a single
+user and site. They are not compiled; callers load them per request
+and apply them on top of the compiled layer.
+"""
+
+__all__ = [
+    "CompiledSettings",
+    "apply_site_overrides",
+    "clear_compiled_settings",
+    "get_compiled_settings",
+    "invalidate_settings_layers",
+    "uses_layered_settings",
+]
+
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from ayon_server.addons.addon import BaseServerAddon
+from ayon_server.addons.settings_caching import AddonSettingsCache
+from ayon_server.lib.redis import Redis
+from ayon_server.settings import apply_overrides_dict
+from ayon_server.utils import hash_data
+
+SETTINGS_LAYER_NS = "settings-layer"
+SETTINGS_LAYER_TTL = 3600
+
+
+@dataclass
+class CompiledSettings:
+    # None means the addon does not have settings at all
+    settings: dict[str, Any] | None = None
+    has_studio_overrides: bool | None = None
+    has_project_overrides: bool | None = None
+    checksum: str | None = None
+
+
+def _layer_key(
+    addon_name: str,
+    addon_version: str,
+    variant: str | None = None,
+    project_name: str | None = None,
+) -> str:
+    if variant is None:
+        return f"{addon_name}|{addon_version}|default"
+    if project_name is None:
+        return f"{addon_name}|{addon_version}|{variant}"
+    return f"{addon_name}|{addon_version}|{variant}|{project_name}"
+
+
+async def _load_layer(key: str) -> CompiledSettings | None:
+    try:
+        cached = await Redis.get_json(SETTINGS_LAYER_NS, key)
+    except ValueError:
+        return None
+    if cached is None:
+        return None
+    return CompiledSettings(**cached)
+
+
+async def _store_layer(key: str, layer: CompiledSettings) -> CompiledSettings:
+    if layer.checksum is None:
+        layer.checksum = hash_data(layer.settings or {})
+    await Redis.set_json(
+        SETTINGS_LAYER_NS,
+        key,
+        asdict(layer),
+        ttl=SETTINGS_LAYER_TTL,
+    )
+    return layer
+
+
+def _overlay(
+    addon: BaseServerAddon,
+    layer: CompiledSettings,
+    overrides: dict[str, Any],
+) -> dict[str, Any]:
+    model = addon.get_settings_model()
+    assert model is not None, "Compiled settings of an addon without a model"
+    assert layer.settings is not None, "Addon does not have settings"
+    return apply_overrides_dict(model, layer.settings, overrides, layer.checksum)
+
+
+def uses_layered_settings(addon: BaseServerAddon) -> bool:
+    """Return True if the addon resolves settings the default way.
+
+    Addons that override the settings resolution methods can't be served
+    from compiled layers, because we can't tell what their methods do.
+    """
+    cls = type(addon)
+    return (
+        cls.get_studio_settings is BaseServerAddon.get_studio_settings
+        and cls.get_project_settings is BaseServerAddon.get_project_settings
+        and cls.get_project_site_settings is BaseServerAddon.get_project_site_settings
+    )
+
+
+async def _get_default_layer(addon: BaseServerAddon) -> CompiledSettings:
+    key = _layer_key(addon.name, addon.version)
+    if layer := await _load_layer(key):
+        return layer
+
+    settings = await addon.get_default_settings()
+    layer = CompiledSettings(settings=settings.dict() if settings else None)
+    return await _store_layer(key, layer)
+
+
+async def _get_studio_layer(
+    addon: BaseServerAddon,
+    variant: str,
+    settings_cache: AddonSettingsCache | None,
+) -> CompiledSettings:
+    key = _layer_key(addon.name, addon.version, variant)
+    if layer := await _load_layer(key):
+        return layer
+
+    layer = await _get_default_layer(addon)
+    if layer.settings is None:
+        return layer
+
+    overrides = await addon.get_studio_overrides(
+        variant=variant,
+        settings_cache=settings_cache,
+    )
+    if overrides:
+        layer = CompiledSettings(
+            settings=_overlay(addon, layer, overrides),
+            has_studio_overrides=True,
+        )
+    return await _store_layer(key, layer)
+
+
+async def _get_project_layer(
+    addon: BaseServerAddon,
+    project_name: str,
+    variant: str,
+    settings_cache: AddonSettingsCache | None,
+) -> CompiledSettings:
+    key = _layer_key(addon.name, addon.version, variant, project_name)
+    if layer := await _load_layer(key):
+        return layer
+
+    layer = await _get_studio_layer(addon, variant, settings_cache)
+    if layer.settings is None:
+        return layer
+
+    overrides = await addon.get_project_overrides(
+        project_name,
+        variant=variant,
+        settings_cache=settings_cache,
+    )
+    if overrides:
+        layer = CompiledSettings(
+            settings=_overlay(addon, layer, overrides),
+            has_studio_overrides=layer.has_studio_overrides,
+            has_project_overrides=True,
+        )
+    return await _store_layer(key, layer)
+
+
+async def get_compiled_settings(
+    addon: BaseServerAddon,
+    variant: str = "production",
+    project_name: str | None = None,
+    *,
+    settings_cache: AddonSettingsCache | None = None,
+) -> CompiledSettings:
+    """Return the compiled studio or project settings of the addon.
+
+    Missing layers are compiled from the layer below and stored.
+    `settings_cache` may be provided to avoid per-addon override queries
+    when the layers need to be compiled.
+    """
+    if project_name:
+        return await _get_project_layer(addon, project_name, variant, settings_cache)
+    return await _get_studio_layer(addon, variant, settings_cache)
+
+
+def apply_site_overrides(
+    addon: BaseServerAddon,
+    layer: CompiledSettings,
+    overrides: dict[str, Any],
+) -> dict[str, Any]:
+    """Apply project site overrides on top of a compiled project layer."""
+    return _overlay(addon, layer, overrides)
+
+
+async def invalidate_settings_layers(
+    addon_name: str,
+    addon_version: str,
+    variant: str,
+    project_name: str | None = None,
+) -> None:
+    """Drop compiled layers affected by a change of addon overrides.
+
+    Project overrides only affect the layer of the given project.
+    Studio overrides affect the studio layer and all project layers
+    of the addon version and variant.
+    """
+    if project_name:
+        key = _layer_key(addon_name, addon_version, variant, project_name)
+        await Redis.delete(SETTINGS_LAYER_NS, key)
+        return
+
+    studio_key = _layer_key(addon_name, addon_version, variant)
+    for key in await Redis.keys(SETTINGS_LAYER_NS):
+        if key == studio_key or key.startswith(f"{studio_key}|"):
+            await Redis.delete(SETTINGS_LAYER_NS, key)
+
+
+async def clear_compiled_settings() -> None:
+    """Drop all compiled settings layers and cached settings responses.
+
+    Use this when addon versions, bundles or overrides change in a way
+    that is not tracked per addon.
+    """
+    await Redis.delete_ns(SETTINGS_LAYER_NS)
+    await Redis.delete_ns("all-settings")
@@ -5,8 +5,8 @@ from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
 import shortuuid
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from ayon_server.auth.session import Session
 from ayon_server.auth.utils import hash_password
@@ -237,8 +237,16 @@ async def user_request_throttler(
     yield
 
 
-class AuthMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
+class AuthMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
         context = {}
 
         try:
@@ -252,6 +260,4 @@ class AuthMiddleware(BaseHTTPMiddleware):
 
         async with user_request_throttler(request.state.user, request):
             with logger.contextualize(**context):
-                response = await call_next(request)
-
-        return response
+                await self.app(scope, receive, send)
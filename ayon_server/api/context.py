@@ -5,7 +5,7 @@ from contextvars import ContextVar
 from dataclasses import dataclass
 
 from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from ayon_server.entities.user import UserEntity
 from ayon_server.types import NAME_REGEX
@@ -55,12 +55,20 @@ async def request_context_manager(context: RequestContext) -> AsyncIterator[None
         request_context.reset(token)
 
 
-class RequestContextMiddleware(BaseHTTPMiddleware):
+class RequestContextMiddleware:
     """
     Middleware for setting the request context for each request.
     """
 
-    async def dispatch(self, request: Request, call_next):
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
         try:
             user = request.state.user
         except AttributeError:
@@ -74,8 +82,7 @@ class RequestContextMiddleware(BaseHTTPMiddleware):
             ),
         )
         async with request_context_manager(context):
-            response = await call_next(request)
-        return response
+            await self.app(scope, receive, send)
 
     @staticmethod
     def _validated_header(value: str | None, default: str | None = None) -> str | None:
@@ -6,8 +6,10 @@ from fastapi.exceptions import HTTPException
 from fastapi.responses import JSONResponse
 from fastapi.routing import APIRoute
 from shortuuid import ShortUUID
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
 from starlette.requests import ClientDisconnect
+from starlette.routing import BaseRoute
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from ayon_server.api.dependencies import NoTraces
 from ayon_server.exceptions import AyonException
@@ -15,6 +17,7 @@ from ayon_server.lib.postgres_exceptions import (
     IntegrityConstraintViolationError,
     parse_postgres_exception,
 )
+from ayon_server.lib.request_stats import request_stats
 from ayon_server.logging import log_exception, logger
 
 
@@ -94,8 +97,9 @@ def handle_assertion_error(request: Request, exc: AssertionError) -> JSONRespons
         "function": func,
         "line": line_no,
     }
-    if request.state.user:
-        extras["user"] = request.state.user.name
+    # The user is not set when the authentication itself fails
+    if user := getattr(request.state, "user", None):
+        extras["user"] = user.name
 
     with logger.contextualize(**extras):
         logger.error(detail)
@@ -107,89 +111,143 @@ def handle_assertion_error(request: Request, exc: AssertionError) -> JSONRespons
 
 def handle_undhandled_exception(request: Request, exc: Exception) -> JSONResponse:
     extras = {}
-    if request.state.user:
-        extras["user"] = request.state.user.name
+    # The user is not set when the authentication itself fails
+    if user := getattr(request.state, "user", None):
+        extras["user"] = user.name
 
     res = log_exception(exc, **extras)
     return JSONResponse(status_code=res["status"], content=res)
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        request_id = ShortUUID().random(length=16)
-        context = {"request_id": request_id}
-        path = request.url.path
+def response_from_exception(request: Request, exc: Exception) -> Response:
+    """Convert an exception raised by an endpoint to an error response"""
 
-        with logger.contextualize(**context):
-            start_time = time.perf_counter()
-            try:
-                response = await call_next(request)
-            except AyonException as e:
-                # Custom Ayon exceptions
-                response = handle_ayon_exception(request, e)
+    if isinstance(exc, AyonException):
+        # Custom Ayon exceptions
+        return handle_ayon_exception(request, exc)
+
+    if isinstance(exc, ClientDisconnect):
+        # Client disconnected
+        return Response(status_code=499)
+
+    if isinstance(exc, HTTPException):
+        # FastAPI / Starlette HTTP exceptions
+        return handle_http_exception(request, exc)
+
+    if isinstance(exc, IntegrityConstraintViolationError):
+        # PostgreSQL constraint violation
+        return handle_constraint_violation(request, exc)
+
+    if isinstance(exc, AssertionError):
+        return handle_assertion_error(request, exc)
+
+    # Unhandled exceptions
+    return handle_undhandled_exception(request, exc)
 
-            except ClientDisconnect:
-                # Client disconnected
-                response = Response(status_code=499)
 
-            except HTTPException as e:
-                # FastAPI / Starlette HTTP exceptions
-                response = handle_http_exception(request, e)
+class LoggingMiddleware:
+    """Assign request IDs, convert exceptions to responses and log requests.
 
-            except IntegrityConstraintViolationError as e:
-                # PostgreSQL constraint violation
-                response = handle_constraint_violation(request, e)
+    This is a pure ASGI middleware, so streamed responses are passed
+    through without buffering.
+    """
 
-            except AssertionError as e:
-                # AssertionError
-                response = handle_assertion_error(request, e)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        request_id = ShortUUID().random(length=16)
+        context = {"request_id": request_id}
+
+        status_code = 500
+        response_started = False
+
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code, response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers["X-Request-ID"] = request_id
+            await send(message)
+
+        with logger.contextualize(**context):
+            start_time = time.perf_counter()
+            stats_token = request_stats.start()
+            try:
+                await self.app(scope, receive, send_with_request_id)
             except Exception as e:
-                # Unhandled exceptions
-                response = handle_undhandled_exception(request, e)
-
-            # except ExceptionGroup as eg:
-            #     response = handle_exception_group(eg)
-
-            # Before processing the request, we don't have access to
-            # the route information, so we need to check it here
-            # (that's also why we don't track the beginning of the request)
-            should_trace = path.startswith("/api") or path.startswith("/graphql")
-
-            if should_trace and (route := request.scope.get("route")):
-                # We don't need to log successful requests to routes,
-                # that have "NoTraces" dependencies.
-                # They are usually heartbeats that pollute the logs.
-                if isinstance(route, APIRoute):
-                    for dependency in route.dependencies:
-                        if dependency == NoTraces:
-                            should_trace = False
-
-            if should_trace:
-                extras = {
-                    "nodb": True,  # don't store in the event stream
-                }
-                if request.state.user:
-                    extras["user"] = request.state.user.name
-
-                process_time = round(time.perf_counter() - start_time, 3)
-                f_result = f"| {response.status_code} in {process_time}s"
-
-                log_path = path
-                if graphql_query := getattr(request.state, "graphql_query", None):
-                    log_path += f" ({graphql_query})"
-
-                msg = f"[{request.method}] {log_path} {f_result}"
-
-                with logger.contextualize(**extras):
-                    if process_time > 5 or response.status_code >= 500:
-                        # When a request takes longer than usual, raise the log level
-                        # so we can see it in the logs by default.
-                        logger.debug(msg)
-                    else:
-                        # Otherwise, we can log it as a trace,
-                        # so it doesn't pollute the logs.
-                        logger.trace(msg)
-
-        response.headers["X-Request-ID"] = request_id
-        return response
+                if response_started:
+                    # Too late to send an error response
+                    raise
+                response = response_from_exception(request, e)
+                await response(scope, receive, send_with_request_id)
+            finally:
+                process_time = time.perf_counter() - start_time
+                route = scope.get("route")
+                graphql_query = getattr(request.state, "graphql_query", None)
+                request_stats.finish(
+                    stats_token,
+                    route=getattr(route, "path", None) or "unmatched",
+                    method=request.method,
+                    status_code=status_code,
+                    duration=process_time,
+                    operation=graphql_query,
+                )
+
+            self.log_request(request, route, status_code, process_time)
+
+    def log_request(
+        self,
+        request: Request,
+        route: BaseRoute | None,
+        status_code: int,
+        process_time: float,
+    ) -> None:
+        # Before processing the request, we don't have access to
+        # the route information, so we need to check it here
+        # (that's also why we don't track the beginning of the request)
+        path = request.url.path
+        should_trace = path.startswith("/api") or path.startswith("/graphql")
+
+        if should_trace and route:
+            # We don't need to log successful requests to routes,
+            # that have "NoTraces" dependencies.
+            # They are usually heartbeats that pollute the logs.
+            if isinstance(route, APIRoute):
+                for dependency in route.dependencies:
+                    if dependency == NoTraces:
+                        should_trace = False
+
+        if not should_trace:
+            return
+
+        extras = {
+            "nodb": True,  # don't store in the event stream
+        }
+        if user := getattr(request.state, "user", None):
+            extras["user"] = user.name
+
+        process_time = round(process_time, 3)
+        f_result = f"| {status_code} in {process_time}s"
+
+        log_path = path
+        if graphql_query := getattr(request.state, "graphql_query", None):
+            log_path += f" ({graphql_query})"
+
+        msg = f"[{request.method}] {log_path} {f_result}"
+
+        with logger.contextualize(**extras):
+            if process_time > 5 or status_code >= 500:
+                # When a request takes longer than usual, raise the log level
+                # so we can see it in the logs by default.
+                logger.debug(msg)
+            else:
+                # Otherwise, we can log it as a trace,
+                # so it doesn't pollute the logs.
+                logger.trace(msg)
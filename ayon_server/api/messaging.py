@@ -1,5 +1,4 @@
 import asyncio
-import copy
 import time
 import uuid
 from contextlib import suppress
@@ -24,6 +23,10 @@ ALWAYS_SUBSCRIBE = (
     "heartbeat",
 )
 
+# Maximum number of messages waiting to be sent to a single client.
+# Clients which are not able to keep up are disconnected.
+CLIENT_QUEUE_SIZE = 512
+
 GUEST_TOPICS = (
     "activity.created",
     "heartbeat",
@@ -64,6 +67,7 @@ class Client:
     topics: list[str] = []
     disconnected: bool = False
     authorized: bool = False
+    slow: bool = False
     created_at: float
     project_name: str | None = None
     user: UserEntity | None = None
@@ -72,6 +76,8 @@ class Client:
         self.id = str(uuid.uuid1())
         self.sock: WebSocket = sock
         self.created_at = time.time()
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=CLIENT_QUEUE_SIZE)
+        self.writer: asyncio.Task[None] | None = None
 
     @property
     def user_name(self) -> str | None:
@@ -105,21 +111,49 @@ class Client:
             return True
         return False
 
-    async def send(self, message: dict[str, Any], auth_only: bool = True):
-        if (not self.authorized) and auth_only:
-            return None
+    def start(self) -> None:
+        self.writer = asyncio.create_task(self._write())
+
+    async def _write(self) -> None:
+        """Send queued messages to the socket"""
+        while True:
+            text = await self.queue.get()
+            try:
+                await self.sock.send_text(text)
+            except WebSocketDisconnect:
+                logger.warning("[WS] Client disconnected")
+                self.disconnected = True
+                return
+            except RuntimeError:
+                logger.warning("[WS] Client disconnected (RTE)")
+                self.disconnected = True
+                return
+            except Exception:
+                log_traceback("[WS] Error sending message")
+
+    def enqueue(self, text: str) -> None:
+        """Schedule a serialized message to be sent to the client"""
         if not self.is_valid:
-            return None
+            return
         try:
-            await self.sock.send_text(json_dumps(message))
-        except WebSocketDisconnect:
-            logger.warning("[WS] Client disconnected")
-            self.disconnected = True
-        except RuntimeError:
-            logger.warning("[WS] Client disconnected (RTE)")
+            self.queue.put_nowait(text)
+        except asyncio.QueueFull:
+            logger.warning(f"[WS] Disconnecting slow client {self}")
             self.disconnected = True
-        except Exception:
-            log_traceback("[WS] Error sending message")
+            self.slow = True
+
+    async def send(self, message: dict[str, Any], auth_only: bool = True):
+        if (not self.authorized) and auth_only:
+            return None
+        self.enqueue(json_dumps(message))
+
+    async def close(self) -> None:
+        if self.writer is not None:
+            self.writer.cancel()
+            self.writer = None
+        # Closing handshake of a stalled client would block the caller
+        with suppress(RuntimeError, asyncio.TimeoutError):
+            await asyncio.wait_for(self.sock.close(code=1000), timeout=1)
 
     async def receive(self):
         data = await self.sock.receive_text()
@@ -148,9 +182,121 @@ class Client:
         return f"<WSClient user={self.user_name}>"
 
 
+class TopicIndex:
+    """Index of authorized clients by their subscriptions
+
+    Subscribed topics are prefixes, so they are stored in a character trie.
+    Walking the trie along the message topic yields all subscribers.
+    """
+
+    def __init__(self) -> None:
+        self.trie: dict[str, Any] = {}
+        self.wildcard: set[str] = set()
+        self.all: set[str] = set()
+        self.by_project: dict[str | None, set[str]] = {}
+        self.by_user: dict[str, set[str]] = {}
+
+    def _nodes(self, prefix: str, create: bool = False) -> list[dict[str, Any]]:
+        node = self.trie
+        nodes = [node]
+        for char in prefix:
+            if char not in node:
+                if not create:
+                    return []
+                node[char] = {}
+            node = node[char]
+            nodes.append(node)
+        return nodes
+
+    def add(self, client: Client) -> None:
+        self.all.add(client.id)
+        self.by_project.setdefault(client.project_name or None, set()).add(client.id)
+        if client.user_name:
+            self.by_user.setdefault(client.user_name, set()).add(client.id)
+        for topic in client.topics:
+            if topic == "*":
+                self.wildcard.add(client.id)
+                continue
+            node = self._nodes(topic, create=True)[-1]
+            node.setdefault("", set()).add(client.id)
+
+    def remove(self, client: Client) -> None:
+        if client.id not in self.all:
+            return
+        self.all.discard(client.id)
+        self.wildcard.discard(client.id)
+        project_clients = self.by_project.get(client.project_name or None, set())
+        project_clients.discard(client.id)
+        if not project_clients:
+            self.by_project.pop(client.project_name or None, None)
+        if client.user_name:
+            user_clients = self.by_user.get(client.user_name, set())
+            user_clients.discard(client.id)
+            if not user_clients:
+                self.by_user.pop(client.user_name, None)
+
+        for topic in client.topics:
+            if topic == "*":
+                continue
+            nodes = self._nodes(topic)
+            if not nodes:
+                continue
+            subscribers = nodes[-1].get("", set())
+            subscribers.discard(client.id)
+            if subscribers:
+                continue
+            nodes[-1].pop("", None)
+            # prune empty branches
+            for parent, char in zip(reversed(nodes[:-1]), reversed(topic), strict=True):
+                if parent[char]:
+                    break
+                del parent[char]
+
+    def subscribers(self, topic: str) -> set[str]:
+        """Return ids of clients subscribed to the topic"""
+        if topic in ALWAYS_SUBSCRIBE:
+            return set(self.all)
+        result = set(self.wildcard)
+        node = self.trie
+        for char in topic:
+            next_node = node.get(char)
+            if next_node is None:
+                break
+            node = next_node
+            if subscribers := node.get(""):
+                result |= subscribers
+        return result
+
+    def in_project(self, project_name: str) -> set[str]:
+        """Return ids of clients receiving messages of the project"""
+        return self.by_project.get(None, set()) | self.by_project.get(
+            project_name, set()
+        )
+
+    def of_users(self, user_names: list[str]) -> set[str]:
+        result: set[str] = set()
+        for user_name in user_names:
+            result |= self.by_user.get(user_name, set())
+        return result
+
+
+class FanoutStats:
+    """Cumulative statistics of sending messages to the clients"""
+
+    def __init__(self) -> None:
+        self.messages = 0
+        self.deliveries = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.slow_clients = 0
+
+
 class Messaging(BackgroundWorker):
     def initialize(self):
         self.clients: dict[str, Client] = {}
+        self.index = TopicIndex()
+        self.stats = FanoutStats()
+        self.closing: set[asyncio.Task[None]] = set()
 
     async def join(self, websocket: WebSocket):
         if not self.is_running:
@@ -159,25 +305,59 @@ class Messaging(BackgroundWorker):
 
         await websocket.accept()
         client = Client(websocket)
+        client.start()
         self.clients[client.id] = client
         return client
 
+    async def authorize(
+        self,
+        client: Client,
+        access_token: str,
+        topics: list[str],
+        project: str | None = None,
+    ) -> bool:
+        """Authorize the client and subscribe it to the given topics"""
+        self.index.remove(client)
+        result = await client.authorize(access_token, topics=topics, project=project)
+        if client.authorized:
+            self.index.add(client)
+        return result
+
+    async def leave(self, client: Client) -> None:
+        self.index.remove(client)
+        self.clients.pop(client.id, None)
+        if client.writer is not None:
+            client.writer.cancel()
+            client.writer = None
+
     async def purge(self):
-        to_rm = []
-        for client_id, client in list(self.clients.items()):
+        invalid = []
+        for client in list(self.clients.values()):
             if not client.is_valid:
-                if not client.disconnected:
-                    with suppress(RuntimeError):
-                        await client.sock.close(code=1000)
-                to_rm.append(client_id)
-        for client_id in to_rm:
-            with suppress(KeyError):
-                del self.clients[client_id]
+                if client.slow:
+                    self.stats.slow_clients += 1
+                self.index.remove(client)
+                self.clients.pop(client.id, None)
+                invalid.append(client)
+
+        if invalid:
+            # Closing handshakes of stalled clients may take a while,
+            # so they are closed in the background, all at once
+            task = asyncio.create_task(self._close_clients(invalid))
+            self.closing.add(task)
+            task.add_done_callback(self.closing.discard)
+
+    async def _close_clients(self, clients: list[Client]) -> None:
+        await asyncio.gather(
+            *(client.close() for client in clients),
+            return_exceptions=True,
+        )
 
     async def run(self) -> None:
         self.pubsub = await Redis.pubsub()
         await self.pubsub.subscribe(ayonconfig.redis_channel)
         self.last_msg = time.time()
+        self.last_purge = time.time()
 
         while True:
             try:
@@ -186,10 +366,49 @@ class Messaging(BackgroundWorker):
                 log_traceback("Unhandled exception in messaging loop", nodb=True)
                 await asyncio.sleep(0.5)
 
+    def get_recipients(self, message: dict[str, Any]) -> list[Client]:
+        """Return clients the message should be delivered to"""
+        topic = message["topic"]
+        client_ids = self.index.subscribers(topic)
+
+        project_name = message.get("project", None)
+        if project_name is not None:
+            if topic != "inbox.message" and topic not in ALWAYS_SUBSCRIBE:
+                # only send project-specific messages to clients
+                # of the project (or clients without a project)
+                client_ids &= self.index.in_project(project_name)
+
+        # Does the message have explicit recipients?
+        # If so, only send to those recipients
+
+        recipients = message.get("recipients", None)
+        if isinstance(recipients, list):
+            client_ids &= self.index.of_users(recipients)
+
+        result = []
+        for client_id in client_ids:
+            if (client := self.clients.get(client_id)) is None:
+                continue
+
+            if project_name is not None and client.user:
+                if client.user.is_guest:
+                    if topic not in GUEST_TOPICS:
+                        continue
+
+                elif not client.user.is_manager:
+                    access_groups = client.user.data.get("accessGroups", {})
+                    if project_name not in access_groups:
+                        continue
+
+            result.append(client)
+        return result
+
     async def main(self) -> None:
         """Main messaging loop
 
-        Waits for messages from Redis and sends them to connected WebSocket clients.
+        Waits for messages from Redis and queues them for connected
+        WebSocket clients. Messages are sent by the per-client writer tasks,
+        so a slow client does not delay the others.
         """
 
         raw_message = await self.pubsub.get_message(
@@ -218,55 +437,20 @@ class Messaging(BackgroundWorker):
         # (or only to those subscribed to the topic and authorized)
         #
 
-        connected_clients = list(self.clients.values())
-        for client in connected_clients:
-            project_name = message.get("project", None)
-            if project_name is not None:
-                if topic == "inbox.message" or topic in ALWAYS_SUBSCRIBE:
-                    # inbox messages are sent to all projects
-                    pass
-
-                elif client.project_name and client.project_name != project_name:
-                    # only send project-specific messages to clients
-                    continue
-
-                if client.user:
-                    if client.user.is_guest:
-                        if topic not in GUEST_TOPICS:
-                            continue
-
-                    elif not client.user.is_manager:
-                        access_groups = client.user.data.get("accessGroups", {})
-                        if project_name not in access_groups:
-                            continue
-
-            # Does the message have explicit recipients?
-            # If so, only send to those recipients
-
-            recipients = message.get("recipients", None)
-            if isinstance(recipients, list):
-                if client.user_name not in recipients:
-                    continue
-
-            if topic not in ALWAYS_SUBSCRIBE:
-                for client_topic in client.topics:
-                    if client_topic == "*":
-                        break
-
-                    elif topic.startswith(client_topic):
-                        break
-                else:
-                    # Client is not subscribed to this topic
-                    # Skip sending
-                    continue
-
-            # Message is good to be sent to this client
-            # we just remove the recipients field if present
-            # as it's not needed anymore
-
-            m = copy.deepcopy(message)
-            m.pop("recipients", None)
-            await client.send(m)
+        start_time = time.perf_counter()
+        recipients = self.get_recipients(message)
+        if recipients:
+            # Message is good to be sent. We just remove the recipients
+            # field if present as it's not needed anymore
+            text = json_dumps({k: v for k, v in message.items() if k != "recipients"})
+            for client in recipients:
+                client.enqueue(text)
+
+        elapsed = time.perf_counter() - start_time
+        self.stats.messages += 1
+        self.stats.deliveries += len(recipients)
+        self.stats.seconds += elapsed
+        self.stats.max_seconds = max(self.stats.max_seconds, elapsed)
 
         # Special handling for some topics
         # These are server-wide actions that need to be executed
@@ -274,7 +458,9 @@ class Messaging(BackgroundWorker):
         if topic == "server.restart_requested":
             restart_server()
 
-        await self.purge()
+        if time.time() - self.last_purge > 1:
+            self.last_purge = time.time()
+            await self.purge()
 
 
 messaging = Messaging()
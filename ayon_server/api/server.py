@@ -46,9 +46,12 @@ app = FastAPI(
     **app_meta,
 )
 
+# The last added middleware is the outermost one. Logging wraps
+# authentication, so its database and Redis calls are included
+# in the request statistics and its errors are converted to responses.
 app.add_middleware(RequestContextMiddleware)
-app.add_middleware(LoggingMiddleware)
 app.add_middleware(AuthMiddleware)
+app.add_middleware(LoggingMiddleware)
 
 
 #
@@ -239,16 +242,14 @@ async def ws_endpoint(websocket: WebSocket) -> None:
                 message["topic"] == "auth"
                 and (token := message.get("token")) is not None
             ):
-                await client.authorize(
+                await messaging.authorize(
+                    client,
                     token,
                     topics=message.get("subscribe", []),
                     project=message.get("project"),
                 )
     except (RuntimeError, WebSocketDisconnect):
-        try:
-            del messaging.clients[client.id]
-        except KeyError:
-            pass
+        await messaging.leave(client)
 
 
 #
@@ -14,12 +14,17 @@ from ayon_server.entities import UserEntity
 from ayon_server.events import EventStream
 from ayon_server.exceptions import UnauthorizedException
 from ayon_server.helpers.auth_utils import AuthUtils
+from ayon_server.lib.local_cache import local_cache
 from ayon_server.lib.redis import Redis
 from ayon_server.logging import logger
 from ayon_server.types import OPModel
 from ayon_server.utils import json_dumps, json_loads
 from ayon_server.utils.server import get_real_ip_from_request, is_internal_ip
 
+# Validated sessions are kept in memory of the server process for this
+# many seconds. Changes made by other processes evict them immediately.
+SESSION_CACHE_TTL = 10
+
 
 def is_local_ip(ip: str) -> bool:
     # Deprecated, but still used for backward compatibility.
@@ -67,18 +72,26 @@ class Session:
         If it's not expired, update the last_used field and extend
         its lifetime.
         """
-        data = await Redis.get_json(cls.ns, token)
-        if not data:
-            logger.trace(f"Session {token} not found")
-            return None
-
-        if data.get("isInvalid", False):
-            # if a session is marked as invalid, raise Unauthorized immediately
-            # without giving the user a chance to refresh the token.
-            await asyncio.sleep(0.2)
-            raise UnauthorizedException("Invalid session")
-
-        session = SessionModel(**data)
+        cached = local_cache.get(cls.ns, token)
+        if cached is None:
+            data = await Redis.get_json(cls.ns, token)
+            if not data:
+                logger.trace(f"Session {token} not found")
+                return None
+
+            if data.get("isInvalid", False):
+                # if a session is marked as invalid, raise Unauthorized immediately
+                # without giving the user a chance to refresh the token.
+                await asyncio.sleep(0.2)
+                raise UnauthorizedException("Invalid session")
+
+            cached = SessionModel(**data)
+            local_cache.set(cls.ns, token, cached, SESSION_CACHE_TTL)
+
+        # Cached model is shared by concurrent requests. Only the top-level
+        # fields of the session are modified (nested models are replaced,
+        # never changed in place), so a shallow copy is enough.
+        session = cached.copy()
 
         if session.is_expired:
             await cls.delete(token, "Session expired")
@@ -92,6 +105,7 @@ class Session:
                 session.client_info = get_client_info(request)
                 session.last_used = time.time()
                 await Redis.set(cls.ns, token, session.json())
+                local_cache.set(cls.ns, token, session.copy(), SESSION_CACHE_TTL)
             elif not ayonconfig.disable_check_session_ip:
                 real_ip = get_real_ip_from_request(request)
                 if not is_internal_ip(real_ip):
@@ -107,6 +121,10 @@ class Session:
             remaining_ttl = ayonconfig.session_ttl - (time.time() - session.last_used)
             if remaining_ttl < ayonconfig.session_ttl - 120:
                 session.last_used = time.time()
+                # Concurrent requests of this process see the session
+                # as extended, so the extension is written only once.
+                # Other processes reload it after the write.
+                cached.last_used = session.last_used
                 try:
                     await cls.on_extend(session)
                 except UnauthorizedException as e:
@@ -117,6 +135,7 @@ class Session:
                     token,
                     json_dumps(session.dict()),
                 )
+                local_cache.set(cls.ns, token, session.copy(), SESSION_CACHE_TTL)
 
         return session
 
@@ -314,4 +333,5 @@ class Session:
                     await Session.update(session.token, user)
 
 
+local_cache.register(Session.ns)
 UserEntity.save_hooks.append(Session.user_save_hook)
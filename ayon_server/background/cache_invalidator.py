@@ -0,0 +1,40 @@
+import asyncio
+
+from ayon_server.background.background_worker import BackgroundWorker
+from ayon_server.lib.local_cache import local_cache
+from ayon_server.lib.redis import Redis
+from ayon_server.logging import log_traceback
+
+
+class CacheInvalidator(BackgroundWorker):
+    """Evict local cache entries changed by other server processes.
+
+    Invalidation messages are not persisted, so any message published
+    while the worker is not subscribed is lost. Local cache is therefore
+    cleared every time the subscription is (re)established.
+    """
+
+    async def run(self):
+        pubsub = await Redis.pubsub()
+        await pubsub.subscribe(Redis.invalidation_channel())
+        local_cache.clear()
+
+        try:
+            while True:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True,
+                    timeout=2,
+                )
+                if message is None:
+                    await asyncio.sleep(0.01)
+                    continue
+                try:
+                    Redis.handle_invalidation(message["data"])
+                except Exception:
+                    log_traceback("Failed to process cache invalidation", nodb=True)
+        finally:
+            await pubsub.unsubscribe()
+            await pubsub.aclose()
+
+
+cache_invalidator = CacheInvalidator()
@@ -8,17 +8,33 @@ from ayon_server.config import ayonconfig
 from ayon_server.events import EventStream
 from ayon_server.logging import logger
 
+# Messages logged while the queue is full are dropped
+LOG_QUEUE_SIZE = 10_000
+
+# Max number of messages written to the database at once
+LOG_BATCH_SIZE = 500
+
+# How long to wait for more messages before writing a batch (seconds)
+LOG_BATCH_INTERVAL = 0.1
+
 
 class LogCollector(BackgroundWorker):
     """Log handler that collects log messages and dispatches them to the event stream.
 
     It is started as a background worker and runs in the background
-    so it does not block the main loop.
+    so it does not block the main loop. Messages are written in batches
+    of up to `LOG_BATCH_SIZE` using `EventStream.dispatch_many`.
     """
 
     def initialize(self):
-        self.queue: queue.Queue[dict[str, Any]] = queue.Queue()
+        self.queue: queue.Queue[dict[str, Any]] = queue.Queue(maxsize=LOG_QUEUE_SIZE)
         self.start_time = time.time()
+        self.dropped = 0
+        self.flushed = 0
+        self.failed = 0
+        self.batch: list[dict[str, Any]] = []
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.wakeup: asyncio.Event | None = None
         logger.add(self, level=ayonconfig.log_level_db)
 
     def __call__(self, message):
@@ -26,8 +42,6 @@ class LogCollector(BackgroundWorker):
         # collector is not running to catch the messages
         # that are logged during the startup.
         record = message.record
-        if len(self.queue.queue) > 1000:
-            return
 
         topic = f"log.{record['level'].name.lower()}"
         description = record["message"].splitlines()[0].strip()
@@ -42,23 +56,52 @@ class LogCollector(BackgroundWorker):
         if extra.pop("nodb", False):
             # Used by the API middleware to avoid writing to the database
             return
-        self.queue.put(
-            {
-                "topic": topic,
-                "description": description,
-                "user": user,
-                "project": project,
-                "payload": extra,
-            }
-        )
-
-    async def process_message(self, record):
+
+        try:
+            self.queue.put_nowait(
+                {
+                    "topic": topic,
+                    "description": description,
+                    "user": user,
+                    "project": project,
+                    "payload": extra,
+                }
+            )
+        except queue.Full:
+            self.dropped += 1
+            return
+
+        # Messages may be logged from other threads,
+        # so the collector is woken up thread-safely
+        if self.loop is not None and self.wakeup is not None:
+            if not self.wakeup.is_set():
+                try:
+                    self.loop.call_soon_threadsafe(self.wakeup.set)
+                except RuntimeError:
+                    pass  # loop is closed
+
+    def _take_batch(self) -> None:
+        while len(self.batch) < LOG_BATCH_SIZE:
+            try:
+                self.batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+
+    async def flush(self) -> None:
+        """Write the current batch to the event stream"""
+        if not self.batch:
+            return
         try:
-            await EventStream.dispatch(**record)
-        except Exception:
-            m = f"Unable to dispatch log message: {record}"
+            await EventStream.dispatch_many(self.batch)
+        except Exception as e:
+            self.failed += len(self.batch)
             with logger.contextualize(nodb=True):
-                logger.warning(m)
+                logger.warning(
+                    f"Unable to dispatch {len(self.batch)} log messages: {e}"
+                )
+        else:
+            self.flushed += len(self.batch)
+        self.batch = []
 
     async def run(self):
         # During the startup, we cannot write to the database
@@ -72,22 +115,34 @@ class LogCollector(BackgroundWorker):
                 continue
             break
 
+        self.loop = asyncio.get_running_loop()
+        self.wakeup = asyncio.Event()
+
         while True:
+            self.wakeup.clear()
             if self.queue.empty():
-                await asyncio.sleep(0.2)
-                continue
+                # Timeout is a safety net for a missed wakeup
+                try:
+                    await asyncio.wait_for(self.wakeup.wait(), timeout=1)
+                except TimeoutError:
+                    continue
 
-            record = self.queue.get()
-            await self.process_message(record)
+            # Give the burst a moment to grow, so it is written at once
+            if self.queue.qsize() < LOG_BATCH_SIZE:
+                await asyncio.sleep(LOG_BATCH_INTERVAL)
+
+            self._take_batch()
+            await self.flush()
 
     async def finalize(self):
-        while not self.queue.empty():
-            with logger.contextualize(nodb=True):
-                logger.trace(
-                    f"Processing {len(self.queue.queue)} remaining log messages"
-                )
-            record = self.queue.get()
-            await self.process_message(record)
+        self.loop = None
+        with logger.contextualize(nodb=True):
+            logger.trace(f"Processing {self.queue.qsize()} remaining log messages")
+        while True:
+            self._take_batch()
+            if not self.batch:
+                break
+            await self.flush()
 
 
 # Create the instance here.
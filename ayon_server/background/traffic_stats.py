@@ -0,0 +1,33 @@
+import asyncio
+
+from ayon_server.background.background_worker import BackgroundWorker
+from ayon_server.config import ayonconfig
+from ayon_server.helpers.statistics import traffic_stats
+from ayon_server.logging import logger
+
+
+class TrafficStatsWriter(BackgroundWorker):
+    """Periodically write traffic counted in memory to the database.
+
+    Remaining traffic is written when the worker is stopped,
+    so it is not lost on a graceful shutdown.
+    """
+
+    async def run(self):
+        while True:
+            await asyncio.sleep(ayonconfig.traffic_stats_flush_interval)
+            try:
+                await traffic_stats.flush()
+            except Exception as e:
+                with logger.contextualize(nodb=True):
+                    logger.warning(f"Unable to write traffic stats: {e}")
+
+    async def finalize(self):
+        try:
+            await traffic_stats.flush()
+        except Exception as e:
+            with logger.contextualize(nodb=True):
+                logger.warning(f"Unable to write traffic stats: {e}")
+
+
+traffic_stats_writer = TrafficStatsWriter()
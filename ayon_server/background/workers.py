@@ -1,8 +1,10 @@
 from ayon_server.installer import background_installer
 
 from .background_worker import BackgroundWorker
+from .cache_invalidator import cache_invalidator
 from .invalidate_actions import invalidate_actions
 from .log_collector import log_collector
+from .traffic_stats import traffic_stats_writer
 
 
 class BackgroundWorkers:
@@ -22,8 +24,10 @@ class BackgroundWorkers:
     def __init__(self):
         self.tasks: list[BackgroundWorker] = [
             background_installer,
+            cache_invalidator,
             invalidate_actions,
             log_collector,
+            traffic_stats_writer,
         ]
 
     def start(self):
@@ -315,11 +315,52 @@ class AyonConfig(BaseModel):
         description="Project files CDN resolver URL",
     )
 
+    s3_upload_concurrency: int = Field(
+        default=4,
+        description="Number of parts of a multipart S3 upload sent in parallel",
+    )
+
+    s3_upload_retries: int = Field(
+        default=3,
+        description="Number of attempts to upload a single part to S3",
+    )
+
     thumbnail_size: int = Field(
         default=500,
         description="Max width/height of generated thumbnails in pixels",
     )
 
+    thumbnail_cache_size: int = Field(
+        default=128,
+        description="Memory used to cache thumbnails in each server process (MB)",
+    )
+
+    thumbnail_cache_dir: str | None = Field(
+        default=None,
+        description="Directory to cache thumbnails on the local disk of the node",
+    )
+
+    thumbnail_cache_disk_size: int = Field(
+        default=1024,
+        description="Max size of the thumbnail disk cache (MB)",
+    )
+
+    server_workers: int = Field(
+        default=1,
+        description="Number of server worker processes on the node",
+    )
+
+    media_jobs_concurrency: int = Field(
+        default=3,
+        description="Max number of ffmpeg/ffprobe processes per node. "
+        "It is split between the server processes, each runs at least one.",
+    )
+
+    traffic_stats_flush_interval: int = Field(
+        default=10,
+        description="How often each server process writes traffic stats (seconds)",
+    )
+
     # Temporary / workarounds
 
     limit_user_visibility: bool = Field(
@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from contextlib import suppress
 from datetime import datetime
 from typing import Any
@@ -253,16 +254,8 @@ class ProjectLevelEntity(BaseEntity):
                 )
 
             else:
-                await self.pre_save(True)
                 # Create a new entity
-                fields = dict_exclude(
-                    self.dict(exclude_none=True),
-                    self.model.dynamic_fields,
-                )
-                fields["attrib"] = attrib
-                fields["created_by"] = kwargs.get("user_name", None)
-                fields["updated_by"] = kwargs.get("user_name", None)
-
+                fields = await self.get_insert_fields(kwargs.get("user_name", None))
                 await Postgres.execute(
                     *SQLTool.insert(
                         f"project_{self.project_name}.{self.entity_type}s",
@@ -273,15 +266,56 @@ class ProjectLevelEntity(BaseEntity):
             if auto_commit:
                 await self.commit()
 
+    async def get_insert_fields(self, user_name: str | None = None) -> dict[str, Any]:
+        """Return column values used to insert a new entity to the database.
+
+        Calls pre_save hook, so it must be called in the transaction,
+        in which the entity is inserted. Used by save() and by bulk
+        operations, which insert many entities at once.
+        """
+        if self.status is None:
+            self.status = await self.get_default_status()
+
+        await self.pre_save(True)
+
+        attrib = {}
+        for key in self.own_attrib:
+            with suppress(AttributeError):
+                if (value := getattr(self.attrib, key)) is not None:
+                    attrib[key] = value
+
+        fields = dict_exclude(
+            self.dict(exclude_none=True),
+            self.model.dynamic_fields,
+        )
+        fields["attrib"] = attrib
+        fields["created_by"] = user_name
+        fields["updated_by"] = user_name
+        return fields
+
     async def commit(self) -> None:
-        await self.refresh_views(self.project_name)
+        parent_ids = {self.parent_id} if self.parent_id else set()
+        await self.refresh_views(
+            self.project_name,
+            entity_ids={self.id},
+            parent_ids=parent_ids,
+        )
 
     @classmethod
-    async def refresh_views(cls, project_name: str) -> None:
+    async def refresh_views(
+        cls,
+        project_name: str,
+        entity_ids: Iterable[str] | None = None,
+        parent_ids: Iterable[str] | None = None,
+    ) -> None:
         """Refresh the views for the entity type in the given project.
 
         This method should be overridden in subclasses to refresh.
         and should be called from commit() method after the entity is saved.
+
+        When `entity_ids` (and `parent_ids` of these entities) are provided,
+        the implementation may refresh only the affected part of the views.
+        When omitted, the whole project is refreshed.
         """
         pass
 
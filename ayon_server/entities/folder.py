@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from datetime import datetime
 from typing import Any
 
@@ -8,8 +9,14 @@ from ayon_server.exceptions import (
     AyonException,
     ForbiddenException,
 )
-from ayon_server.helpers.hierarchy_cache import rebuild_hierarchy_cache
-from ayon_server.helpers.inherited_attributes import rebuild_inherited_attributes
+from ayon_server.helpers.hierarchy_cache import (
+    rebuild_hierarchy_cache,
+    update_hierarchy_cache,
+)
+from ayon_server.helpers.inherited_attributes import (
+    rebuild_inherited_attributes,
+    update_inherited_attributes,
+)
 from ayon_server.lib.postgres import Postgres
 from ayon_server.logging import logger
 from ayon_server.types import ProjectLevelEntityType
@@ -103,21 +110,37 @@ class FolderEntity(ProjectLevelEntity):
         attrib.update(record["attrib"])
         return {**record, "attrib": attrib, "inherited_attrib": inherited_attrib}
 
+    async def get_default_folder_type(self) -> str:
+        """Return the first folder type of the project."""
+        res = await Postgres.fetch(
+            f"""
+            SELECT name from project_{self.project_name}.folder_types
+            ORDER BY position ASC LIMIT 1
+            """
+        )
+        if not res:
+            raise AyonException("No folder types defined")
+        return res[0]["name"]
+
+    async def apply_defaults(self) -> None:
+        """Set default status and folder type if they are not set."""
+        if self.status is None:
+            self.status = await self.get_default_status()
+
+        if self.folder_type is None:
+            self.folder_type = await self.get_default_folder_type()
+
+    async def get_insert_fields(self, user_name: str | None = None) -> dict[str, Any]:
+        await self.apply_defaults()
+        return {
+            "created_by": user_name,
+            "updated_by": user_name,
+            **dict_exclude(self.dict(exclude_none=True), ["own_attrib"]),
+        }
+
     async def save(self, *args, auto_commit: bool = True, **kwargs) -> None:
         async with Postgres.transaction():
-            if self.status is None:
-                self.status = await self.get_default_status()
-
-            if self.folder_type is None:
-                res = await Postgres.fetch(
-                    f"""
-                    SELECT name from project_{self.project_name}.folder_types
-                    ORDER BY position ASC LIMIT 1
-                    """
-                )
-                if not res:
-                    raise AyonException("No folder types defined")
-                self.folder_type = res[0]["name"]
+            await self.apply_defaults()
 
             attrib = {}
             for key in self.own_attrib:
@@ -150,42 +173,50 @@ class FolderEntity(ProjectLevelEntity):
 
             else:
                 # Create a new entity
+                fields = await self.get_insert_fields(kwargs.get("user_name"))
                 await Postgres.execute(
                     *SQLTool.insert(
                         f"project_{self.project_name}.{self.entity_type}s",
-                        created_by=kwargs.get("user_name"),
-                        updated_by=kwargs.get("user_name"),
-                        **dict_exclude(self.dict(exclude_none=True), ["own_attrib"]),
+                        **fields,
                     )
                 )
 
-            # This needs to run in save, not in refresh_views, because
-            # we may need the hierarchy record in the same transaction
-            await Postgres.execute(
-                f"""
-                REFRESH MATERIALIZED VIEW
-                project_{self.project_name}.hierarchy
-                """
-            )
+            # Hierarchy table is updated by database triggers,
+            # so the new path is available in the same transaction
 
             if auto_commit:
                 await self.commit()
 
     @classmethod
-    async def refresh_views(cls, project_name: str) -> None:
-        """Refresh hierarchy materialized view on folder save."""
+    async def refresh_views(
+        cls,
+        project_name: str,
+        entity_ids: Iterable[str] | None = None,
+        parent_ids: Iterable[str] | None = None,
+    ) -> None:
+        """Refresh exported attributes and hierarchy cache on folder save.
+
+        When entity_ids are provided, exported attributes and the hierarchy
+        cache are updated only for the subtrees of the affected folders.
+        """
         logger.trace(f"Refreshing folder views for project {project_name}")
 
         # Do not change the order of these calls!
         #
         # Inherited attributes call:
-        #  - refreshes hierarchy materialized view
         #  - rebuilds exported_attributes table
+        #  - which depends on the hierarchy table (maintained by triggers)
         #
         # Hierarchy cache call:
         #  - caches the hierarchy table in Redis
         #  - which depends on the exported_attributes table
 
+        if entity_ids is not None:
+            folder_ids = set(entity_ids)
+            await update_inherited_attributes(project_name, folder_ids)
+            await update_hierarchy_cache(project_name, folder_ids)
+            return
+
         await rebuild_inherited_attributes(project_name)
         await rebuild_hierarchy_cache(project_name)
 
@@ -22,6 +22,7 @@ from ayon_server.entities.project_aux_tables import (
     link_types_update,
 )
 from ayon_server.exceptions import NotFoundException, ServiceUnavailableException
+from ayon_server.helpers.hierarchy_cache import invalidate_hierarchy_cache
 from ayon_server.helpers.inherited_attributes import rebuild_inherited_attributes
 from ayon_server.helpers.project_list import build_project_list
 from ayon_server.lib.postgres import Postgres
@@ -314,7 +315,7 @@ class ProjectEntity(TopLevelEntity):
                 await Redis.delete("global", "project-list")
                 await Redis.delete("project-anatomy", self.name)
                 await Redis.delete("project-data", self.name)
-                await Redis.delete("project-folders", self.name)
+                await invalidate_hierarchy_cache(self.name)
         return True
 
     def as_user(self, user):
@@ -7,6 +7,7 @@ from ayon_server.entities.project_aux_tables import (
     aux_table_update,
     link_types_update,
 )
+from ayon_server.helpers.hierarchy_cache import invalidate_hierarchy_cache
 from ayon_server.lib.postgres import Postgres
 from ayon_server.lib.redis import Redis
 from ayon_server.logging import logger
@@ -104,7 +105,7 @@ class ProjectSkeletonEntity(ProjectEntity):
                 await Redis.delete("global", "project-list")
                 await Redis.delete("project-anatomy", self.name)
                 await Redis.delete("project-data", self.name)
-                await Redis.delete("project-folders", self.name)
+                await invalidate_hierarchy_cache(self.name)
         return True
 
     async def promote(self) -> None:
@@ -1,10 +1,14 @@
+from collections.abc import Iterable
 from typing import Any
 
 from ayon_server.access.utils import ensure_entity_access
 from ayon_server.entities.core import ProjectLevelEntity, attribute_library
 from ayon_server.entities.models import ModelSet
 from ayon_server.exceptions import AyonException
-from ayon_server.helpers.hierarchy_cache import rebuild_hierarchy_cache
+from ayon_server.helpers.hierarchy_cache import (
+    rebuild_hierarchy_cache,
+    update_hierarchy_cache,
+)
 from ayon_server.lib.postgres import Postgres
 from ayon_server.logging import logger
 from ayon_server.types import ProjectLevelEntityType
@@ -65,23 +69,56 @@ class TaskEntity(ProjectLevelEntity):
         payload["path"] = f"/{folder_path}/{payload['name']}"
         return payload
 
+    async def get_default_task_type(self) -> str:
+        """Return the first task type of the project."""
+        res = await Postgres.fetch(
+            f"""
+            SELECT name from project_{self.project_name}.task_types
+            ORDER BY position ASC LIMIT 1
+            """
+        )
+        if not res:
+            raise AyonException("No task types defined")
+        return res[0]["name"]
+
+    async def apply_defaults(self) -> None:
+        """Set default task type if it is not set."""
+        if self.task_type is None:
+            self.task_type = await self.get_default_task_type()
+
+    async def get_insert_fields(self, user_name: str | None = None) -> dict[str, Any]:
+        await self.apply_defaults()
+        return await super().get_insert_fields(user_name)
+
     async def save(self, *args, auto_commit: bool = True, **kwargs) -> None:
         async with Postgres.transaction():
-            if self.task_type is None:
-                res = await Postgres.fetch(
-                    f"""
-                    SELECT name from project_{self.project_name}.task_types
-                    ORDER BY position ASC LIMIT 1
-                    """
-                )
-                if not res:
-                    raise AyonException("No task types defined")
-                self.task_type = res[0]["name"]
+            await self.apply_defaults()
             await super().save(auto_commit=auto_commit)
 
     @classmethod
-    async def refresh_views(cls, project_name: str) -> None:
-        await rebuild_hierarchy_cache(project_name)
+    async def refresh_views(
+        cls,
+        project_name: str,
+        entity_ids: Iterable[str] | None = None,
+        parent_ids: Iterable[str] | None = None,
+    ) -> None:
+        if entity_ids is None:
+            await rebuild_hierarchy_cache(project_name)
+            return
+
+        # Tasks affect only their folder's record in the cache.
+        # parent_ids contain the original folders (including the ones
+        # of deleted tasks), but tasks may have been moved as well.
+        folder_ids = set(parent_ids or [])
+        res = await Postgres.fetch(
+            f"""
+            SELECT DISTINCT folder_id FROM project_{project_name}.tasks
+            WHERE id = ANY($1::uuid[])
+            """,
+            list(entity_ids),
+        )
+        folder_ids.update(row["folder_id"] for row in res)
+        await update_hierarchy_cache(project_name, folder_ids, subtree=False)
 
     async def ensure_create_access(self, user, **kwargs) -> None:
         if user.is_manager:
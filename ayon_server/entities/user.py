@@ -275,7 +275,7 @@ class UserEntity(TopLevelEntity):
                     await hook(self)
 
             if self.was_manager != self.is_manager:
-                await Redis.delete("global", "manager-names")
+                await Redis.delete("users", "manager-names")
 
             return True
 
@@ -318,7 +318,7 @@ class UserEntity(TopLevelEntity):
                     continue
 
         if self.was_manager or self.is_manager:
-            await Redis.delete("global", "manager-names")
+            await Redis.delete("users", "manager-names")
         from ayon_server.auth.session import Session
 
         await Session.logout_user(self.name, message="Account has been deleted")
@@ -2,6 +2,10 @@ __all__ = ["DEFAULT_HOOKS"]
 
 from typing import TYPE_CHECKING
 
+from ayon_server.addons.settings_layers import (
+    clear_compiled_settings,
+    invalidate_settings_layers,
+)
 from ayon_server.lib.redis import Redis
 from ayon_server.logging import logger
 
@@ -15,9 +19,36 @@ async def clear_settings_cache(event: "EventModel"):
     logger.trace("Clearing all-settings cache")
     await Redis.delete_ns("all-settings")
 
+    # Site overrides are not compiled, so only studio and project
+    # overrides invalidate the compiled settings layers
+
+    summary = event.summary
+    if summary.get("site_id"):
+        return
+
+    addon_name = summary.get("addon_name")
+    addon_version = summary.get("addon_version")
+    variant = summary.get("variant")
+    if not (addon_name and addon_version and variant):
+        await clear_compiled_settings()
+        return
+
+    await invalidate_settings_layers(
+        addon_name,
+        addon_version,
+        variant,
+        project_name=event.project,
+    )
+
+
+async def clear_compiled_settings_cache(event: "EventModel"):
+    logger.trace("Clearing compiled settings cache")
+    await clear_compiled_settings()
+
 
 DEFAULT_HOOKS: list[tuple[str, HandlerType, bool]] = [
     ("settings.changed", clear_settings_cache, False),
-    ("bundle.created", clear_settings_cache, False),
-    ("bundle.updated", clear_settings_cache, False),
+    ("bundle.created", clear_compiled_settings_cache, False),
+    ("bundle.updated", clear_compiled_settings_cache, False),
+    ("bundle.status_changed", clear_compiled_settings_cache, False),
 ]
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime
 from typing import Any
 
@@ -10,6 +11,12 @@ from ayon_server.utils import SQLTool, json_dumps
 
 from .base import EventModel, EventStatus, HandlerType, create_id
 
+# Number of events stored using a single INSERT statement in dispatch_many
+DISPATCH_MANY_CHUNK_SIZE = 500
+
+# Maximum number of local event handlers running concurrently in dispatch_many
+DISPATCH_MANY_HANDLER_CONCURRENCY = 8
+
 
 class EventStream:
     model: type[EventModel] = EventModel
@@ -34,9 +41,12 @@ class EventStream:
                 if not mapping:
                     hooks.pop(topic)
 
-    @classmethod
-    async def dispatch(
-        cls,
+    #
+    # Helpers shared by dispatch and dispatch_many
+    #
+
+    @staticmethod
+    def _create_event(
         topic: str,
         *,
         hash: str | None = None,
@@ -47,27 +57,9 @@ class EventStream:
         summary: dict[str, Any] | None = None,
         payload: dict[str, Any] | None = None,
         finished: bool = True,
-        store: bool = True,
-        reuse: bool = False,
-        recipients: list[str] | None = None,
         sender: str | None = None,
         sender_type: str | None = None,
-    ) -> str:
-        """
-
-        finished:
-            whether the event one shot and should be marked as finished upon creation
-
-        store:
-            whether to store the event in the database
-
-        reuse:
-            allow to reuse an existing event with the same hash
-
-        recipients:
-            list of user names to notify via websocket (None for all users)
-        """
-
+    ) -> EventModel:
         if summary is None:
             summary = {}
         if payload is None:
@@ -80,14 +72,13 @@ class EventStream:
             hash = f"{event_id}"
 
         status: str = "finished" if finished else "pending"
-        progress: float = 100 if finished else 0.0
 
         request_context = get_request_context()
 
         if user is None and request_context.user:
             user = request_context.user.name
 
-        event = EventModel(
+        return EventModel(
             id=event_id,
             hash=hash,
             sender=sender or request_context.sender,
@@ -103,6 +94,116 @@ class EventStream:
             retries=0,
         )
 
+    @staticmethod
+    def _create_message(
+        event: EventModel,
+        *,
+        progress: float,
+        store: bool,
+        recipients: list[str] | None,
+    ) -> str:
+        depends_on = (
+            str(event.depends_on).replace("-", "") if event.depends_on else None
+        )
+        return json_dumps(
+            {
+                "id": str(event.id).replace("-", ""),
+                "topic": event.topic,
+                "project": event.project,
+                "user": event.user,
+                "dependsOn": depends_on,
+                "description": event.description,
+                "summary": event.summary,
+                "status": event.status,
+                "progress": progress,
+                "sender": event.sender,
+                "senderType": event.sender_type,
+                "store": store,  # useful to allow querying details
+                "recipients": recipients,
+                "createdAt": event.created_at,
+                "updatedAt": event.updated_at,
+            }
+        )
+
+    @staticmethod
+    def _log_created(event: EventModel) -> None:
+        if event.topic.startswith("log."):
+            return
+        p = f" ({event.description})" if event.description else ""
+        ctx = {"nodb": True, "event_id": event.id}
+        if event.user:
+            ctx["user"] = event.user
+        if event.project:
+            ctx["project"] = event.project
+        with logger.contextualize(**ctx):
+            logger.debug(f"[EVENT CREATE] {event.topic}{p}")
+
+    @classmethod
+    def _get_local_handlers(cls, event_topic: str) -> list[HandlerType]:
+        result: list[HandlerType] = []
+        for topic, handlers in list(cls.local_hooks.items()):
+            if topic == event_topic or (
+                topic.endswith(".*") and event_topic.startswith(topic[:-2])
+            ):
+                result.extend(handlers.values())
+        return result
+
+    @staticmethod
+    async def _run_handler(handler: HandlerType, event: EventModel) -> None:
+        try:
+            await handler(event)
+        except Exception:
+            log_traceback(f"Error in event handler '{handler.__name__}'")
+
+    @classmethod
+    async def dispatch(
+        cls,
+        topic: str,
+        *,
+        hash: str | None = None,
+        project: str | None = None,
+        user: str | None = None,
+        depends_on: str | None = None,
+        description: str | None = None,
+        summary: dict[str, Any] | None = None,
+        payload: dict[str, Any] | None = None,
+        finished: bool = True,
+        store: bool = True,
+        reuse: bool = False,
+        recipients: list[str] | None = None,
+        sender: str | None = None,
+        sender_type: str | None = None,
+    ) -> str:
+        """
+
+        finished:
+            whether the event one shot and should be marked as finished upon creation
+
+        store:
+            whether to store the event in the database
+
+        reuse:
+            allow to reuse an existing event with the same hash
+
+        recipients:
+            list of user names to notify via websocket (None for all users)
+        """
+
+        event = cls._create_event(
+            topic,
+            hash=hash,
+            project=project,
+            user=user,
+            depends_on=depends_on,
+            description=description,
+            summary=summary,
+            payload=payload,
+            finished=finished,
+            sender=sender,
+            sender_type=sender_type,
+        )
+        progress: float = 100 if finished else 0.0
+
         if store:
             query = """
                 INSERT INTO
@@ -152,8 +253,8 @@ class EventStream:
                     event.project,
                     event.user,
                     event.depends_on,
-                    status,
-                    description,
+                    event.status,
+                    event.description,
                     event.summary,
                     event.payload,
                 )
@@ -172,60 +273,152 @@ class EventStream:
                     "Event with the same hash already exists",
                 )
 
-        depends_on = (
-            str(event.depends_on).replace("-", "") if event.depends_on else None
-        )
         await Redis.publish(
-            json_dumps(
-                {
-                    "id": str(event.id).replace("-", ""),
-                    "topic": event.topic,
-                    "project": event.project,
-                    "user": event.user,
-                    "dependsOn": depends_on,
-                    "description": event.description,
-                    "summary": event.summary,
-                    "status": event.status,
-                    "progress": progress,
-                    "sender": event.sender,
-                    "senderType": event.sender_type,
-                    "store": store,  # useful to allow querying details
-                    "recipients": recipients,
-                    "createdAt": event.created_at,
-                    "updatedAt": event.updated_at,
-                }
+            cls._create_message(
+                event,
+                progress=progress,
+                store=store,
+                recipients=recipients,
             )
         )
+        cls._log_created(event)
+
+        for handler in cls._get_local_handlers(event.topic):
+            await cls._run_handler(handler, event)
 
-        if not event.topic.startswith("log."):
-            p = f" ({event.description})" if event.description else ""
-            ctx = {"nodb": True, "event_id": event.id}
-            if event.user:
-                ctx["user"] = event.user
-            if event.project:
-                ctx["project"] = event.project
-            with logger.contextualize(**ctx):
-                logger.debug(f"[EVENT CREATE] {event.topic}{p}")
-
-        hooks = list(cls.local_hooks.items())
-        for topic, handlers in hooks:
-            do_handle = False
-            if topic == event.topic:
-                do_handle = True
-            elif topic.endswith(".*"):
-                if event.topic.startswith(topic[:-2]):
-                    do_handle = True
-            if not do_handle:
+        return event.id
+
+    @classmethod
+    async def dispatch_many(
+        cls,
+        events: list[dict[str, Any]],
+        *,
+        sender: str | None = None,
+        sender_type: str | None = None,
+    ) -> list[str]:
+        """Dispatch multiple events at once.
+
+        Each item of `events` contains keyword arguments of `dispatch`.
+        Events are stored using multi-row inserts, published in a single
+        Redis pipeline and local handlers run concurrently (with a limit).
+
+        Events which need special handling (`reuse` or `depends_on`)
+        are dispatched one by one. Events with a hash, which already
+        exists, are skipped (logged, not raised).
+
+        Return a list of ids of the dispatched events (not in the order
+        of the provided events).
+        """
+
+        result: list[str] = []
+        created: list[EventModel] = []
+        messages: list[str] = []
+
+        to_store: list[EventModel] = []
+        for item in events:
+            kwargs = {"sender": sender, "sender_type": sender_type, **item}
+            reuse = kwargs.pop("reuse", False)
+            if reuse or kwargs.get("depends_on"):
+                result.append(await cls.dispatch(reuse=reuse, **kwargs))
                 continue
 
-            handler_funcs = list(handlers.values())
-            for handler in handler_funcs:
-                try:
-                    await handler(event)
-                except Exception:
-                    log_traceback(f"Error in event handler '{handler.__name__}'")
+            recipients = kwargs.pop("recipients", None)
+            store = kwargs.pop("store", True)
+            event = cls._create_event(**kwargs)
+            progress: float = 100 if kwargs.get("finished", True) else 0.0
+            message = cls._create_message(
+                event,
+                progress=progress,
+                store=store,
+                recipients=recipients,
+            )
+            if store:
+                to_store.append(event)
+            created.append(event)
+            messages.append(message)
+
+        stored_ids: set[str] = set()
+        for i in range(0, len(to_store), DISPATCH_MANY_CHUNK_SIZE):
+            chunk = to_store[i : i + DISPATCH_MANY_CHUNK_SIZE]
+            stored_ids.update(await cls._store_many(chunk))
+
+        published: list[EventModel] = []
+        published_messages: list[str] = []
+        stored_event_ids = {event.id for event in to_store}
+        for event, message in zip(created, messages, strict=True):
+            if event.id in stored_event_ids and event.id not in stored_ids:
+                logger.warning(
+                    f"Event {event.topic} with hash {event.hash} already exists",
+                    nodb=True,
+                )
+                continue
+            published.append(event)
+            published_messages.append(message)
+
+        await Redis.publish_many(published_messages)
+
+        semaphore = asyncio.Semaphore(DISPATCH_MANY_HANDLER_CONCURRENCY)
+
+        async def run_handler(handler: HandlerType, event: EventModel) -> None:
+            async with semaphore:
+                await cls._run_handler(handler, event)
+
+        tasks = []
+        for event in published:
+            cls._log_created(event)
+            for handler in cls._get_local_handlers(event.topic):
+                tasks.append(run_handler(handler, event))
+        await asyncio.gather(*tasks)
+
+        result.extend(event.id for event in published)
+        return result
+
+    @staticmethod
+    async def _store_many(events: list[EventModel]) -> set[str]:
+        """Insert events to the database and return ids of the inserted ones"""
+        columns = [
+            "id",
+            "hash",
+            "sender",
+            "sender_type",
+            "topic",
+            "project_name",
+            "user_name",
+            "status",
+            "description",
+            "summary",
+            "payload",
+        ]
+        values: list[Any] = []
+        rows: list[str] = []
+        for event in events:
+            offset = len(values)
+            placeholders = [f"${offset + i + 1}" for i in range(len(columns))]
+            rows.append(f"({', '.join(placeholders)})")
+            values.extend(
+                [
+                    event.id,
+                    event.hash,
+                    event.sender,
+                    event.sender_type,
+                    event.topic,
+                    event.project,
+                    event.user,
+                    event.status,
+                    event.description,
+                    event.summary,
+                    event.payload,
+                ]
+            )
 
-        return event.id
+        query = f"""
+            INSERT INTO public.events ({", ".join(columns)})
+            VALUES {", ".join(rows)}
+            ON CONFLICT (hash) DO NOTHING
+            RETURNING id
+        """
+        res = await Postgres.fetch(query, *values)
+        return {row["id"] for row in res}
 
     @classmethod
     async def update(
@@ -16,19 +16,25 @@ from ayon_server.config.serverconfig import get_server_config
 from ayon_server.exceptions import AyonException, ForbiddenException, NotFoundException
 from ayon_server.files.s3 import (
     S3Config,
+    abort_s3_multipart_upload,
+    complete_s3_multipart_upload,
+    create_s3_multipart_upload,
     delete_s3_file,
     get_s3_file_info,
     get_signed_url,
     handle_s3_upload,
     list_s3_files,
+    list_s3_multipart_uploads,
     remote_to_s3,
     retrieve_s3_file,
     store_s3_file,
     upload_s3_file,
+    upload_s3_part,
 )
 from ayon_server.helpers.cloud import CloudUtils
 from ayon_server.helpers.download import download_file
 from ayon_server.helpers.ffprobe import extract_media_info
+from ayon_server.helpers.media_jobs import JobPriority
 from ayon_server.helpers.project_list import ProjectListItem, get_project_info
 from ayon_server.lib.postgres import Postgres
 from ayon_server.lib.redis import Redis
@@ -37,7 +43,7 @@ from ayon_server.models.file_info import FileInfo
 from ayon_server.utils.request_coalescer import RequestCoalescer
 
 from .common import FileGroup, StorageType
-from .utils import list_local_files
+from .utils import list_local_files, list_local_files_with_suffix
 
 
 class ProjectStorage:
@@ -278,6 +284,128 @@ class ProjectStorage:
             )
         raise Exception("Unknown storage type")
 
+    #
+    # Chunked uploads
+    # Local storage writes chunks to a partial file next to the target path,
+    # S3 storage maps chunks to parts of a multipart upload.
+    #
+
+    async def init_chunked_upload(
+        self,
+        file_id: str,
+        *,
+        content_type: str | None = None,
+        content_disposition: str | None = None,
+    ) -> str | None:
+        """Prepare the storage for a chunked upload of the file
+
+        Returns the multipart upload ID for S3 storages, None otherwise.
+        """
+        path = await self.get_path(file_id)
+        if self.storage_type == "local":
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                async with aiofiles.open(f"{path}.part", "wb"):
+                    pass
+            except Exception as e:
+                raise AyonException(f"Failed to create file: {e}") from e
+            return None
+        elif self.storage_type == "s3":
+            return await create_s3_multipart_upload(
+                self,
+                path,
+                content_type=content_type,
+                content_disposition=content_disposition,
+            )
+        raise AyonException("Unknown storage type")
+
+    async def write_chunk(
+        self,
+        file_id: str,
+        data: bytes,
+        *,
+        offset: int,
+        part_number: int,
+        upload_id: str | None = None,
+    ) -> str | None:
+        """Store a chunk of a file uploaded using `init_chunked_upload`
+
+        Returns the ETag of the uploaded part for S3 storages, None otherwise.
+        """
+        path = await self.get_path(file_id)
+        if self.storage_type == "local":
+            try:
+                async with aiofiles.open(f"{path}.part", "r+b") as f:
+                    await f.seek(offset)
+                    await f.write(data)
+            except FileNotFoundError:
+                raise NotFoundException("Upload not found") from None
+            except Exception as e:
+                raise AyonException(f"Failed to write file: {e}") from e
+            return None
+        elif self.storage_type == "s3":
+            assert upload_id, "Upload ID is required for S3 storage"
+            return await upload_s3_part(self, path, upload_id, part_number, data)
+        raise AyonException("Unknown storage type")
+
+    async def complete_chunked_upload(
+        self,
+        file_id: str,
+        *,
+        upload_id: str | None = None,
+        parts: list[tuple[int, str]] | None = None,
+    ) -> None:
+        """Move the completely uploaded file to its target path"""
+        path = await self.get_path(file_id)
+        if self.storage_type == "local":
+            try:
+                os.replace(f"{path}.part", path)
+            except FileNotFoundError:
+                raise NotFoundException("Upload not found") from None
+        elif self.storage_type == "s3":
+            assert upload_id, "Upload ID is required for S3 storage"
+            await complete_s3_multipart_upload(self, path, upload_id, parts or [])
+        else:
+            raise AyonException("Unknown storage type")
+
+    async def abort_chunked_upload(
+        self,
+        file_id: str,
+        *,
+        upload_id: str | None = None,
+    ) -> None:
+        """Discard chunks of an unfinished upload"""
+        path = await self.get_path(file_id)
+        if self.storage_type == "local":
+            try:
+                os.remove(f"{path}.part")
+            except FileNotFoundError:
+                pass
+        elif self.storage_type == "s3":
+            assert upload_id, "Upload ID is required for S3 storage"
+            await abort_s3_multipart_upload(self, path, upload_id)
+
+    async def list_chunked_uploads(
+        self,
+    ) -> AsyncGenerator[tuple[str, str | None, float]]:
+        """List unfinished chunked uploads on the storage
+
+        Yields (file_id, upload_id, timestamp) tuples, where timestamp
+        is the time of the last write (local) or the upload start (S3).
+        """
+        group_dir = await self.get_filegroup_dir("uploads")
+        if self.storage_type == "local":
+            if not os.path.isdir(group_dir):
+                return
+            async for path, mtime in list_local_files_with_suffix(group_dir, ".part"):
+                file_id = os.path.basename(path).removesuffix(".part")
+                yield file_id, None, mtime
+        elif self.storage_type == "s3":
+            for key, upload_id, initiated in await list_s3_multipart_uploads(
+                self, group_dir
+            ):
+                yield key.split("/")[-1], upload_id, initiated
+
     #
     # Delete files
     #
@@ -417,7 +545,12 @@ class ProjectStorage:
 
         raise AyonException("Unknown storage type")
 
-    async def extract_media_info(self, file_id: str) -> dict[str, Any]:
+    async def extract_media_info(
+        self,
+        file_id: str,
+        *,
+        priority: JobPriority = "background",
+    ) -> dict[str, Any]:
         """Extract media info from the file
 
         Returns a dictionary with media information.
@@ -428,7 +561,11 @@ class ProjectStorage:
             path = await self.get_signed_url(file_id)
         else:
             raise AyonException("Unknown storage type")
-        return await extract_media_info(path)
+        return await extract_media_info(
+            path,
+            key=f"{self.project_name}/{file_id}",
+            priority=priority,
+        )
 
     # Thumbnail methods
     # Used for storing original images of the thumbnail
@@ -168,6 +168,159 @@ async def get_s3_file_info(storage: "ProjectStorage", key: str) -> FileInfo:
     return await run_in_threadpool(_get_s3_file_info, storage, key)
 
 
+# Multipart upload primitives
+# Used by resumable uploads, where parts arrive in separate requests
+
+
+def _create_s3_multipart_upload(
+    storage: "ProjectStorage",
+    key: str,
+    content_type: str | None = None,
+    content_disposition: str | None = None,
+) -> str:
+    client = _get_s3_client(storage)
+    params = {"Bucket": storage.bucket_name, "Key": key}
+    if content_type:
+        params["ContentType"] = content_type
+    if content_disposition:
+        params["ContentDisposition"] = content_disposition
+    return client.create_multipart_upload(**params)["UploadId"]
+
+
+async def create_s3_multipart_upload(
+    storage: "ProjectStorage",
+    key: str,
+    *,
+    content_type: str | None = None,
+    content_disposition: str | None = None,
+) -> str:
+    """Start a multipart upload and return its upload ID"""
+    return await run_in_threadpool(
+        _create_s3_multipart_upload,
+        storage,
+        key,
+        content_type,
+        content_disposition,
+    )
+
+
+def _upload_s3_part(
+    storage: "ProjectStorage",
+    key: str,
+    upload_id: str,
+    part_number: int,
+    data: bytes,
+) -> str:
+    client = _get_s3_client(storage)
+    res = client.upload_part(
+        Body=data,
+        Bucket=storage.bucket_name,
+        Key=key,
+        PartNumber=part_number,
+        UploadId=upload_id,
+    )
+    return res["ResponseMetadata"]["HTTPHeaders"]["etag"]
+
+
+async def upload_s3_part(
+    storage: "ProjectStorage",
+    key: str,
+    upload_id: str,
+    part_number: int,
+    data: bytes,
+) -> str:
+    """Upload a single part of a multipart upload and return its ETag"""
+    return await run_in_threadpool(
+        _upload_s3_part,
+        storage,
+        key,
+        upload_id,
+        part_number,
+        data,
+    )
+
+
+def _complete_s3_multipart_upload(
+    storage: "ProjectStorage",
+    key: str,
+    upload_id: str,
+    parts: list[tuple[int, str]],
+) -> None:
+    client = _get_s3_client(storage)
+    client.complete_multipart_upload(
+        Bucket=storage.bucket_name,
+        Key=key,
+        MultipartUpload={
+            "Parts": [{"ETag": etag, "PartNumber": i} for i, etag in sorted(parts)]
+        },
+        UploadId=upload_id,
+    )
+
+
+async def complete_s3_multipart_upload(
+    storage: "ProjectStorage",
+    key: str,
+    upload_id: str,
+    parts: list[tuple[int, str]],
+) -> None:
+    await run_in_threadpool(
+        _complete_s3_multipart_upload,
+        storage,
+        key,
+        upload_id,
+        parts,
+    )
+
+
+def _abort_s3_multipart_upload(
+    storage: "ProjectStorage",
+    key: str,
+    upload_id: str,
+) -> None:
+    client = _get_s3_client(storage)
+    try:
+        client.abort_multipart_upload(
+            Bucket=storage.bucket_name,
+            Key=key,
+            UploadId=upload_id,
+        )
+    except client.exceptions.NoSuchUpload:
+        pass  # fail silently
+
+
+async def abort_s3_multipart_upload(
+    storage: "ProjectStorage",
+    key: str,
+    upload_id: str,
+) -> None:
+    await run_in_threadpool(_abort_s3_multipart_upload, storage, key, upload_id)
+
+
+def _list_s3_multipart_uploads(
+    storage: "ProjectStorage",
+    prefix: str,
+) -> list[tuple[str, str, float]]:
+    client = _get_s3_client(storage)
+    paginator = client.get_paginator("list_multipart_uploads")
+    result = []
+    for page in paginator.paginate(Bucket=storage.bucket_name, Prefix=prefix):
+        for upload in page.get("Uploads", []):
+            initiated = upload["Initiated"].timestamp()
+            result.append((upload["Key"], upload["UploadId"], initiated))
+    return result
+
+
+async def list_s3_multipart_uploads(
+    storage: "ProjectStorage",
+    prefix: str,
+) -> list[tuple[str, str, float]]:
+    """List unfinished multipart uploads under the prefix
+
+    Returns a list of (key, upload_id, initiated_timestamp) tuples.
+    """
+    return await run_in_threadpool(_list_s3_multipart_uploads, storage, prefix)
+
+
 class FileIterator:
     def __init__(
         self,
@@ -232,7 +385,19 @@ async def list_s3_files(
 # Used for larger files
 
 
+def _throughput(size: int, elapsed: float) -> str:
+    return f"{size / max(elapsed, 0.001) / 1024 / 1024:.2f} MB/s"
+
+
 class S3Uploader:
+    """Multipart upload to S3.
+
+    Pushed chunks are uploaded as parts, up to `max_workers` of them
+    in parallel. Memory use is bounded: at most `max_queue_size` chunks
+    wait in the queue and `max_workers` chunks are being uploaded.
+    Each part gets `max_retries` attempts before the upload fails.
+    """
+
     _worker_task: asyncio.Task[Any] | None
     _queue: asyncio.Queue[bytes | None]
 
@@ -242,7 +407,8 @@ class S3Uploader:
         bucket_name: str,
         *,
         max_queue_size=5,
-        max_workers=4,
+        max_workers: int | None = None,
+        max_retries: int | None = None,
         content_type: str | None = None,
         content_disposition: str | None = None,
     ):
@@ -250,14 +416,19 @@ class S3Uploader:
         self._multipart = None
         self._parts: list[tuple[int, str]] = []
         self._key: str | None = None
+        self._error: BaseException | None = None
         self.bucket_name = bucket_name
         self.content_type = content_type
         self.content_disposition = content_disposition
+        self.max_workers = max(1, max_workers or ayonconfig.s3_upload_concurrency)
+        self.max_retries = max(1, max_retries or ayonconfig.s3_upload_retries)
 
         # Limited-size async queue for chunk uploads to prevent over-filling
         self._queue = asyncio.Queue(maxsize=max_queue_size)
         self._worker_task = None
-        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._part_tasks: list[asyncio.Task[tuple[int, str]]] = []
+        self._slots = asyncio.Semaphore(self.max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
 
     def _init_file_upload(self, key: str):
         if self._multipart:
@@ -295,28 +466,58 @@ class S3Uploader:
         etag = res["ResponseMetadata"]["HTTPHeaders"]["etag"]
         return part_number, etag
 
+    async def _upload_part(self, chunk: bytes, part_number: int) -> tuple[int, str]:
+        """Upload a single part in the thread pool, retrying on failure."""
+        loop = asyncio.get_running_loop()
+        attempt = 1
+        try:
+            while True:
+                try:
+                    return await loop.run_in_executor(
+                        self._executor,
+                        self._upload_chunk,
+                        chunk,
+                        part_number,
+                    )
+                except Exception as e:
+                    if attempt >= self.max_retries:
+                        raise
+                    logger.warning(
+                        f"Upload of part {part_number} failed "
+                        f"(attempt {attempt}/{self.max_retries}): {e}"
+                    )
+                    await asyncio.sleep(attempt)
+                    attempt += 1
+        finally:
+            self._slots.release()
+
+    def _on_part_done(self, task: asyncio.Task[tuple[int, str]]) -> None:
+        if not task.cancelled() and task.exception() and self._error is None:
+            self._error = task.exception()
+
     async def _worker(self):
         """
         Async worker that continuously processes chunks in the queue.
-        Uploads to S3 and maintains part order.
+        Starts a part upload for each chunk as soon as a slot is free
+        and collects the uploaded parts in order.
         """
         part_number = 1
 
         while True:
             chunk = await self._queue.get()
+            self._queue.task_done()
             if chunk is None:
                 break  # Exit signal received
+            if self._error is not None:
+                continue  # Upload failed, just drain the queue
 
-            # Upload the chunk in a thread pool, and block asyncio minimally
-            part_number, etag = await asyncio.get_running_loop().run_in_executor(
-                self._executor,
-                self._upload_chunk,
-                chunk,
-                part_number,
-            )
-            self._parts.append((part_number, etag))
+            await self._slots.acquire()
+            task = asyncio.create_task(self._upload_part(chunk, part_number))
+            task.add_done_callback(self._on_part_done)
+            self._part_tasks.append(task)
             part_number += 1
-            self._queue.task_done()  # Mark chunk as processed
+
+        self._parts = sorted(await asyncio.gather(*self._part_tasks))
 
     async def init_file_upload(self, file_path: str):
         await asyncio.get_running_loop().run_in_executor(
@@ -332,6 +533,9 @@ class S3Uploader:
         If the queue is full, wait until there's space.
         """
 
+        if self._error is not None:
+            raise self._error
+
         if isinstance(chunk, bytearray):
             await self._queue.put(bytes(memoryview(chunk)))
         else:
@@ -377,10 +581,28 @@ class S3Uploader:
         self._parts = []
         self._key = None
 
+    def _shutdown(self) -> None:
+        # Drop the parts waiting for a thread and wait for the running
+        # ones, so no part is uploaded after the upload is aborted
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._abort()
+
     async def abort(self) -> None:
-        """Abort the multipart upload if there's an exception."""
+        """Abort the multipart upload if there's an exception.
+
+        Stops the worker and the pending part uploads (including their
+        retries) first. The uploader can't be used after that.
+        """
         logger.warning("Aborting upload")
-        await asyncio.get_running_loop().run_in_executor(self._executor, self._abort)
+        tasks = [
+            task
+            for task in (self._worker_task, *self._part_tasks)
+            if task and not task.done()
+        ]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await run_in_threadpool(self._shutdown)
 
     def __del__(self):
         """Ensure clean-up if the object is destroyed prematurely."""
@@ -440,7 +662,10 @@ async def handle_s3_upload(
             finished_ok = True
 
             await update_traffic_stats("ingress", i, service="s3")
-            logger.info(f"Uploaded {i} bytes in {upload_time:.2f} seconds")
+            logger.info(
+                f"Uploaded {i} bytes in {upload_time:.2f} seconds "
+                f"({_throughput(i, upload_time)})"
+            )
             return i
 
         finally:
@@ -500,7 +725,11 @@ async def remote_to_s3(
 
     await uploader.complete()
     upload_time = time.monotonic() - start_time
-    logger.info(f"Uploaded {i} bytes to {path} in {upload_time:.2f} seconds")
+    await update_traffic_stats("ingress", i, service="s3")
+    logger.info(
+        f"Uploaded {i} bytes to {path} in {upload_time:.2f} seconds "
+        f"({_throughput(i, upload_time)})"
+    )
     finfo_payload = {"size": i, "filename": filename}
     if content_type:
         finfo_payload["content_type"] = content_type
@@ -0,0 +1,316 @@
+"""Resumable uploads of project files
+
+An upload session is created with the size of the file. The file is then
+sent in chunks of `chunk_size` bytes (the last one may be shorter). Every
+chunk is identified by its byte offset, chunks may arrive in any order
+and a chunk may be sent again. When all chunks are received, the session
+is finalized and the file record is created.
+
+When the connection drops, the client asks for the session progress
+and sends only the missing chunks.
+
+Sessions are stored in Redis and expire when they are not used for
+`UPLOAD_SESSION_TTL` seconds. Chunks of expired sessions are removed
+from the project storage by `remove_incomplete_uploads`.
+"""
+
+import asyncio
+import math
+import time
+
+from pydantic import BaseModel
+
+from ayon_server.exceptions import (
+    BadRequestException,
+    ConflictException,
+    NotFoundException,
+)
+from ayon_server.files import Storages, create_project_file_record
+from ayon_server.helpers.statistics import update_traffic_stats
+from ayon_server.lib.postgres import Postgres
+from ayon_server.lib.redis import Redis
+from ayon_server.logging import logger
+from ayon_server.utils import create_uuid
+
+UPLOAD_SESSION_NS = "upload-session"
+UPLOAD_SESSION_LOCK_NS = "upload-session-lock"
+UPLOAD_SESSION_TTL = 24 * 3600
+
+# S3 parts must be at least 5 MB (except the last one)
+# and a multipart upload can't have more than 10000 parts
+MIN_CHUNK_SIZE = 8 * 1024 * 1024
+MAX_CHUNKS = 10_000
+
+
+class UploadSession(BaseModel):
+    id: str  # ID of the uploaded file
+    project_name: str
+    file_name: str
+    content_type: str
+    size: int
+    chunk_size: int
+    user_name: str
+    activity_id: str | None = None
+    upload_id: str | None = None  # S3 multipart upload ID
+    parts: dict[int, str] = {}  # part number: S3 etag (empty for local storage)
+    created_at: float
+    updated_at: float | None = None  # last time the session was saved
+
+    @property
+    def expires_in(self) -> int:
+        """Seconds until the session expires unless it is used"""
+        updated_at = self.updated_at or self.created_at
+        return max(0, int(updated_at + UPLOAD_SESSION_TTL - time.time()))
+
+    @property
+    def chunk_count(self) -> int:
+        return math.ceil(self.size / self.chunk_size)
+
+    @property
+    def received(self) -> int:
+        """Number of received bytes"""
+        last = self.chunk_count
+        total = 0
+        for part_number in self.parts:
+            if part_number == last:
+                total += self.size - (last - 1) * self.chunk_size
+            else:
+                total += self.chunk_size
+        return total
+
+    @property
+    def missing_offsets(self) -> list[int]:
+        return [
+            (part_number - 1) * self.chunk_size
+            for part_number in range(1, self.chunk_count + 1)
+            if part_number not in self.parts
+        ]
+
+
+def _session_key(project_name: str, session_id: str) -> str:
+    return f"{project_name}-{session_id}"
+
+
+async def _save_session(session: UploadSession) -> None:
+    session.updated_at = time.time()
+    await Redis.set(
+        UPLOAD_SESSION_NS,
+        _session_key(session.project_name, session.id),
+        session.json(),
+        ttl=UPLOAD_SESSION_TTL,
+    )
+
+
+async def _ensure_new_file(project_name: str, file_id: str) -> None:
+    """Refuse uploading data of an existing file
+
+    File IDs may be provided by the client, so the data and the record
+    of an existing file would be overwritten when the upload is finalized.
+    """
+    res = await Postgres.fetchrow(
+        f"SELECT id FROM project_{project_name}.files WHERE id = $1",
+        file_id,
+    )
+    if res is not None:
+        raise ConflictException(f"File {file_id} already exists")
+
+
+async def create_upload_session(
+    project_name: str,
+    file_name: str,
+    size: int,
+    *,
+    user_name: str,
+    content_type: str | None = None,
+    file_id: str | None = None,
+    activity_id: str | None = None,
+) -> UploadSession:
+    """Start a resumable upload of a project file"""
+
+    if size <= 0:
+        raise BadRequestException("Empty file")
+
+    if file_id:
+        file_id = file_id.replace("-", "")
+        if len(file_id) != 32:
+            raise BadRequestException("Invalid file ID")
+        await _ensure_new_file(project_name, file_id)
+    else:
+        file_id = create_uuid()
+
+    if await Redis.get(UPLOAD_SESSION_NS, _session_key(project_name, file_id)):
+        raise ConflictException("Upload of this file is already in progress")
+
+    content_type = content_type or "application/octet-stream"
+    chunk_size = max(MIN_CHUNK_SIZE, math.ceil(size / MAX_CHUNKS))
+
+    storage = await Storages.project(project_name)
+    upload_id = await storage.init_chunked_upload(
+        file_id,
+        content_type=content_type,
+        content_disposition=f'inline; filename="{file_name}"',
+    )
+
+    session = UploadSession(
+        id=file_id,
+        project_name=project_name,
+        file_name=file_name,
+        content_type=content_type,
+        size=size,
+        chunk_size=chunk_size,
+        user_name=user_name,
+        activity_id=activity_id,
+        upload_id=upload_id,
+        created_at=time.time(),
+    )
+    await _save_session(session)
+    logger.debug(f"Started upload session {file_id} ({size} bytes) in {project_name}")
+    return session
+
+
+async def get_upload_session(project_name: str, session_id: str) -> UploadSession:
+    data = await Redis.get(UPLOAD_SESSION_NS, _session_key(project_name, session_id))
+    if data is None:
+        raise NotFoundException("Upload session not found or expired")
+    return UploadSession.parse_raw(data)
+
+
+async def _update_session(
+    session: UploadSession,
+    part_number: int,
+    etag: str,
+) -> UploadSession:
+    """Record a received part.
+
+    Chunks of the same session may be uploaded in parallel, so the session
+    is re-loaded and updated under a lock.
+    """
+    key = _session_key(session.project_name, session.id)
+    for _ in range(100):
+        token = await Redis.try_lock(UPLOAD_SESSION_LOCK_NS, key, ttl=10)
+        if token:
+            break
+        await asyncio.sleep(0.05)
+    else:
+        raise ConflictException("Upload session is locked")
+
+    try:
+        session = await get_upload_session(session.project_name, session.id)
+        session.parts[part_number] = etag
+        await _save_session(session)
+    finally:
+        await Redis.unlock(UPLOAD_SESSION_LOCK_NS, key, token)
+    return session
+
+
+async def write_upload_chunk(
+    session: UploadSession,
+    offset: int,
+    data: bytes,
+) -> UploadSession:
+    """Store a chunk of the file starting at the given byte offset"""
+
+    if offset < 0 or offset >= session.size or offset % session.chunk_size:
+        raise BadRequestException(
+            f"Offset must be a multiple of {session.chunk_size} "
+            f"lower than {session.size}"
+        )
+
+    expected_size = min(session.chunk_size, session.size - offset)
+    if len(data) != expected_size:
+        raise BadRequestException(
+            f"Chunk at offset {offset} must have {expected_size} bytes, got {len(data)}"
+        )
+
+    part_number = offset // session.chunk_size + 1
+    storage = await Storages.project(session.project_name)
+    etag = await storage.write_chunk(
+        session.id,
+        data,
+        offset=offset,
+        part_number=part_number,
+        upload_id=session.upload_id,
+    )
+    await update_traffic_stats(
+        "ingress",
+        len(data),
+        service="s3" if storage.storage_type == "s3" else "ayon",
+    )
+    return await _update_session(session, part_number, etag or "")
+
+
+async def finalize_upload_session(session: UploadSession) -> str:
+    """Assemble the uploaded file and create its record.
+
+    Returns the file ID.
+    """
+
+    if missing := session.missing_offsets:
+        raise BadRequestException(
+            f"Upload is incomplete. {len(missing)} chunks are missing"
+        )
+
+    storage = await Storages.project(session.project_name)
+    async with Postgres.transaction():
+        # The file may have been created since the session started.
+        # The record is created before the data is moved to the target
+        # path and rolled back when that fails.
+        await _ensure_new_file(session.project_name, session.id)
+        await create_project_file_record(
+            session.project_name,
+            session.file_name,
+            size=session.size,
+            content_type=session.content_type,
+            file_id=session.id,
+            user_name=session.user_name,
+            activity_id=session.activity_id,
+        )
+        await storage.complete_chunked_upload(
+            session.id,
+            upload_id=session.upload_id,
+            parts=list(session.parts.items()),
+        )
+
+    await Redis.delete(
+        UPLOAD_SESSION_NS,
+        _session_key(session.project_name, session.id),
+    )
+    elapsed = time.time() - session.created_at
+    logger.info(
+        f"Finished upload of {session.size} bytes to {session.project_name} "
+        f"in {elapsed:.2f} seconds ({len(session.parts)} chunks)"
+    )
+    return session.id
+
+
+async def abort_upload_session(session: UploadSession) -> None:
+    """Discard the upload session and all its received chunks"""
+    storage = await Storages.project(session.project_name)
+    await storage.abort_chunked_upload(session.id, upload_id=session.upload_id)
+    await Redis.delete(
+        UPLOAD_SESSION_NS,
+        _session_key(session.project_name, session.id),
+    )
+
+
+async def remove_incomplete_uploads(project_name: str) -> int:
+    """Remove chunks of expired upload sessions from the project storage
+
+    Returns the number of removed uploads.
+    """
+    storage = await Storages.project(project_name)
+    count = 0
+    async for file_id, upload_id, timestamp in storage.list_chunked_uploads():
+        if time.time() - timestamp < UPLOAD_SESSION_TTL:
+            continue
+        key = _session_key(project_name, file_id)
+        if await Redis.get(UPLOAD_SESSION_NS, key):
+            continue  # Session is still in progress
+        logger.debug(f"Removing incomplete upload {file_id} from {storage}")
+        try:
+            await storage.abort_chunked_upload(file_id, upload_id=upload_id)
+        except Exception as e:
+            logger.warning(f"Failed to remove incomplete upload {file_id}: {e}")
+            continue
+        count += 1
+    return count
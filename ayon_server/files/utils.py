@@ -11,3 +11,17 @@ async def list_local_files(root: str) -> AsyncGenerator[str]:
                 yield file
         else:
             yield rec.name
+
+
+async def list_local_files_with_suffix(
+    root: str,
+    suffix: str,
+) -> AsyncGenerator[tuple[str, float]]:
+    """Yield (path, mtime) of files with the given suffix under the root"""
+    records = await aiofiles.os.scandir(root)
+    for rec in records:
+        if rec.is_dir():
+            async for item in list_local_files_with_suffix(rec.path, suffix):
+                yield item
+        elif rec.name.endswith(suffix):
+            yield rec.path, rec.stat().st_mtime
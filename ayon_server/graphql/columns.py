@@ -0,0 +1,130 @@
+"""Column lists of project tables
+
+Schema-relative queries (see `Postgres.iterate`) have the same text for
+all projects, so each connection keeps a single prepared statement for
+them. Postgres re-plans such a statement when the search path points
+to another project, but the result columns of the new plan must match
+the cached ones.
+
+`SELECT folders.*` returns the columns in their physical order, which
+is not the same in projects created from the current schema and in
+projects upgraded by migrations (added columns go last). Schema-relative
+queries therefore list the columns explicitly.
+"""
+
+PROJECT_TABLE_COLUMNS: dict[str, tuple[str, ...]] = {
+    "folders": (
+        "id",
+        "name",
+        "label",
+        "folder_type",
+        "parent_id",
+        "thumbnail_id",
+        "attrib",
+        "data",
+        "status",
+        "tags",
+        "active",
+        "created_at",
+        "updated_at",
+        "created_by",
+        "updated_by",
+        "creation_order",
+    ),
+    "tasks": (
+        "id",
+        "name",
+        "label",
+        "folder_id",
+        "task_type",
+        "assignees",
+        "thumbnail_id",
+        "attrib",
+        "data",
+        "active",
+        "status",
+        "tags",
+        "created_at",
+        "updated_at",
+        "created_by",
+        "updated_by",
+        "creation_order",
+    ),
+    "products": (
+        "id",
+        "name",
+        "folder_id",
+        "product_type",
+        "product_base_type",
+        "attrib",
+        "data",
+        "active",
+        "status",
+        "tags",
+        "created_at",
+        "updated_at",
+        "created_by",
+        "updated_by",
+        "creation_order",
+    ),
+    "versions": (
+        "id",
+        "version",
+        "product_id",
+        "task_id",
+        "thumbnail_id",
+        "author",
+        "attrib",
+        "data",
+        "active",
+        "status",
+        "tags",
+        "created_at",
+        "updated_at",
+        "created_by",
+        "updated_by",
+        "creation_order",
+    ),
+    "representations": (
+        "id",
+        "name",
+        "version_id",
+        "files",
+        "attrib",
+        "data",
+        "traits",
+        "active",
+        "status",
+        "tags",
+        "created_at",
+        "updated_at",
+        "created_by",
+        "updated_by",
+        "creation_order",
+    ),
+    "workfiles": (
+        "id",
+        "path",
+        "task_id",
+        "thumbnail_id",
+        "attrib",
+        "data",
+        "active",
+        "status",
+        "tags",
+        "created_at",
+        "updated_at",
+        "created_by",
+        "updated_by",
+        "creation_order",
+    ),
+}
+
+
+def table_columns(table: str, alias: str | None = None) -> str:
+    """Return the columns of a project table as a `SELECT` list
+
+    Use instead of `alias.*` in schema-relative queries.
+    """
+    prefix = alias or table
+    return ", ".join(f"{prefix}.{col}" for col in PROJECT_TABLE_COLUMNS[table])
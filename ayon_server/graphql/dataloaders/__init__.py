@@ -7,10 +7,10 @@ need for access control.
 from typing import Any, NewType
 
 from ayon_server.exceptions import AyonException
+from ayon_server.graphql.columns import table_columns
 from ayon_server.lib.postgres import Postgres
 
 # from ayon_server.logging import logger
-from ayon_server.utils import SQLTool
 
 KeyType = NewType("KeyType", tuple[str, str])
 KeysType = NewType("KeysType", list[KeyType])
@@ -33,33 +33,36 @@ async def folder_loader(keys: list[KeyType]) -> list[dict[str, Any] | None]:
 
     result_dict: dict[KeyType, Any] = dict.fromkeys(keys)
     project_name = get_project_name(keys)
+    ids = [k[1] for k in keys]
 
     query = f"""
         SELECT
-            folders.*,
+            {table_columns("folders")},
             hierarchy.path AS path,
             pr.attrib AS project_attributes,
             ex.attrib AS inherited_attributes
         FROM
-            project_{project_name}.folders as folders
+            folders as folders
 
         LEFT JOIN
-            project_{project_name}.hierarchy as hierarchy
+            hierarchy as hierarchy
             ON hierarchy.id = folders.id
         LEFT JOIN
-            project_{project_name}.exported_attributes AS ex
+            exported_attributes AS ex
             ON folders.parent_id = ex.folder_id
         INNER JOIN
             public.projects AS pr
-            ON pr.name ILIKE '{project_name}'
+            ON pr.name ILIKE $2
 
-        WHERE folders.id IN {SQLTool.id_array([k[1] for k in keys])}
+        WHERE folders.id = ANY($1::uuid[])
 
         GROUP BY
             folders.id, hierarchy.path, pr.attrib, ex.attrib
     """
 
-    async for record in Postgres.iterate(query):
+    async for record in Postgres.iterate(
+        query, ids, project_name, project_name=project_name
+    ):
         key: KeyType = KeyType((project_name, str(record["id"])))
         result_dict[key] = record
     return [result_dict[k] for k in keys]
@@ -75,18 +78,19 @@ async def product_loader(keys: list[KeyType]) -> list[dict[str, Any] | None]:
 
     result_dict = dict.fromkeys(keys)
     project_name = get_project_name(keys)
+    ids = [k[1] for k in keys]
 
     query = f"""
         SELECT
-            products.*,
+            {table_columns("products")},
             hierarchy.path AS _folder_path
-        FROM project_{project_name}.products AS products
-        JOIN project_{project_name}.hierarchy AS hierarchy
+        FROM products AS products
+        JOIN hierarchy AS hierarchy
         ON hierarchy.id = products.folder_id
-        WHERE products.id IN {SQLTool.id_array([k[1] for k in keys])}
+        WHERE products.id = ANY($1::uuid[])
         """
 
-    async for record in Postgres.iterate(query):
+    async for record in Postgres.iterate(query, ids, project_name=project_name):
         key: KeyType = KeyType((project_name, str(record["id"])))
         result_dict[key] = record
     return [result_dict[k] for k in keys]
@@ -102,24 +106,25 @@ async def task_loader(keys: list[KeyType]) -> list[dict[str, Any] | None]:
 
     result_dict = dict.fromkeys(keys)
     project_name = get_project_name(keys)
+    ids = [k[1] for k in keys]
 
     query = f"""
         SELECT
-            tasks.*,
+            {table_columns("tasks")},
             pf.attrib AS inherited_attributes,
             hierarchy.path AS _folder_path
-        FROM project_{project_name}.tasks as tasks
+        FROM tasks as tasks
 
-        JOIN project_{project_name}.exported_attributes AS pf
+        JOIN exported_attributes AS pf
         ON tasks.folder_id = pf.folder_id
 
-        JOIN project_{project_name}.hierarchy AS hierarchy
+        JOIN hierarchy AS hierarchy
         ON hierarchy.id = tasks.folder_id
 
-        WHERE tasks.id IN {SQLTool.id_array([k[1] for k in keys])}
+        WHERE tasks.id = ANY($1::uuid[])
         """
 
-    async for record in Postgres.iterate(query):
+    async for record in Postgres.iterate(query, ids, project_name=project_name):
         key: KeyType = KeyType((project_name, str(record["id"])))
         result_dict[key] = record
     return [result_dict[k] for k in keys]
@@ -137,24 +142,25 @@ async def workfile_loader(keys: list[KeyType]) -> list[dict[str, Any] | None]:
 
     result_dict = dict.fromkeys(keys)
     project_name = get_project_name(keys)
+    ids = [k[1] for k in keys]
 
     query = f"""
         SELECT
-            workfiles.*,
+            {table_columns("workfiles")},
             tasks.name AS _task_name,
             hierarchy.path AS _folder_path
         FROM
-            project_{project_name}.workfiles
-        JOIN project_{project_name}.tasks AS tasks
+            workfiles
+        JOIN tasks AS tasks
         ON tasks.id = workfiles.task_id
 
-        JOIN project_{project_name}.hierarchy AS hierarchy
+        JOIN hierarchy AS hierarchy
         ON hierarchy.id = tasks.folder_id
 
-        WHERE workfiles.id IN {SQLTool.id_array([k[1] for k in keys])}
+        WHERE workfiles.id = ANY($1::uuid[])
         """
 
-    async for record in Postgres.iterate(query):
+    async for record in Postgres.iterate(query, ids, project_name=project_name):
         key: KeyType = KeyType((project_name, str(record["id"])))
         result_dict[key] = record
     return [result_dict[k] for k in keys]
@@ -170,36 +176,36 @@ async def version_loader(keys: list[KeyType]) -> list[dict[str, Any] | None]:
 
     result_dict = dict.fromkeys(keys)
     project_name = get_project_name(keys)
+    ids = [k[1] for k in keys]
 
     query = f"""
         WITH reviewables AS (
-            SELECT entity_id FROM project_{project_name}.activity_feed
+            SELECT entity_id FROM activity_feed
             WHERE entity_type = 'version'
             AND activity_type = 'reviewable'
         ),
 
         hero_versions AS (
-            SELECT version.id id, hero_version.id AS hero_version_id
-            FROM project_{project_name}.versions AS version
-            JOIN project_{project_name}.versions AS hero_version
-            ON hero_version.product_id = version.product_id
-            AND hero_version.version < 0
-            AND ABS(hero_version.version) = version.version
+            SELECT version.id id, l.hero_id AS hero_version_id
+            FROM version_list AS l
+            JOIN versions AS version
+            ON version.product_id = l.product_id
+            AND version.version = l.hero_version
         )
 
         SELECT
-            versions.*,
+            {table_columns("versions")},
             hero_versions.hero_version_id AS hero_version_id,
             hierarchy.path AS _folder_path,
             products.name AS _product_name,
             reviewables.entity_id IS NOT NULL AS has_reviewables
         FROM
-            project_{project_name}.versions AS versions
+            versions AS versions
 
-        JOIN project_{project_name}.products AS products
+        JOIN products AS products
         ON products.id = versions.product_id
 
-        JOIN project_{project_name}.hierarchy AS hierarchy
+        JOIN hierarchy AS hierarchy
         ON hierarchy.id = products.folder_id
 
         LEFT JOIN hero_versions
@@ -208,10 +214,10 @@ async def version_loader(keys: list[KeyType]) -> list[dict[str, Any] | None]:
         LEFT JOIN reviewables
         ON reviewables.entity_id = versions.id
 
-        WHERE versions.id IN {SQLTool.id_array([k[1] for k in keys])}
+        WHERE versions.id = ANY($1::uuid[])
         """
 
-    async for record in Postgres.iterate(query):
+    async for record in Postgres.iterate(query, ids, project_name=project_name):
         key: KeyType = KeyType((project_name, str(record["id"])))
         result_dict[key] = record
     return [result_dict[k] for k in keys]
@@ -224,25 +230,25 @@ async def latest_version_loader(keys: list[KeyType]) -> list[dict[str, Any] | No
 
     result_dict = dict.fromkeys(keys)
     project_name = get_project_name(keys)
+    ids = [k[1] for k in keys]
 
     query = f"""
         WITH reviewables AS (
-            SELECT entity_id FROM project_{project_name}.activity_feed
+            SELECT entity_id FROM activity_feed
             WHERE entity_type = 'version'
             AND activity_type = 'reviewable'
         ),
 
         hero_versions AS (
-            SELECT version.id id, hero_version.id AS hero_version_id
-            FROM project_{project_name}.versions AS version
-            JOIN project_{project_name}.versions AS hero_version
-            ON hero_version.product_id = version.product_id
-            AND hero_version.version < 0
-            AND ABS(hero_version.version) = version.version
+            SELECT version.id id, l.hero_id AS hero_version_id
+            FROM version_list AS l
+            JOIN versions AS version
+            ON version.product_id = l.product_id
+            AND version.version = l.hero_version
         )
 
         SELECT
-            v.*,
+            {table_columns("versions", "v")},
             hero_versions.hero_version_id AS hero_version_id,
             hierarchy.path AS _folder_path,
             p.name AS _product_name,
@@ -250,12 +256,12 @@ async def latest_version_loader(keys: list[KeyType]) -> list[dict[str, Any] | No
                 SELECT 1 FROM reviewables WHERE entity_id = v.id
             ) AS has_reviewables
         FROM
-            project_{project_name}.versions AS v
+            versions AS v
 
-        JOIN project_{project_name}.products AS p
+        JOIN products AS p
         ON p.id = v.product_id
 
-        JOIN project_{project_name}.hierarchy AS hierarchy
+        JOIN hierarchy AS hierarchy
         ON hierarchy.id = p.folder_id
 
         LEFT JOIN hero_versions
@@ -263,12 +269,12 @@ async def latest_version_loader(keys: list[KeyType]) -> list[dict[str, Any] | No
 
         WHERE v.id IN (
             SELECT l.ids[array_upper(l.ids, 1)]
-            FROM project_{project_name}.version_list as l
-            WHERE l.product_id IN {SQLTool.id_array([k[1] for k in keys])}
+            FROM version_list as l
+            WHERE l.product_id = ANY($1::uuid[])
         )
         """
 
-    async for record in Postgres.iterate(query):
+    async for record in Postgres.iterate(query, ids, project_name=project_name):
         key: KeyType = KeyType((project_name, str(record["product_id"])))
         result_dict[key] = record
     return [result_dict[k] for k in keys]
@@ -284,30 +290,31 @@ async def representation_loader(keys: list[KeyType]) -> list[dict[str, Any] | No
 
     result_dict = dict.fromkeys(keys)
     project_name = get_project_name(keys)
+    ids = [k[1] for k in keys]
 
     query = f"""
         SELECT
-            r.*,
+            {table_columns("representations", "r")},
             hierarchy.path AS _folder_path,
             p.name AS _product_name,
             v.version AS _version_number
 
         FROM
-            project_{project_name}.representations AS r
+            representations AS r
 
-        JOIN project_{project_name}.versions AS v
+        JOIN versions AS v
         ON v.id = r.version_id
 
-        JOIN project_{project_name}.products AS p
+        JOIN products AS p
         ON p.id = v.product_id
 
-        JOIN project_{project_name}.hierarchy AS hierarchy
+        JOIN hierarchy AS hierarchy
         ON hierarchy.id = p.folder_id
 
-        WHERE r.id IN {SQLTool.id_array([k[1] for k in keys])}
+        WHERE r.id = ANY($1::uuid[])
         """
 
-    async for record in Postgres.iterate(query):
+    async for record in Postgres.iterate(query, ids, project_name=project_name):
         key: KeyType = KeyType((project_name, str(record["id"])))
         result_dict[key] = record
     return [result_dict[k] for k in keys]
@@ -319,7 +326,7 @@ async def user_loader(keys: list[str]) -> list[dict[str, Any] | None]:
     # logger.trace(f"Using user_loader for {len(keys)} keys")
 
     result_dict = dict.fromkeys(keys)
-    query = f"SELECT * FROM public.users WHERE name IN {SQLTool.array(keys)}"
-    async for record in Postgres.iterate(query):
+    query = "SELECT * FROM public.users WHERE name = ANY($1::varchar[])"
+    async for record in Postgres.iterate(query, keys):
         result_dict[record["name"]] = record
     return [result_dict[k] for k in keys]
@@ -1,4 +1,4 @@
-from collections.abc import Callable, Generator
+from collections.abc import Callable, Generator, Iterable
 from dataclasses import dataclass
 from enum import Enum
 from typing import Annotated, Any, Literal
@@ -172,12 +172,19 @@ async def resolve[R](
     query: str,
     *,
     project_name: str | None = None,
+    schema_relative: bool = False,
     first: int | None = None,
     last: int | None = None,
     context: dict[str, Any] | None = None,
     order_by: list[str] | None = None,
+    args: Iterable[Any] = (),
 ) -> R:
-    """Return a connection object from a query."""
+    """Return a connection object from a query.
+
+    Query arguments (see `SQLArgs`) may be provided using `args`.
+    Schema-relative queries (referencing project tables without
+    the schema name) need `schema_relative` and `project_name`.
+    """
 
     if first is not None:
         count = first
@@ -188,7 +195,11 @@ async def resolve[R](
 
     edges: list[Any] = []
     # Now execute the original query for the actual data
-    async for record in Postgres.iterate(query):
+    async for record in Postgres.iterate(
+        query,
+        *args,
+        project_name=project_name if schema_relative else None,
+    ):
         # Create a standard dictionary from the record
         record_dict = dict(record)
 
@@ -254,24 +265,23 @@ async def resolve[R](
 
 
 def get_has_links_conds(
-    project_name: str,
     id_field: str,
     filter: HasLinksFilter | None,
 ) -> list[str]:
     if filter is None:
         return []
     if filter == HasLinksFilter.IN:
-        return [f"{id_field} IN (SELECT output_id FROM project_{project_name}.links)"]
+        return [f"{id_field} IN (SELECT output_id FROM links)"]
     if filter == HasLinksFilter.OUT:
-        return [f"{id_field} IN (SELECT input_id FROM project_{project_name}.links)"]
+        return [f"{id_field} IN (SELECT input_id FROM links)"]
     if filter == HasLinksFilter.ANY:
         return [
-            f"({id_field} IN (SELECT input_id FROM project_{project_name}.links) OR "
-            f"{id_field} IN (SELECT output_id FROM project_{project_name}.links))",
+            f"({id_field} IN (SELECT input_id FROM links) OR "
+            f"{id_field} IN (SELECT output_id FROM links))",
         ]
     if filter == HasLinksFilter.BOTH:
         return [
-            f"{id_field} IN (SELECT output_id FROM project_{project_name}.links)",
-            f"{id_field} IN (SELECT input_id FROM project_{project_name}.links)",
+            f"{id_field} IN (SELECT output_id FROM links)",
+            f"{id_field} IN (SELECT input_id FROM links)",
         ]
     raise ValueError("Wrong has_links value")
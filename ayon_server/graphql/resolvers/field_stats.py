@@ -1,4 +1,5 @@
 import json
+from collections.abc import Iterable
 from enum import Enum
 from typing import Any
 
@@ -204,11 +205,21 @@ def generate_specific_stats_columns(
     return ",\n    ".join(list(stats_fields))
 
 
-async def generate_field_stats(query: str) -> list[ColumnStats]:
-    """Calculates field stats from prepared query."""
+async def generate_field_stats(
+    query: str,
+    args: Iterable[Any] = (),
+    *,
+    project_name: str | None = None,
+) -> list[ColumnStats]:
+    """Calculates field stats from prepared query.
+
+    Schema-relative queries need the `project_name`.
+    """
     grouped_data: dict[str, dict[str, Any]] = {}
+    db_result = None
     try:
-        db_result = await Postgres.fetchrow(query)
+        async for record in Postgres.iterate(query, *args, project_name=project_name):
+            db_result = record
     except Exception:
         logger.warning(f"Failed to fetch {query}")
         raise
@@ -4,6 +4,7 @@ from typing import Annotated, cast
 from ayon_server.entities import ProjectEntity
 from ayon_server.entities.core import attribute_library
 from ayon_server.exceptions import BadRequestException, NotFoundException
+from ayon_server.graphql.columns import table_columns
 from ayon_server.graphql.connections import FoldersConnection
 from ayon_server.graphql.edges import FolderEdge
 from ayon_server.graphql.nodes.folder import FolderNode
@@ -15,7 +16,7 @@ from ayon_server.types import (
     validate_status_list,
     validate_type_name_list,
 )
-from ayon_server.utils import EntityID, SQLTool, slugify
+from ayon_server.utils import EntityID, SQLArgs, SQLTool, slugify
 
 from .common import (
     ARGAfter,
@@ -136,25 +137,26 @@ async def get_folders(
     # SQL
     #
 
+    args = SQLArgs()
     sql_cte = []
     sql_columns = [
-        "folders.*",
+        table_columns("folders"),
         "hierarchy.path AS path",
         "pr.attrib AS project_attributes",
         "ex.attrib AS inherited_attributes",
     ]
 
     sql_joins = [
-        f"""
-        LEFT JOIN project_{project_name}.exported_attributes AS ex
+        """
+        LEFT JOIN exported_attributes AS ex
         ON folders.parent_id = ex.folder_id
         """,
         f"""
         INNER JOIN public.projects AS pr
-        ON pr.name ILIKE '{project_name}'
+        ON pr.name ILIKE {args.add(project_name)}
         """,
-        f"""
-        INNER JOIN project_{project_name}.hierarchy AS hierarchy
+        """
+        INNER JOIN hierarchy AS hierarchy
         ON folders.id = hierarchy.id
         """,
     ]
@@ -173,8 +175,8 @@ async def get_folders(
     if (has_children is not None) or fields.has_any("childount", "hasChildren"):
         sql_columns.append("COUNT(children.id) AS child_count")
         sql_joins.append(
-            f"""
-            LEFT JOIN project_{project_name}.folders AS children
+            """
+            LEFT JOIN folders AS children
             ON folders.id = children.parent_id
             """
         )
@@ -182,8 +184,8 @@ async def get_folders(
     if (has_products is not None) or fields.has_any("productCount", "hasProducts"):
         sql_columns.append("COUNT(products.id) AS product_count")
         sql_joins.append(
-            f"""
-            LEFT JOIN project_{project_name}.products AS products
+            """
+            LEFT JOIN products AS products
             ON folders.id = products.folder_id
             """
         )
@@ -191,8 +193,8 @@ async def get_folders(
     if (has_tasks is not None) or fields.has_any("taskCount", "hasTasks"):
         sql_columns.append("COUNT(tasks.id) AS task_count")
         sql_joins.append(
-            f"""
-            LEFT JOIN project_{project_name}.tasks AS tasks
+            """
+            LEFT JOIN tasks AS tasks
             ON folders.id = tasks.folder_id
             """
         )
@@ -202,17 +204,17 @@ async def get_folders(
     if ids is not None:
         if fields.has_any("totalFolderCount"):
             sql_columns.append(
-                f"""
-                (SELECT COUNT(*) FROM project_{project_name}.hierarchy h2
+                """
+                (SELECT COUNT(*) FROM hierarchy h2
                 WHERE starts_with(h2.path, hierarchy.path || '/')) AS total_folder_count
                 """
             )
 
         if fields.has_any("totalTaskCount"):
             sql_columns.append(
-                f"""
-                (SELECT COUNT(*) FROM project_{project_name}.tasks t
-                JOIN project_{project_name}.hierarchy h2 ON t.folder_id = h2.id
+                """
+                (SELECT COUNT(*) FROM tasks t
+                JOIN hierarchy h2 ON t.folder_id = h2.id
                 WHERE h2.path = hierarchy.path
                 OR starts_with(h2.path, hierarchy.path || '/')) AS total_task_count
                 """
@@ -220,9 +222,9 @@ async def get_folders(
 
         if fields.has_any("totalProductCount"):
             sql_columns.append(
-                f"""
-                (SELECT COUNT(*) FROM project_{project_name}.products p
-                JOIN project_{project_name}.hierarchy h2 ON p.folder_id = h2.id
+                """
+                (SELECT COUNT(*) FROM products p
+                JOIN hierarchy h2 ON p.folder_id = h2.id
                 WHERE h2.path = hierarchy.path
                 OR starts_with(h2.path, hierarchy.path || '/')) AS total_product_count
                 """
@@ -230,10 +232,10 @@ async def get_folders(
 
         if fields.has_any("totalVersionCount"):
             sql_columns.append(
-                f"""
-                (SELECT COUNT(*) FROM project_{project_name}.versions v
-                JOIN project_{project_name}.products p ON v.product_id = p.id
-                JOIN project_{project_name}.hierarchy h2 ON p.folder_id = h2.id
+                """
+                (SELECT COUNT(*) FROM versions v
+                JOIN products p ON v.product_id = p.id
+                JOIN hierarchy h2 ON p.folder_id = h2.id
                 WHERE h2.path = hierarchy.path
                 OR starts_with(h2.path, hierarchy.path || '/')) AS total_version_count
                 """
@@ -241,15 +243,15 @@ async def get_folders(
 
     if fields.any_endswith("hasReviewables"):
         sql_cte.append(
-            f"""
+            """
             reviewables AS (
                 SELECT p.folder_id AS folder_id
-                FROM project_{project_name}.activity_feed af
-                INNER JOIN project_{project_name}.versions v
+                FROM activity_feed af
+                INNER JOIN versions v
                 ON af.entity_id = v.id
                 AND af.entity_type = 'version'
                 AND  af.activity_type = 'reviewable'
-                INNER JOIN project_{project_name}.products p
+                INNER JOIN products p
                 ON p.id = v.product_id
             )
             """
@@ -271,23 +273,23 @@ async def get_folders(
 
         sql_cte.extend(
             [
-                f"""
+                """
             folder_closure AS (
                 SELECT id AS ancestor_id, id AS descendant_id
-                FROM project_{project_name}.folders
+                FROM folders
                 UNION ALL
                 SELECT fc.ancestor_id, f.id AS descendant_id
                 FROM folder_closure fc
-                JOIN project_{project_name}.folders f
+                JOIN folders f
                 ON f.parent_id = fc.descendant_id
             )
             """,
-                f"""
+                """
             folder_with_versions AS (
                 SELECT DISTINCT fc.ancestor_id
                 FROM folder_closure fc
-                JOIN project_{project_name}.products p ON p.folder_id = fc.descendant_id
-                JOIN project_{project_name}.versions v ON v.product_id = p.id
+                JOIN products p ON p.folder_id = fc.descendant_id
+                JOIN versions v ON v.product_id = p.id
             )
             """,
             ]
@@ -304,7 +306,7 @@ async def get_folders(
 
     if fields.any_endswith("latestComments"):
         sql_cte.append(
-            f"""
+            """
             comments AS (
                 SELECT
                     entity_id,
@@ -328,7 +330,7 @@ async def get_folders(
                             PARTITION BY entity_id
                             ORDER BY created_at DESC
                         ) AS rn
-                    FROM project_{project_name}.activity_feed
+                    FROM activity_feed
                     WHERE activity_type = 'comment'
                     AND entity_type = 'folder'
                     AND reference_type = 'origin'
@@ -358,22 +360,22 @@ async def get_folders(
             sql_cte.append(
                 f"""
                 top_folder_paths AS (
-                    SELECT id, path FROM project_{project_name}.hierarchy
-                    WHERE id IN {SQLTool.id_array(ids)}
+                    SELECT id, path FROM hierarchy
+                    WHERE id = ANY({args.ids(ids)})
                 )
                 """
             )
 
             sql_cte.append(
-                f"""
+                """
                 child_folder_ids AS (
-                    SELECT id FROM project_{project_name}.hierarchy
+                    SELECT id FROM hierarchy
                     WHERE EXISTS (
                         SELECT 1 FROM top_folder_paths
-                        WHERE project_{project_name}.hierarchy.path
+                        WHERE hierarchy.path
                         LIKE top_folder_paths.path || '/%'
                     )
-                    OR project_{project_name}.hierarchy.id
+                    OR hierarchy.id
                     IN (SELECT id FROM top_folder_paths)
                 )
                 """
@@ -382,7 +384,7 @@ async def get_folders(
             sql_conditions.append("folders.id IN (SELECT id FROM child_folder_ids)")
 
         else:
-            sql_conditions.append(f"folders.id IN {SQLTool.id_array(ids)}")
+            sql_conditions.append(f"folders.id = ANY({args.ids(ids)})")
 
     if parent_id is not None:
         # Still used. do not remove!
@@ -400,19 +402,19 @@ async def get_folders(
             sql_cte.append(
                 f"""
                 top_folder_paths AS (
-                    SELECT id, path FROM project_{project_name}.hierarchy
-                    WHERE id IN {SQLTool.id_array(parent_ids)}
+                    SELECT id, path FROM hierarchy
+                    WHERE id = ANY({args.ids(parent_ids)})
                 )
                 """
             )
 
             sql_cte.append(
-                f"""
+                """
                 child_folder_ids AS (
-                    SELECT id FROM project_{project_name}.hierarchy
+                    SELECT id FROM hierarchy
                     WHERE EXISTS (
                         SELECT 1 FROM top_folder_paths
-                        WHERE project_{project_name}.hierarchy.path
+                        WHERE hierarchy.path
                         LIKE top_folder_paths.path || '/%'
                     )
                 )
@@ -430,7 +432,7 @@ async def get_folders(
 
             if pids_set:
                 pids_list = cast("list[str]", list(pids_set))
-                lconds.append(f"folders.parent_id IN {SQLTool.id_array(pids_list)}")
+                lconds.append(f"folders.parent_id = ANY({args.ids(pids_list)})")
             if lconds:
                 sql_conditions.append(f"({' OR '.join(lconds)})")
 
@@ -438,7 +440,7 @@ async def get_folders(
         if not folder_types:
             return FoldersConnection()
         validate_type_name_list(folder_types)
-        sql_conditions.append(f"folders.folder_type in {SQLTool.array(folder_types)}")
+        sql_conditions.append(f"folders.folder_type = ANY({args.array(folder_types)})")
 
     if name is not None:
         validate_name(name)
@@ -448,17 +450,17 @@ async def get_folders(
         if not names:
             return FoldersConnection()
         validate_name_list(names)
-        sql_conditions.append(f"folders.name in {SQLTool.array(names)}")
+        sql_conditions.append(f"folders.name = ANY({args.array(names)})")
 
     if statuses is not None:
         if not statuses:
             return FoldersConnection()
         validate_status_list(statuses)
-        sql_conditions.append(f"status IN {SQLTool.array(statuses)}")
+        sql_conditions.append(f"status = ANY({args.array(statuses)})")
 
     if tags:
         validate_name_list(tags)
-        sql_conditions.append(f"tags @> {SQLTool.array(tags, curly=True)}")
+        sql_conditions.append(f"tags @> {args.array(tags, 'varchar[]')}")
 
     if has_products is not None:
         sql_having.append(
@@ -474,15 +476,13 @@ async def get_folders(
         sql_having.append("COUNT(tasks.id) > 0" if has_tasks else "COUNT(tasks.id) = 0")
 
     if has_links is not None:
-        sql_conditions.extend(
-            get_has_links_conds(project_name, "folders.id", has_links)
-        )
+        sql_conditions.extend(get_has_links_conds("folders.id", has_links))
 
     if paths is not None:
         if not paths:
             return FoldersConnection()
-        paths = [p.strip("/").replace("'", "''") for p in paths]
-        sql_conditions.append(f"hierarchy.path IN {SQLTool.array(paths)}")
+        paths = [p.strip("/") for p in paths]
+        sql_conditions.append(f"hierarchy.path = ANY({args.array(paths)})")
 
     if path_ex is not None:
         path_ex = path_ex.replace("'", "''")
@@ -504,8 +504,8 @@ async def get_folders(
         validate_name_list(assignees)
         cond = f"""
             folders.id IN (
-                SELECT folder_id FROM project_{project_name}.tasks
-                WHERE assignees @> {SQLTool.array(assignees, curly=True)}
+                SELECT folder_id FROM tasks
+                WHERE assignees @> {args.array(assignees, "varchar[]")}
             )
         """
         sql_conditions.append(cond)
@@ -553,6 +553,7 @@ async def get_folders(
             fq,
             column_whitelist=column_whitelist,
             table_prefix="folders",
+            args=args,
             column_map={
                 "attrib": "(pr.attrib || coalesce(ex.attrib, '{}'::jsonb ) || folders.attrib)",  # noqa: E501
             },
@@ -583,6 +584,7 @@ async def get_folders(
             fq,
             column_whitelist=column_whitelist,
             table_prefix="tasks",
+            args=args,
             column_map={
                 "attrib": "(coalesce(ex.attrib, '{}'::jsonb ) || tasks.attrib)"
             },
@@ -593,10 +595,10 @@ async def get_folders(
                 f"""
                 filtered_tasks AS (
                     SELECT DISTINCT tasks.folder_id
-                    FROM project_{project_name}.tasks
+                    FROM tasks
                     INNER JOIN public.projects AS pr
-                        ON pr.name ILIKE '{project_name}'
-                    LEFT JOIN project_{project_name}.exported_attributes AS ex
+                        ON pr.name ILIKE {args.add(project_name)}
+                    LEFT JOIN exported_attributes AS ex
                         ON tasks.folder_id = ex.folder_id
                     WHERE {tfilter}
                 )
@@ -654,6 +656,7 @@ async def get_folders(
             after,
             last,
             before,
+            args=args,
         )
         sql_conditions.append(paging_conds)
 
@@ -727,7 +730,7 @@ async def get_folders(
         {cte}
         {raw_data_start}
         SELECT {cursor}, {", ".join(sql_columns)}
-        FROM project_{project_name}.folders AS folders
+        FROM folders AS folders
         {" ".join(sql_joins)}
         {SQLTool.conditions(sql_conditions)}
         GROUP BY {",".join(sql_group_by)}
@@ -741,7 +744,7 @@ async def get_folders(
     # logger.debug(f"Folder query\n{query}")
 
     if stats_select_clause:
-        field_stats = await generate_field_stats(query)
+        field_stats = await generate_field_stats(query, args, project_name=project_name)
 
         return FoldersConnection(edges=[], field_stats=field_stats)
 
@@ -751,10 +754,12 @@ async def get_folders(
         FolderNode,
         query,
         project_name=project_name,
+        schema_relative=True,
         first=first,
         last=last,
         order_by=order_by,
         context=info.context,
+        args=args,
     )
 
 
@@ -1,6 +1,7 @@
 # import time
 
 from collections.abc import Iterable
+from typing import Any
 
 from ayon_server.config import ayonconfig
 from ayon_server.entities import UserEntity
@@ -17,7 +18,6 @@ from ayon_server.graphql.resolvers.common import (
 from ayon_server.graphql.types import Info
 from ayon_server.helpers.users import get_manager_names
 from ayon_server.lib.postgres import Postgres
-from ayon_server.logging import logger
 from ayon_server.types import validate_name_list, validate_user_name_list
 from ayon_server.utils import SQLTool
 
@@ -192,55 +192,85 @@ async def get_kanban(
     if not project_data:
         return KanbanConnection(edges=[])
 
-    # Sub-query conditions
-
-    sub_query_conds = []
-
-    if task_ids:
-        # id_array sanitizes the input
-        c = f"t.id IN {SQLTool.id_array(task_ids)}"
-        sub_query_conds.append(c)
-
     umap = await get_accessible_users(user, project_names=project_names)
 
-    union_queries = []
+    # Assignees each project is restricted to (None means no restriction)
+
+    scope: dict[str, list[str] | None] = {}
     for pdata in project_data:
         project_name = pdata["name"]
-        project_code = pdata["code"]
-        project_schema = f"project_{project_name}"
-        project_priority = pdata.get("priority") or DEFAULT_PRIORITY
 
-        ucond = ""
         if umap is None:
-            if assignees_any:
-                # assignees list is already sanitized at this point
-                ucond = f"t.assignees && {SQLTool.array(assignees_any, curly=True)}"
+            # assignees list is already sanitized at this point
+            scope[project_name] = assignees_any or None
+            continue
+
+        try:
+            project_permissions = user.permissions(project_name)
+        except ForbiddenException:
+            continue
+
+        if project_permissions.read.enabled:
+            # user has restricted read access.
+            # limit assignees to themselves
+
+            users = {user.name}
+
         else:
-            try:
-                project_permissions = user.permissions(project_name)
-            except ForbiddenException:
-                continue
+            users = umap.get(project_name, set())
+            if assignees_any:
+                users = users.intersection(assignees_any)
 
-            if project_permissions.read.enabled:
-                # user has restricted read access.
-                # limit assignees to themselves
+        if not users:
+            # No accessible users, skip this project
+            continue
+        scope[project_name] = list(users)
 
-                users = {user.name}
+    if not scope:
+        return KanbanConnection(edges=[])
 
-            else:
-                users = umap.get(project_name, set())
-                if assignees_any:
-                    users = users.intersection(assignees_any)
+    #
+    # Find the tasks using the cross-project task index
+    #
+
+    conds = [
+        """(
+            jsonb_typeof(s.value) != 'array'
+            OR ti.assignees && ARRAY(SELECT jsonb_array_elements_text(s.value))
+        )""",
+    ]
+    args: list[Any] = [scope, last]
+    if task_ids:
+        args.append(task_ids)
+        conds.append(f"ti.task_id = ANY(${len(args)}::uuid[])")
+
+    index_query = f"""
+        SELECT ti.project_name, ti.task_id
+        FROM public.task_index ti
+        INNER JOIN jsonb_each($1::jsonb) s ON ti.project_name = s.key
+        {SQLTool.conditions(conds)}
+        ORDER BY ti.due_date DESC NULLS LAST, ti.updated_at DESC
+        LIMIT $2
+    """
 
-            if users:
-                ucond = f"t.assignees && {SQLTool.array(list(users), curly=True)}"
-            else:
-                # No accessible users, skip this project
-                continue
+    found: dict[str, list[str]] = {}
+    for row in await Postgres.fetch(index_query, *args):
+        found.setdefault(row["project_name"], []).append(row["task_id"])
 
-        sq_conds = sub_query_conds.copy()
-        if ucond:
-            sq_conds.append(ucond)
+    if not found:
+        return KanbanConnection(edges=[])
+
+    # Load the board data of the found tasks.
+    # Only projects with matching tasks are queried.
+
+    union_queries = []
+    for pdata in project_data:
+        project_name = pdata["name"]
+        if project_name not in found:
+            continue
+        project_code = pdata["code"]
+        project_schema = f"project_{project_name}"
+        project_priority = pdata.get("priority") or DEFAULT_PRIORITY
 
         uq = f"""
             SELECT
@@ -277,18 +307,10 @@ async def get_kanban(
                 FROM {project_schema}.tasks t
                 JOIN {project_schema}.folders f ON f.id = t.folder_id
                 JOIN {project_schema}.exported_attributes h ON h.folder_id = f.id
-                {SQLTool.conditions(sq_conds)}
+                WHERE t.id IN {SQLTool.id_array(found[project_name])}
         """
         union_queries.append(uq)
 
-    if not union_queries:
-        # This should not normally happen, but if it does,
-        # return an empty result instead of an error
-        logger.warning(
-            "No union queries generated for Kanban fetch, returning empty result"
-        )
-        return KanbanConnection(edges=[])
-
     unions = " UNION ALL ".join(union_queries)
     cursor = "updated_at"
 
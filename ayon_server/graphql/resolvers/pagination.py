@@ -1,9 +1,10 @@
 import re
 from base64 import b64decode, b64encode
+from decimal import Decimal
 from typing import Any
 
 from ayon_server.exceptions import BadRequestException
-from ayon_server.utils import json_dumps, json_loads
+from ayon_server.utils import SQLArgs, json_dumps, json_loads
 
 # Top-level non-nullable fields.
 # We don't need COALESCE for these.
@@ -40,6 +41,8 @@ def create_pagination(
     after: str | None = None,
     last: int | None = None,
     before: str | None = None,
+    *,
+    args: SQLArgs | None = None,
 ) -> tuple[str, str, str]:
     """
     Generates a pagination SQL query for a GraphQL resolver.
@@ -55,8 +58,16 @@ def create_pagination(
         meant to be combined with other conditions using `AND`.
     - `cursor`: A set of virtual columns in the `SELECT` section,
         which the resolver uses to construct the actual cursor.
+
+    If `args` is provided, cursor values and the limit are passed
+    as query arguments instead of literals.
     """
 
+    def value(literal: str, val: Any, cast: str) -> str:
+        if args is None:
+            return literal
+        return args.add(val, cast)
+
     cursor_arr = []
     ordering_arr = []
     decoded_cursor = decode_cursor(before or after)
@@ -76,20 +87,21 @@ def create_pagination(
             # Known non-nullable top-level field
             keys.append(f"{ob}")
             if ctype == "text":
-                val_str = str(val).replace("'", "''") if val is not None else ""
-                sql_val = f"'{val_str}'::text"
+                val_str = str(val) if val is not None else ""
+                escaped = val_str.replace("'", "''")
+                sql_val = value(f"'{escaped}'::text", val_str, "text")
             elif ctype == "timestamptz":
-                sql_val = f"'{val}'::timestamptz"
                 if not isinstance(val, str) or not re.match(
                     r"^\d{4}-\d{2}-\d{2}T[0-9:\.\+\-Z]+$", val
                 ):
                     raise BadRequestException(
                         f"Invalid value for timestamptz field: {val}"
                     )
+                sql_val = value(f"'{val}'::timestamptz", val, "timestamptz")
             else:  # numeric
                 if not isinstance(val, (int, float)):
                     raise BadRequestException(f"Invalid value for numeric field: {val}")
-                sql_val = f"{val or 0}"
+                sql_val = value(f"{val or 0}", Decimal(str(val or 0)), "numeric")
             cursor_values.append(sql_val)
             continue
 
@@ -97,18 +109,19 @@ def create_pagination(
         if isinstance(val, (int, float)):
             cast = "numeric"
             # default = "'0'"
-            sql_val = f"{val}::numeric"
+            sql_val = value(f"{val}::numeric", Decimal(str(val)), "numeric")
         elif isinstance(val, str) and re.match(
             r"^\d{4}-\d{2}-\d{2}T[0-9:\.\+\-Z]+$", val
         ):
             cast = "timestamptz"
             # default = "'1970-01-01T00:00:00Z'"
-            sql_val = f"'{val}'::timestamptz"
+            sql_val = value(f"'{val}'::timestamptz", val, "timestamptz")
         else:
             cast = "text"
             # default = "'\"\"'"
-            v_str = str(val).replace("'", "''") if val is not None else ""
-            sql_val = f"'{v_str}'::text"
+            v_str = str(val) if val is not None else ""
+            escaped = v_str.replace("'", "''")
+            sql_val = value(f"'{escaped}'::text", v_str, "text")
 
         # if is_jsonb:
         #     keys.append(f"COALESCE({ob}, {default}::jsonb)::{cast}")
@@ -138,6 +151,7 @@ def create_pagination(
 
     limit = (first or last or 500) * 2
 
-    ordering = "ORDER BY " + ", ".join(ordering_arr) + f" LIMIT {limit}"
+    limit_str = value(str(limit), limit, "integer")
+    ordering = "ORDER BY " + ", ".join(ordering_arr) + f" LIMIT {limit_str}"
     cursor = ", ".join(cursor_arr)
     return ordering, conditions, cursor
@@ -4,6 +4,7 @@ from typing import Annotated
 from ayon_server.access.utils import folder_access_list
 from ayon_server.entities import ProjectEntity
 from ayon_server.exceptions import BadRequestException, NotFoundException
+from ayon_server.graphql.columns import table_columns
 from ayon_server.graphql.connections import ProductsConnection
 from ayon_server.graphql.edges import ProductEdge
 from ayon_server.graphql.nodes.product import ProductNode
@@ -29,7 +30,7 @@ from ayon_server.types import (
     validate_status_list,
     validate_type_name_list,
 )
-from ayon_server.utils import SQLTool, slugify
+from ayon_server.utils import SQLArgs, SQLTool, slugify
 
 from .field_stats import (
     MetricTargetInput,
@@ -148,7 +149,7 @@ async def get_products(
     #
 
     sql_columns = [
-        "products.*",
+        table_columns("products"),
         "folders.id AS _folder_id",
         "folders.name AS _folder_name",
         "folders.label AS _folder_label",
@@ -166,50 +167,49 @@ async def get_products(
     ]
 
     sql_joins = [
-        f"""
-        INNER JOIN project_{project_name}.folders
+        """
+        INNER JOIN folders
         ON folders.id = products.folder_id
         """,
-        f"""
-        INNER JOIN project_{project_name}.hierarchy AS hierarchy
+        """
+        INNER JOIN hierarchy AS hierarchy
         ON folders.id = hierarchy.id
         """,
     ]
 
+    args = SQLArgs()
     sql_cte = []
     sql_conditions = []
 
     if ids is not None:
         if not ids:
             return ProductsConnection()
-        sql_conditions.append(f"products.id IN {SQLTool.id_array(ids)}")
+        sql_conditions.append(f"products.id = ANY({args.ids(ids)})")
 
     if folder_ids is not None:
         if not folder_ids:
             return ProductsConnection()
         if not include_folder_children:
-            sql_conditions.append(
-                f"products.folder_id IN {SQLTool.id_array(folder_ids)}"
-            )
+            sql_conditions.append(f"products.folder_id = ANY({args.ids(folder_ids)})")
         else:
             sql_cte.append(
                 f"""
                 top_folder_paths AS (
-                    SELECT path FROM project_{project_name}.hierarchy
-                    WHERE id IN {SQLTool.id_array(folder_ids)}
+                    SELECT path FROM hierarchy
+                    WHERE id = ANY({args.ids(folder_ids)})
                 )
                 """
             )
             sql_cte.append(
-                f"""
+                """
                 child_folder_ids AS (
-                    SELECT id FROM project_{project_name}.hierarchy
+                    SELECT id FROM hierarchy
                     WHERE EXISTS (
                         SELECT 1 FROM top_folder_paths
-                        WHERE project_{project_name}.hierarchy.path
+                        WHERE hierarchy.path
                         LIKE top_folder_paths.path || '/%'
                     )
-                    OR project_{project_name}.hierarchy.path = ANY(
+                    OR hierarchy.path = ANY(
                         SELECT path FROM top_folder_paths
                     )
                 )
@@ -230,21 +230,21 @@ async def get_products(
         if not names:
             return ProductsConnection()
         validate_name_list(names)
-        sql_conditions.append(f"products.name IN {SQLTool.array(names)}")
+        sql_conditions.append(f"products.name = ANY({args.array(names)})")
 
     if names_ci is not None:
         if not names_ci:
             return ProductsConnection()
         validate_name_list(names_ci)
         names_ci = [name.lower() for name in names_ci]
-        sql_conditions.append(f"LOWER(products.name) IN {SQLTool.array(names_ci)}")
+        sql_conditions.append(f"LOWER(products.name) = ANY({args.array(names_ci)})")
 
     if product_types is not None:
         if not product_types:
             return ProductsConnection()
         validate_type_name_list(product_types)
         sql_conditions.append(
-            f"products.product_type IN {SQLTool.array(product_types)}"
+            f"products.product_type = ANY({args.array(product_types)})"
         )
 
     if product_base_types is not None:
@@ -252,24 +252,22 @@ async def get_products(
             return ProductsConnection()
         validate_name_list(product_base_types)
         sql_conditions.append(
-            f"products.product_base_type IN {SQLTool.array(product_base_types)}"
+            f"products.product_base_type = ANY({args.array(product_base_types)})"
         )
 
     if statuses is not None:
         if not statuses:
             return ProductsConnection()
         validate_status_list(statuses)
-        sql_conditions.append(f"products.status IN {SQLTool.array(statuses)}")
+        sql_conditions.append(f"products.status = ANY({args.array(statuses)})")
     if tags is not None:
         if not tags:
             return ProductsConnection()
         validate_name_list(tags)
-        sql_conditions.append(f"products.tags @> {SQLTool.array(tags, curly=True)}")
+        sql_conditions.append(f"products.tags @> {args.array(tags, 'varchar[]')}")
 
     if has_links is not None:
-        sql_conditions.extend(
-            get_has_links_conds(project_name, "products.id", has_links)
-        )
+        sql_conditions.extend(get_has_links_conds("products.id", has_links))
 
     if name_ex is not None:
         sql_conditions.append(f"products.name ~ '{name_ex}'")
@@ -315,13 +313,13 @@ async def get_products(
         )
         sql_joins.extend(
             [
-                f"""
-                LEFT JOIN project_{project_name}.exported_attributes AS ex
+                """
+                LEFT JOIN exported_attributes AS ex
                 ON folders.parent_id = ex.folder_id
                 """,
                 f"""
                 INNER JOIN public.projects AS pr
-                ON pr.name ILIKE '{project_name}'
+                ON pr.name ILIKE {args.add(project_name)}
                 """,
             ]
         )
@@ -341,9 +339,9 @@ async def get_products(
         ]
 
         sql_cte.append(
-            f"""
+            """
             reviewables AS (
-                SELECT entity_id FROM project_{project_name}.activity_feed
+                SELECT entity_id FROM activity_feed
                 WHERE entity_type = 'version'
                 AND activity_type = 'reviewable'
             )
@@ -352,16 +350,16 @@ async def get_products(
 
         if "hero" in req_order:
             sql_cte.append(
-                f"""
+                """
                 hero_versions AS (
                     SELECT
                         distinct on (versions.product_id)
                         versions.*,
                         hero_versions.id AS hero_version_id,
                         rv.entity_id IS NOT NULL AS has_reviewables
-                    FROM project_{project_name}.versions AS versions
+                    FROM versions AS versions
 
-                    JOIN project_{project_name}.versions AS hero_versions
+                    JOIN versions AS hero_versions
                     ON hero_versions.product_id = versions.product_id
                     AND hero_versions.version < 0
                     AND ABS(hero_versions.version) = versions.version
@@ -383,22 +381,22 @@ async def get_products(
 
         if "latestDone" in req_order:
             sql_cte.append(
-                f"""
+                """
                 done_statuses AS (
-                    SELECT name from project_{project_name}.statuses
+                    SELECT name from statuses
                     WHERE data->>'state' = 'done'
                 )
                 """
             )
 
             sql_cte.append(
-                f"""
+                """
                 latest_done_versions AS (
                     SELECT
                         DISTINCT ON (versions.product_id)
                         versions.*,
                         rv.entity_id IS NOT NULL AS has_reviewables
-                    FROM project_{project_name}.versions
+                    FROM versions
 
                     JOIN done_statuses AS s
                     ON versions.status = s.name
@@ -422,12 +420,12 @@ async def get_products(
 
         if "latest" in req_order:
             sql_cte.append(
-                f"""
+                """
                 latest_versions AS (
                     SELECT
                         DISTINCT ON (versions.product_id) versions.*,
                         rv.entity_id IS NOT NULL AS has_reviewables
-                    FROM project_{project_name}.versions
+                    FROM versions
 
                     LEFT JOIN reviewables AS rv
                     ON versions.id = rv.entity_id
@@ -455,9 +453,9 @@ async def get_products(
             ["version_list.ids as version_ids", "version_list.versions as version_list"]
         )
         sql_joins.append(
-            f"""
+            """
             LEFT JOIN
-                project_{project_name}.version_list
+                version_list
                 ON products.id = version_list.product_id
             """
         )
@@ -503,6 +501,7 @@ async def get_products(
         fq = QueryFilter(**fdata)
         if fcond := build_filter(
             fq,
+            args=args,
             column_whitelist=column_whitelist,
             table_prefix="products",
         ):
@@ -539,6 +538,7 @@ async def get_products(
             fq = QueryFilter(**fdata)
             fcond = build_filter(
                 fq,
+                args=args,
                 column_whitelist=column_whitelist,
                 table_prefix="versions",
                 column_map={
@@ -571,6 +571,7 @@ async def get_products(
             fq = QueryFilter(**fdata)
             fcond = build_filter(
                 fq,
+                args=args,
                 column_whitelist=column_whitelist,
                 table_prefix="tasks",
             )
@@ -584,8 +585,8 @@ async def get_products(
                 vtconds.append(version_cond)
             if task_cond:
                 vtconds.append(task_cond)
-                tjoin = f"""
-                LEFT JOIN project_{project_name}.tasks
+                tjoin = """
+                LEFT JOIN tasks
                 ON versions.task_id = tasks.id
                 """
 
@@ -595,8 +596,8 @@ async def get_products(
                 f"""
                 filtered_versions AS (
                     SELECT DISTINCT product_id
-                    FROM project_{project_name}.versions
-                    JOIN project_{project_name}.products
+                    FROM versions
+                    JOIN products
                     ON versions.product_id = products.id
                     {tjoin}
                     {vtcondstr}
@@ -628,12 +629,12 @@ async def get_products(
         elif sort_by == "version":
             # count by product version count
             sql_cte.append(
-                f"""
+                """
                 product_version_counts AS (
                     SELECT
                         product_id,
                         COUNT(*) AS version_count
-                    FROM project_{project_name}.versions
+                    FROM versions
                     WHERE version >= 0
                     GROUP BY product_id
                 )
@@ -667,6 +668,7 @@ async def get_products(
             after,
             last,
             before,
+            args=args,
         )
         sql_conditions.append(paging_conds)
 
@@ -715,7 +717,7 @@ async def get_products(
         {cte}
         {raw_data_start}
         SELECT {sql_columns_str}
-        FROM project_{project_name}.products
+        FROM products
         {" ".join(sql_joins)}
         {SQLTool.conditions(sql_conditions)}
         {ordering}
@@ -729,7 +731,7 @@ async def get_products(
     #
 
     if stats_select_clause:
-        field_stats = await generate_field_stats(query)
+        field_stats = await generate_field_stats(query, args, project_name=project_name)
 
         return ProductsConnection(edges=[], field_stats=field_stats)
 
@@ -739,10 +741,12 @@ async def get_products(
         ProductNode,
         query,
         project_name=project_name,
+        schema_relative=True,
         first=first,
         last=last,
         order_by=order_by,
         context=info.context,
+        args=args,
     )
 
 
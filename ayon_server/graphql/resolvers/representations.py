@@ -2,6 +2,7 @@ import json
 from typing import Annotated
 
 from ayon_server.exceptions import BadRequestException, NotFoundException
+from ayon_server.graphql.columns import table_columns
 from ayon_server.graphql.connections import RepresentationsConnection
 from ayon_server.graphql.edges import RepresentationEdge
 from ayon_server.graphql.nodes.representation import RepresentationNode
@@ -22,7 +23,7 @@ from ayon_server.graphql.resolvers.pagination import create_pagination
 from ayon_server.graphql.types import Info
 from ayon_server.sqlfilter import QueryFilter, build_filter
 from ayon_server.types import validate_name_list, validate_status_list
-from ayon_server.utils import SQLTool
+from ayon_server.utils import SQLArgs, SQLTool
 from ayon_server.utils.strings import slugify
 
 
@@ -60,21 +61,22 @@ async def get_representations(
     # Conditions
     #
 
-    sql_columns = ["representations.*"]
+    sql_columns = [table_columns("representations")]
 
     sql_joins = []
+    args = SQLArgs()
     sql_conditions = []
 
     if ids is not None:
         if not ids:
             return RepresentationsConnection()
-        sql_conditions.append(f"representations.id IN {SQLTool.id_array(ids)}")
+        sql_conditions.append(f"representations.id = ANY({args.ids(ids)})")
 
     if version_ids is not None:
         if not version_ids:
             return RepresentationsConnection()
         sql_conditions.append(
-            f"representations.version_id IN {SQLTool.id_array(version_ids)}"
+            f"representations.version_id = ANY({args.ids(version_ids)})"
         )
     elif root.__class__.__name__ == "VersionNode":
         # cannot use isinstance here because of circular imports
@@ -84,26 +86,24 @@ async def get_representations(
         if not names:
             return RepresentationsConnection()
         validate_name_list(names)
-        sql_conditions.append(f"representations.name IN {SQLTool.array(names)}")
+        sql_conditions.append(f"representations.name = ANY({args.array(names)})")
 
     if statuses is not None:
         if not statuses:
             return RepresentationsConnection()
         validate_status_list(statuses)
-        sql_conditions.append(f"representations.status IN {SQLTool.array(statuses)}")
+        sql_conditions.append(f"representations.status = ANY({args.array(statuses)})")
 
     if tags is not None:
         if not tags:
             return RepresentationsConnection()
         validate_name_list(tags)
         sql_conditions.append(
-            f"representations.tags @> {SQLTool.array(tags, curly=True)}"
+            f"representations.tags @> {args.array(tags, 'varchar[]')}"
         )
 
     if has_links is not None:
-        sql_conditions.extend(
-            get_has_links_conds(project_name, "representations.id", has_links)
-        )
+        sql_conditions.extend(get_has_links_conds("representations.id", has_links))
 
     #
     # ACL
@@ -118,16 +118,16 @@ async def get_representations(
     ):
         sql_joins.extend(
             [
-                f"""
-                INNER JOIN project_{project_name}.versions AS versions
+                """
+                INNER JOIN versions AS versions
                 ON versions.id = representations.version_id
                 """,
-                f"""
-                INNER JOIN project_{project_name}.products AS products
+                """
+                INNER JOIN products AS products
                 ON products.id = versions.product_id
                 """,
-                f"""
-                INNER JOIN project_{project_name}.hierarchy AS hierarchy
+                """
+                INNER JOIN hierarchy AS hierarchy
                 ON hierarchy.id = products.folder_id
                 """,
             ]
@@ -186,6 +186,7 @@ async def get_representations(
         fq = QueryFilter(**fdata)
         if fcond := build_filter(
             fq,
+            args=args,
             column_whitelist=column_whitelist,
             table_prefix="representations",
         ):
@@ -197,7 +198,7 @@ async def get_representations(
 
     order_by = ["representations.creation_order"]
     ordering, paging_conds, cursor = create_pagination(
-        order_by, first, after, last, before
+        order_by, first, after, last, before, args=args
     )
     sql_conditions.append(paging_conds)
 
@@ -207,7 +208,7 @@ async def get_representations(
 
     query = f"""
         SELECT {cursor}, {", ".join(sql_columns)}
-        FROM project_{project_name}.representations
+        FROM representations
         {" ".join(sql_joins)}
         {SQLTool.conditions(sql_conditions)}
         {ordering}
@@ -219,10 +220,12 @@ async def get_representations(
         RepresentationNode,
         query,
         project_name=project_name,
+        schema_relative=True,
         first=first,
         last=last,
         order_by=order_by,
         context=info.context,
+        args=args,
     )
 
 
@@ -6,6 +6,7 @@ from ayon_server.access.utils import path_to_paths
 from ayon_server.entities import ProjectEntity
 from ayon_server.entities.core import attribute_library
 from ayon_server.exceptions import BadRequestException, NotFoundException
+from ayon_server.graphql.columns import table_columns
 from ayon_server.graphql.connections import TasksConnection
 from ayon_server.graphql.edges import TaskEdge
 from ayon_server.graphql.nodes.task import TaskNode
@@ -34,7 +35,7 @@ from ayon_server.types import (
     validate_type_name_list,
     validate_user_name_list,
 )
-from ayon_server.utils import SQLTool, slugify
+from ayon_server.utils import SQLArgs, SQLTool, slugify
 
 from .field_stats import (
     MetricTargetInput,
@@ -198,32 +199,33 @@ async def get_tasks(
     # SQL
     #
 
+    args = SQLArgs()
     sql_cte = []
     sql_conditions = []
 
     sql_columns = [
-        "tasks.*",
+        table_columns("tasks"),
         "hierarchy.path AS _folder_path",
         "f_ex.attrib as inherited_attributes",
     ]
 
     sql_joins = [
-        f"""
-        INNER JOIN project_{project_name}.hierarchy AS hierarchy
+        """
+        INNER JOIN hierarchy AS hierarchy
         ON tasks.folder_id = hierarchy.id
         """,
-        f"""
-        INNER JOIN project_{project_name}.exported_attributes AS f_ex
+        """
+        INNER JOIN exported_attributes AS f_ex
         ON tasks.folder_id = f_ex.folder_id
         """,
     ]
 
     if fields.any_endswith("hasReviewables"):
         sql_cte.append(
-            f"""
+            """
             reviewables AS (
-                SELECT v.task_id AS task_id FROM project_{project_name}.activity_feed af
-                INNER JOIN project_{project_name}.versions v
+                SELECT v.task_id AS task_id FROM activity_feed af
+                INNER JOIN versions v
                 ON af.entity_id = v.id
                 AND af.entity_type = 'version'
                 AND af.activity_type = 'reviewable'
@@ -238,7 +240,7 @@ async def get_tasks(
 
     if fields.any_endswith("latestComments"):
         sql_cte.append(
-            f"""
+            """
             comments AS (
                 SELECT
                     entity_id,
@@ -262,7 +264,7 @@ async def get_tasks(
                             PARTITION BY entity_id
                             ORDER BY created_at DESC
                         ) AS rn
-                    FROM project_{project_name}.activity_feed
+                    FROM activity_feed
                     WHERE activity_type = 'comment'
                     AND entity_type = 'task'
                     AND reference_type = 'origin'
@@ -283,7 +285,7 @@ async def get_tasks(
     if ids is not None:
         if not ids:
             return TasksConnection()
-        sql_conditions.append(f"tasks.id IN {SQLTool.id_array(ids)}")
+        sql_conditions.append(f"tasks.id = ANY({args.ids(ids)})")
 
     if folder_ids is not None:
         if not folder_ids:
@@ -294,23 +296,23 @@ async def get_tasks(
             sql_cte.append(
                 f"""
                 top_folder_paths AS (
-                    SELECT path FROM project_{project_name}.hierarchy
-                    WHERE id IN {SQLTool.id_array(folder_ids)}
+                    SELECT path FROM hierarchy
+                    WHERE id = ANY({args.ids(folder_ids)})
                 )
                 """
             )
 
             sql_cte.append(
-                f"""
+                """
                 child_folder_ids AS (
-                    SELECT id FROM project_{project_name}.hierarchy
+                    SELECT id FROM hierarchy
                     WHERE EXISTS (
                         SELECT 1
                         FROM top_folder_paths
-                        WHERE project_{project_name}.hierarchy.path
+                        WHERE hierarchy.path
                         LIKE top_folder_paths.path || '/%'
                     )
-                    OR project_{project_name}.hierarchy.path = ANY (
+                    OR hierarchy.path = ANY (
                         SELECT path FROM top_folder_paths
                     )
                 )
@@ -321,7 +323,7 @@ async def get_tasks(
             )
 
         else:
-            sql_conditions.append(f"tasks.folder_id IN {SQLTool.id_array(folder_ids)}")
+            sql_conditions.append(f"tasks.folder_id = ANY({args.ids(folder_ids)})")
 
     elif root.__class__.__name__ == "FolderNode":
         # cannot use isinstance here because of circular imports
@@ -331,35 +333,33 @@ async def get_tasks(
         if not names:
             return TasksConnection()
         validate_name_list(names)
-        sql_conditions.append(f"tasks.name IN {SQLTool.array(names)}")
+        sql_conditions.append(f"tasks.name = ANY({args.array(names)})")
 
     if task_types is not None:
         if not task_types:
             return TasksConnection()
         validate_type_name_list(task_types)
-        sql_conditions.append(f"tasks.task_type IN {SQLTool.array(task_types)}")
+        sql_conditions.append(f"tasks.task_type = ANY({args.array(task_types)})")
 
     if statuses is not None:
         if not statuses:
             return TasksConnection()
         validate_status_list(statuses)
-        sql_conditions.append(f"tasks.status IN {SQLTool.array(statuses)}")
+        sql_conditions.append(f"tasks.status = ANY({args.array(statuses)})")
 
     if tags is not None:
         if not tags:
             sql_conditions.append("tasks.tags = '{}'")
         else:
             tags = sanitize_string_list(tags)
-            sql_conditions.append(f"tasks.tags @> {SQLTool.array(tags, curly=True)}")
+            sql_conditions.append(f"tasks.tags @> {args.array(tags, 'varchar[]')}")
 
     if tags_any is not None:
         if not tags_any:
             sql_conditions.append("tasks.tags != '{}'")
         else:
             tags_any = sanitize_string_list(tags_any)
-            sql_conditions.append(
-                f"tasks.tags && {SQLTool.array(tags_any, curly=True)}"
-            )
+            sql_conditions.append(f"tasks.tags && {args.array(tags_any, 'varchar[]')}")
 
     if assignees is not None:
         if not assignees:
@@ -367,7 +367,7 @@ async def get_tasks(
         else:
             validate_user_name_list(assignees)
             sql_conditions.append(
-                f"tasks.assignees @> {SQLTool.array(assignees, curly=True)}"
+                f"tasks.assignees @> {args.array(assignees, 'varchar[]')}"
             )
 
     if assignees_any is not None:
@@ -376,11 +376,11 @@ async def get_tasks(
         else:
             validate_user_name_list(assignees_any)
             sql_conditions.append(
-                f"tasks.assignees && {SQLTool.array(assignees_any, curly=True)}"
+                f"tasks.assignees && {args.array(assignees_any, 'varchar[]')}"
             )
 
     if has_links is not None:
-        sql_conditions.extend(get_has_links_conds(project_name, "tasks.id", has_links))
+        sql_conditions.extend(get_has_links_conds("tasks.id", has_links))
 
     user = info.context["user"]
     access_list = None
@@ -451,6 +451,7 @@ async def get_tasks(
         # with the task attributes to get the full attribute set
         if fcond := build_filter(
             fq,
+            args=args,
             column_whitelist=column_whitelist,
             table_prefix="tasks",
             column_map={
@@ -480,6 +481,7 @@ async def get_tasks(
         fq = QueryFilter(**fdata)
         if fcond := build_filter(
             fq,
+            args=args,
             column_whitelist=column_whitelist,
             table_prefix="folders",
             column_map={"attrib": "f_ex.attrib"},
@@ -536,18 +538,18 @@ async def get_tasks(
 
         sql_joins.extend(
             [
-                f"""
-                INNER JOIN project_{project_name}.folders
+                """
+                INNER JOIN folders
                 ON folders.id = tasks.folder_id
                 """,
                 # but not here. parent's parent can be NULL
-                f"""
-                LEFT JOIN project_{project_name}.exported_attributes AS pf_ex
+                """
+                LEFT JOIN exported_attributes AS pf_ex
                 ON folders.parent_id = pf_ex.folder_id
                 """,
                 f"""
                 INNER JOIN public.projects AS projects
-                ON projects.name ILIKE '{project_name}'
+                ON projects.name ILIKE {args.add(project_name)}
                 """,
             ]
         )
@@ -597,6 +599,7 @@ async def get_tasks(
             after,
             last,
             before,
+            args=args,
         )
         sql_conditions.append(paging_conds)
 
@@ -647,7 +650,7 @@ async def get_tasks(
         {raw_data_start}
         SELECT
         {sql_columns_str}
-        FROM project_{project_name}.tasks AS tasks
+        FROM tasks AS tasks
         {" ".join(sql_joins)}
         {SQLTool.conditions(sql_conditions)}
         {ordering}
@@ -660,7 +663,7 @@ async def get_tasks(
     # print()
 
     if stats_select_clause:
-        field_stats = await generate_field_stats(query)
+        field_stats = await generate_field_stats(query, args, project_name=project_name)
 
         return TasksConnection(edges=[], field_stats=field_stats)
 
@@ -670,10 +673,12 @@ async def get_tasks(
         TaskNode,
         query,
         project_name=project_name,
+        schema_relative=True,
         first=first,
         last=last,
         order_by=order_by,
         context=info.context,
+        args=args,
     )
 
 
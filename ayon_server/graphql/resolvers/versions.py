@@ -3,6 +3,7 @@ from typing import Annotated
 
 from ayon_server.entities import ProjectEntity
 from ayon_server.exceptions import BadRequestException, NotFoundException
+from ayon_server.graphql.columns import table_columns
 from ayon_server.graphql.connections import VersionsConnection
 from ayon_server.graphql.edges import VersionEdge
 from ayon_server.graphql.nodes.version import VersionNode
@@ -29,7 +30,7 @@ from ayon_server.types import (
     validate_status_list,
     validate_user_name_list,
 )
-from ayon_server.utils import SQLTool, slugify
+from ayon_server.utils import SQLArgs, SQLTool, slugify
 
 from .field_stats import (
     MetricTargetInput,
@@ -160,29 +161,30 @@ async def get_versions(
     # SQL
     #
 
+    args = SQLArgs()
     sql_cte = []
     sql_conditions = []
     sql_joins = [
-        f"""
-        INNER JOIN project_{project_name}.products AS products
+        """
+        INNER JOIN products AS products
         ON products.id = versions.product_id
         """,
-        f"""
-        INNER JOIN project_{project_name}.hierarchy AS hierarchy
+        """
+        INNER JOIN hierarchy AS hierarchy
         ON hierarchy.id = products.folder_id
         """,
-        f"""
-        INNER JOIN project_{project_name}.folders AS folders
+        """
+        INNER JOIN folders AS folders
         ON folders.id = products.folder_id
         """,
-        f"""
-        LEFT JOIN project_{project_name}.tasks AS tasks
+        """
+        LEFT JOIN tasks AS tasks
         ON tasks.id = versions.task_id
         """,
     ]
 
     sql_columns = [
-        "versions.*",
+        table_columns("versions"),
         "versions.creation_order AS creation_order",
         "hierarchy.path AS _folder_path",
         "products.name AS _product_name",
@@ -190,7 +192,7 @@ async def get_versions(
 
     if fields.any_endswith("latestComments"):
         sql_cte.append(
-            f"""
+            """
             comments AS (
                 SELECT
                     entity_id,
@@ -214,7 +216,7 @@ async def get_versions(
                             PARTITION BY entity_id
                             ORDER BY created_at DESC
                         ) AS rn
-                    FROM project_{project_name}.activity_feed
+                    FROM activity_feed
                     WHERE activity_type = 'comment'
                     AND entity_type = 'version'
                     AND reference_type = 'origin'
@@ -234,9 +236,9 @@ async def get_versions(
 
     if fields.any_endswith("hasReviewables") or (has_reviewables is not None):
         sql_cte.append(
-            f"""
+            """
             reviewables AS (
-                SELECT entity_id FROM project_{project_name}.activity_feed
+                SELECT entity_id FROM activity_feed
                 WHERE entity_type = 'version'
                 AND activity_type = 'reviewable'
             )
@@ -272,7 +274,7 @@ async def get_versions(
     if ids is not None:
         if not ids:
             return VersionsConnection()
-        sql_conditions.append(f"versions.id IN {SQLTool.id_array(ids)}")
+        sql_conditions.append(f"versions.id = ANY({args.ids(ids)})")
 
     if version:
         sql_conditions.append(f"versions.version = {version}")
@@ -280,35 +282,36 @@ async def get_versions(
     if versions is not None:
         if not versions:
             return VersionsConnection()
-        sql_conditions.append(f"versions.version IN {SQLTool.array(versions)}")
+        versions_arg = args.array(versions, "integer[]")
+        sql_conditions.append(f"versions.version = ANY({versions_arg})")
 
     if authors is not None:
         if not authors:
             return VersionsConnection()
         validate_user_name_list(authors)
-        sql_conditions.append(f"versions.author IN {SQLTool.array(authors)}")
+        sql_conditions.append(f"versions.author = ANY({args.array(authors)})")
 
     if statuses is not None:
         if not statuses:
             return VersionsConnection()
         validate_status_list(statuses)
-        sql_conditions.append(f"versions.status IN {SQLTool.array(statuses)}")
+        sql_conditions.append(f"versions.status = ANY({args.array(statuses)})")
 
     if tags is not None:
         if not tags:
             return VersionsConnection()
         validate_name_list(tags)
-        sql_conditions.append(f"versions.tags @> {SQLTool.array(tags, curly=True)}")
+        sql_conditions.append(f"versions.tags @> {args.array(tags, 'varchar[]')}")
 
     if product_ids is not None:
         if not product_ids:
             return VersionsConnection()
-        sql_conditions.append(f"versions.product_id IN {SQLTool.id_array(product_ids)}")
+        sql_conditions.append(f"versions.product_id = ANY({args.ids(product_ids)})")
     elif root.__class__.__name__ == "ProductNode":
         sql_conditions.append(f"versions.product_id = '{root.id}'")
 
     if task_ids:
-        sql_conditions.append(f"versions.task_id IN {SQLTool.id_array(task_ids)}")
+        sql_conditions.append(f"versions.task_id = ANY({args.ids(task_ids)})")
     elif root.__class__.__name__ == "TaskNode":
         sql_conditions.append(f"versions.task_id = '{root.id}'")
 
@@ -320,22 +323,22 @@ async def get_versions(
             sql_cte.append(
                 f"""
                 top_folder_paths AS (
-                    SELECT path FROM project_{project_name}.hierarchy
-                    WHERE id IN {SQLTool.id_array(folder_ids)}
+                    SELECT path FROM hierarchy
+                    WHERE id = ANY({args.ids(folder_ids)})
                 )
                 """
             )
 
             sql_cte.append(
-                f"""
+                """
                 child_folder_ids AS (
-                    SELECT id FROM project_{project_name}.hierarchy
+                    SELECT id FROM hierarchy
                     WHERE EXISTS (
                         SELECT 1 FROM top_folder_paths
-                        WHERE project_{project_name}.hierarchy.path
+                        WHERE hierarchy.path
                         LIKE top_folder_paths.path || '/%'
                     )
-                    OR project_{project_name}.hierarchy.path = ANY(
+                    OR hierarchy.path = ANY(
                         SELECT path FROM top_folder_paths
                     )
                 )
@@ -350,48 +353,45 @@ async def get_versions(
             )
 
         else:
-            sql_conditions.append(
-                f"products.folder_id IN {SQLTool.id_array(folder_ids)}"
-            )
+            sql_conditions.append(f"products.folder_id = ANY({args.ids(folder_ids)})")
 
     #
     # Always-on CTEs (to get latest and hero versions)
+    # Latest and hero versions of each product are kept in version_list
     #
 
     sql_cte.extend(
         [
-            f"""
+            """
             latest_versions AS (
-                SELECT DISTINCT ON (product_id) id, version, product_id
-                FROM project_{project_name}.versions
-                WHERE version >= 0
-                ORDER BY product_id, version DESC
+                SELECT latest_id AS id, product_id
+                FROM version_list
+                WHERE latest_id IS NOT NULL
             )
             """,
-            f"""
+            """
             done_statuses AS (
-                SELECT name from project_{project_name}.statuses
+                SELECT name from statuses
                 WHERE data->>'state' = 'done'
             )
             """,
-            f"""
+            """
             latest_done_versions AS (
                 SELECT DISTINCT ON (v.product_id) v.id, v.version, v.product_id
-                FROM project_{project_name}.versions v
+                FROM versions v
                 JOIN done_statuses ds
                 ON v.status = ds.name
                 WHERE v.version >= 0
                 ORDER BY v.product_id, v.version DESC
             )
             """,
-            f"""
+            """
             hero_versions AS (
-                SELECT version.id id, hero_version.id AS hero_version_id
-                FROM project_{project_name}.versions AS version
-                JOIN project_{project_name}.versions AS hero_version
-                ON hero_version.product_id = version.product_id
-                AND hero_version.version < 0
-                AND ABS(hero_version.version) = version.version
+                SELECT version.id id, l.hero_id AS hero_version_id
+                FROM version_list AS l
+                JOIN versions AS version
+                ON version.product_id = l.product_id
+                AND version.version = l.hero_version
             )
             """,
         ]
@@ -478,7 +478,7 @@ async def get_versions(
             f"""
             featured_versions AS (
                 SELECT DISTINCT ON (versions.product_id) versions.id
-                FROM project_{project_name}.versions AS versions
+                FROM versions AS versions
                 LEFT JOIN latest_versions AS lv
                 ON lv.id = versions.id
                 LEFT JOIN latest_done_versions AS ldv
@@ -503,9 +503,7 @@ async def get_versions(
     #
 
     if has_links is not None:
-        sql_conditions.extend(
-            get_has_links_conds(project_name, "versions.id", has_links)
-        )
+        sql_conditions.extend(get_has_links_conds("versions.id", has_links))
 
     #
     # Access control
@@ -526,11 +524,11 @@ async def get_versions(
             sql_cte.append(
                 f"""guest_accessible_versions AS (
                     SELECT DISTINCT(entity_id)
-                    FROM project_{project_name}.entity_list_items i
-                    JOIN project_{project_name}.entity_lists l
+                    FROM entity_list_items i
+                    JOIN entity_lists l
                     ON l.id = i.entity_list_id
                     AND l.entity_type = 'version'
-                    AND l.id IN {SQLTool.id_array(entity_list_ids)}
+                    AND l.id = ANY({args.ids(entity_list_ids)})
                     )
                 """
             )
@@ -538,8 +536,8 @@ async def get_versions(
             sql_cte.append(
                 f"""guest_accessible_versions AS (
                     SELECT DISTINCT(entity_id)
-                    FROM project_{project_name}.entity_list_items i
-                    JOIN project_{project_name}.entity_lists l
+                    FROM entity_list_items i
+                    JOIN entity_lists l
                     ON l.id = i.entity_list_id
                     AND l.entity_type = 'version'
                     AND (
@@ -621,6 +619,7 @@ async def get_versions(
         fq = QueryFilter(**fdata)
         if fcond := build_filter(
             fq,
+            args=args,
             column_whitelist=column_whitelist,
             table_prefix="versions",
             column_map={
@@ -655,6 +654,7 @@ async def get_versions(
         fq = QueryFilter(**fdata)
         if fcond := build_filter(
             fq,
+            args=args,
             column_whitelist=column_whitelist,
             table_prefix="products",
             column_map={
@@ -685,6 +685,7 @@ async def get_versions(
         fq = QueryFilter(**fdata)
         if fcond := build_filter(
             fq,
+            args=args,
             column_whitelist=column_whitelist,
             table_prefix="tasks",
         ):
@@ -719,6 +720,7 @@ async def get_versions(
             after,
             last,
             before,
+            args=args,
         )
         sql_conditions.append(paging_conds)
 
@@ -772,7 +774,7 @@ async def get_versions(
         {cte}
         {raw_data_start}
         SELECT {cursor}, {", ".join(sql_columns)}
-        FROM project_{project_name}.versions AS versions
+        FROM versions AS versions
         {" ".join(sql_joins)}
         {SQLTool.conditions(sql_conditions)}
         {ordering}
@@ -786,7 +788,7 @@ async def get_versions(
     #
 
     if stats_select_clause:
-        field_stats = await generate_field_stats(query)
+        field_stats = await generate_field_stats(query, args, project_name=project_name)
 
         return VersionsConnection(edges=[], field_stats=field_stats)
 
@@ -796,10 +798,12 @@ async def get_versions(
         VersionNode,
         query,
         project_name=project_name,
+        schema_relative=True,
         first=first,
         last=last,
         order_by=order_by,
         context=info.context,
+        args=args,
     )
 
 
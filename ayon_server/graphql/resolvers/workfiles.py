@@ -1,6 +1,7 @@
 from typing import Annotated
 
 from ayon_server.exceptions import BadRequestException, NotFoundException
+from ayon_server.graphql.columns import table_columns
 from ayon_server.graphql.connections import WorkfilesConnection
 from ayon_server.graphql.edges import WorkfileEdge
 from ayon_server.graphql.nodes.workfile import WorkfileNode
@@ -21,7 +22,7 @@ from ayon_server.graphql.resolvers.common import (
 from ayon_server.graphql.resolvers.pagination import create_pagination
 from ayon_server.graphql.types import Info
 from ayon_server.types import validate_name_list, validate_status_list
-from ayon_server.utils import SQLTool, slugify
+from ayon_server.utils import SQLArgs, SQLTool, slugify
 
 SORT_OPTIONS = {
     "name": "workfiles.name",
@@ -66,29 +67,29 @@ async def get_workfiles(
     # SQL
     #
 
-    sql_columns = ["workfiles.*"]
+    sql_columns = [table_columns("workfiles")]
 
     # sql_joins = []
+    args = SQLArgs()
     sql_conditions = []
     sql_joins = []
 
     if ids is not None:
         if not ids:
             return WorkfilesConnection()
-        sql_conditions.append(f"workfiles.id IN {SQLTool.id_array(ids)}")
+        sql_conditions.append(f"workfiles.id = ANY({args.ids(ids)})")
 
     if task_ids is not None:
         if not task_ids:
             return WorkfilesConnection()
-        sql_conditions.append(f"workfiles.task_id IN {SQLTool.id_array(task_ids)}")
+        sql_conditions.append(f"workfiles.task_id = ANY({args.ids(task_ids)})")
     elif root.__class__.__name__ == "TaskNode":
         sql_conditions.append(f"workfiles.task_id = '{root.id}'")
 
     if paths is not None:
         if not paths:
             return WorkfilesConnection()
-        paths = [r.replace("'", "''") for r in paths]
-        sql_conditions.append(f"workfiles.path IN {SQLTool.array(paths)}")
+        sql_conditions.append(f"workfiles.path = ANY({args.array(paths)})")
 
     if path_ex:
         # TODO: is this safe?
@@ -96,20 +97,18 @@ async def get_workfiles(
         sql_conditions.append(f"workfiles.path ~ '{path_ex}'")
 
     if has_links is not None:
-        sql_conditions.extend(
-            get_has_links_conds(project_name, "workfiles.id", has_links)
-        )
+        sql_conditions.extend(get_has_links_conds("workfiles.id", has_links))
 
     if statuses is not None:
         if not statuses:
             return WorkfilesConnection()
         validate_status_list(statuses)
-        sql_conditions.append(f"workfiles.status IN {SQLTool.array(statuses)}")
+        sql_conditions.append(f"workfiles.status = ANY({args.array(statuses)})")
     if tags is not None:
         if not tags:
             return WorkfilesConnection()
         validate_name_list(tags)
-        sql_conditions.append(f"workfiles.tags @> {SQLTool.array(tags, curly=True)}")
+        sql_conditions.append(f"workfiles.tags @> {args.array(tags, 'varchar[]')}")
 
     access_list = await create_folder_access_list(root, info)
     if access_list is not None or search or fields.any_endswith("parents"):
@@ -122,12 +121,12 @@ async def get_workfiles(
 
         sql_joins.extend(
             [
-                f"""
-                INNER JOIN project_{project_name}.tasks AS tasks
+                """
+                INNER JOIN tasks AS tasks
                 ON tasks.id = workfiles.task_id
                 """,
-                f"""
-                INNER JOIN project_{project_name}.hierarchy AS hierarchy
+                """
+                INNER JOIN hierarchy AS hierarchy
                 ON hierarchy.id = tasks.folder_id
                 """,
             ]
@@ -171,6 +170,7 @@ async def get_workfiles(
         after,
         last,
         before,
+        args=args,
     )
     sql_conditions.append(paging_conds)
 
@@ -180,7 +180,7 @@ async def get_workfiles(
 
     query = f"""
         SELECT {cursor}, {", ".join(sql_columns)}
-        FROM project_{project_name}.workfiles AS workfiles
+        FROM workfiles AS workfiles
         {" ".join(sql_joins)}
         {SQLTool.conditions(sql_conditions)}
         {ordering}
@@ -192,10 +192,12 @@ async def get_workfiles(
         WorkfileNode,
         query,
         project_name=project_name,
+        schema_relative=True,
         first=first,
         last=last,
         order_by=order_by,
         context=info.context,
+        args=args,
     )
 
 
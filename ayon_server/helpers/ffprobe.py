@@ -2,13 +2,33 @@ import asyncio
 import json
 from typing import Any, Literal
 
+from ayon_server.helpers.media_jobs import JobPriority, media_jobs
+
 ReviewableAvailability = Literal[
     "unknown", "conversionRequired", "conversionRecommended", "ready"
 ]
 
 
-async def ffprobe(file_path: str) -> dict[str, Any]:
-    """Runs ffprobe on a file and returns the metadata."""
+async def ffprobe(
+    file_path: str,
+    *,
+    key: str | None = None,
+    priority: JobPriority = "background",
+) -> dict[str, Any]:
+    """Runs ffprobe on a file and returns the metadata.
+
+    ffprobe runs in the media job scheduler. Requests with the same
+    `key` (file id) share a single ffprobe process.
+    """
+    return await media_jobs.run(
+        lambda: _ffprobe(file_path),
+        kind="ffprobe",
+        key=key or file_path.split("?")[0],
+        priority=priority,
+    )
+
+
+async def _ffprobe(file_path: str) -> dict[str, Any]:
     process = await asyncio.create_subprocess_exec(
         "ffprobe",
         "-v",
@@ -30,11 +50,16 @@ async def ffprobe(file_path: str) -> dict[str, Any]:
     return json.loads(stdout)
 
 
-async def extract_media_info(file_path: str) -> dict[str, Any]:
+async def extract_media_info(
+    file_path: str,
+    *,
+    key: str | None = None,
+    priority: JobPriority = "background",
+) -> dict[str, Any]:
     """Extracts metadata from a video file."""
 
     try:
-        probe_data = await ffprobe(file_path)
+        probe_data = await ffprobe(file_path, key=key, priority=priority)
     except Exception:
         return {}
 
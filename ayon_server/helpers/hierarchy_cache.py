@@ -1,10 +1,166 @@
+"""Redis cache of project folder lists
+
+The folder list of each project is stored in Redis hashes keyed by folder id,
+so individual records may be updated without rewriting the whole list:
+
+- `<project>:base` - camelCased JSON record of the folder without attributes
+- `<project>:attrib` - JSON fragment with `attrib` and `ownAttrib` keys
+  (without the enclosing braces), so it can be spliced to the base record
+- `<project>:paths` - folder path used for access control
+- `<project>:children` - JSON list of ids of the direct children of
+  the folder (only folders with children), used to find the cached
+  descendants of deleted folders
+- `<project>:version` - counter bumped on every change.
+  Its presence also marks the cache as populated.
+
+Records are stored in the final (API) format, so the folder list endpoint
+may stream them without deserializing.
+"""
+
 import time
+import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass
 from typing import Any
 
+from redis.asyncio.client import Pipeline
+from redis.exceptions import WatchError
+
 from ayon_server.lib.postgres import Postgres
 from ayon_server.lib.redis import Redis
 from ayon_server.logging import logger
-from ayon_server.utils import json_dumps
+from ayon_server.utils import batched, camelize, json_dumps, json_loads
+
+CACHE_NAMESPACE = "project-folders"
+CACHE_TTL = 3600
+# Expiration of the keys written by a rebuild before they are swapped in,
+# so keys of an interrupted rebuild don't leak
+REBUILD_TTL = 600
+WRITE_BATCH_SIZE = 2000
+
+_camelize_memo: dict[str, str] = {}
+
+
+def _camelize(key: str) -> str:
+    if key not in _camelize_memo:
+        _camelize_memo[key] = camelize(key)
+    return _camelize_memo[key]
+
+
+@dataclass
+class FolderListCacheKeys:
+    base: str
+    attrib: str
+    paths: str
+    children: str
+    version: str
+
+    @classmethod
+    def for_project(cls, project_name: str) -> "FolderListCacheKeys":
+        prefix = f"{Redis.prefix}{CACHE_NAMESPACE}-{project_name}"
+        return cls(
+            base=f"{prefix}:base",
+            attrib=f"{prefix}:attrib",
+            paths=f"{prefix}:paths",
+            children=f"{prefix}:children",
+            version=f"{prefix}:version",
+        )
+
+    @property
+    def hashes(self) -> tuple[str, str, str]:
+        """Hashes holding a field for each folder"""
+        return (self.base, self.attrib, self.paths)
+
+    @property
+    def all(self) -> tuple[str, ...]:
+        return (*self.hashes, self.children, self.version)
+
+
+@dataclass
+class CachedFolderList:
+    """Raw (serialized) folder list records as loaded from Redis"""
+
+    version: int
+    base: dict[bytes, bytes]
+    attrib: dict[bytes, bytes] | None = None
+    paths: dict[bytes, bytes] | None = None
+
+
+def _build_record(row: Any) -> dict[str, Any]:
+    """Convert a database row to a folder list cache record"""
+    return {
+        "id": row["id"],
+        "path": row["path"],
+        "parent_id": row["parent_id"],
+        "parents": row["path"].strip("/").split("/")[:-1],
+        "name": row["name"],
+        "label": row["label"],
+        "folder_type": row["folder_type"],
+        "has_tasks": row["task_count"] > 0,
+        "task_names": row["task_names"] if row["task_names"] != [None] else [],
+        "status": row["status"],
+        "attrib": row["all_attrib"],
+        "tags": row["tags"],
+        "own_attrib": list(row["attrib"].keys()),
+        "has_reviewables": row["has_reviewables"],
+        "has_versions": row["has_versions"],
+        "thumbnail_hash": row["thumbnail_hash"] or row["id"][-6:],
+        "created_at": row["created_at"],
+        "updated_at": row["updated_at"],
+    }
+
+
+def _serialize_record(record: dict[str, Any]) -> tuple[str, str, str]:
+    """Return (base, attrib fragment, path) of the record for the cache"""
+    base = {
+        _camelize(k): v for k, v in record.items() if k not in ("attrib", "own_attrib")
+    }
+    attrib = json_dumps({"attrib": record["attrib"], "ownAttrib": record["own_attrib"]})
+    return json_dumps(base), attrib[1:-1], record["path"]
+
+
+def _hset_records(
+    pipe: Pipeline,
+    keys: FolderListCacheKeys,
+    records: list[dict[str, Any]],
+) -> None:
+    for batch in batched(records, WRITE_BATCH_SIZE):
+        base: dict[str, str] = {}
+        attrib: dict[str, str] = {}
+        paths: dict[str, str] = {}
+        for record in batch:
+            folder_id = record["id"]
+            base[folder_id], attrib[folder_id], paths[folder_id] = _serialize_record(
+                record
+            )
+        pipe.hset(keys.base, mapping=base)  # type: ignore[arg-type]
+        pipe.hset(keys.attrib, mapping=attrib)  # type: ignore[arg-type]
+        pipe.hset(keys.paths, mapping=paths)  # type: ignore[arg-type]
+
+
+def _hset_children(
+    pipe: Pipeline,
+    keys: FolderListCacheKeys,
+    children: dict[str, list[str]],
+) -> None:
+    for batch in batched(list(children.items()), WRITE_BATCH_SIZE):
+        mapping = {folder_id: json_dumps(child_ids) for folder_id, child_ids in batch}
+        pipe.hset(keys.children, mapping=mapping)
+
+
+def _expire(pipe: Pipeline, keys: FolderListCacheKeys) -> None:
+    for key in keys.all:
+        pipe.expire(key, CACHE_TTL)
+
+
+async def _ensure_connection() -> None:
+    if not Redis.connected:
+        await Redis.connect()
+
+
+#
+# Full rebuild
+#
 
 
 async def rebuild_hierarchy_cache(project_name: str) -> list[dict[str, Any]]:
@@ -75,43 +231,54 @@ async def rebuild_hierarchy_cache(project_name: str) -> list[dict[str, Any]]:
     """
 
     result = []
-    ids_with_children = set()
+    children: dict[str, list[str]] = {}
     async with Postgres.transaction():
         # Since this is ALWAYS called after rebuild_inherited_attributes,
-        # we don't need to refresh materialized views here.
+        # exported_attributes are already up to date.
         stmt = await Postgres.prepare(query)
         async for row in stmt.cursor():
-            result.append(
-                {
-                    "id": row["id"],
-                    "path": row["path"],
-                    "parent_id": row["parent_id"],
-                    "parents": row["path"].strip("/").split("/")[:-1],
-                    "name": row["name"],
-                    "label": row["label"],
-                    "folder_type": row["folder_type"],
-                    "has_tasks": row["task_count"] > 0,
-                    "task_names": row["task_names"]
-                    if row["task_names"] != [None]
-                    else [],
-                    "status": row["status"],
-                    "attrib": row["all_attrib"],
-                    "tags": row["tags"],
-                    "own_attrib": list(row["attrib"].keys()),
-                    "has_reviewables": row["has_reviewables"],
-                    "has_versions": row["has_versions"],
-                    "thumbnail_hash": row["thumbnail_hash"] or row["id"][-6:],
-                    "created_at": row["created_at"],
-                    "updated_at": row["updated_at"],
-                }
-            )
+            result.append(_build_record(row))
             if row["parent_id"] is not None:
-                ids_with_children.add(row["parent_id"])
+                children.setdefault(row["parent_id"], []).append(row["id"])
 
     for folder in result:
-        folder["has_children"] = folder["id"] in ids_with_children
+        folder["has_children"] = folder["id"] in children
+
+    # Write the new list to temporary keys and atomically swap them,
+    # so readers never see a partially written list.
+
+    await _ensure_connection()
+    keys = FolderListCacheKeys.for_project(project_name)
+    tmp_suffix = f":tmp-{uuid.uuid4().hex}"
+    tmp_keys = FolderListCacheKeys(
+        base=keys.base + tmp_suffix,
+        attrib=keys.attrib + tmp_suffix,
+        paths=keys.paths + tmp_suffix,
+        children=keys.children + tmp_suffix,
+        version=keys.version,
+    )
+
+    async with Redis.redis_pool.pipeline(transaction=False) as pipe:
+        _hset_records(pipe, tmp_keys, result)
+        _hset_children(pipe, tmp_keys, children)
+        for key in (*tmp_keys.hashes, tmp_keys.children):
+            pipe.expire(key, REBUILD_TTL)
+        await pipe.execute()
+
+    async with Redis.redis_pool.pipeline(transaction=True) as pipe:
+        if result:
+            for tmp_key, key in zip(tmp_keys.hashes, keys.hashes, strict=True):
+                pipe.rename(tmp_key, key)
+        else:
+            pipe.delete(*keys.hashes)
+        if children:
+            pipe.rename(tmp_keys.children, keys.children)
+        else:
+            pipe.delete(keys.children)
+        pipe.incr(keys.version)
+        _expire(pipe, keys)
+        await pipe.execute()
 
-    await Redis.set("project-folders", project_name, json_dumps(result), 3600)
     elapsed_time = time.monotonic() - start_time
     logger.trace(
         f"Rebuilt hierarchy cache for {project_name} "
@@ -119,3 +286,312 @@ async def rebuild_hierarchy_cache(project_name: str) -> list[dict[str, Any]]:
         f"in {elapsed_time:.2f}s"
     )
     return result
+
+
+async def invalidate_hierarchy_cache(project_name: str) -> None:
+    """Drop the cached folder list of the project"""
+    await _ensure_connection()
+    keys = FolderListCacheKeys.for_project(project_name)
+    await Redis.redis_pool.delete(*keys.all)
+
+
+async def get_cached_folder_list(
+    project_name: str,
+    *,
+    attrib: bool = False,
+    paths: bool = False,
+) -> CachedFolderList | None:
+    """Load the raw cached folder list of the project.
+
+    Attribute fragments and paths are loaded only when requested.
+    Returns None if the list is not cached.
+    """
+    await _ensure_connection()
+    keys = FolderListCacheKeys.for_project(project_name)
+    async with Redis.redis_pool.pipeline(transaction=True) as pipe:
+        pipe.get(keys.version)
+        pipe.hgetall(keys.base)
+        if attrib:
+            pipe.hgetall(keys.attrib)
+        if paths:
+            pipe.hgetall(keys.paths)
+        res = await pipe.execute()
+
+    if res[0] is None:
+        return None
+
+    return CachedFolderList(
+        version=int(res[0]),
+        base=res[1],
+        attrib=res[2] if attrib else None,
+        paths=res[-1] if paths else None,
+    )
+
+
+#
+# Incremental updates
+#
+
+
+async def _get_affected_folder_ids(
+    project_name: str,
+    folder_ids: list[str],
+) -> set[str]:
+    """Return ids of the given folders, their descendants and ancestors"""
+    query = f"""
+        WITH RECURSIVE subtree AS (
+            SELECT id FROM project_{project_name}.folders
+            WHERE id = ANY($1::uuid[])
+            UNION
+            SELECT f.id FROM project_{project_name}.folders f
+            INNER JOIN subtree s ON f.parent_id = s.id
+        ),
+        ancestors AS (
+            SELECT parent_id AS id FROM project_{project_name}.folders
+            WHERE id = ANY($1::uuid[]) AND parent_id IS NOT NULL
+            UNION
+            SELECT f.parent_id AS id FROM project_{project_name}.folders f
+            INNER JOIN ancestors a ON f.id = a.id
+            WHERE f.parent_id IS NOT NULL
+        )
+        SELECT id FROM subtree
+        UNION
+        SELECT id FROM ancestors
+    """
+    return {row["id"] for row in await Postgres.fetch(query, folder_ids)}
+
+
+async def _fetch_records(
+    project_name: str,
+    folder_ids: list[str],
+) -> list[dict[str, Any]]:
+    """Load cache records of the given folders.
+
+    Contrary to the full rebuild, `has_versions` contains only
+    whether the folder itself has versions. Descendants are resolved
+    by the caller.
+    """
+    query = f"""
+        SELECT
+            f.id,
+            f.parent_id,
+            f.name,
+            f.label,
+            f.folder_type,
+            f.status,
+            f.attrib,
+            f.tags,
+            f.data->>'thumbnailHash' AS thumbnail_hash,
+            f.created_at,
+            f.updated_at,
+            ea.attrib as all_attrib,
+            ea.path as path,
+            COUNT (tasks.id) AS task_count,
+            array_agg(DISTINCT tasks.name) AS task_names,
+            EXISTS (
+                SELECT 1 FROM project_{project_name}.products p
+                INNER JOIN project_{project_name}.versions v
+                ON v.product_id = p.id
+                WHERE p.folder_id = f.id
+            ) AS has_versions,
+            EXISTS (
+                SELECT 1 FROM project_{project_name}.activity_feed af
+                INNER JOIN project_{project_name}.versions v
+                ON af.entity_id = v.id
+                AND af.entity_type = 'version'
+                AND af.activity_type = 'reviewable'
+                INNER JOIN project_{project_name}.products p
+                ON p.id = v.product_id
+                WHERE p.folder_id = f.id
+            ) AS has_reviewables
+
+        FROM project_{project_name}.folders f
+
+        INNER JOIN project_{project_name}.exported_attributes ea
+        ON f.id = ea.folder_id
+
+        LEFT JOIN project_{project_name}.tasks AS tasks
+        ON tasks.folder_id = f.id
+
+        WHERE f.id = ANY($1::uuid[])
+        GROUP BY f.id, ea.attrib, ea.path
+    """
+    return [_build_record(row) for row in await Postgres.fetch(query, folder_ids)]
+
+
+async def _get_children(
+    project_name: str,
+    folder_ids: list[str],
+) -> dict[str, list[str]]:
+    """Return a map of folder ids to the ids of their direct children"""
+    query = f"""
+        SELECT id, parent_id FROM project_{project_name}.folders
+        WHERE parent_id = ANY($1::uuid[])
+    """
+    result: dict[str, list[str]] = {}
+    for row in await Postgres.fetch(query, folder_ids):
+        result.setdefault(row["parent_id"], []).append(row["id"])
+    return result
+
+
+async def _get_cached_records(
+    pipe: Pipeline,
+    keys: FolderListCacheKeys,
+    folder_ids: list[str],
+) -> dict[str, dict[str, Any]]:
+    """Load and parse cached base records of the given folders"""
+    if not folder_ids:
+        return {}
+    result = {}
+    for folder_id, data in zip(
+        folder_ids,
+        await pipe.hmget(keys.base, folder_ids),
+        strict=True,
+    ):
+        if data is not None:
+            result[folder_id] = json_loads(data)
+    return result
+
+
+async def _get_cached_descendants(
+    pipe: Pipeline,
+    keys: FolderListCacheKeys,
+    folder_ids: set[str],
+) -> set[str]:
+    """Return ids of the cached descendants of the given folders"""
+    result: set[str] = set()
+    pending = list(folder_ids)
+    while pending:
+        level: list[str] = []
+        for data in await pipe.hmget(keys.children, pending):
+            if data is None:
+                continue
+            for child_id in json_loads(data):
+                if child_id not in result and child_id not in folder_ids:
+                    result.add(child_id)
+                    level.append(child_id)
+        pending = level
+    return result
+
+
+async def update_hierarchy_cache(
+    project_name: str,
+    folder_ids: Iterable[str],
+    *,
+    subtree: bool = True,
+) -> None:
+    """Patch the cached folder list of the project in place.
+
+    Only records of the given folders are reloaded from the database.
+    When `subtree` is set (default), their descendants and ancestors are
+    reloaded too. This is needed when a folder is created, renamed, moved
+    or deleted. Changes which affect only the folder itself (tasks,
+    thumbnails, reviewables) may use `subtree=False`.
+
+    If there is no cached list, nothing is done. It will be built
+    from scratch on the next request.
+    """
+
+    touched_ids = set(folder_ids)
+    if not touched_ids:
+        return
+
+    start_time = time.monotonic()
+    await _ensure_connection()
+    keys = FolderListCacheKeys.for_project(project_name)
+
+    for _ in range(3):
+        async with Redis.redis_pool.pipeline(transaction=True) as pipe:
+            try:
+                # Any write to the cache bumps the version,
+                # so watching it is enough to detect concurrent changes
+                await pipe.watch(keys.version)
+                if not await pipe.exists(keys.version):
+                    return
+
+                if subtree:
+                    requested_ids = await _get_affected_folder_ids(
+                        project_name, list(touched_ids)
+                    )
+                    # Former ancestors of the moved or deleted folders
+                    pending = list(touched_ids)
+                    while pending:
+                        cached = await _get_cached_records(pipe, keys, pending)
+                        pending = []
+                        for record in cached.values():
+                            parent_id = record.get("parentId")
+                            if parent_id and parent_id not in requested_ids:
+                                requested_ids.add(parent_id)
+                                pending.append(parent_id)
+                else:
+                    requested_ids = set(touched_ids)
+
+                records = await _fetch_records(project_name, list(requested_ids))
+                fresh = {record["id"]: record for record in records}
+
+                # Folders which no longer exist. If any of them was touched
+                # with the subtree, its cached descendants are gone too.
+
+                deleted = {i for i in requested_ids if i not in fresh}
+                if deleted and subtree:
+                    deleted |= await _get_cached_descendants(pipe, keys, deleted)
+
+                # has_children is resolved in the database. has_versions of
+                # the fresh records is propagated from their children bottom-up
+
+                children = await _get_children(project_name, list(fresh))
+                outside = [
+                    child_id
+                    for child_ids in children.values()
+                    for child_id in child_ids
+                    if child_id not in fresh
+                ]
+                outside_versions = {
+                    folder_id: record.get("hasVersions", False)
+                    for folder_id, record in (
+                        await _get_cached_records(pipe, keys, outside)
+                    ).items()
+                }
+
+                for record in sorted(
+                    records, key=lambda r: len(r["parents"]), reverse=True
+                ):
+                    child_ids = children.get(record["id"], [])
+                    record["has_children"] = bool(child_ids)
+                    if record["has_versions"]:
+                        continue
+                    record["has_versions"] = any(
+                        fresh[child_id]["has_versions"]
+                        if child_id in fresh
+                        else outside_versions.get(child_id, False)
+                        for child_id in child_ids
+                    )
+
+                pipe.multi()
+                if records:
+                    _hset_records(pipe, keys, records)
+                    _hset_children(pipe, keys, children)
+                    childless = [i for i in fresh if i not in children]
+                    if childless:
+                        pipe.hdel(keys.children, *childless)
+                if deleted:
+                    for key in (*keys.hashes, keys.children):
+                        pipe.hdel(key, *deleted)
+                pipe.incr(keys.version)
+                _expire(pipe, keys)
+                await pipe.execute()
+
+            except WatchError:
+                # Another worker changed the list in the meantime. try again
+                continue
+
+        elapsed_time = time.monotonic() - start_time
+        logger.trace(
+            f"Updated {len(records)} and removed {len(deleted)} records "
+            f"of {project_name} hierarchy cache in {elapsed_time:.2f}s"
+        )
+        return
+
+    # We weren't able to patch the list. Drop it,
+    # so it is rebuilt from scratch on the next request
+    await invalidate_hierarchy_cache(project_name)
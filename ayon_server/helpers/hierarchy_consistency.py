@@ -0,0 +1,77 @@
+from ayon_server.lib.postgres import Postgres
+from ayon_server.logging import logger
+
+
+async def check_hierarchy_consistency(
+    project_name: str,
+    *,
+    repair: bool = False,
+) -> int:
+    """Verify the hierarchy table against the recursive folder definition.
+
+    Hierarchy table is maintained by database triggers. This compares
+    its content with paths computed from the folders table and returns
+    the number of inconsistent records. When `repair` is set,
+    the table is fixed in place.
+    """
+
+    query = f"""
+        WITH RECURSIVE expected AS (
+            SELECT id, name::VARCHAR AS path
+            FROM project_{project_name}.folders
+            WHERE parent_id IS NULL
+            UNION ALL
+            SELECT f.id, (e.path || '/' || f.name)::VARCHAR AS path
+            FROM project_{project_name}.folders f
+            INNER JOIN expected e ON f.parent_id = e.id
+        )
+        SELECT
+            COALESCE(e.id, h.id) AS id,
+            e.path AS expected_path,
+            h.path AS actual_path
+        FROM expected e
+        FULL OUTER JOIN project_{project_name}.hierarchy h
+        ON h.id = e.id
+        WHERE e.path IS DISTINCT FROM h.path
+    """
+
+    async with Postgres.transaction():
+        result = await Postgres.fetch(query)
+        if not result:
+            return 0
+
+        logger.warning(
+            f"Found {len(result)} inconsistent hierarchy records "
+            f"in project {project_name}"
+        )
+
+        if not repair:
+            return len(result)
+
+        to_delete = [row["id"] for row in result if row["expected_path"] is None]
+        to_upsert = [
+            (row["id"], row["expected_path"])
+            for row in result
+            if row["expected_path"] is not None
+        ]
+
+        if to_delete:
+            await Postgres.execute(
+                f"""
+                DELETE FROM project_{project_name}.hierarchy
+                WHERE id = ANY($1::uuid[])
+                """,
+                to_delete,
+            )
+
+        if to_upsert:
+            await Postgres.executemany(
+                f"""
+                INSERT INTO project_{project_name}.hierarchy (id, path)
+                VALUES ($1, $2)
+                ON CONFLICT (id) DO UPDATE SET path = EXCLUDED.path
+                """,
+                to_upsert,
+            )
+
+    return len(result)
@@ -1,4 +1,5 @@
 import time
+from collections.abc import Iterable
 from typing import Any
 
 from ayon_server.entities.core import attribute_library
@@ -73,6 +74,29 @@ async def _rebuild_from(project_name: str, project_attrib: dict[str, Any]) -> No
         await st_upsert.executemany(buff)
 
 
+async def _get_project_attrib(
+    project_name: str,
+    pattr: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Return the inheritable project attributes used as the hierarchy root"""
+    if pattr is None:
+        project_attrib = attribute_library.project_defaults
+        res = await Postgres.fetch(
+            "SELECT attrib FROM public.projects WHERE name = $1", project_name
+        )
+        project_attrib.update(res[0]["attrib"])
+    else:
+        project_attrib = pattr.copy()
+
+    # Filter out non-inheritable and non-folder attributes
+    for attr_type in attribute_library["folder"]:
+        if attr_type["name"] not in project_attrib:
+            continue
+        if not attr_type.get("inherit", True):
+            del project_attrib[attr_type["name"]]
+    return project_attrib
+
+
 async def rebuild_inherited_attributes(
     project_name: str,
     pattr: dict[str, Any] | None = None,
@@ -82,27 +106,108 @@ async def rebuild_inherited_attributes(
     start = time.monotonic()
 
     async with Postgres.transaction():
-        await Postgres.execute(
-            f"REFRESH MATERIALIZED VIEW project_{project_name}.hierarchy"
-        )
+        project_attrib = await _get_project_attrib(project_name, pattr)
+        await _rebuild_from(project_name, project_attrib)
 
-        if pattr is None:
-            project_attrib = attribute_library.project_defaults
-            res = await Postgres.fetch(
-                "SELECT attrib FROM public.projects WHERE name = $1", project_name
-            )
-            project_attrib.update(res[0]["attrib"])
-        else:
-            project_attrib = pattr.copy()
+    elapsed = time.monotonic() - start
+    logger.trace(f"Rebuilt inherited attributes for {project_name} in {elapsed:.2f}s")
 
-        # Filter out non-inheritable and non-folder attributes
-        for attr_type in attribute_library["folder"]:
-            if attr_type["name"] not in project_attrib:
-                continue
-            if not attr_type.get("inherit", True):
-                del project_attrib[attr_type["name"]]
 
-        await _rebuild_from(project_name, project_attrib)
+async def update_inherited_attributes(
+    project_name: str,
+    folder_ids: Iterable[str],
+) -> None:
+    """Recompute exported attributes only for the subtrees of the given folders.
+
+    This is used after an operation touched a known set of folders.
+    Paths and attributes outside of the affected subtrees are left intact,
+    exported attributes of the parent of each subtree root are used as its
+    inheritance base. Ids of deleted folders are silently ignored
+    (their exported attributes are removed by the foreign key cascade).
+
+    Paths are read from the hierarchy table, which is kept
+    up to date by database triggers.
+    """
+    folder_ids = list(set(folder_ids))
+    if not folder_ids:
+        return
+
+    start = time.monotonic()
+
+    query = f"""
+        WITH RECURSIVE subtree AS (
+            SELECT id FROM project_{project_name}.folders
+            WHERE id = ANY($1::uuid[])
+            UNION
+            SELECT f.id FROM project_{project_name}.folders f
+            INNER JOIN subtree s ON f.parent_id = s.id
+        )
+        SELECT
+            h.id, h.path, f.parent_id,
+            f.attrib as own,
+            e.attrib as exported, e.path as exported_path,
+            pe.attrib as parent_exported
+        FROM subtree s
+        INNER JOIN project_{project_name}.hierarchy h
+        ON h.id = s.id
+        INNER JOIN project_{project_name}.folders f
+        ON f.id = s.id
+        LEFT JOIN project_{project_name}.exported_attributes e
+        ON e.folder_id = s.id
+        LEFT JOIN project_{project_name}.exported_attributes pe
+        ON pe.folder_id = f.parent_id
+        ORDER BY h.path ASC
+    """
+
+    async with Postgres.transaction():
+        project_attrib: dict[str, Any] | None = None
+        computed: dict[str, dict[str, Any]] = {}
+        buff: list[tuple[str, str, dict[str, Any]]] = []
+
+        for record in await Postgres.fetch(query, folder_ids):
+            parent_id = record["parent_id"]
+            if parent_id is None:
+                if project_attrib is None:
+                    project_attrib = await _get_project_attrib(project_name)
+                base_attrib_set = project_attrib
+            elif parent_id in computed:
+                base_attrib_set = computed[parent_id]
+            elif record["parent_exported"] is not None:
+                base_attrib_set = record["parent_exported"]
+            else:
+                # Parent was never exported. Inconsistent state,
+                # we cannot continue incrementally.
+                logger.warning(
+                    f"Missing exported attributes of {project_name} folder "
+                    f"{parent_id}. Rebuilding the whole project."
+                )
+                await rebuild_inherited_attributes(project_name)
+                return
+
+            new_attrib_set = {**base_attrib_set, **record["own"]}
+            computed[record["id"]] = new_attrib_set
+
+            if (
+                record["exported"] != new_attrib_set
+                or record["exported_path"] != record["path"]
+            ):
+                buff.append((record["id"], record["path"], new_attrib_set))
+
+        if buff:
+            await Postgres.executemany(
+                f"""
+                INSERT INTO project_{project_name}.exported_attributes
+                    (folder_id, path, attrib)
+                VALUES
+                    ($1, $2, $3)
+                ON CONFLICT (folder_id)
+                DO UPDATE SET path = EXCLUDED.path, attrib = EXCLUDED.attrib
+                """,
+                buff,
+            )
 
     elapsed = time.monotonic() - start
-    logger.trace(f"Rebuilt inherited attributes for {project_name} in {elapsed:.2f}s")
+    logger.trace(
+        f"Updated inherited attributes of {len(computed)} folders "
+        f"in {project_name} in {elapsed:.2f}s"
+    )
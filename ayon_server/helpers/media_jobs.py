@@ -0,0 +1,172 @@
+"""Scheduler of ffmpeg and ffprobe jobs
+
+Media jobs run external processes that may take seconds each and load
+the node heavily, so their number is limited. `media_jobs_concurrency`
+is the limit of the node. The scheduler is local to each server process,
+so the limit is split evenly between the `server_workers` processes
+of the node (each process runs at least one job). Waiting jobs are
+started by priority (interactive before background) and then in the
+order they were submitted.
+
+Jobs with the same key (usually derived from the file id) are
+deduplicated: while a job is waiting or running, submitting the same key
+again waits for the result of the existing job instead of starting
+a new process.
+"""
+
+__all__ = ["JobPriority", "media_jobs"]
+
+import asyncio
+import itertools
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any, Literal, TypeVar
+
+from ayon_server.config import ayonconfig
+from ayon_server.logging import logger
+
+T = TypeVar("T")
+
+JobPriority = Literal["interactive", "background"]
+PRIORITIES: dict[JobPriority, int] = {"interactive": 0, "background": 1}
+
+
+@dataclass
+class MediaJobStats:
+    submitted: int = 0
+    deduplicated: int = 0
+    completed: int = 0
+    failed: int = 0
+    duration_seconds: float = 0.0
+    wait_seconds: float = 0.0
+
+
+@dataclass(eq=False)
+class _Job:
+    kind: str
+    key: str | None
+    func: Callable[[], Awaitable[Any]]
+    future: asyncio.Future[Any]
+    priority: int
+    submitted_at: float = field(default_factory=time.monotonic)
+    started: bool = False
+
+
+class MediaJobScheduler:
+    def __init__(self, concurrency: int) -> None:
+        self.concurrency = max(1, concurrency)
+        self.stats: dict[str, MediaJobStats] = {}
+        self.running = 0
+        self._jobs: dict[str, _Job] = {}
+        self._waiting: set[_Job] = set()
+        self._seq = itertools.count()
+        self._queue: asyncio.PriorityQueue[tuple[int, int, _Job]] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._workers: list[asyncio.Task[None]] = []
+
+    @property
+    def queue_depth(self) -> dict[JobPriority, int]:
+        """Number of waiting jobs per priority"""
+        result: dict[JobPriority, int] = dict.fromkeys(PRIORITIES, 0)
+        names = {value: name for name, value in PRIORITIES.items()}
+        for job in self._waiting:
+            result[names[job.priority]] += 1
+        return result
+
+    def _get_queue(self) -> asyncio.PriorityQueue[tuple[int, int, _Job]]:
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            # Queue and workers are bound to the event loop,
+            # so they are created on first use in each loop
+            self._loop = loop
+            self._queue = asyncio.PriorityQueue()
+            self._jobs = {}
+            self._waiting = set()
+            self._workers = [
+                loop.create_task(self._worker(self._queue))
+                for _ in range(self.concurrency)
+            ]
+        return self._queue
+
+    async def run(
+        self,
+        func: Callable[[], Awaitable[T]],
+        *,
+        kind: str,
+        key: str | None = None,
+        priority: JobPriority = "background",
+    ) -> T:
+        """Run the job when a slot is available and return its result.
+
+        Cancelling the caller does not cancel the job itself,
+        as other callers may be waiting for the same key.
+        """
+        queue = self._get_queue()
+        stats = self.stats.setdefault(kind, MediaJobStats())
+        stats.submitted += 1
+        job_key = f"{kind}:{key}" if key else None
+        priority_value = PRIORITIES[priority]
+
+        job = self._jobs.get(job_key) if job_key else None
+        if job is not None:
+            stats.deduplicated += 1
+            if not job.started and priority_value < job.priority:
+                # Queue it again with the higher priority. The original
+                # entry is skipped by the worker as the job is started.
+                job.priority = priority_value
+                queue.put_nowait((priority_value, next(self._seq), job))
+        else:
+            future = asyncio.get_running_loop().create_future()
+            # Mark exceptions as retrieved when all callers are gone
+            future.add_done_callback(lambda f: f.cancelled() or f.exception())
+            job = _Job(kind, job_key, func, future, priority_value)
+            if job_key:
+                self._jobs[job_key] = job
+            self._waiting.add(job)
+            queue.put_nowait((priority_value, next(self._seq), job))
+
+        return await asyncio.shield(job.future)
+
+    async def _worker(self, queue: asyncio.PriorityQueue[tuple[int, int, _Job]]):
+        while True:
+            _, _, job = await queue.get()
+            if job.started:
+                continue
+            job.started = True
+            self._waiting.discard(job)
+
+            stats = self.stats[job.kind]
+            start_time = time.monotonic()
+            stats.wait_seconds += start_time - job.submitted_at
+            self.running += 1
+            try:
+                result = await job.func()
+            except asyncio.CancelledError:
+                job.future.cancel()
+                task = asyncio.current_task()
+                if task is not None and task.cancelling():
+                    raise  # The worker itself is cancelled
+                # The job cancelled itself, the worker keeps running
+                stats.failed += 1
+            except Exception as e:
+                stats.failed += 1
+                job.future.set_exception(e)
+            else:
+                stats.completed += 1
+                job.future.set_result(result)
+            finally:
+                self.running -= 1
+                stats.duration_seconds += time.monotonic() - start_time
+                if job.key and self._jobs.get(job.key) is job:
+                    del self._jobs[job.key]
+
+            logger.trace(
+                f"Media job {job.key or job.kind} finished "
+                f"in {time.monotonic() - start_time:.2f}s"
+            )
+
+
+media_jobs = MediaJobScheduler(
+    ayonconfig.media_jobs_concurrency // max(1, ayonconfig.server_workers)
+)
@@ -20,6 +20,7 @@ from ayon_server.exceptions import (
     UnsupportedMediaException,
 )
 from ayon_server.files import Storages
+from ayon_server.helpers.media_jobs import JobPriority, media_jobs
 from ayon_server.helpers.mimetypes import is_image_mime_type, is_video_mime_type
 from ayon_server.helpers.thumbnails.common import get_fake_thumbnail, retrieve_thumbnail
 from ayon_server.helpers.thumbnails.store_thumbnail import store_thumbnail
@@ -28,77 +29,98 @@ from ayon_server.logging import logger
 from ayon_server.utils.hashing import create_uuid
 from ayon_server.utils.request_coalescer import RequestCoalescer
 
-PREVIEW_SEMAPHORE = asyncio.Semaphore(3)
-
 
 async def create_video_thumbnail(
     video_path: str,
     *,
     timestamp: float | None = None,
     thumbnail: bool = True,
+    key: str | None = None,
+    priority: JobPriority = "interactive",
 ) -> bytes:
     """Create a thumbnail image for a video file.
 
+    ffmpeg runs in the media job scheduler. Requests with the same
+    `key` (file id), timestamp and size share a single ffmpeg process.
+
     Returns the thumbnail image as bytes.
     """
 
-    async with PREVIEW_SEMAPHORE:
-        async with aiofiles.tempfile.NamedTemporaryFile(
-            suffix=".jpg", delete=True
-        ) as temp_file:
-            temp_path = str(temp_file.name)
+    job_key = f"{key or video_path.split('?')[0]}:{timestamp}:{int(thumbnail)}"
+    return await media_jobs.run(
+        lambda: _create_video_thumbnail(
+            video_path,
+            timestamp=timestamp,
+            thumbnail=thumbnail,
+        ),
+        kind="ffmpeg",
+        key=job_key,
+        priority=priority,
+    )
 
-            cmd: list[str] = ["ffmpeg", "-hide_banner", "-loglevel", "error"]
 
-            if timestamp is not None:
-                cmd.extend(["-ss", str(timestamp)])
+async def _create_video_thumbnail(
+    video_path: str,
+    *,
+    timestamp: float | None = None,
+    thumbnail: bool = True,
+) -> bytes:
+    async with aiofiles.tempfile.NamedTemporaryFile(
+        suffix=".jpg", delete=True
+    ) as temp_file:
+        temp_path = str(temp_file.name)
 
-            cmd.extend(["-y", "-i", video_path])
-            if thumbnail:
-                target_size = ayonconfig.thumbnail_size
-                cmd.extend(
-                    [
-                        "-filter:v",
-                        f"scale={target_size}:-1",
-                    ]
-                )
+        cmd: list[str] = ["ffmpeg", "-hide_banner", "-loglevel", "error"]
 
+        if timestamp is not None:
+            cmd.extend(["-ss", str(timestamp)])
+
+        cmd.extend(["-y", "-i", video_path])
+        if thumbnail:
+            target_size = ayonconfig.thumbnail_size
             cmd.extend(
                 [
-                    "-frames:v",
-                    "1",
-                    "-c:v",
-                    "mjpeg",
-                    temp_path,
+                    "-filter:v",
+                    f"scale={target_size}:-1",
                 ]
             )
 
-            safe_file_name = video_path.split("?")[0]
-            logger.trace(f"Extracting still from {safe_file_name}")
-            proc = await asyncio.create_subprocess_exec(
-                *cmd,
-                stderr=asyncio.subprocess.PIPE,
-            )
+        cmd.extend(
+            [
+                "-frames:v",
+                "1",
+                "-c:v",
+                "mjpeg",
+                temp_path,
+            ]
+        )
 
+        safe_file_name = video_path.split("?")[0]
+        logger.trace(f"Extracting still from {safe_file_name}")
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stderr=asyncio.subprocess.PIPE,
+        )
+
+        try:
+            _, stderr = await proc.communicate()
+        except asyncio.CancelledError:
+            logger.warning("Thumbnail generation cancelled. Terminating ffmpeg.")
             try:
-                _, stderr = await proc.communicate()
-            except asyncio.CancelledError:
-                logger.warning("Thumbnail generation cancelled. Terminating ffmpeg.")
-                try:
-                    proc.terminate()
-                    await asyncio.wait_for(proc.wait(), timeout=2.0)
-                except Exception:
-                    proc.kill()
-                raise
+                proc.terminate()
+                await asyncio.wait_for(proc.wait(), timeout=2.0)
+            except Exception:
+                proc.kill()
+            raise
 
-            if proc.returncode != 0:
-                stderr_str = stderr.decode()
-                raise AyonException(f"FFMPeg failed: {stderr_str}")
+        if proc.returncode != 0:
+            stderr_str = stderr.decode()
+            raise AyonException(f"FFMPeg failed: {stderr_str}")
 
-            async with aiofiles.open(temp_path, "rb") as f:
-                image_bytes = await f.read()
+        async with aiofiles.open(temp_path, "rb") as f:
+            image_bytes = await f.read()
 
-        return image_bytes
+    return image_bytes
 
 
 async def obtain_file_preview(
@@ -113,9 +135,12 @@ async def obtain_file_preview(
     | VersionEntity
     | WorkfileEntity
     | None = None,
+    priority: JobPriority = "interactive",
 ) -> bytes:
     """Return a preview image for a file as bytes.
 
+    Use `priority="background"` when nobody is waiting for the preview,
+    so previews requested by users are generated first.
 
     Raises:
         - UnsupportedMediaException if the mimetype is not supported
@@ -174,7 +199,12 @@ async def obtain_file_preview(
 
     if is_video_mime_type(mime_type) or is_image_mime_type(mime_type):
         try:
-            pvw_bytes = await create_video_thumbnail(path, thumbnail=thumbnail)
+            pvw_bytes = await create_video_thumbnail(
+                path,
+                thumbnail=thumbnail,
+                key=f"{project_name}/{file_id}",
+                priority=priority,
+            )
         except Exception as e:
             logger.error(
                 f"Error creating preview for {project_name}/{file_id}: {str(e)}"
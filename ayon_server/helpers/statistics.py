@@ -1,21 +1,111 @@
+"""Traffic accounting
+
+Ingress and egress are aggregated in memory of each server process
+and periodically added to `public.traffic_stats` by the traffic stats
+background worker (and once more when the server shuts down).
+
+Each flush adds only the traffic counted since the previous flush,
+so the totals of all server processes and nodes add up correctly
+regardless of how often each of them flushes. Traffic is counted per
+UTC day, so nodes in different timezones add to the same rows.
+"""
+
+import datetime
+import time
 from typing import Literal
 
 from ayon_server.lib.postgres import Postgres
 
 UsageType = Literal["ingress", "egress"]
 
+# (date, service) -> [ingress, egress]
+TrafficCounters = dict[tuple[datetime.date, str], list[int]]
+
+
+class TrafficStats:
+    def __init__(self) -> None:
+        self.pending: TrafficCounters = {}
+        self.pending_since: float | None = None
+        self.last_flush = time.time()
+        self.flushed_bytes = 0
+        self.failed_flushes = 0
+
+    def record(self, usage_type: UsageType, value: int, service: str) -> None:
+        if usage_type not in ["ingress", "egress"]:
+            raise ValueError("Invalid usage type")
+        key = (datetime.datetime.now(datetime.UTC).date(), service)
+        counters = self.pending.setdefault(key, [0, 0])
+        counters[0 if usage_type == "ingress" else 1] += value
+        if self.pending_since is None:
+            self.pending_since = time.time()
+
+    @property
+    def flush_lag(self) -> float:
+        """Age of the oldest traffic not written to the database (seconds)"""
+        if self.pending_since is None:
+            return 0.0
+        return time.time() - self.pending_since
+
+    def pending_bytes(self, usage_type: UsageType) -> int:
+        index = 0 if usage_type == "ingress" else 1
+        return sum(counters[index] for counters in self.pending.values())
+
+    async def flush(self) -> None:
+        """Add the pending traffic to the database
+
+        When the write fails, the traffic is kept for the next flush.
+        """
+        if not self.pending:
+            return
+
+        pending, pending_since = self.pending, self.pending_since
+        self.pending, self.pending_since = {}, None
+
+        # Sorted, so concurrent flushes of multiple processes
+        # lock the rows in the same order
+        keys = sorted(pending)
+        query = """
+            INSERT INTO public.traffic_stats (date, service, ingress, egress)
+            SELECT * FROM UNNEST($1::date[], $2::varchar[], $3::bigint[], $4::bigint[])
+            ON CONFLICT (date, service) DO UPDATE SET
+                ingress = traffic_stats.ingress + EXCLUDED.ingress,
+                egress = traffic_stats.egress + EXCLUDED.egress
+        """
+        try:
+            await Postgres.execute(
+                query,
+                [key[0] for key in keys],
+                [key[1] for key in keys],
+                [pending[key][0] for key in keys],
+                [pending[key][1] for key in keys],
+            )
+        except BaseException:
+            # Including cancellation, so the traffic is written at shutdown
+            self.failed_flushes += 1
+            for key, (ingress, egress) in pending.items():
+                counters = self.pending.setdefault(key, [0, 0])
+                counters[0] += ingress
+                counters[1] += egress
+            if self.pending_since is None or (
+                pending_since is not None and pending_since < self.pending_since
+            ):
+                self.pending_since = pending_since
+            raise
+
+        self.flushed_bytes += sum(sum(counters) for counters in pending.values())
+        self.last_flush = time.time()
+
+
+traffic_stats = TrafficStats()
+
 
 async def update_traffic_stats(
     usage_type: UsageType,
     value: int,
     service: str = "ayon",
 ) -> None:
-    if usage_type not in ["ingress", "egress"]:
-        raise ValueError("Invalid usage type")
-    query = f"""
-       INSERT INTO public.traffic_stats (date, service, {usage_type})
-       VALUES (current_date, $1, $2)
-       ON CONFLICT (date, service)
-       DO UPDATE SET {usage_type} = traffic_stats.{usage_type} + $2
+    """Count transferred bytes
+
+    Traffic is written to the database by the traffic stats worker.
     """
-    await Postgres().execute(query, service, value)
+    traffic_stats.record(usage_type, value, service)
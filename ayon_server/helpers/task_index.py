@@ -0,0 +1,34 @@
+from ayon_server.lib.postgres import Postgres
+from ayon_server.logging import logger
+
+
+async def rebuild_task_index(project_name: str) -> int:
+    """Rebuild public.task_index records of the project.
+
+    The index is normally maintained by database triggers on the project
+    tables. This recreates it from scratch and returns the number of
+    indexed tasks.
+    """
+
+    query = f"""
+        INSERT INTO public.task_index (
+            project_name, task_id, assignees, status,
+            due_date, priority, folder_path, updated_at
+        )
+        SELECT
+            $1, t.id, t.assignees, t.status,
+            t.attrib->>'endDate', t.attrib->>'priority', h.path, t.updated_at
+        FROM project_{project_name}.tasks t
+        LEFT JOIN project_{project_name}.hierarchy h ON h.id = t.folder_id
+    """
+
+    async with Postgres.transaction():
+        await Postgres.execute(
+            "DELETE FROM public.task_index WHERE project_name = $1",
+            project_name,
+        )
+        status = await Postgres.execute(query, project_name)
+
+    count = int(status.split()[-1])
+    logger.debug(f"Indexed {count} tasks of project {project_name}")
+    return count
@@ -0,0 +1,176 @@
+"""Batch retrieval of entity thumbnails
+
+Thumbnails of many entities (e.g. a browser grid) are resolved with
+a few set-based queries and returned in a single payload: a length
+prefixed JSON header with an entry per item (status, etag, size)
+followed by the concatenated thumbnails. The format is described
+in the `/thumbnails/batch` endpoint documentation.
+"""
+
+import asyncio
+import struct
+from typing import Any, Literal
+
+from pydantic import validator
+
+from ayon_server.entities import UserEntity
+from ayon_server.exceptions import NotFoundException
+from ayon_server.helpers.mimetypes import guess_mime_type
+from ayon_server.logging import logger
+from ayon_server.types import Field, OPModel
+from ayon_server.utils import EntityID, json_dumps
+
+from .common import (
+    ThumbnailInfo,
+    get_thumbnail_hashes,
+    retrieve_thumbnails,
+    thumbnail_content_hash,
+)
+from .thumbnail_acl import filter_accessible
+from .thumbnail_info_resolvers import resolve_thumbnail_infos
+
+THUMBNAIL_BATCH_MEDIA_TYPE = "application/x-ayon-thumbnails"
+
+# Number of previews generated from reviewable files at once
+PREVIEW_CONCURRENCY = 4
+
+
+class ThumbnailBatchItem(OPModel):
+    entity_type: Literal["folder", "task", "version", "workfile"] = Field(
+        ...,
+        title="Entity type",
+    )
+    entity_id: str = Field(..., title="Entity ID")
+    etag: str | None = Field(
+        None,
+        title="ETag",
+        description="ETag of the thumbnail the client already has",
+    )
+
+    @validator("entity_id")
+    def validate_entity_id(cls, value: str) -> str:
+        entity_id = EntityID.parse(value)
+        if entity_id is None:
+            raise ValueError("Entity ID is required")
+        return entity_id
+
+
+def _etag(content_hash: str) -> str:
+    return f'"{content_hash}"'
+
+
+async def _get_previews(
+    project_name: str,
+    file_ids: set[str],
+) -> dict[str, bytes]:
+    """Return previews of reviewable files which don't have thumbnails yet"""
+    from ayon_server.helpers.preview import get_file_preview_bytes
+
+    semaphore = asyncio.Semaphore(PREVIEW_CONCURRENCY)
+    result: dict[str, bytes] = {}
+
+    async def get_preview(file_id: str) -> None:
+        async with semaphore:
+            try:
+                result[file_id] = await get_file_preview_bytes(project_name, file_id)
+            except NotFoundException:
+                pass
+            except Exception as e:
+                logger.warning(
+                    f"Unable to get preview of {project_name}/{file_id}: {e}"
+                )
+
+    await asyncio.gather(*(get_preview(file_id) for file_id in file_ids))
+    return result
+
+
+async def get_thumbnail_batch(
+    project_name: str,
+    items: list[ThumbnailBatchItem],
+    user: UserEntity,
+) -> bytes:
+    """Return thumbnails of the requested entities as a packed payload"""
+
+    infos: dict[tuple[str, str], ThumbnailInfo] = {}
+    ids_by_type: dict[str, list[str]] = {}
+    for item in items:
+        ids_by_type.setdefault(item.entity_type, []).append(item.entity_id)
+    for entity_type, entity_ids in ids_by_type.items():
+        resolved = await resolve_thumbnail_infos(project_name, entity_type, entity_ids)
+        for entity_id, info in resolved.items():
+            infos[(entity_type, entity_id)] = info
+
+    accessible = await filter_accessible(project_name, infos, user)
+
+    thumbnail_ids: set[str] = set()
+    for key in accessible:
+        if thumbnail_id := infos[key].get("thumbnail_id"):
+            thumbnail_ids.add(thumbnail_id)
+    hashes = await get_thumbnail_hashes(project_name, list(thumbnail_ids))
+
+    # Only load thumbnails the client does not already have
+
+    to_load: set[str] = set()
+    file_ids: set[str] = set()
+    for item in items:
+        key = (item.entity_type, item.entity_id)
+        if key not in accessible:
+            continue
+        info = infos[key]
+        if thumbnail_id := info.get("thumbnail_id"):
+            known_hash = hashes.get(thumbnail_id)
+            if not (known_hash and item.etag == _etag(known_hash)):
+                to_load.add(thumbnail_id)
+        elif file_id := info.get("file_id"):
+            file_ids.add(file_id)
+
+    thumbnails = await retrieve_thumbnails(project_name, list(to_load), hashes)
+    previews = await _get_previews(project_name, file_ids) if file_ids else {}
+
+    header: list[dict[str, Any]] = []
+    payloads: list[bytes] = []
+    for item in items:
+        key = (item.entity_type, item.entity_id)
+        entry: dict[str, Any] = {
+            "entityType": item.entity_type,
+            "entityId": item.entity_id,
+            "status": 404,
+        }
+        header.append(entry)
+        if key not in infos:
+            continue
+        if key not in accessible:
+            entry["status"] = 403
+            continue
+
+        info = infos[key]
+        content: bytes | None = None
+        if thumbnail_id := info.get("thumbnail_id"):
+            if thumbnail_id in thumbnails:
+                content, content_hash = thumbnails[thumbnail_id]
+            elif (content_hash := hashes.get(thumbnail_id, "")) and (
+                item.etag == _etag(content_hash)
+            ):
+                entry["status"] = 304
+                entry["etag"] = _etag(content_hash)
+                continue
+        elif file_id := info.get("file_id"):
+            if file_id in previews:
+                content = previews[file_id]
+                content_hash = thumbnail_content_hash(content)
+
+        if content is None:
+            continue
+
+        entry["etag"] = _etag(content_hash)
+        if item.etag == entry["etag"]:
+            entry["status"] = 304
+            continue
+
+        entry["status"] = 200
+        entry["mime"] = guess_mime_type(content) or "image/png"
+        entry["size"] = len(content)
+        payloads.append(content)
+
+    header_bytes = json_dumps(header).encode()
+    return b"".join([struct.pack(">I", len(header_bytes)), header_bytes, *payloads])
@@ -1,5 +1,6 @@
 import base64
 import functools
+import hashlib
 from typing import Literal, NotRequired, TypedDict
 
 from fastapi import Response
@@ -7,6 +8,7 @@ from fastapi import Response
 from ayon_server.exceptions import NotFoundException
 from ayon_server.files import Storages
 from ayon_server.helpers.mimetypes import guess_mime_type
+from ayon_server.lib.blob_cache import thumbnail_cache
 from ayon_server.lib.postgres import Postgres
 from ayon_server.lib.redis import Redis
 from ayon_server.logging import logger
@@ -38,13 +40,19 @@ class ThumbnailData(TypedDict):
     mime: str
 
 
-@Redis.cached(
-    "thumbnail",
-    "{project_name}:{thumbnail_id}:{mode}",
-    ttl=300,
-    model="bytes",
-)
-async def retrieve_thumbnail(
+THUMBNAIL_HASH_NS = "thumbnail-hash"
+THUMBNAIL_HASH_TTL = 3600
+
+
+def thumbnail_cache_key(
+    project_name: str,
+    thumbnail_id: str,
+    mode: Literal["small", "original"] = "small",
+) -> str:
+    return f"{project_name}:{thumbnail_id}:{mode}"
+
+
+async def _load_thumbnail(
     project_name: str,
     thumbnail_id: str,
     mode: Literal["small", "original"] = "small",
@@ -68,6 +76,102 @@ async def retrieve_thumbnail(
     return content
 
 
+async def retrieve_thumbnail(
+    project_name: str,
+    thumbnail_id: str,
+    mode: Literal["small", "original"] = "small",
+) -> bytes | None:
+    """Return the thumbnail payload or None if it does not exist.
+
+    Payloads are cached in `thumbnail_cache` of the node under a key
+    containing their content hash. Redis only holds the hash of the
+    current payload, so all nodes agree on which version is valid.
+    """
+    key = thumbnail_cache_key(project_name, thumbnail_id, mode)
+    if content_hash := await Redis.get(THUMBNAIL_HASH_NS, key):
+        if isinstance(content_hash, bytes):
+            content_hash = content_hash.decode()
+        content = await thumbnail_cache.get(f"{key}:{content_hash}")
+        if content is not None:
+            return content
+
+    content = await _load_thumbnail(project_name, thumbnail_id, mode)
+    if content is None:
+        return None
+
+    await _cache_thumbnail(key, content)
+    return content
+
+
+def thumbnail_content_hash(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()[:16]
+
+
+async def _cache_thumbnail(key: str, content: bytes) -> str:
+    content_hash = thumbnail_content_hash(content)
+    await thumbnail_cache.set(f"{key}:{content_hash}", content)
+    await Redis.set(THUMBNAIL_HASH_NS, key, content_hash, ttl=THUMBNAIL_HASH_TTL)
+    return content_hash
+
+
+async def get_thumbnail_hashes(
+    project_name: str,
+    thumbnail_ids: list[str],
+) -> dict[str, str]:
+    """Return known content hashes of small thumbnails.
+
+    Thumbnails which were not retrieved recently are not included.
+    """
+    keys = [thumbnail_cache_key(project_name, tid) for tid in thumbnail_ids]
+    result = {}
+    for thumbnail_id, value in zip(
+        thumbnail_ids,
+        await Redis.get_many(THUMBNAIL_HASH_NS, keys),
+        strict=True,
+    ):
+        if value:
+            result[thumbnail_id] = value.decode() if isinstance(value, bytes) else value
+    return result
+
+
+async def retrieve_thumbnails(
+    project_name: str,
+    thumbnail_ids: list[str],
+    hashes: dict[str, str] | None = None,
+) -> dict[str, tuple[bytes, str]]:
+    """Return small thumbnails and their content hashes.
+
+    Thumbnails missing in the local cache are loaded using a single query.
+    `hashes` may be provided if they were already obtained
+    by `get_thumbnail_hashes`.
+    """
+    if hashes is None:
+        hashes = await get_thumbnail_hashes(project_name, thumbnail_ids)
+
+    result: dict[str, tuple[bytes, str]] = {}
+    missing: list[str] = []
+    for thumbnail_id in thumbnail_ids:
+        content_hash = hashes.get(thumbnail_id)
+        if content_hash:
+            key = thumbnail_cache_key(project_name, thumbnail_id)
+            content = await thumbnail_cache.get(f"{key}:{content_hash}")
+            if content is not None:
+                result[thumbnail_id] = (content, content_hash)
+                continue
+        missing.append(thumbnail_id)
+
+    if missing:
+        query = f"""
+            SELECT id, data FROM project_{project_name}.thumbnails
+            WHERE id = ANY($1) AND data IS NOT NULL
+        """
+        for row in await Postgres.fetch(query, missing):
+            key = thumbnail_cache_key(project_name, row["id"])
+            content_hash = await _cache_thumbnail(key, row["data"])
+            result[row["id"]] = (row["data"], content_hash)
+    return result
+
+
 async def get_thumbnail_response(
     thumbnail_info: ThumbnailInfo,
     *,
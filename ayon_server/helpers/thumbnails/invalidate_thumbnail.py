@@ -1,11 +1,14 @@
 import uuid
 
 from ayon_server.events.eventstream import EventStream
+from ayon_server.lib.blob_cache import thumbnail_cache
 from ayon_server.lib.postgres import Postgres
 from ayon_server.lib.redis import Redis
 from ayon_server.logging import logger
 from ayon_server.types import OPModel
 
+from .common import THUMBNAIL_HASH_NS, thumbnail_cache_key
+
 
 class AffectedEntity(OPModel):
     entity_type: str
@@ -103,8 +106,10 @@ async def invalidate_thumbnail_by_id(
     the thumbnail from the cache.
     """
 
-    await Redis.delete("thumbnail", f"{project_name}:{thumbnail_id}:small")
-    await Redis.delete("thumbnail", f"{project_name}:{thumbnail_id}:original")
+    for mode in ("small", "original"):
+        key = thumbnail_cache_key(project_name, thumbnail_id, mode)
+        await Redis.delete(THUMBNAIL_HASH_NS, key)
+        await thumbnail_cache.invalidate(f"{key}:")
 
     affected_entities: list[AffectedEntity] = []
 
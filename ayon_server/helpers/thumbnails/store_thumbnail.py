@@ -2,7 +2,7 @@ from ayon_server.config import ayonconfig
 from ayon_server.entities import FolderEntity, TaskEntity, VersionEntity, WorkfileEntity
 from ayon_server.exceptions import UnsupportedMediaException
 from ayon_server.files import Storages
-from ayon_server.helpers.hierarchy_cache import rebuild_hierarchy_cache
+from ayon_server.helpers.hierarchy_cache import update_hierarchy_cache
 from ayon_server.helpers.mimetypes import guess_mime_type
 from ayon_server.lib.postgres import Postgres
 from ayon_server.logging import logger
@@ -95,7 +95,11 @@ async def store_thumbnail(
             await entity.save()
 
         affected_entities = await invalidate_thumbnail_by_id(project_name, thumbnail_id)
-        await rebuild_hierarchy_cache(project_name)
+        await update_hierarchy_cache(
+            project_name,
+            {e.entity_id for e in affected_entities if e.entity_type == "folder"},
+            subtree=False,
+        )
         return affected_entities
 
 
@@ -19,3 +19,22 @@ async def ensure_accessible(thumbnail_info: ThumbnailInfo, user: UserEntity) ->
         return
 
     raise ForbiddenException("You don't have access to this thumbnail")
+
+
+async def filter_accessible[K](
+    project_name: str,
+    thumbnail_infos: dict[K, ThumbnailInfo],
+    user: UserEntity,
+) -> set[K]:
+    """Return keys of thumbnail infos the user has access to.
+
+    Access list of the user is loaded once for all thumbnails.
+    """
+    if user.is_manager:
+        return set(thumbnail_infos)
+
+    access_checker = AccessChecker()
+    await access_checker.load(user, project_name)
+    return {
+        key for key, info in thumbnail_infos.items() if access_checker[info["path"]]
+    }
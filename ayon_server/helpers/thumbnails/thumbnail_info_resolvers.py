@@ -232,3 +232,145 @@ async def resolve_workfile_thumbnail_info(
         "thumbnail_source": "workfile" if res["thumbnail_id"] else None,
         "file_id": None,
     }
+
+
+#
+# Batch resolution
+#
+
+# Reviewables joined to the entity by the `entity_id` column.
+# Only the latest reviewable of each entity is used.
+
+BATCH_REVIEWABLES_QUERIES = {
+    "folder": """
+        SELECT DISTINCT ON (p.folder_id)
+            p.folder_id AS entity_id,
+            f.id AS reviewable_id,
+            f.thumbnail_id AS reviewable_thumbnail_id,
+            v.thumbnail_id AS version_thumbnail_id
+        FROM project_{project_name}.products p
+        JOIN project_{project_name}.versions v
+            ON v.product_id = p.id
+        JOIN project_{project_name}.activity_feed a
+            ON a.entity_id = v.id
+            AND a.entity_type = 'version'
+            AND a.activity_type = 'reviewable'
+            AND a.reference_type = 'origin'
+        JOIN project_{project_name}.files f
+            ON f.activity_id = a.activity_id
+        WHERE p.folder_id = ANY($1)
+        ORDER BY p.folder_id, a.created_at DESC
+    """,
+    "task": """
+        SELECT DISTINCT ON (v.task_id)
+            v.task_id AS entity_id,
+            f.id AS reviewable_id,
+            f.thumbnail_id AS reviewable_thumbnail_id,
+            v.thumbnail_id AS version_thumbnail_id
+        FROM project_{project_name}.versions v
+        JOIN project_{project_name}.activity_feed a
+            ON a.entity_id = v.id
+            AND a.entity_type = 'version'
+            AND a.activity_type = 'reviewable'
+            AND a.reference_type = 'origin'
+        JOIN project_{project_name}.files f
+            ON f.activity_id = a.activity_id
+        WHERE v.task_id = ANY($1)
+        ORDER BY v.task_id, a.created_at DESC
+    """,
+    "version": """
+        SELECT DISTINCT ON (a.entity_id)
+            a.entity_id AS entity_id,
+            f.id AS reviewable_id,
+            f.thumbnail_id AS reviewable_thumbnail_id,
+            NULL::UUID AS version_thumbnail_id
+        FROM project_{project_name}.activity_feed a
+        JOIN project_{project_name}.files f
+            ON f.activity_id = a.activity_id
+        WHERE a.entity_id = ANY($1)
+            AND a.entity_type = 'version'
+            AND a.activity_type = 'reviewable'
+            AND a.reference_type = 'origin'
+        ORDER BY a.entity_id, a.created_at DESC
+    """,
+}
+
+# Entities with their own thumbnail and the path used for access control
+
+BATCH_ENTITIES_QUERIES = {
+    "folder": """
+        SELECT entity.id, entity.thumbnail_id, h.path
+        FROM project_{project_name}.folders entity
+        JOIN project_{project_name}.hierarchy h ON h.id = entity.id
+        WHERE entity.id = ANY($1)
+    """,
+    "task": """
+        SELECT entity.id, entity.thumbnail_id, h.path
+        FROM project_{project_name}.tasks entity
+        JOIN project_{project_name}.hierarchy h ON h.id = entity.folder_id
+        WHERE entity.id = ANY($1)
+    """,
+    "version": """
+        SELECT entity.id, entity.thumbnail_id, h.path
+        FROM project_{project_name}.versions entity
+        JOIN project_{project_name}.products p ON p.id = entity.product_id
+        JOIN project_{project_name}.hierarchy h ON h.id = p.folder_id
+        WHERE entity.id = ANY($1)
+    """,
+    "workfile": """
+        SELECT entity.id, entity.thumbnail_id, h.path
+        FROM project_{project_name}.workfiles entity
+        JOIN project_{project_name}.hierarchy h ON h.id = entity.folder_id
+        WHERE entity.id = ANY($1)
+    """,
+}
+
+
+async def resolve_thumbnail_infos(
+    project_name: str,
+    entity_type: str,
+    entity_ids: list[str],
+) -> dict[str, ThumbnailInfo]:
+    """Resolve thumbnail info of multiple entities of the same type.
+
+    Uses the same rules as the single entity resolvers, but with one query
+    for the entities and one for their reviewables. Entities which
+    don't exist are not included in the result.
+    """
+    if entity_type not in BATCH_ENTITIES_QUERIES:
+        raise ValueError(f"Unsupported entity type '{entity_type}' for thumbnail")
+
+    query = BATCH_ENTITIES_QUERIES[entity_type].format(project_name=project_name)
+    entities = await Postgres.fetch(query, entity_ids)
+
+    reviewables = {}
+    if entity_type in BATCH_REVIEWABLES_QUERIES:
+        query = BATCH_REVIEWABLES_QUERIES[entity_type]
+        query = query.format(project_name=project_name)
+        for row in await Postgres.fetch(query, [row["id"] for row in entities]):
+            reviewables[row["entity_id"]] = row
+
+    result: dict[str, ThumbnailInfo] = {}
+    for row in entities:
+        reviewable = reviewables.get(row["id"])
+        if row["thumbnail_id"]:
+            thumbnail_source = entity_type
+            thumbnail_id = row["thumbnail_id"]
+        elif reviewable and reviewable["version_thumbnail_id"]:
+            thumbnail_source = "version"
+            thumbnail_id = reviewable["version_thumbnail_id"]
+        elif reviewable and reviewable["reviewable_thumbnail_id"]:
+            thumbnail_source = "reviewable"
+            thumbnail_id = reviewable["reviewable_thumbnail_id"]
+        else:
+            thumbnail_source = None
+            thumbnail_id = None
+
+        result[row["id"]] = {
+            "project_name": project_name,
+            "path": row["path"],
+            "thumbnail_id": thumbnail_id,
+            "thumbnail_source": thumbnail_source,
+            "file_id": reviewable["reviewable_id"] if reviewable else None,
+        }
+    return result
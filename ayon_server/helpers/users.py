@@ -2,7 +2,7 @@ from ayon_server.lib.postgres import Postgres
 from ayon_server.lib.redis import Redis
 
 
-@Redis.cached("global", "manager-names", ttl=3600)
+@Redis.cached("users", "manager-names", ttl=3600, local_ttl=60)
 async def get_manager_names() -> list[str]:
     """
     Returns a set of user names for all users with manager access.
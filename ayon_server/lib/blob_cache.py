@@ -0,0 +1,210 @@
+"""Per-node cache of binary payloads (thumbnails)
+
+Blobs are kept in memory of the server process up to `max_bytes`
+(least recently used are evicted first). When `disk_dir` is set, blobs
+are also written there and evicted from it when it exceeds
+`max_disk_bytes`, so they survive restarts and are shared by the
+server processes of the node.
+
+Keys should contain a hash of the content, so a changed payload never
+hits a stale entry and entries of other nodes don't need to be
+invalidated: they are not reachable and they age out.
+"""
+
+import asyncio
+import os
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from urllib.parse import quote, unquote
+
+import aiofiles
+import aiofiles.os
+
+from ayon_server.config import ayonconfig
+from ayon_server.logging import logger
+
+
+@dataclass
+class BlobCacheStats:
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class BlobCache:
+    def __init__(
+        self,
+        max_bytes: int,
+        disk_dir: str | None = None,
+        max_disk_bytes: int = 0,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.stats = BlobCacheStats()
+        self.size = 0
+        self.disk_size = 0
+        self._data: OrderedDict[str, bytes] = OrderedDict()
+        self._disk: OrderedDict[str, int] | None = None
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    #
+    # Memory tier
+    #
+
+    def _remember(self, key: str, data: bytes) -> None:
+        if len(data) > self.max_bytes:
+            return
+        if old := self._data.pop(key, None):
+            self.size -= len(old)
+        self._data[key] = data
+        self.size += len(data)
+        while self.size > self.max_bytes:
+            _, evicted = self._data.popitem(last=False)
+            self.size -= len(evicted)
+            self.stats.evictions += 1
+
+    #
+    # Disk tier
+    #
+
+    def _disk_path(self, key: str) -> str:
+        assert self.disk_dir is not None
+        return os.path.join(self.disk_dir, quote(key, safe=""))
+
+    def _scan_disk(self) -> list[tuple[float, str, int]] | None:
+        """Return (mtime, key, size) of the blobs on disk
+
+        Blocking, runs in a thread. Returns None if the directory
+        is not available.
+        """
+        assert self.disk_dir is not None
+        entries = []
+        try:
+            os.makedirs(self.disk_dir, exist_ok=True)
+            for entry in os.scandir(self.disk_dir):
+                if not entry.is_file() or entry.name.endswith(".tmp"):
+                    continue
+                stat = entry.stat()
+                entries.append((stat.st_mtime, unquote(entry.name), stat.st_size))
+        except OSError as e:
+            logger.warning(f"Disk cache {self.disk_dir} is not available: {e}")
+            return None
+        return entries
+
+    async def _disk_index(self) -> OrderedDict[str, int]:
+        """Return the index of blobs on disk (oldest first)
+
+        The index is built from the directory listing on first use.
+        """
+        if self._disk is not None:
+            return self._disk
+        entries = await asyncio.to_thread(self._scan_disk)
+        if self._disk is not None:
+            return self._disk  # built by a concurrent call
+        self._disk = OrderedDict()
+        if entries is None:
+            self.disk_dir = None
+            return self._disk
+        for _, key, size in sorted(entries):
+            self._disk[key] = size
+            self.disk_size += size
+        return self._disk
+
+    async def _remove_from_disk(self, key: str) -> None:
+        index = await self._disk_index()
+        if (size := index.pop(key, None)) is None:
+            return
+        self.disk_size -= size
+        try:
+            await aiofiles.os.remove(self._disk_path(key))
+        except FileNotFoundError:
+            pass  # removed by another process
+
+    async def _load_from_disk(self, key: str) -> bytes | None:
+        if not self.disk_dir:
+            return None
+        index = await self._disk_index()
+        if not self.disk_dir:
+            return None
+        try:
+            async with aiofiles.open(self._disk_path(key), "rb") as f:
+                data = await f.read()
+        except OSError:
+            return None
+        if key in index:
+            index.move_to_end(key)
+        else:
+            # Stored by another process of the node
+            index[key] = len(data)
+            self.disk_size += len(data)
+        return data
+
+    async def _store_on_disk(self, key: str, data: bytes) -> None:
+        if not self.disk_dir or len(data) > self.max_disk_bytes:
+            return
+        index = await self._disk_index()
+        if not self.disk_dir:
+            return
+        path = self._disk_path(key)
+        tmp_path = f"{path}.{uuid.uuid1().hex}.tmp"
+        try:
+            async with aiofiles.open(tmp_path, "wb") as f:
+                await f.write(data)
+            await aiofiles.os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write {key} to the blob cache: {e}")
+            return
+        if (old := index.pop(key, None)) is not None:
+            self.disk_size -= old
+        index[key] = len(data)
+        self.disk_size += len(data)
+        while self.disk_size > self.max_disk_bytes and index:
+            await self._remove_from_disk(next(iter(index)))
+
+    #
+    # Public interface
+    #
+
+    async def get(self, key: str) -> bytes | None:
+        """Return the cached blob or None"""
+        if (data := self._data.get(key)) is not None:
+            self._data.move_to_end(key)
+            self.stats.hits += 1
+            return data
+        if (data := await self._load_from_disk(key)) is not None:
+            self._remember(key, data)
+            self.stats.disk_hits += 1
+            return data
+        self.stats.misses += 1
+        return None
+
+    async def set(self, key: str, data: bytes) -> None:
+        self._remember(key, data)
+        await self._store_on_disk(key, data)
+
+    async def invalidate(self, prefix: str) -> None:
+        """Drop all blobs with keys starting with the prefix"""
+        for key in [k for k in self._data if k.startswith(prefix)]:
+            self.size -= len(self._data.pop(key))
+        if self.disk_dir:
+            index = await self._disk_index()
+            for key in [k for k in index if k.startswith(prefix)]:
+                await self._remove_from_disk(key)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.size = 0
+
+
+_MB = 1024 * 1024
+
+thumbnail_cache = BlobCache(
+    ayonconfig.thumbnail_cache_size * _MB,
+    disk_dir=ayonconfig.thumbnail_cache_dir,
+    max_disk_bytes=ayonconfig.thumbnail_cache_disk_size * _MB,
+)
@@ -0,0 +1,85 @@
+"""Per-process cache tier in front of Redis
+
+Values returned by `Redis.cached` functions with `local_ttl` set are kept
+in memory of the worker process, so repeated calls skip the Redis round
+trip and deserialization. Entries are evicted on TTL expiration, when the
+cache is full (least recently used first), or when the record is changed
+or deleted in Redis by any server process (see `Redis.set` and
+`Redis.delete`).
+"""
+
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+LOCAL_CACHE_SIZE = 10_000
+
+# Unique identifier of this process. Used to ignore own invalidation messages
+PROCESS_ID = uuid.uuid1().hex
+
+
+@dataclass
+class LocalCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class LocalCache:
+    def __init__(self, max_size: int = LOCAL_CACHE_SIZE):
+        self.max_size = max_size
+        self.namespaces: set[str] = set()
+        self.stats: dict[str, LocalCacheStats] = {}
+        self._data: OrderedDict[tuple[str, str], tuple[float, Any]] = OrderedDict()
+
+    def register(self, namespace: str) -> None:
+        """Mark the namespace as locally cached.
+
+        Changes of records in registered namespaces are broadcast
+        to other server processes.
+        """
+        self.namespaces.add(namespace)
+        self.stats.setdefault(namespace, LocalCacheStats())
+
+    def get(self, namespace: str, key: str) -> Any:
+        """Return the cached value or None if missing or expired"""
+        stats = self.stats[namespace]
+        item = self._data.get((namespace, key))
+        if item is None:
+            stats.misses += 1
+            return None
+        expires_at, value = item
+        if expires_at < time.monotonic():
+            del self._data[(namespace, key)]
+            stats.misses += 1
+            stats.evictions += 1
+            return None
+        self._data.move_to_end((namespace, key))
+        stats.hits += 1
+        return value
+
+    def set(self, namespace: str, key: str, value: Any, ttl: float) -> None:
+        self._data[(namespace, key)] = (time.monotonic() + ttl, value)
+        self._data.move_to_end((namespace, key))
+        while len(self._data) > self.max_size:
+            (evicted_ns, _), _ = self._data.popitem(last=False)
+            self.stats[evicted_ns].evictions += 1
+
+    def invalidate(self, namespace: str, key: str | None = None) -> None:
+        """Drop a record or (if key is not provided) the whole namespace"""
+        if key is not None:
+            self._data.pop((namespace, key), None)
+            return
+        for item_key in [k for k in self._data if k[0] == namespace]:
+            del self._data[item_key]
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+local_cache = LocalCache()
@@ -1,4 +1,5 @@
 import asyncio
+import time
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from contextvars import ContextVar
@@ -15,6 +16,8 @@ from ayon_server.exceptions import ServiceUnavailableException
 from ayon_server.logging import logger
 
 from .postgres_setup import postgres_setup
+from .request_stats import request_stats
+from .statement_stats import statement_stats
 
 if TYPE_CHECKING:
     Connection = PoolConnectionProxy[Any]
@@ -157,12 +160,15 @@ class Postgres:
         if timeout is None:
             timeout = ayonconfig.postgres_pool_timeout
 
+        start_time = time.monotonic()
         try:
             connection_proxy = await cls.pool.acquire(timeout=timeout)
         except TimeoutError:
             raise ServiceUnavailableException("Database pool timeout")
         except TooManyConnectionsError:
             raise ServiceUnavailableException("Database pool is full")
+        finally:
+            request_stats.record_pool_wait(time.monotonic() - start_time)
 
         token = _current_connection.set(connection_proxy)
 
@@ -277,9 +283,23 @@ class Postgres:
         cls,
         query: str,
         *args: Any,
+        project_name: str | None = None,
         **kwargs: Any,
     ) -> AsyncGenerator[dict[str, Any]]:
-        """Run a query and return a generator yielding rows as dictionaries."""
+        """Run a query and return a generator yielding rows as dictionaries.
+
+        When `project_name` is provided, the query runs with the search path
+        set to the project schema, so it may reference project tables
+        without the `project_{name}.` prefix. Such schema-relative queries
+        have the same text for all projects and share one cached statement
+        per connection instead of one per project.
+
+        Postgres re-plans the statement when the connection switches
+        to another project, but its result columns must stay the same.
+        Schema-relative queries must not select `table.*` (the column order
+        differs between fresh and migrated projects), use the column lists
+        from `ayon_server.graphql.columns` instead.
+        """
         _ = kwargs  # collect unused kwargs (such as legacy "conn" argument)
         assert cls.pool is not None, "Connection pool is not initialized. "
 
@@ -287,17 +307,22 @@ class Postgres:
         # Never set() a ContextVar in a context that may yield to caller
         # and then try to reset() it as async context may change
 
+        start_time = time.monotonic()
         conn = await cls.pool.acquire()
+        request_stats.record_pool_wait(time.monotonic() - start_time)
+
+        # Connection cursors use the statement cache, so parameterized
+        # queries with the same text skip parsing and planning
 
         try:
-            if not conn.is_in_transaction():
-                async with conn.transaction():
-                    statement = await conn.prepare(query)
-                    async for record in statement.cursor(*args):
-                        yield dict(record)
-            else:
-                statement = await conn.prepare(query)
-                async for record in statement.cursor(*args):
+            async with conn.transaction():
+                if project_name is not None:
+                    await conn.execute(
+                        f"SET LOCAL search_path TO project_{project_name}"
+                    )
+                cursor = conn.cursor(query, *args)
+                tracked = statement_stats.track(query, cursor, project_name)
+                async for record in tracked:
                     yield dict(record)
         finally:
             await cls.pool.release(conn)
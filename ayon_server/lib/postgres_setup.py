@@ -1,5 +1,6 @@
 from datetime import datetime
 
+from ayon_server.lib.request_stats import request_stats
 from ayon_server.utils import EntityID, json_dumps, json_loads
 
 
@@ -44,3 +45,6 @@ async def postgres_setup(conn) -> None:
         decoder=timestamptz_decoder,
         schema="pg_catalog",
     )
+
+    # Count queries of the current request
+    conn.add_query_logger(request_stats.record_query)
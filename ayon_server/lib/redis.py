@@ -1,87 +1,101 @@
+import asyncio
 import inspect
 import json
+import time
+import uuid
 from collections.abc import Awaitable, Callable, Coroutine
 from functools import wraps
 from typing import Any, Literal, TypeVar, cast
 
 from pydantic import BaseModel
 from redis import asyncio as aioredis
-from redis.asyncio.client import PubSub
+from redis.asyncio.client import Pipeline, PubSub
 
 from ayon_server.config import ayonconfig
+from ayon_server.lib.local_cache import PROCESS_ID, local_cache
+from ayon_server.lib.redis_size import redis_size
+from ayon_server.lib.request_stats import request_stats
 from ayon_server.logging import logger
 from ayon_server.utils import json_dumps, json_loads
 
-GET_SIZE_SCRIPT = """
-local cursor = "0"
-local total_size = 0
-local key_pattern = ARGV[1]
-
-repeat
-    local result = redis.call("SCAN", cursor, "MATCH", key_pattern, "COUNT", 1000)
-    cursor = result[1]
-    local keys = result[2]
-
-    for i, key in ipairs(keys) do
-        total_size = total_size + redis.call("MEMORY", "USAGE", key)
-    end
-until cursor == "0"
-
-return total_size
+UNLOCK_SCRIPT = """
+if redis.call("GET", KEYS[1]) == ARGV[1] then
+    return redis.call("DEL", KEYS[1])
+end
+return 0
 """
 
 T = TypeVar("T", bound=Callable[..., Coroutine[Any, Any, Any]])
 
 
-def _make_cache_key(
+def _make_key_builder(
     func: Callable[..., Any],
-    ns: str,
     key_template: str,
-    *args: Any,  # noqa: ANN401
-    **kwargs: Any,  # noqa: ANN401
-) -> str:
+) -> Callable[..., str]:
     """
-    Generates the full Redis key from the namespace, key template,
-    and function arguments.
+    Create a function generating the cache key (without the namespace)
+    from the key template and function arguments.
+
+    Function signature is resolved once, when the decorator is applied.
     """
-    try:
-        sig = inspect.signature(func)
-        bound_args = sig.bind(*args, **kwargs)
-        bound_args.apply_defaults()
-
-        format_args = {
-            k: v
-            for i, (k, v) in enumerate(bound_args.arguments.items())
-            if i > 0 or k != "self"  # Exclude the 'self' argument from key generation
-        }
-
-        key = key_template.format(**format_args)
-
-    except Exception as e:
-        logger.warning(
-            f"Could not format cache key for {func.__name__}. "
-            f"Falling back to default key generation. Error: {e}"
-        )
+    sig = inspect.signature(func)
+    params = list(sig.parameters.values())
+    skip_first = bool(
+        params and params[0].kind == inspect.Parameter.POSITIONAL_OR_KEYWORD
+    )
 
-        sig = inspect.signature(func)
-        params = list(sig.parameters.values())
+    def build_key(*args: Any, **kwargs: Any) -> str:
+        try:
+            bound_args = sig.bind(*args, **kwargs)
+            bound_args.apply_defaults()
+
+            format_args = {
+                k: v
+                for i, (k, v) in enumerate(bound_args.arguments.items())
+                if i > 0 or k != "self"  # Exclude 'self' from key generation
+            }
+
+            return key_template.format(**format_args)
 
-        skip_first = False
-        if args and params:
-            first_param = params[0]
-            if (
-                first_param is not None
-                and first_param.kind == inspect.Parameter.POSITIONAL_OR_KEYWORD
-            ):
-                skip_first = True
+        except Exception as e:
+            logger.warning(
+                f"Could not format cache key for {func.__name__}. "
+                f"Falling back to default key generation. Error: {e}"
+            )
 
-        relevant_args = args[1:] if skip_first else args
+        relevant_args = args[1:] if args and skip_first else args
         arg_str = "_".join(str(a) for a in relevant_args)
 
         kwarg_str = "_".join(f"{k}_{v}" for k, v in kwargs.items())
-        key = f"{func.__name__}_{arg_str}_{kwarg_str}"
+        return f"{func.__name__}_{arg_str}_{kwarg_str}"
 
-    return f"{ns}:{key}"
+    return build_key
+
+
+class _CountingPipeline(Pipeline):
+    async def execute(self, raise_on_error: bool = True) -> list[Any]:
+        request_stats.record_redis_call()
+        return await super().execute(raise_on_error)
+
+
+class _CountingRedis(aioredis.Redis):
+    """Redis client which counts round trips of the current request"""
+
+    async def execute_command(self, *args: Any, **options: Any) -> Any:
+        request_stats.record_redis_call()
+        return await super().execute_command(*args, **options)
+
+    def pipeline(
+        self,
+        transaction: bool = True,
+        shard_hint: str | None = None,
+    ) -> Pipeline:
+        return _CountingPipeline(
+            self.connection_pool,
+            self.response_callbacks,
+            transaction,
+            shard_hint,
+        )
 
 
 class Redis:
@@ -92,7 +106,7 @@ class Redis:
     @classmethod
     async def connect(cls) -> None:
         """Create a Redis connection pool"""
-        cls.redis_pool = aioredis.from_url(ayonconfig.redis_url)
+        cls.redis_pool = _CountingRedis.from_url(ayonconfig.redis_url)
 
         try:
             t = cls.redis_pool.ping()
@@ -118,6 +132,18 @@ class Redis:
         value = await cls.redis_pool.get(f"{cls.prefix}{namespace}-{key}")
         return value
 
+    @classmethod
+    async def get_many(cls, namespace: str, keys: list[str]) -> list[Any]:
+        """Get multiple values from Redis in a single round trip
+
+        Returns values in the order of the keys (None for missing keys).
+        """
+        if not keys:
+            return []
+        if not cls.connected:
+            await cls.connect()
+        return await cls.redis_pool.mget([f"{cls.prefix}{namespace}-{k}" for k in keys])
+
     @classmethod
     async def get_json(cls, namespace: str, key: str) -> Any:
         """Get a JSON-serialized value from Redis"""
@@ -139,8 +165,16 @@ class Redis:
 
         Optional ttl argument may be provided to set expiration time.
         """
+        await cls._set(namespace, key, value, ttl)
+        await cls.invalidate_local(namespace, key)
+
+    @classmethod
+    async def _set(
+        cls, namespace: str, key: str, value: str | bytes, ttl: int = 0
+    ) -> None:
         if not cls.connected:
             await cls.connect()
+        redis_size.register(namespace)
         command = ["set", f"{cls.prefix}{namespace}-{key}", value]
         if ttl:
             command.extend(["ex", str(ttl)])
@@ -159,12 +193,14 @@ class Redis:
         if not cls.connected:
             await cls.connect()
         await cls.redis_pool.delete(f"{cls.prefix}{namespace}-{key}")
+        await cls.invalidate_local(namespace, key)
 
     @classmethod
     async def incr(cls, namespace: str, key: str, *, ttl: int = 0) -> int:
         """Increment a value in Redis"""
         if not cls.connected:
             await cls.connect()
+        redis_size.register(namespace)
         res = await cls.redis_pool.incr(f"{cls.prefix}{namespace}-{key}")
         if ttl:
             await cls.redis_pool.expire(f"{cls.prefix}{namespace}-{key}", ttl)
@@ -175,6 +211,7 @@ class Redis:
         """Decrement a value in Redis"""
         if not cls.connected:
             await cls.connect()
+        redis_size.register(namespace)
         res = await cls.redis_pool.decr(f"{cls.prefix}{namespace}-{key}")
         if ttl:
             await cls.redis_pool.expire(f"{cls.prefix}{namespace}-{key}", ttl)
@@ -203,6 +240,53 @@ class Redis:
             channel = ayonconfig.redis_channel
         await cls.redis_pool.publish(channel, message)
 
+    @classmethod
+    async def publish_many(
+        cls,
+        messages: list[str],
+        channel: str | None = None,
+    ) -> None:
+        """Publish multiple messages to a Redis channel in one round trip"""
+        if not messages:
+            return
+        if not cls.connected:
+            await cls.connect()
+        if channel is None:
+            channel = ayonconfig.redis_channel
+        async with cls.redis_pool.pipeline(transaction=False) as pipe:
+            for message in messages:
+                pipe.publish(channel, message)
+            await pipe.execute()
+
+    @classmethod
+    def invalidation_channel(cls) -> str:
+        return f"{ayonconfig.redis_channel}:invalidate"
+
+    @classmethod
+    async def invalidate_local(cls, namespace: str, key: str | None = None) -> None:
+        """Evict a record (or the whole namespace) from local caches
+
+        This is no-op for namespaces which don't use the local cache tier.
+        Otherwise the record is evicted from the cache of this process
+        and the other server processes are notified.
+        """
+        if namespace not in local_cache.namespaces:
+            return
+        local_cache.invalidate(namespace, key)
+        message = {"origin": PROCESS_ID, "namespace": namespace, "key": key}
+        try:
+            await cls.publish(json_dumps(message), cls.invalidation_channel())
+        except Exception as e:
+            logger.warning(f"Failed to broadcast cache invalidation: {e}")
+
+    @classmethod
+    def handle_invalidation(cls, payload: str | bytes) -> None:
+        """Process a message from the invalidation channel"""
+        message = json_loads(payload)
+        if message.get("origin") == PROCESS_ID:
+            return
+        local_cache.invalidate(message["namespace"], message.get("key"))
+
     @classmethod
     async def keys(cls, namespace: str) -> list[str]:
         if not cls.connected:
@@ -224,6 +308,7 @@ class Redis:
         keys = await cls.redis_pool.keys(f"{cls.prefix}{namespace}-*")
         for key in keys:
             await cls.redis_pool.delete(key)
+        await cls.invalidate_local(namespace)
 
     @classmethod
     async def iterate(cls, namespace: str):
@@ -244,26 +329,50 @@ class Redis:
 
     @classmethod
     async def get_total_size(cls) -> int:
-        """Get total memory usage of all keys in with the current prefix"""
+        """Get estimated memory usage of all keys with the current prefix
+
+        Each call continues the incremental scan of the keyspace
+        (see `ayon_server.lib.redis_size`).
+        """
 
         if not cls.connected:
             await cls.connect()
 
         try:
-            result: Awaitable[str] | str = cls.redis_pool.eval(
-                GET_SIZE_SCRIPT, 0, f"{cls.prefix}*"
-            )
+            await redis_size.update(cls.redis_pool, cls.prefix)
+        except Exception as e:
+            logger.debug(f"Unable to update Redis size estimate: {e}")
+        return redis_size.total
 
-            if isinstance(result, Awaitable):
-                value = await result
-            else:
-                value = result
-        except Exception:
-            return 0
+    @classmethod
+    async def try_lock(cls, namespace: str, key: str, ttl: float) -> str | None:
+        """Acquire a short-lived lock shared by all server processes
 
-        if value is None:
-            return 0
-        return int(value)
+        Returns a token for `unlock` if the lock was acquired, None otherwise.
+        The lock is released automatically after `ttl` seconds.
+        """
+        if not cls.connected:
+            await cls.connect()
+        redis_size.register(namespace)
+        token = uuid.uuid4().hex
+        acquired = await cls.redis_pool.set(
+            f"{cls.prefix}{namespace}-{key}",
+            token,
+            nx=True,
+            px=int(ttl * 1000),
+        )
+        return token if acquired else None
+
+    @classmethod
+    async def unlock(cls, namespace: str, key: str, token: str) -> None:
+        """Release a lock acquired using `try_lock`"""
+        if not cls.connected:
+            await cls.connect()
+        res = cls.redis_pool.eval(
+            UNLOCK_SCRIPT, 1, f"{cls.prefix}{namespace}-{key}", token
+        )
+        if isinstance(res, Awaitable):
+            await res
 
     @classmethod
     def cached(
@@ -273,74 +382,168 @@ class Redis:
         ttl: int = 60 * 5,
         model: type[BaseModel] | Literal["bytes"] | None = None,
         auto_extend: bool = False,
+        local_ttl: int = 0,
+        stale_ttl: int = 0,
+        lock_timeout: float = 10,
     ) -> Callable[[T], T]:
         """
         Decorator to cache the result of an async function in Redis.
         The function must return a JSON-serializable object.
+
+        If `local_ttl` is set, the result is also kept in memory of the
+        server process for up to `local_ttl` seconds. Since the same object
+        is returned to all callers, it must not be modified.
+
+        If `stale_ttl` is set, the value is kept in Redis for `stale_ttl`
+        seconds after it expires. Expired (stale) value is returned
+        immediately, while it is recomputed in the background. Only one
+        server process recomputes the value at a time (for up to
+        `lock_timeout` seconds), others keep serving the stale value or,
+        if there is none, wait for the result.
         """
 
-        def decorator(func: T) -> T:
-            @wraps(func)
-            async def wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
-                full_key = _make_cache_key(func, ns, key, *args, **kwargs)
+        redis_size.register(ns)
+        if local_ttl:
+            local_cache.register(ns)
+            local_ttl = min(local_ttl, ttl) if ttl else local_ttl
 
-                result: T
+        # Stale values are kept in Redis past their expiration
+        redis_ttl = ttl + stale_ttl if ttl else 0
 
-                if model == "bytes":
-                    cached_result = await cls.get(ns, full_key.removeprefix(f"{ns}:"))
-                else:
-                    cached_result = await cls.get_json(
-                        ns, full_key.removeprefix(f"{ns}:")
+        def decorator(func: T) -> T:
+            build_key = _make_key_builder(func, key)
+            refresh_tasks: set[asyncio.Task[Any]] = set()
+
+            def parse(cache_key: str, value: Any) -> Any:
+                if value is None or model == "bytes":
+                    return value
+                try:
+                    value = json_loads(value)
+                    if model:
+                        return model(**value)
+                    return value
+                except (TypeError, ValueError) as e:
+                    logger.error(
+                        f"Failed to parse cached result for {ns}:{cache_key}: {e}"
                     )
-
-                if cached_result is not None:
-                    # Too noisy
-                    # logger.trace(f"Cache hit for key: {full_key}")
-                    if model and model != "bytes":
-                        try:
-                            result = cast(T, model(**cached_result))
-                        except (TypeError, json.JSONDecodeError) as e:
-                            logger.error(
-                                f"Failed to parse cached result for {full_key}: {e}"
-                            )
-                            # Fall through to recompute the value
+                    return None
+
+            async def load(cache_key: str) -> tuple[Any, bool]:
+                """Return the cached value and whether it is stale"""
+                if not stale_ttl:
+                    value = parse(cache_key, await cls.get(ns, cache_key))
+                    return value, False
+
+                if not cls.connected:
+                    await cls.connect()
+                async with cls.redis_pool.pipeline(transaction=False) as pipe:
+                    pipe.get(f"{cls.prefix}{ns}-{cache_key}")
+                    pipe.pttl(f"{cls.prefix}{ns}-{cache_key}")
+                    value, pttl = await pipe.execute()
+                # Keys without expiration (pttl -1) were not stored by us,
+                # but they are certainly not stale
+                stale = 0 <= pttl <= stale_ttl * 1000
+                return parse(cache_key, value), stale
+
+            async def store(cache_key: str, result: Any) -> None:
+                # Storing a freshly computed value does not invalidate
+                # local caches of other processes. Their copies expire
+                # within local_ttl.
+                payload: str | bytes
+                try:
+                    if model == "bytes":
+                        payload = cast(bytes, result)
                     else:
-                        result = cached_result
+                        val = result.dict() if isinstance(result, BaseModel) else result
+                        payload = json_dumps(val)
+                    await cls._set(ns, cache_key, payload, ttl=redis_ttl)
+                except (TypeError, json.JSONDecodeError, ConnectionError) as e:
+                    logger.warning(f"Failed to set cache for {ns}:{cache_key}: {e}")
+
+                if local_ttl:
+                    local_cache.set(ns, cache_key, result, local_ttl)
+
+            async def compute(
+                cache_key: str,
+                args: tuple[Any, ...],
+                kwargs: dict[str, Any],
+            ) -> Any:
+                logger.trace(f"Cache miss for key: {ns}:{cache_key}")
+                result = await func(*args, **kwargs)
+                if result is not None:
+                    await store(cache_key, result)
+                return result
 
+            async def compute_locked(
+                cache_key: str,
+                token: str,
+                args: tuple[Any, ...],
+                kwargs: dict[str, Any],
+            ) -> Any:
+                try:
+                    return await compute(cache_key, args, kwargs)
+                finally:
+                    await cls.unlock("cache-lock", f"{ns}:{cache_key}", token)
+
+            async def revalidate(
+                cache_key: str,
+                args: tuple[Any, ...],
+                kwargs: dict[str, Any],
+            ) -> None:
+                token = await cls.try_lock(
+                    "cache-lock", f"{ns}:{cache_key}", lock_timeout
+                )
+                if token is None:
+                    # Someone else is already on it
+                    return
+                task = asyncio.create_task(
+                    compute_locked(cache_key, token, args, kwargs)
+                )
+                refresh_tasks.add(task)
+                task.add_done_callback(refresh_tasks.discard)
+
+            async def wait_or_compute(
+                cache_key: str,
+                args: tuple[Any, ...],
+                kwargs: dict[str, Any],
+            ) -> Any:
+                deadline = time.monotonic() + lock_timeout
+                while True:
+                    token = await cls.try_lock(
+                        "cache-lock", f"{ns}:{cache_key}", lock_timeout
+                    )
+                    if token is not None:
+                        return await compute_locked(cache_key, token, args, kwargs)
+                    if time.monotonic() > deadline:
+                        # Lock holder did not deliver in time. Give up waiting.
+                        return await compute(cache_key, args, kwargs)
+                    await asyncio.sleep(0.05)
+                    result, _ = await load(cache_key)
                     if result:
-                        if auto_extend:
-                            await cls.expire(ns, full_key.removeprefix(f"{ns}:"), ttl)
                         return result
 
-                logger.trace(f"Cache miss for key: {full_key}")
-                result = await func(*args, **kwargs)
+            @wraps(func)
+            async def wrapper(*args: Any, **kwargs: Any) -> Any:
+                cache_key = build_key(*args, **kwargs)
 
-                if result is not None:
-                    try:
-                        if model == "bytes":
-                            await cls.set(
-                                ns,
-                                full_key.removeprefix(f"{ns}:"),
-                                cast(bytes, result),
-                                ttl=ttl,
-                            )
-                        else:
-                            val = (
-                                result.dict()
-                                if isinstance(result, BaseModel)
-                                else result
-                            )
-
-                            await cls.set_json(
-                                ns,
-                                full_key.removeprefix(f"{ns}:"),
-                                val,
-                                ttl=ttl,
-                            )
-                    except (TypeError, json.JSONDecodeError, ConnectionError) as e:
-                        logger.warning(f"Failed to set cache for {full_key}: {e}")
+                if local_ttl:
+                    result = local_cache.get(ns, cache_key)
+                    if result is not None:
+                        return result
 
-                return result
+                result, stale = await load(cache_key)
+                if result:
+                    if stale:
+                        await revalidate(cache_key, args, kwargs)
+                    elif auto_extend:
+                        await cls.expire(ns, cache_key, redis_ttl)
+                    if local_ttl:
+                        local_cache.set(ns, cache_key, result, local_ttl)
+                    return result
+
+                if stale_ttl:
+                    return await wait_or_compute(cache_key, args, kwargs)
+                return await compute(cache_key, args, kwargs)
 
             return wrapper  # type: ignore[return-value]
 
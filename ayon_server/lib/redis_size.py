@@ -0,0 +1,111 @@
+"""Estimated memory usage of Redis keys per namespace
+
+Instead of walking the whole keyspace at once (which blocks Redis for
+the entire run), the keyspace is scanned incrementally: each update
+inspects a bounded number of keys using `SCAN` and pipelined
+`MEMORY USAGE` and then continues from the same cursor next time.
+Sizes are reported from the last completed pass (or the pass in progress
+before the first one finishes), so they lag behind by one pass.
+
+Key names don't mark where the namespace ends (namespaces contain
+dashes too), so keys are attributed to the longest namespace registered
+by the write paths of `Redis`. Keys of unknown namespaces are counted
+as "other".
+"""
+
+import asyncio
+import time
+
+from redis import asyncio as aioredis
+
+# Keys requested by a single SCAN call
+SCAN_COUNT = 1000
+
+# Max number of keys scanned by a single update. With a key prefix
+# configured, SCAN visits this many keys but returns only matching ones.
+KEYS_PER_UPDATE = 10_000
+
+
+class RedisSizeEstimator:
+    def __init__(self, keys_per_update: int = KEYS_PER_UPDATE) -> None:
+        self.keys_per_update = keys_per_update
+        self.namespaces: set[str] = set()
+
+        # Result of the last completed pass
+        self.sizes: dict[str, int] = {}
+        self.key_counts: dict[str, int] = {}
+        self.completed_at: float | None = None
+        self.passes = 0
+
+        # Pass in progress
+        self._cursor = 0
+        self._sizes: dict[str, int] = {}
+        self._key_counts: dict[str, int] = {}
+        self._lock = asyncio.Lock()
+
+    def register(self, namespace: str) -> None:
+        self.namespaces.add(namespace)
+
+    def namespace_of(self, key: str) -> str:
+        """Return the longest registered namespace of the (unprefixed) key"""
+        result = "other"
+        pos = key.find("-")
+        while pos != -1:
+            if key[:pos] in self.namespaces:
+                result = key[:pos]
+            pos = key.find("-", pos + 1)
+        return result
+
+    @property
+    def total(self) -> int:
+        return sum(self.current_sizes().values())
+
+    def current_sizes(self) -> dict[str, int]:
+        return self.sizes if self.completed_at is not None else self._sizes
+
+    def current_key_counts(self) -> dict[str, int]:
+        return self.key_counts if self.completed_at is not None else self._key_counts
+
+    async def update(self, redis: aioredis.Redis, prefix: str) -> None:
+        """Continue the scan of keys starting with the prefix
+
+        Concurrent calls are skipped, since they would share the cursor.
+        """
+        if self._lock.locked():
+            return
+        async with self._lock:
+            await self._update(redis, prefix)
+
+    async def _update(self, redis: aioredis.Redis, prefix: str) -> None:
+        for _ in range(max(1, self.keys_per_update // SCAN_COUNT)):
+            cursor, keys = await redis.scan(
+                self._cursor, match=f"{prefix}*", count=SCAN_COUNT
+            )
+            self._cursor = int(cursor)
+
+            if keys:
+                async with redis.pipeline(transaction=False) as pipe:
+                    for key in keys:
+                        pipe.memory_usage(key)
+                    usages = await pipe.execute()
+
+                for key, usage in zip(keys, usages, strict=True):
+                    if usage is None:
+                        continue  # expired meanwhile
+                    if isinstance(key, bytes):
+                        key = key.decode("utf-8", errors="replace")
+                    namespace = self.namespace_of(key.removeprefix(prefix))
+                    self._sizes[namespace] = self._sizes.get(namespace, 0) + usage
+                    self._key_counts[namespace] = self._key_counts.get(namespace, 0) + 1
+
+            if self._cursor == 0:
+                self.sizes = self._sizes
+                self.key_counts = self._key_counts
+                self.completed_at = time.time()
+                self.passes += 1
+                self._sizes = {}
+                self._key_counts = {}
+                break
+
+
+redis_size = RedisSizeEstimator()
@@ -0,0 +1,140 @@
+"""Statistics of handled HTTP requests
+
+Request durations are collected in histograms labelled by the route
+template, method, status class and GraphQL operation name. Each series
+also sums the database queries, Redis round trips and time spent waiting
+for a database connection of its requests, so their averages per request
+can be derived from the request count.
+
+Resources used outside of a request (background tasks) are not
+attributed to any series; only the pool wait histogram includes them.
+"""
+
+import bisect
+import re
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any
+
+# Upper bounds of the latency histogram buckets in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Upper bounds of the database pool wait histogram buckets in seconds
+POOL_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+# GraphQL operation names come from clients. When there are too many
+# series, new operations are counted as "other".
+MAX_SERIES = 2000
+
+_OPERATION_NAME_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]{0,63}$")
+
+
+@dataclass
+class RequestCounters:
+    """Resources used by a single request"""
+
+    queries: int = 0
+    redis_calls: int = 0
+    pool_wait_seconds: float = 0.0
+
+
+@dataclass
+class Histogram:
+    bounds: tuple[float, ...]
+    buckets: list[int] = field(default_factory=list)
+    count: int = 0
+    total: float = 0.0
+
+    def __post_init__(self) -> None:
+        self.buckets = [0] * len(self.bounds)
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.bounds, value)
+        if index < len(self.buckets):
+            self.buckets[index] += 1
+        self.count += 1
+        self.total += value
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        """Return (upper bound, count) pairs as Prometheus expects them"""
+        result = []
+        running = 0
+        for bound, count in zip(self.bounds, self.buckets, strict=True):
+            running += count
+            result.append((str(bound), running))
+        result.append(("+Inf", self.count))
+        return result
+
+
+@dataclass
+class RouteStats:
+    latency: Histogram = field(default_factory=lambda: Histogram(LATENCY_BUCKETS))
+    queries: int = 0
+    redis_calls: int = 0
+    pool_wait_seconds: float = 0.0
+
+
+_current_counters: ContextVar[RequestCounters | None] = ContextVar(
+    "_current_request_counters", default=None
+)
+
+
+class RequestStats:
+    def __init__(self, max_series: int = MAX_SERIES) -> None:
+        self.max_series = max_series
+        self.routes: dict[tuple[str, str, str, str], RouteStats] = {}
+        self.pool_wait = Histogram(POOL_WAIT_BUCKETS)
+
+    def start(self) -> Token[RequestCounters | None]:
+        """Start counting resources used by the current request"""
+        return _current_counters.set(RequestCounters())
+
+    def finish(
+        self,
+        token: Token[RequestCounters | None],
+        *,
+        route: str,
+        method: str,
+        status_code: int,
+        duration: float,
+        operation: str | None = None,
+    ) -> None:
+        counters = _current_counters.get()
+        _current_counters.reset(token)
+
+        if operation is None:
+            operation = ""
+        elif not _OPERATION_NAME_PATTERN.match(operation):
+            operation = "invalid"
+
+        key = (route, method, f"{status_code // 100}xx", operation)
+        stats = self.routes.get(key)
+        if stats is None:
+            if len(self.routes) >= self.max_series:
+                key = (route, method, key[2], "other")
+                stats = self.routes.get(key)
+            if stats is None:
+                stats = self.routes.setdefault(key, RouteStats())
+
+        stats.latency.observe(duration)
+        if counters is not None:
+            stats.queries += counters.queries
+            stats.redis_calls += counters.redis_calls
+            stats.pool_wait_seconds += counters.pool_wait_seconds
+
+    def record_query(self, *_: Any) -> None:
+        """Count a database query (used as an asyncpg query logger)"""
+        if counters := _current_counters.get():
+            counters.queries += 1
+
+    def record_redis_call(self) -> None:
+        if counters := _current_counters.get():
+            counters.redis_calls += 1
+
+    def record_pool_wait(self, seconds: float) -> None:
+        self.pool_wait.observe(seconds)
+        if counters := _current_counters.get():
+            counters.pool_wait_seconds += seconds
+
+
+request_stats = RequestStats()
@@ -0,0 +1,95 @@
+"""Statistics of executed SQL statement shapes
+
+Queries built with bound arguments (see `SQLArgs`) have the same text
+regardless of the values, so they may be served from the statement cache
+of the connection. These statistics are collected per process, not per
+connection: they show how many executions repeated an already seen
+statement text (a repeat on a connection which has not prepared the
+statement yet is still a cache miss) and how long it took to get the
+first row (which includes planning of new statements).
+
+For schema-relative queries (see `Postgres.iterate`), each shape also
+counts the projects it served.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass, field
+from typing import Any
+
+MAX_SHAPES = 1000
+
+
+@dataclass
+class ShapeStats:
+    query: str
+    calls: int = 0
+    first_row_seconds: float = 0.0
+    max_first_row_seconds: float = 0.0
+    projects: set[str] = field(default_factory=set)
+
+
+class StatementStats:
+    def __init__(self, max_shapes: int = MAX_SHAPES) -> None:
+        self.max_shapes = max_shapes
+        self.shapes: OrderedDict[str, ShapeStats] = OrderedDict()
+        self.calls = 0
+        self.repeated = 0
+
+    def record(
+        self,
+        query: str,
+        first_row_seconds: float,
+        project_name: str | None = None,
+    ) -> None:
+        key = hashlib.md5(query.encode()).hexdigest()[:12]
+        self.calls += 1
+        if (shape := self.shapes.get(key)) is not None:
+            self.repeated += 1
+            self.shapes.move_to_end(key)
+        else:
+            shape = ShapeStats(query=" ".join(query.split())[:200])
+            self.shapes[key] = shape
+            while len(self.shapes) > self.max_shapes:
+                self.shapes.popitem(last=False)
+        shape.calls += 1
+        shape.first_row_seconds += first_row_seconds
+        shape.max_first_row_seconds = max(
+            shape.max_first_row_seconds, first_row_seconds
+        )
+        if project_name is not None:
+            shape.projects.add(project_name)
+
+    @property
+    def repeat_ratio(self) -> float:
+        return self.repeated / self.calls if self.calls else 0.0
+
+    def top(self, count: int = 10) -> list[tuple[str, ShapeStats]]:
+        """Return shapes with the highest total time to the first row"""
+        return sorted(
+            self.shapes.items(),
+            key=lambda item: item[1].first_row_seconds,
+            reverse=True,
+        )[:count]
+
+    async def track(
+        self,
+        query: str,
+        cursor: AsyncGenerator[Any] | Any,
+        project_name: str | None = None,
+    ) -> AsyncGenerator[Any]:
+        """Pass through the cursor records and record the time to first row"""
+        start_time = time.perf_counter()
+        recorded = False
+        async for record in cursor:
+            if not recorded:
+                self.record(query, time.perf_counter() - start_time, project_name)
+                recorded = True
+            yield record
+        if not recorded:
+            self.record(query, time.perf_counter() - start_time, project_name)
+
+
+statement_stats = StatementStats()
@@ -6,9 +6,16 @@ from typing import Any
 import aiocache
 import psutil
 
+from ayon_server.helpers.media_jobs import media_jobs
 from ayon_server.helpers.project_list import get_project_list
+from ayon_server.helpers.statistics import traffic_stats
+from ayon_server.lib.blob_cache import thumbnail_cache
+from ayon_server.lib.local_cache import local_cache
 from ayon_server.lib.postgres import Postgres
 from ayon_server.lib.redis import Redis
+from ayon_server.lib.redis_size import redis_size
+from ayon_server.lib.request_stats import Histogram, request_stats
+from ayon_server.lib.statement_stats import statement_stats
 from ayon_server.types import Field, OPModel
 
 
@@ -130,6 +137,205 @@ class SystemMetrics:
         )
         result += db_avail.render_prometheus()
 
+        for metric in self.get_local_cache_metrics():
+            result += metric.render_prometheus()
+
+        for metric in self.get_statement_metrics():
+            result += metric.render_prometheus()
+
+        for metric in self.get_media_job_metrics():
+            result += metric.render_prometheus()
+
+        for metric in self.get_log_collector_metrics():
+            result += metric.render_prometheus()
+
+        for metric in self.get_messaging_metrics():
+            result += metric.render_prometheus()
+
+        for metric in self.get_request_metrics():
+            result += metric.render_prometheus()
+
+        for metric in self.get_traffic_metrics():
+            result += metric.render_prometheus()
+
+        for metric in self.get_redis_size_metrics():
+            result += metric.render_prometheus()
+
+        return result
+
+    def get_statement_metrics(self) -> list[Metric]:
+        result = [
+            Metric("db_statement_calls_total", statement_stats.calls),
+            Metric("db_statement_repeated_total", statement_stats.repeated),
+            Metric("db_statement_shapes", len(statement_stats.shapes)),
+        ]
+        for key, shape in statement_stats.top():
+            tags = {"shape": key}
+            result.append(Metric("db_statement_shape_calls_total", shape.calls, tags))
+            result.append(
+                Metric(
+                    "db_statement_shape_first_row_seconds_sum",
+                    shape.first_row_seconds,
+                    tags,
+                )
+            )
+            if shape.projects:
+                result.append(
+                    Metric(
+                        "db_statement_shape_projects",
+                        len(shape.projects),
+                        tags,
+                    )
+                )
+        return result
+
+    def get_local_cache_metrics(self) -> list[Metric]:
+        result = [Metric("local_cache_entries", len(local_cache))]
+        for namespace, cache_stats in local_cache.stats.items():
+            tags = {"namespace": namespace}
+            result.append(Metric("local_cache_hits_total", cache_stats.hits, tags))
+            result.append(Metric("local_cache_misses_total", cache_stats.misses, tags))
+            result.append(
+                Metric("local_cache_evictions_total", cache_stats.evictions, tags)
+            )
+
+        thumbnail_stats = thumbnail_cache.stats
+        result.extend(
+            [
+                Metric("thumbnail_cache_entries", len(thumbnail_cache)),
+                Metric("thumbnail_cache_bytes", thumbnail_cache.size),
+                Metric("thumbnail_cache_disk_bytes", thumbnail_cache.disk_size),
+                Metric("thumbnail_cache_hits_total", thumbnail_stats.hits),
+                Metric("thumbnail_cache_disk_hits_total", thumbnail_stats.disk_hits),
+                Metric("thumbnail_cache_misses_total", thumbnail_stats.misses),
+                Metric("thumbnail_cache_evictions_total", thumbnail_stats.evictions),
+            ]
+        )
+        return result
+
+    def _histogram_metrics(
+        self,
+        key: str,
+        histogram: Histogram,
+        tags: dict[str, str] | None = None,
+    ) -> list[Metric]:
+        tags = tags or {}
+        result = [
+            Metric(f"{key}_bucket", count, {**tags, "le": bound})
+            for bound, count in histogram.cumulative()
+        ]
+        result.append(Metric(f"{key}_sum", histogram.total, tags))
+        result.append(Metric(f"{key}_count", histogram.count, tags))
+        return result
+
+    def get_request_metrics(self) -> list[Metric]:
+        result = self._histogram_metrics(
+            "db_pool_wait_seconds",
+            request_stats.pool_wait,
+        )
+        for (route, method, status, operation), stats in list(
+            request_stats.routes.items()
+        ):
+            tags = {"route": route, "method": method, "status": status}
+            if operation:
+                tags["operation"] = operation
+            result.extend(
+                self._histogram_metrics(
+                    "http_request_duration_seconds",
+                    stats.latency,
+                    tags,
+                )
+            )
+            result.append(Metric("http_request_db_queries_total", stats.queries, tags))
+            result.append(
+                Metric("http_request_redis_calls_total", stats.redis_calls, tags)
+            )
+            result.append(
+                Metric(
+                    "http_request_db_pool_wait_seconds_sum",
+                    stats.pool_wait_seconds,
+                    tags,
+                )
+            )
+        return result
+
+    def get_log_collector_metrics(self) -> list[Metric]:
+        from ayon_server.background.log_collector import log_collector
+
+        return [
+            Metric("log_collector_queue_size", log_collector.queue.qsize()),
+            Metric("log_collector_flushed_total", log_collector.flushed),
+            Metric("log_collector_failed_total", log_collector.failed),
+            Metric("log_collector_dropped_total", log_collector.dropped),
+        ]
+
+    def get_redis_size_metrics(self) -> list[Metric]:
+        """Per-namespace Redis memory usage estimated by `Redis.get_total_size`"""
+        result = []
+        key_counts = redis_size.current_key_counts()
+        for namespace, size in redis_size.current_sizes().items():
+            tags = {"namespace": namespace}
+            result.append(Metric("redis_size", size, tags))
+            result.append(Metric("redis_keys", key_counts.get(namespace, 0), tags))
+        if redis_size.completed_at is not None:
+            result.append(
+                Metric(
+                    "redis_size_age_seconds",
+                    time.time() - redis_size.completed_at,
+                )
+            )
+        result.append(Metric("redis_size_passes_total", redis_size.passes))
+        return result
+
+    def get_traffic_metrics(self) -> list[Metric]:
+        return [
+            Metric("traffic_stats_flush_lag_seconds", traffic_stats.flush_lag),
+            Metric(
+                "traffic_stats_pending_bytes",
+                traffic_stats.pending_bytes("ingress"),
+                {"usage_type": "ingress"},
+            ),
+            Metric(
+                "traffic_stats_pending_bytes",
+                traffic_stats.pending_bytes("egress"),
+                {"usage_type": "egress"},
+            ),
+            Metric("traffic_stats_flushed_bytes_total", traffic_stats.flushed_bytes),
+            Metric("traffic_stats_failed_flushes_total", traffic_stats.failed_flushes),
+        ]
+
+    def get_messaging_metrics(self) -> list[Metric]:
+        from ayon_server.api.messaging import messaging
+
+        stats = messaging.stats
+        return [
+            Metric("ws_clients", len(messaging.clients)),
+            Metric("ws_messages_total", stats.messages),
+            Metric("ws_deliveries_total", stats.deliveries),
+            Metric("ws_fanout_seconds_sum", stats.seconds),
+            Metric("ws_fanout_seconds_count", stats.messages),
+            Metric("ws_fanout_seconds_max", stats.max_seconds),
+            Metric("ws_slow_clients_total", stats.slow_clients),
+        ]
+
+    def get_media_job_metrics(self) -> list[Metric]:
+        result = [Metric("media_jobs_running", media_jobs.running)]
+        for priority, depth in media_jobs.queue_depth.items():
+            result.append(Metric("media_jobs_waiting", depth, {"priority": priority}))
+        for kind, stats in media_jobs.stats.items():
+            tags = {"kind": kind}
+            result.append(Metric("media_jobs_submitted_total", stats.submitted, tags))
+            result.append(
+                Metric("media_jobs_deduplicated_total", stats.deduplicated, tags)
+            )
+            result.append(Metric("media_jobs_completed_total", stats.completed, tags))
+            result.append(Metric("media_jobs_failed_total", stats.failed, tags))
+            result.append(
+                Metric("media_jobs_duration_seconds_sum", stats.duration_seconds, tags)
+            )
+            result.append(
+                Metric("media_jobs_wait_seconds_sum", stats.wait_seconds, tags)
+            )
         return result
 
     @aiocache.cached(ttl=120)
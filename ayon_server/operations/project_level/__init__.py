@@ -30,6 +30,7 @@ from ayon_server.types import OPModel, ProjectLevelEntityType
 from ayon_server.utils import create_uuid
 
 from ..common import OperationType, RollbackException
+from .entity_bulk_create import BULK_CREATE_THRESHOLD, BulkCreate
 from .entity_create import create_project_level_entity
 from .entity_delete import delete_project_level_entity
 from .entity_update import update_project_level_entity
@@ -49,18 +50,40 @@ async def _process_events(
     sender_type: str | None = None,
 ) -> None:
     """Process a list of events and dispatch them to the event stream."""
+    await EventStream.dispatch_many(
+        events,
+        sender=sender,
+        sender_type=sender_type,
+    )
+
+
+def _get_affected_entities(
+    events: list[dict[str, Any]],
+) -> dict[str, tuple[set[str], set[str]]]:
+    """Collect ids of entities (and their parents) touched by the operations.
+
+    Returns a dict mapping entity types to a tuple
+    of (entity_ids, parent_ids) sets.
+    """
+    result: dict[str, tuple[set[str], set[str]]] = {}
     for event in events:
-        await EventStream.dispatch(
-            sender=sender,
-            sender_type=sender_type,
-            **event,
-        )
+        topic = event.get("topic", "").split(".")
+        if len(topic) < 3 or topic[0] != "entity":
+            continue
+        entity_ids, parent_ids = result.setdefault(topic[1], (set(), set()))
+        summary = event.get("summary") or {}
+        if entity_id := summary.get("entityId"):
+            entity_ids.add(entity_id)
+        if parent_id := summary.get("parentId"):
+            parent_ids.add(parent_id)
+    return result
 
 
 async def _process_operation(
     project_name: str,
     user: UserEntity | None,
     operation: OperationModel,
+    bulk: BulkCreate | None = None,
 ) -> tuple[list[dict[str, Any]] | None, OperationResponseModel]:
     """Process a single operation. Raise an exception on error."""
 
@@ -72,11 +95,23 @@ async def _process_operation(
 
     try:
         if operation.type == "create":
+            if bulk is not None:
+                # Reuse the validation result of the bulk create attempt
+                if (error := bulk.errors.pop(operation.id, None)) is not None:
+                    raise error
+                entity = bulk.entities.pop(operation.id, None)
+                access_checked = operation.id in bulk.access_checked
+            else:
+                entity = None
+                access_checked = False
+
             entity_id, events, status = await create_project_level_entity(
                 entity_class,
                 project_name,
                 operation,
                 user,
+                entity=entity,
+                access_checked=access_checked,
             )
 
         elif operation.type == "update":
@@ -141,6 +176,11 @@ async def _process_operations(
     events: list[dict[str, Any]] = []
     entity_types: set[ProjectLevelEntityType] = set()
 
+    # Large batches create runs of entities of the same type in bulk
+    bulk: BulkCreate | None = None
+    if len(operations) >= BULK_CREATE_THRESHOLD:
+        bulk = BulkCreate(project_name, user_map)
+
     logger.debug(f"[OPS] {len(operations)} project {project_name} operations")
     for i, operation in enumerate(operations):
         if operation.as_user:
@@ -162,6 +202,16 @@ async def _process_operations(
             )
             await progress_handler(progress)
 
+        if bulk is not None:
+            if bulk.should_process(operation):
+                await bulk.process(operations[i:])
+            if (bulk_result := bulk.results.pop(operation.id, None)) is not None:
+                bulk_events, bulk_response = bulk_result
+                events.extend(bulk_events)
+                result.append(bulk_response)
+                entity_types.add(operation.entity_type)
+                continue
+
         try:
             # This is a neat trick. transaction() will try
             # to reuse the current transaction if it exists,
@@ -176,6 +226,7 @@ async def _process_operations(
                     project_name,
                     user,
                     operation,
+                    bulk,
                 )
                 if evt is not None:
                     events.extend(evt)
@@ -501,11 +552,19 @@ class ProjectLevelOperations:
         if events:
             msg = f"[OPS] {len(events)} events dispatched"
             affected_entity_types = {op.entity_type for op in self.operations}
+            affected_entities = _get_affected_entities(events)
             for entity_type in affected_entity_types:
                 entity_class = get_entity_class(entity_type)
+                entity_ids, parent_ids = affected_entities.get(
+                    entity_type, (set(), set())
+                )
                 try:
                     logger.trace(f"[OPS] Refreshing views for {entity_type}")
-                    await entity_class.refresh_views(self.project_name)
+                    await entity_class.refresh_views(
+                        self.project_name,
+                        entity_ids=entity_ids,
+                        parent_ids=parent_ids,
+                    )
                 except DeadlockDetectedError:
                     logger.debug("[OPS] View refresh deadlock. Skipping refresh.")
 
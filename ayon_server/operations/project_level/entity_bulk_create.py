@@ -0,0 +1,210 @@
+"""Bulk creation of project level entities
+
+Large batches of operations usually consist of long runs of create
+operations of the same entity type (folders, then tasks, products...).
+Such runs are validated up front and inserted using a single
+`executemany` call per run instead of one INSERT per entity.
+Create access is checked once per user and parent entity and default
+values (status, folder and task type) are looked up once per batch.
+
+When a run cannot be inserted at once, its operations are processed
+one by one by the regular code path (reusing already built entities),
+so errors are still reported for the individual operations.
+"""
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from ayon_server.entities import FolderEntity, TaskEntity, UserEntity, VersionEntity
+from ayon_server.entities.core import ProjectLevelEntity
+from ayon_server.helpers.get_entity_class import get_entity_class
+from ayon_server.lib.postgres import Postgres
+from ayon_server.logging import logger
+
+from .entity_create import build_project_level_entity, get_create_events
+from .models import OperationModel, OperationResponseModel
+
+# Use bulk creation only for batches with at least this number of operations
+BULK_CREATE_THRESHOLD = 100
+
+# Maximum number of entities inserted at once
+BULK_CREATE_CHUNK_SIZE = 1000
+
+
+class BulkCreate:
+    def __init__(
+        self,
+        project_name: str,
+        user_map: dict[str, UserEntity | None],
+    ) -> None:
+        self.project_name = project_name
+        self.user_map = user_map
+
+        # Entities built from the create operations (by operation id)
+        self.entities: dict[str, ProjectLevelEntity] = {}
+        # Operations with already checked create access
+        self.access_checked: set[str] = set()
+        # Errors raised while validating the operations
+        self.errors: dict[str, Exception] = {}
+        # Results of operations created in bulk
+        self.results: dict[
+            str, tuple[list[dict[str, Any]], OperationResponseModel]
+        ] = {}
+
+        self._attempted: set[str] = set()
+        self._access_cache: dict[tuple[str, str | None], Exception | None] = {}
+        self._defaults: dict[str, str] = {}
+
+    def should_process(self, operation: OperationModel) -> bool:
+        """Return True if the operation may start a new bulk run"""
+        return operation.type == "create" and operation.id not in self._attempted
+
+    def _get_user(self, operation: OperationModel) -> UserEntity | None:
+        if not operation.as_user:
+            return None
+        return self.user_map.get(operation.as_user)
+
+    async def _ensure_create_access(
+        self,
+        entity: ProjectLevelEntity,
+        user: UserEntity,
+    ) -> None:
+        # Create access depends only on the user and the parent entity
+        key = (user.name, entity.parent_id)
+        if key not in self._access_cache:
+            try:
+                await entity.ensure_create_access(user)
+            except Exception as e:
+                self._access_cache[key] = e
+            else:
+                self._access_cache[key] = None
+        if (error := self._access_cache[key]) is not None:
+            raise error
+
+    async def process(self, operations: list[OperationModel]) -> None:
+        """Create entities of the run of create operations at the start of the list.
+
+        The run ends with an operation of a different type, an operation
+        which fails validation, an entity whose parent is created
+        in the same run (its access can only be checked after the parent
+        exists) or a second hero version of the same product (the check
+        for an existing hero version only sees already inserted rows).
+        Results are stored in `results`.
+        """
+        entity_type = operations[0].entity_type
+        entity_class = get_entity_class(entity_type)
+        run: list[tuple[OperationModel, ProjectLevelEntity, UserEntity | None]] = []
+        run_ids: set[str] = set()
+        hero_product_ids: set[str] = set()
+
+        for operation in operations[:BULK_CREATE_CHUNK_SIZE]:
+            if operation.type != "create" or operation.entity_type != entity_type:
+                break
+
+            user = self._get_user(operation)
+            try:
+                if (entity := self.entities.get(operation.id)) is None:
+                    entity = await build_project_level_entity(
+                        entity_class,
+                        self.project_name,
+                        operation,
+                        user,
+                    )
+                    self.entities[operation.id] = entity
+
+                if entity.parent_id in run_ids:
+                    break
+
+                if isinstance(entity, VersionEntity) and entity.version < 0:
+                    if entity.product_id in hero_product_ids:
+                        break
+                    hero_product_ids.add(entity.product_id)
+
+                if user:
+                    await self._ensure_create_access(entity, user)
+                self.access_checked.add(operation.id)
+
+            except Exception as e:
+                self._attempted.add(operation.id)
+                self.errors[operation.id] = e
+                break
+
+            self._attempted.add(operation.id)
+            run.append((operation, entity, user))
+            run_ids.add(entity.id)
+
+        if len(run) < 2:
+            return
+
+        try:
+            # Use a savepoint, so a failed bulk insert does not abort
+            # the transaction the operations are processed in
+            async with Postgres.transaction() as conn:
+                async with conn.transaction():
+                    await self._insert(entity_type, run)
+        except Exception as e:
+            logger.debug(
+                f"[OPS] Bulk create of {len(run)} {entity_type}s failed: {e}. "
+                "Creating one by one"
+            )
+            return
+
+        logger.debug(f"[OPS] Created {len(run)} {entity_type}s in bulk")
+        for operation, entity, user in run:
+            self.results[operation.id] = (
+                get_create_events(entity, user),
+                OperationResponseModel(
+                    id=operation.id,
+                    type=operation.type,
+                    entity_id=entity.id,
+                    entity_type=operation.entity_type,
+                    success=True,
+                    status=201,
+                ),
+            )
+
+    async def _get_default(self, key: str, getter: Callable[[], Awaitable[str]]) -> str:
+        if key not in self._defaults:
+            self._defaults[key] = await getter()
+        return self._defaults[key]
+
+    async def _apply_defaults(self, entity: ProjectLevelEntity) -> None:
+        """Set default values, which are the same for all entities of a type"""
+        if entity.status is None:
+            key = f"{entity.entity_type}.status"
+            entity.status = await self._get_default(key, entity.get_default_status)
+
+        if isinstance(entity, FolderEntity) and entity.folder_type is None:
+            getter = entity.get_default_folder_type
+            entity.folder_type = await self._get_default("folder_type", getter)
+
+        elif isinstance(entity, TaskEntity) and entity.task_type is None:
+            getter = entity.get_default_task_type
+            entity.task_type = await self._get_default("task_type", getter)
+
+    async def _insert(
+        self,
+        entity_type: str,
+        run: list[tuple[OperationModel, ProjectLevelEntity, UserEntity | None]],
+    ) -> None:
+        table = f"project_{self.project_name}.{entity_type}s"
+
+        # Consecutive rows with the same set of columns are inserted
+        # using one statement, so the order of creation is preserved
+
+        batches: list[tuple[tuple[str, ...], list[list[Any]]]] = []
+        for _, entity, user in run:
+            await self._apply_defaults(entity)
+            fields = await entity.get_insert_fields(user.name if user else None)
+            keys = tuple(fields)
+            if not batches or batches[-1][0] != keys:
+                batches.append((keys, []))
+            batches[-1][1].append([fields[key] for key in keys])
+
+        for keys, rows in batches:
+            placeholders = ", ".join(f"${i}" for i in range(1, len(keys) + 1))
+            query = f"""
+                INSERT INTO {table} ({", ".join(keys)})
+                VALUES ({placeholders})
+            """
+            await Postgres.executemany(query, rows)
@@ -9,12 +9,16 @@ from .models import OperationModel
 from .validation import validate_task
 
 
-async def create_project_level_entity(
+async def build_project_level_entity(
     entity_class: type[ProjectLevelEntity],
     project_name: str,
     operation: OperationModel,
     user: UserEntity | None,
-) -> tuple[str, list[dict[str, Any]], int]:
+) -> ProjectLevelEntity:
+    """Run hooks and sanity checks and return the entity to be created.
+
+    Access control is not checked here.
+    """
     assert operation.data is not None, "data is required for create"
 
     hooks = OperationHooks.hooks()
@@ -54,23 +58,55 @@ async def create_project_level_entity(
     elif operation.entity_type == "task":
         validate_task(payload_dict)
 
-    #
-    # Create the entity and events
-    #
+    return entity_class(project_name, payload_dict)
 
-    entity = entity_class(project_name, payload_dict)
-    if user:
-        await entity.ensure_create_access(user)
 
-    description = f"{operation.entity_type.capitalize()} {entity.name} created"
-    events = [
+def get_create_events(
+    entity: ProjectLevelEntity,
+    user: UserEntity | None,
+) -> list[dict[str, Any]]:
+    description = f"{entity.entity_type.capitalize()} {entity.name} created"
+    return [
         {
-            "topic": f"entity.{operation.entity_type}.created",
+            "topic": f"entity.{entity.entity_type}.created",
             "summary": {"entityId": entity.id, "parentId": entity.parent_id},
             "description": description,
-            "project": project_name,
+            "project": entity.project_name,
             "user": user.name if user else None,
         }
     ]
+
+
+async def create_project_level_entity(
+    entity_class: type[ProjectLevelEntity],
+    project_name: str,
+    operation: OperationModel,
+    user: UserEntity | None,
+    *,
+    entity: ProjectLevelEntity | None = None,
+    access_checked: bool = False,
+) -> tuple[str, list[dict[str, Any]], int]:
+    """Create a project level entity.
+
+    An already built entity (see build_project_level_entity) may be provided
+    along with the information whether the create access was already checked.
+    """
+
+    if entity is None:
+        entity = await build_project_level_entity(
+            entity_class,
+            project_name,
+            operation,
+            user,
+        )
+
+    #
+    # Create the entity and events
+    #
+
+    if user and not access_checked:
+        await entity.ensure_create_access(user)
+
+    events = get_create_events(entity, user)
     await entity.save(auto_commit=False, user_name=user.name if user else None)
     return entity.id, events, 201
@@ -129,6 +129,7 @@ async def create_reviewable(
             thumbnail_id=file_thumbnail_id,
             user=user_name,
             for_entity=version if version.thumbnail_id is None else None,
+            priority="background",
         )
     except Exception:
         log_traceback(
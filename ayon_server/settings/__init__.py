@@ -11,6 +11,7 @@ __all__ = [
     "ImageIOFileRulesModel",
     "ImageIOBaseModel",
     "apply_overrides",
+    "apply_overrides_dict",
     "list_overrides",
     "extract_overrides",
     "task_types_enum",
@@ -44,6 +45,7 @@ from ayon_server.settings.models import (
 )
 from ayon_server.settings.overrides import (
     apply_overrides,
+    apply_overrides_dict,
     extract_overrides,
     list_overrides,
 )
@@ -1,9 +1,166 @@
 import copy
+import functools
+from collections import OrderedDict
 from typing import Any
 
+from pydantic.fields import SHAPE_SINGLETON
+from pydantic.utils import lenient_issubclass
+
 from ayon_server.logging import logger
 from ayon_server.settings.common import BaseSettingsModel
-from ayon_server.utils import dict_remove_path
+from ayon_server.utils import dict_remove_path, hash_data
+
+VALIDATED_OVERRIDES_CACHE_SIZE = 1000
+
+# Overridden values as validated by the model, keyed by the model, the base
+# settings and the stored overrides. Stored overrides change rarely, so each
+# revision is validated once and then merged into the settings as it is.
+_validated_overrides: OrderedDict[
+    tuple[type[BaseSettingsModel], str, str], dict[str, Any]
+] = OrderedDict()
+
+
+@functools.cache
+def _submodel_fields(
+    model: type[BaseSettingsModel],
+) -> dict[str, type[BaseSettingsModel]]:
+    """Return fields of the model that hold a nested settings model."""
+    result = {}
+    for name, field in model.__fields__.items():
+        if field.shape == SHAPE_SINGLETON and lenient_issubclass(
+            field.type_, BaseSettingsModel
+        ):
+            result[name] = field.type_
+    return result
+
+
+def _merge(
+    model: type[BaseSettingsModel],
+    data: dict[str, Any],
+    overrides: dict[str, Any],
+) -> dict[str, Any]:
+    """Return the settings data with the overrides applied.
+
+    Nested settings models are merged key by key, other values are
+    replaced. The result is not validated.
+    """
+    submodels = _submodel_fields(model)
+    result = dict(data)
+    for name, value in overrides.items():
+        if name not in model.__fields__:
+            continue  # Field no longer exists in the model
+
+        current = data.get(name)
+        if name in submodels and isinstance(value, dict):
+            if isinstance(current, dict):
+                result[name] = _merge(submodels[name], current, value)
+            else:
+                # Nested model is not set (optional)
+                result[name] = copy.deepcopy(value)
+            continue
+
+        if current is not None:
+            try:
+                type(current)(value)
+            except ValueError:
+                logger.warning(f"Invalid value for {name}: {value}")
+                continue
+            except TypeError:
+                # This is okay
+                pass
+
+        result[name] = copy.deepcopy(value)
+    return result
+
+
+def _validated_fragment(
+    model: type[BaseSettingsModel],
+    data: dict[str, Any],
+    overrides: dict[str, Any],
+    validated: dict[str, Any],
+) -> dict[str, Any]:
+    """Return the validated values of the overridden fields.
+
+    Nested models, which are set in `data`, are returned partially,
+    so the fragment can be merged into `data` key by key.
+    """
+    submodels = _submodel_fields(model)
+    result = {}
+    for name, value in overrides.items():
+        if name not in validated:
+            continue
+        current = data.get(name)
+        if name in submodels and isinstance(value, dict) and isinstance(current, dict):
+            result[name] = _validated_fragment(
+                submodels[name], current, value, validated[name]
+            )
+        else:
+            result[name] = validated[name]
+    return result
+
+
+def _copy_value(value: Any) -> Any:
+    """Copy a value of `model.dict()` output (faster than `copy.deepcopy`)"""
+    if isinstance(value, dict):
+        return {k: _copy_value(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_value(v) for v in value]
+    return value
+
+
+def _merge_fragment(
+    model: type[BaseSettingsModel],
+    data: dict[str, Any],
+    fragment: dict[str, Any],
+) -> dict[str, Any]:
+    submodels = _submodel_fields(model)
+    result = dict(data)
+    for name, value in fragment.items():
+        current = data.get(name)
+        if name in submodels and isinstance(value, dict) and isinstance(current, dict):
+            result[name] = _merge_fragment(submodels[name], current, value)
+        else:
+            result[name] = _copy_value(value)
+    return result
+
+
+def clear_validated_overrides() -> None:
+    """Drop all cached validated overrides."""
+    _validated_overrides.clear()
+
+
+def apply_overrides_dict(
+    model: type[BaseSettingsModel],
+    data: dict[str, Any],
+    overrides: dict[str, Any],
+    checksum: str | None = None,
+) -> dict[str, Any]:
+    """Apply the overrides to settings in the form of a dictionary.
+
+    `data` must be a result of `model.dict()` and so is the result.
+    `checksum` identifies `data` (e.g. a checksum of a compiled settings
+    layer); when it is not provided, `data` is hashed.
+
+    The first time an overrides revision is applied to the given data,
+    the merged settings are validated by the model, so invalid overrides
+    raise a `ValidationError`, as with `apply_overrides`. The validated
+    values are cached, and applying the same overrides again is a plain
+    dict merge.
+    """
+    if not overrides:
+        return data
+
+    key = model, checksum or hash_data(data), hash_data(overrides)
+    if (fragment := _validated_overrides.get(key)) is not None:
+        _validated_overrides.move_to_end(key)
+        return _merge_fragment(model, data, fragment)
+
+    result = model(**_merge(model, data, overrides)).dict()
+    fragment = _validated_fragment(model, data, overrides, result)
+    _validated_overrides[key] = copy.deepcopy(fragment)
+    while len(_validated_overrides) > VALIDATED_OVERRIDES_CACHE_SIZE:
+        _validated_overrides.popitem(last=False)
+    return result
 
 
 def apply_overrides(
@@ -15,38 +172,11 @@ def apply_overrides(
     Overrides are a dictionary of the same structure as the settings object,
     but only the values that have been overridden are included (which is
     the way overrides are stored in the database).
-    """
-    result: dict[str, Any] = {}
 
-    def crawl(
-        obj: BaseSettingsModel,
-        override: dict[str, Any],
-        target: dict[str, Any],
-    ) -> None:
-        for name, _field in obj.__fields__.items():
-            child = getattr(obj, name)
-            if isinstance(child, BaseSettingsModel):
-                target[name] = {}
-                crawl(child, override.get(name, {}), target[name])
-            else:
-                # Naive types
-                if name in override:
-                    try:
-                        # TODO: WTF??
-                        type(child)(override[name])
-                    except ValueError:
-                        logger.warning(f"Invalid value for {name}: {override[name]}")
-                        continue
-                    except TypeError:
-                        # This is okay
-                        pass
-
-                    target[name] = override[name]
-                else:
-                    target[name] = child
-
-    crawl(settings, overrides, result)
-    return settings.__class__(**result)
+    Use `apply_overrides_dict` when the settings are already a dictionary.
+    """
+    model = settings.__class__
+    return model(**_merge(model, settings.dict(), overrides))
 
 
 def list_overrides(
@@ -1,5 +1,6 @@
 import json
 import re
+from collections.abc import Callable
 from typing import Annotated, Any, Literal, Union, cast
 
 from pydantic import (
@@ -14,6 +15,7 @@ from pydantic import (
 from ayon_server.logging import logger
 from ayon_server.types import Field, OPModel
 from ayon_server.utils.entity_id import EntityID
+from ayon_server.utils.sqltool import SQLArgs
 
 ValueType = (
     StrictStr
@@ -167,9 +169,43 @@ def create_path_from_key(
     return path
 
 
+PARAM_MARKER_REGEX = re.compile(r"\x00(\d+)\x00")
+
+
 def build_condition(c: QueryCondition, **kwargs) -> str:
-    """Return a SQL WHERE clause from a Condition object."""
+    """Return a SQL WHERE clause from a Condition object.
+
+    If `args` (SQLArgs) is provided, values are passed as query arguments
+    where their type is known. Plain text values compared with top-level
+    columns are still rendered as literals, so Postgres infers their type
+    from the column.
+    """
+
+    args: SQLArgs | None = kwargs.get("args")
+    if args is None:
+        return _build_condition(c, lambda literal, val, cast: literal, **kwargs)
+
+    # Not every prepared value ends up in the condition, so values
+    # are added to the arguments only when their marker is present
+
+    params: list[tuple[Any, str]] = []
+
+    def param(literal: str, val: Any, cast: str) -> str:
+        params.append((val, cast))
+        return f"\x00{len(params) - 1}\x00"
 
+    condition = _build_condition(c, param, **kwargs)
+    return PARAM_MARKER_REGEX.sub(
+        lambda m: args.add(*params[int(m.group(1))]),
+        condition,
+    )
+
+
+def _build_condition(
+    c: QueryCondition,
+    param: Callable[[str, Any, str], str],
+    **kwargs,
+) -> str:
     json_fields = kwargs.get("json_fields", JSON_FIELDS)
     single_json_column = kwargs.get("single_json_column", None)
     table_prefix = kwargs.get("table_prefix")
@@ -199,10 +235,11 @@ def build_condition(c: QueryCondition, **kwargs) -> str:
 
         if isinstance(value, str):
             if path[0] == "id" or path[0].endswith("_id"):
-                safe_value = EntityID.parse(value)
+                entity_id = EntityID.parse(value)
+                safe_value = param(f"'{entity_id}'", entity_id, "uuid")
             else:
                 safe_value = value.replace("'", "''")
-            safe_value = f"'{safe_value}'"
+                safe_value = f"'{safe_value}'"
 
         elif isinstance(value, int | float):
             cast_type = "integer" if isinstance(value, int) else "number"
@@ -244,13 +281,13 @@ def build_condition(c: QueryCondition, **kwargs) -> str:
             # JSON Field is a string, so we need to cast it to text
             if isinstance(value, str):
                 safe_value = value.replace("'", "''")
-                safe_value = f"'{safe_value}'"
+                safe_value = param(f"'{safe_value}'", value, "text")
             else:
                 raise ValueError("Value must be a string for 'like' operator")
 
         else:
             safe_value = json.dumps(value).replace("'", "''")
-            safe_value = f"'{safe_value}'::jsonb"
+            safe_value = param(f"'{safe_value}'::jsonb", value, "jsonb")
 
     else:
         raise ValueError(f"Invalid path: {path}")
@@ -306,8 +343,10 @@ def build_condition(c: QueryCondition, **kwargs) -> str:
             # Let postgres cast them and validate
             escaped_list = [EntityID.parse(cast(str, v)) for v in value]
 
-            arr_value = (
-                "array[" + ", ".join([f"'{v}'::UUID" for v in escaped_list]) + "]"
+            arr_value = param(
+                "array[" + ", ".join([f"'{v}'::UUID" for v in escaped_list]) + "]",
+                escaped_list,
+                "uuid[]",
             )
             cast_type = "uuid"
 
@@ -316,15 +355,25 @@ def build_condition(c: QueryCondition, **kwargs) -> str:
             if len(path) > 1:
                 # crawling a json, so we need to quote the values
                 # this is needed for in and notin
-                arr_value = (
-                    "array[" + ", ".join([f"'\"{v}\"'" for v in escaped_list]) + "]"
+                arr_value = param(
+                    "array[" + ", ".join([f"'\"{v}\"'" for v in escaped_list]) + "]",
+                    [f'"{v}"' for v in value],
+                    "text[]",
                 )
             else:
-                arr_value = "array[" + ", ".join([f"'{v}'" for v in escaped_list]) + "]"
+                arr_value = param(
+                    "array[" + ", ".join([f"'{v}'" for v in escaped_list]) + "]",
+                    value,
+                    "text[]",
+                )
             cast_type = "text"
 
         elif all(isinstance(v, (int)) for v in value):
-            arr_value = "array[" + ", ".join([str(v) for v in value]) + "]"
+            arr_value = param(
+                "array[" + ", ".join([str(v) for v in value]) + "]",
+                value,
+                "integer[]",
+            )
             cast_type = "integer"
 
         elif all(isinstance(v, (float)) for v in value):
@@ -32,7 +32,7 @@ def json_default_handler(value: Any) -> Any:
     raise TypeError(f"Type {type(value)} is not JSON serializable")
 
 
-def json_loads(data: str) -> Any:
+def json_loads(data: str | bytes) -> Any:
     """Load JSON data."""
     return orjson.loads(data)
 
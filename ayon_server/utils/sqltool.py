@@ -1,4 +1,4 @@
-__all__ = ["SQLTool"]
+__all__ = ["SQLArgs", "SQLTool"]
 
 import uuid
 from typing import Any
@@ -6,6 +6,48 @@ from typing import Any
 from .entity_id import EntityID
 
 
+class SQLArgs:
+    """Query arguments collector.
+
+    Used to build parameterized queries: each added value is stored
+    and its placeholder (`$1`, `$2`...) is returned to be used in the query.
+    As values are not a part of the query text, queries of the same shape
+    share the same statement and its prepared plan.
+
+        args = SQLArgs()
+        query = f"SELECT * FROM tasks WHERE id = ANY({args.ids(ids)})"
+        await Postgres.fetch(query, *args)
+    """
+
+    def __init__(self) -> None:
+        self.values: list[Any] = []
+
+    def add(self, value: Any, cast: str | None = None) -> str:
+        """Add a value and return its placeholder (with an optional cast)"""
+        self.values.append(value)
+        placeholder = f"${len(self.values)}"
+        return f"{placeholder}::{cast}" if cast else placeholder
+
+    def ids(self, ids: list[str] | list[uuid.UUID]) -> str:
+        """Add a list of entity IDs and return an `uuid[]` placeholder
+
+        Provided list elements must be valid entity IDs.
+        Null values will be ignored.
+        """
+        parsed = [EntityID.parse(id, allow_nulls=True) for id in ids]
+        return self.add([id for id in parsed if id is not None], "uuid[]")
+
+    def array(self, elements: list[str] | list[int], cast: str = "text[]") -> str:
+        """Add a list of values and return an array placeholder"""
+        return self.add(list(elements), cast)
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
 class SQLTool:
     """SQL query construction helpers."""
 
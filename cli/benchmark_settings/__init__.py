@@ -0,0 +1,3 @@
+__all__ = ["benchmark_settings"]
+
+from .benchmark_settings import benchmark_settings
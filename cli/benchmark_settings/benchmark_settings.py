@@ -0,0 +1,76 @@
+import time
+
+from ayon_server.addons import AddonLibrary
+from ayon_server.cli import app
+from ayon_server.initialize import ayon_init
+from ayon_server.logging import logger
+from ayon_server.settings import apply_overrides, apply_overrides_dict
+from ayon_server.settings.overrides import clear_validated_overrides
+from ayon_server.utils import hash_data
+
+
+@app.command()
+async def benchmark_settings(
+    variant: str = "production",
+    iterations: int = 100,
+) -> None:
+    """Compare model and dict based overrides for installed addons.
+
+    Stored studio overrides are used. Addons without overrides are
+    benchmarked with their complete default settings as overrides.
+
+    The dict based path is timed twice: uncached, validating the merged
+    settings on every apply, and cached, where the overrides are validated
+    by the first apply and the following applies only merge them.
+    """
+
+    await ayon_init()
+
+    total_model = 0.0
+    total_uncached = 0.0
+    total_cached = 0.0
+    for addon_name, definition in AddonLibrary.items():
+        for addon_version, addon in definition.versions.items():
+            model = addon.get_settings_model()
+            if model is None:
+                continue
+            settings = await addon.get_default_settings()
+            if settings is None:
+                continue
+            overrides = await addon.get_studio_overrides(variant=variant)
+            data = settings.dict()
+            checksum = hash_data(data)
+            overrides = overrides or data
+
+            start_time = time.perf_counter()
+            for _ in range(iterations):
+                apply_overrides(settings, overrides)
+            model_time = time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            for _ in range(iterations):
+                clear_validated_overrides()
+                apply_overrides_dict(model, data, overrides, checksum)
+            uncached_time = time.perf_counter() - start_time
+
+            apply_overrides_dict(model, data, overrides, checksum)
+            start_time = time.perf_counter()
+            for _ in range(iterations):
+                apply_overrides_dict(model, data, overrides, checksum)
+            cached_time = time.perf_counter() - start_time
+
+            total_model += model_time
+            total_uncached += uncached_time
+            total_cached += cached_time
+            logger.info(
+                f"{addon_name} {addon_version}: "
+                f"model {model_time * 1000 / iterations:.2f} ms, "
+                f"uncached {uncached_time * 1000 / iterations:.2f} ms, "
+                f"cached {cached_time * 1000 / iterations:.2f} ms"
+            )
+
+    speedup = total_uncached / total_cached if total_cached else 0
+    logger.info(
+        f"Total: model {total_model:.2f} s, uncached {total_uncached:.2f} s, "
+        f"cached {total_cached:.2f} s ({speedup:.1f}x faster than uncached)"
+    )
@@ -0,0 +1,3 @@
+__all__ = ["rebuild_task_index"]
+
+from .rebuild_task_index import rebuild_task_index
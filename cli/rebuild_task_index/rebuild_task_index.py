@@ -0,0 +1,34 @@
+import time
+
+from ayon_server.cli import app
+from ayon_server.helpers.project_list import get_project_list
+from ayon_server.helpers.task_index import rebuild_task_index as rebuild_index
+from ayon_server.initialize import ayon_init
+from ayon_server.logging import logger
+
+
+@app.command()
+async def rebuild_task_index(project_name: str | None = None) -> None:
+    """Rebuild the cross-project task index for a project or all projects.
+
+    The index is used by the Kanban board and it is normally kept
+    up to date automatically.
+    """
+
+    await ayon_init()
+
+    if project_name is None:
+        project_names = [project.name for project in await get_project_list()]
+    else:
+        project_names = [project_name]
+
+    start_time = time.monotonic()
+    total = 0
+    for name in project_names:
+        total += await rebuild_index(name)
+    elapsed_time = time.monotonic() - start_time
+
+    logger.info(
+        f"Indexed {total} tasks of {len(project_names)} projects "
+        f"in {elapsed_time:.2f} seconds"
+    )
@@ -2,8 +2,10 @@ __all__ = ["task_sequence"]
 
 from .add_missing_project_indexes import AddMissingProjectIndexes
 from .auto_update import AutoUpdate
+from .check_hierarchy_consistency import CheckHierarchyConsistency
 from .push_metrics import PushMetrics
 from .remove_inactive_workers import RemoveInactiveWorkers
+from .remove_incomplete_uploads import RemoveIncompleteUploads
 from .remove_old_action_configs import RemoveOldActionConfigs
 from .remove_old_events import RemoveOldEvents
 from .remove_old_logs import RemoveOldLogs
@@ -22,9 +24,11 @@ task_sequence = [
     RemoveOldEvents,
     RemoveUnusedActivities,
     RemoveUnusedFiles,
+    RemoveIncompleteUploads,
     RemoveUnusedSettings,
     RemoveUnusedThumbnails,
     AddMissingProjectIndexes,
+    CheckHierarchyConsistency,
     # VacuumDB, -- too expensive. maybe run it manually?
     PushMetrics,
 ]
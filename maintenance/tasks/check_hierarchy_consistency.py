@@ -0,0 +1,13 @@
+from ayon_server.entities import FolderEntity
+from ayon_server.helpers.hierarchy_consistency import check_hierarchy_consistency
+from maintenance.maintenance_task import ProjectMaintenanceTask
+
+
+class CheckHierarchyConsistency(ProjectMaintenanceTask):
+    description = "Checking folder hierarchy consistency"
+
+    async def main(self, project_name: str):
+        fixed = await check_hierarchy_consistency(project_name, repair=True)
+        if fixed:
+            # Paths changed, so exported attributes and the cache are stale
+            await FolderEntity.refresh_views(project_name)
@@ -0,0 +1,12 @@
+from ayon_server.files.upload_sessions import remove_incomplete_uploads
+from ayon_server.logging import logger
+from maintenance.maintenance_task import ProjectMaintenanceTask
+
+
+class RemoveIncompleteUploads(ProjectMaintenanceTask):
+    description = "Removing incomplete uploads"
+
+    async def main(self, project_name: str):
+        count = await remove_incomplete_uploads(project_name)
+        if count:
+            logger.debug(f"Removed {count} incomplete uploads from {project_name}")
@@ -0,0 +1,105 @@
+-----------------
+-- Ayon 1.16.0 --
+-----------------
+
+--
+-- Replace the hierarchy materialized view with a trigger-maintained table
+--
+
+CREATE OR REPLACE FUNCTION public.sync_folder_hierarchy()
+RETURNS TRIGGER AS $$
+BEGIN
+    -- Lock hierarchy records of the ancestors (root first), so a concurrent
+    -- rename or move of any of them waits for this transaction (and vice versa)
+
+    EXECUTE format($q$
+        WITH RECURSIVE ancestors AS (
+            SELECT parent_id AS id FROM %1$I.folders
+            WHERE id = $1 AND parent_id IS NOT NULL
+            UNION
+            SELECT f.parent_id AS id FROM %1$I.folders f
+            INNER JOIN ancestors a ON f.id = a.id
+            WHERE f.parent_id IS NOT NULL
+        )
+        SELECT 1 FROM %1$I.hierarchy h
+        WHERE h.id IN (SELECT id FROM ancestors)
+        ORDER BY length(h.path)
+        FOR SHARE OF h
+    $q$, TG_TABLE_SCHEMA) USING NEW.id;
+
+    IF TG_OP = 'UPDATE' THEN
+        EXECUTE format(
+            'SELECT 1 FROM %I.hierarchy WHERE id = $1 FOR UPDATE',
+            TG_TABLE_SCHEMA
+        ) USING NEW.id;
+    END IF;
+
+    EXECUTE format($q$
+        WITH RECURSIVE subtree AS (
+            SELECT f.id, COALESCE(h.path || '/', '') || f.name AS path
+            FROM %1$I.folders f
+            LEFT JOIN %1$I.hierarchy h ON h.id = f.parent_id
+            WHERE f.id = $1
+            UNION ALL
+            SELECT f.id, s.path || '/' || f.name AS path
+            FROM %1$I.folders f
+            INNER JOIN subtree s ON f.parent_id = s.id
+        )
+        INSERT INTO %1$I.hierarchy (id, path)
+        SELECT id, path FROM subtree
+        ON CONFLICT (id) DO UPDATE SET path = EXCLUDED.path
+        WHERE hierarchy.path IS DISTINCT FROM EXCLUDED.path
+    $q$, TG_TABLE_SCHEMA) USING NEW.id;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+
+DO $$
+DECLARE rec RECORD;
+BEGIN
+  FOR rec IN
+    SELECT schemaname FROM pg_matviews
+    WHERE schemaname LIKE 'project_%'
+    AND matviewname = 'hierarchy'
+  LOOP
+    BEGIN
+      RAISE WARNING 'Converting hierarchy view to a table in %', rec.schemaname;
+      EXECUTE 'SET LOCAL search_path TO ' || quote_ident(rec.schemaname);
+
+      DROP MATERIALIZED VIEW hierarchy;
+
+      CREATE TABLE hierarchy(
+        id UUID NOT NULL PRIMARY KEY REFERENCES folders(id) ON DELETE CASCADE,
+        path VARCHAR NOT NULL
+      );
+
+      WITH RECURSIVE htable AS (
+        SELECT id, name::VARCHAR AS path
+        FROM folders WHERE parent_id IS NULL
+        UNION ALL
+        SELECT f.id, (h.path || '/' || f.name)::VARCHAR AS path
+        FROM folders f
+        INNER JOIN htable h ON f.parent_id = h.id
+      )
+      INSERT INTO hierarchy (id, path) SELECT id, path FROM htable;
+
+      CREATE INDEX hierarchy_path_idx ON hierarchy(path);
+
+      CREATE TRIGGER folder_hierarchy_insert
+        AFTER INSERT ON folders
+        FOR EACH ROW EXECUTE FUNCTION public.sync_folder_hierarchy();
+
+      CREATE TRIGGER folder_hierarchy_update
+        AFTER UPDATE OF name, parent_id ON folders
+        FOR EACH ROW
+        WHEN (OLD.name IS DISTINCT FROM NEW.name OR OLD.parent_id IS DISTINCT FROM NEW.parent_id)
+        EXECUTE FUNCTION public.sync_folder_hierarchy();
+
+    EXCEPTION
+      WHEN OTHERS THEN
+        RAISE WARNING 'Skipping hierarchy conversion in % due to error: %', rec.schemaname, SQLERRM;
+    END;
+  END LOOP;
+END $$;
@@ -0,0 +1,151 @@
+-----------------
+-- Ayon 1.16.0 --
+-----------------
+
+--
+-- Cross-project task index for the Kanban board
+--
+
+CREATE TABLE IF NOT EXISTS public.task_index(
+    project_name VARCHAR NOT NULL
+        REFERENCES public.projects(name) ON DELETE CASCADE ON UPDATE CASCADE,
+    task_id UUID NOT NULL,
+    assignees VARCHAR[] NOT NULL DEFAULT ARRAY[]::VARCHAR[],
+    status VARCHAR,
+    due_date VARCHAR,
+    priority VARCHAR,
+    folder_path VARCHAR,
+    updated_at TIMESTAMPTZ,
+    PRIMARY KEY (project_name, task_id)
+);
+
+CREATE INDEX IF NOT EXISTS task_index_assignees_idx
+    ON public.task_index USING gin(assignees);
+CREATE INDEX IF NOT EXISTS task_index_order_idx
+    ON public.task_index(due_date DESC NULLS LAST, updated_at DESC);
+
+CREATE OR REPLACE FUNCTION public.sync_task_index()
+RETURNS TRIGGER AS $$
+DECLARE
+    pname VARCHAR;
+BEGIN
+    SELECT name INTO pname FROM public.projects
+    WHERE 'project_' || lower(name) = TG_TABLE_SCHEMA;
+
+    IF pname IS NULL THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP = 'DELETE' THEN
+        EXECUTE $q$
+            DELETE FROM public.task_index
+            WHERE project_name = $1
+            AND task_id IN (SELECT id FROM old_tasks)
+        $q$ USING pname;
+        RETURN NULL;
+    END IF;
+
+    EXECUTE format($q$
+        INSERT INTO public.task_index AS ti (
+            project_name, task_id, assignees, status,
+            due_date, priority, folder_path, updated_at
+        )
+        SELECT
+            $1, t.id, t.assignees, t.status,
+            t.attrib->>'endDate', t.attrib->>'priority', h.path, t.updated_at
+        FROM new_tasks t
+        LEFT JOIN %I.hierarchy h ON h.id = t.folder_id
+        ON CONFLICT (project_name, task_id) DO UPDATE SET
+            assignees = EXCLUDED.assignees,
+            status = EXCLUDED.status,
+            due_date = EXCLUDED.due_date,
+            priority = EXCLUDED.priority,
+            folder_path = EXCLUDED.folder_path,
+            updated_at = EXCLUDED.updated_at
+    $q$, TG_TABLE_SCHEMA) USING pname;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION public.sync_task_index_paths()
+RETURNS TRIGGER AS $$
+DECLARE
+    pname VARCHAR;
+BEGIN
+    SELECT name INTO pname FROM public.projects
+    WHERE 'project_' || lower(name) = TG_TABLE_SCHEMA;
+
+    IF pname IS NULL THEN
+        RETURN NULL;
+    END IF;
+
+    EXECUTE format($q$
+        UPDATE public.task_index ti SET folder_path = p.path
+        FROM new_paths p
+        INNER JOIN %I.tasks t ON t.folder_id = p.id
+        WHERE ti.project_name = $1
+        AND ti.task_id = t.id
+        AND ti.folder_path IS DISTINCT FROM p.path
+    $q$, TG_TABLE_SCHEMA) USING pname;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+
+DO $$
+DECLARE rec RECORD;
+BEGIN
+  FOR rec IN
+    SELECT p.name AS project_name, n.nspname AS schemaname
+    FROM public.projects p
+    INNER JOIN pg_namespace n ON n.nspname = 'project_' || lower(p.name)
+    WHERE NOT EXISTS (
+      SELECT 1 FROM pg_trigger tg
+      INNER JOIN pg_class c ON c.oid = tg.tgrelid
+      WHERE c.relnamespace = n.oid
+      AND tg.tgname = 'task_index_insert'
+    )
+  LOOP
+    BEGIN
+      RAISE WARNING 'Creating task index in %', rec.schemaname;
+      EXECUTE 'SET LOCAL search_path TO ' || quote_ident(rec.schemaname);
+
+      CREATE TRIGGER task_index_insert
+          AFTER INSERT ON tasks
+          REFERENCING NEW TABLE AS new_tasks
+          FOR EACH STATEMENT EXECUTE FUNCTION public.sync_task_index();
+
+      CREATE TRIGGER task_index_update
+          AFTER UPDATE ON tasks
+          REFERENCING NEW TABLE AS new_tasks
+          FOR EACH STATEMENT EXECUTE FUNCTION public.sync_task_index();
+
+      CREATE TRIGGER task_index_delete
+          AFTER DELETE ON tasks
+          REFERENCING OLD TABLE AS old_tasks
+          FOR EACH STATEMENT EXECUTE FUNCTION public.sync_task_index();
+
+      CREATE TRIGGER task_index_paths
+          AFTER UPDATE ON hierarchy
+          REFERENCING NEW TABLE AS new_paths
+          FOR EACH STATEMENT EXECUTE FUNCTION public.sync_task_index_paths();
+
+      INSERT INTO public.task_index (
+        project_name, task_id, assignees, status,
+        due_date, priority, folder_path, updated_at
+      )
+      SELECT
+        rec.project_name, t.id, t.assignees, t.status,
+        t.attrib->>'endDate', t.attrib->>'priority', h.path, t.updated_at
+      FROM tasks t
+      LEFT JOIN hierarchy h ON h.id = t.folder_id
+      ON CONFLICT (project_name, task_id) DO NOTHING;
+
+    EXCEPTION
+      WHEN OTHERS THEN
+        RAISE WARNING 'Skipping task index creation in % due to error: %', rec.schemaname, SQLERRM;
+    END;
+  END LOOP;
+END $$;
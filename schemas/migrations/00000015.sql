@@ -0,0 +1,141 @@
+-----------------
+-- Ayon 1.16.0 --
+-----------------
+
+--
+-- Replace the version_list materialized view with a trigger-maintained table
+--
+
+CREATE OR REPLACE FUNCTION public.sync_version_list()
+RETURNS TRIGGER AS $$
+DECLARE
+    product_ids UUID[];
+BEGIN
+    -- Only products whose versions were added, removed, renumbered
+    -- or moved need their version list recomputed
+
+    IF TG_OP = 'INSERT' THEN
+        SELECT array_agg(DISTINCT product_id) INTO product_ids FROM new_versions;
+    ELSIF TG_OP = 'DELETE' THEN
+        SELECT array_agg(DISTINCT product_id) INTO product_ids FROM old_versions;
+    ELSE
+        SELECT array_agg(DISTINCT pid) INTO product_ids FROM (
+            SELECT unnest(ARRAY[o.product_id, n.product_id]) AS pid
+            FROM new_versions n
+            INNER JOIN old_versions o ON o.id = n.id
+            WHERE n.version IS DISTINCT FROM o.version
+            OR n.product_id IS DISTINCT FROM o.product_id
+        ) changed;
+    END IF;
+
+    IF product_ids IS NULL THEN
+        RETURN NULL;
+    END IF;
+
+    -- Lock the products, so concurrent publishes to the same product
+    -- are applied one after another and each sees the committed versions
+    -- of the previous one
+
+    EXECUTE format($q$
+        SELECT 1 FROM %I.products
+        WHERE id = ANY($1)
+        ORDER BY id
+        FOR NO KEY UPDATE
+    $q$, TG_TABLE_SCHEMA) USING product_ids;
+
+    EXECUTE format($q$
+        DELETE FROM %1$I.version_list l
+        WHERE l.product_id = ANY($1)
+        AND NOT EXISTS (
+            SELECT 1 FROM %1$I.versions v WHERE v.product_id = l.product_id
+        )
+    $q$, TG_TABLE_SCHEMA) USING product_ids;
+
+    EXECUTE format($q$
+        INSERT INTO %1$I.version_list AS l (
+            product_id, ids, versions, latest_id, hero_id, hero_version
+        )
+        SELECT
+            v.product_id,
+            array_agg(v.id ORDER BY v.version),
+            array_agg(v.version ORDER BY v.version),
+            (array_agg(v.id ORDER BY v.version DESC)
+                FILTER (WHERE v.version >= 0))[1],
+            (array_agg(v.id ORDER BY v.version)
+                FILTER (WHERE v.version < 0))[1],
+            -min(v.version) FILTER (WHERE v.version < 0)
+        FROM %1$I.versions v
+        WHERE v.product_id = ANY($1)
+        GROUP BY v.product_id
+        ON CONFLICT (product_id) DO UPDATE SET
+            ids = EXCLUDED.ids,
+            versions = EXCLUDED.versions,
+            latest_id = EXCLUDED.latest_id,
+            hero_id = EXCLUDED.hero_id,
+            hero_version = EXCLUDED.hero_version
+    $q$, TG_TABLE_SCHEMA) USING product_ids;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+
+DO $$
+DECLARE rec RECORD;
+BEGIN
+  FOR rec IN
+    SELECT schemaname FROM pg_matviews
+    WHERE schemaname LIKE 'project_%'
+    AND matviewname = 'version_list'
+  LOOP
+    BEGIN
+      RAISE WARNING 'Converting version_list view to a table in %', rec.schemaname;
+      EXECUTE 'SET LOCAL search_path TO ' || quote_ident(rec.schemaname);
+
+      DROP MATERIALIZED VIEW version_list;
+
+      CREATE TABLE version_list(
+        product_id UUID NOT NULL PRIMARY KEY REFERENCES products(id) ON DELETE CASCADE,
+        ids UUID[] NOT NULL,
+        versions INTEGER[] NOT NULL,
+        latest_id UUID,
+        hero_id UUID,
+        hero_version INTEGER
+      );
+
+      INSERT INTO version_list (
+        product_id, ids, versions, latest_id, hero_id, hero_version
+      )
+      SELECT
+        v.product_id,
+        array_agg(v.id ORDER BY v.version),
+        array_agg(v.version ORDER BY v.version),
+        (array_agg(v.id ORDER BY v.version DESC) FILTER (WHERE v.version >= 0))[1],
+        (array_agg(v.id ORDER BY v.version) FILTER (WHERE v.version < 0))[1],
+        -min(v.version) FILTER (WHERE v.version < 0)
+      FROM versions v
+      GROUP BY v.product_id;
+
+      CREATE INDEX version_list_latest_idx ON version_list(latest_id);
+
+      CREATE TRIGGER version_list_insert
+        AFTER INSERT ON versions
+        REFERENCING NEW TABLE AS new_versions
+        FOR EACH STATEMENT EXECUTE FUNCTION public.sync_version_list();
+
+      CREATE TRIGGER version_list_update
+        AFTER UPDATE ON versions
+        REFERENCING OLD TABLE AS old_versions NEW TABLE AS new_versions
+        FOR EACH STATEMENT EXECUTE FUNCTION public.sync_version_list();
+
+      CREATE TRIGGER version_list_delete
+        AFTER DELETE ON versions
+        REFERENCING OLD TABLE AS old_versions
+        FOR EACH STATEMENT EXECUTE FUNCTION public.sync_version_list();
+
+    EXCEPTION
+      WHEN OTHERS THEN
+        RAISE WARNING 'Skipping version_list conversion in % due to error: %', rec.schemaname, SQLERRM;
+    END;
+  END LOOP;
+END $$;
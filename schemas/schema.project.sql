@@ -203,32 +203,27 @@ CREATE UNIQUE INDEX folder_root_unique_name ON folders (LOWER(name))
     WHERE (active IS TRUE AND parent_id IS NULL);
 
 
--- Hierarchy view
--- Materialized view used as a shorthand to get folder parents/full path
-
-CREATE MATERIALIZED VIEW hierarchy
-AS
-    WITH htable AS (
-        WITH RECURSIVE hierarchy AS (
-            SELECT id, name, parent_id, 1 as pos, id as base_id
-            FROM
-                folders
-            UNION
-                SELECT e.id, e.name, e.parent_id, pos + 1, base_id
-                FROM folders e
-                INNER JOIN hierarchy s ON s.parent_id = e.id
-        ) SELECT
-            base_id,
-            string_agg(name, '/' ORDER BY pos DESC) as path
-        FROM
-            hierarchy
-        GROUP BY base_id
-   )
-   SELECT base_id AS id, path FROM htable;
-
-CREATE UNIQUE INDEX hierarchy_id ON hierarchy (id);
+-- Hierarchy table
+-- Used as a shorthand to get folder parents/full path.
+-- Maintained by triggers (see public.sync_folder_hierarchy)
+
+CREATE TABLE hierarchy(
+    id UUID NOT NULL PRIMARY KEY REFERENCES folders(id) ON DELETE CASCADE,
+    path VARCHAR NOT NULL
+);
+
 CREATE INDEX hierarchy_path_idx ON hierarchy(path);
 
+CREATE TRIGGER folder_hierarchy_insert
+    AFTER INSERT ON folders
+    FOR EACH ROW EXECUTE FUNCTION public.sync_folder_hierarchy();
+
+CREATE TRIGGER folder_hierarchy_update
+    AFTER UPDATE OF name, parent_id ON folders
+    FOR EACH ROW
+    WHEN (OLD.name IS DISTINCT FROM NEW.name OR OLD.parent_id IS DISTINCT FROM NEW.parent_id)
+    EXECUTE FUNCTION public.sync_folder_hierarchy();
+
 
 CREATE TABLE exported_attributes(
   folder_id UUID NOT NULL PRIMARY KEY REFERENCES folders(id) ON DELETE CASCADE,
@@ -270,6 +265,28 @@ CREATE INDEX task_attrib_idx ON tasks USING gin(attrib);
 CREATE UNIQUE INDEX task_creation_order_idx ON tasks(creation_order);
 CREATE UNIQUE INDEX task_unique_name ON tasks(folder_id, LOWER(name)) WHERE (active IS TRUE);
 
+-- Keep public.task_index (used by the Kanban board) in sync
+
+CREATE TRIGGER task_index_insert
+    AFTER INSERT ON tasks
+    REFERENCING NEW TABLE AS new_tasks
+    FOR EACH STATEMENT EXECUTE FUNCTION public.sync_task_index();
+
+CREATE TRIGGER task_index_update
+    AFTER UPDATE ON tasks
+    REFERENCING NEW TABLE AS new_tasks
+    FOR EACH STATEMENT EXECUTE FUNCTION public.sync_task_index();
+
+CREATE TRIGGER task_index_delete
+    AFTER DELETE ON tasks
+    REFERENCING OLD TABLE AS old_tasks
+    FOR EACH STATEMENT EXECUTE FUNCTION public.sync_task_index();
+
+CREATE TRIGGER task_index_paths
+    AFTER UPDATE ON hierarchy
+    REFERENCING NEW TABLE AS new_paths
+    FOR EACH STATEMENT EXECUTE FUNCTION public.sync_task_index_paths();
+
 -------------
 -- PRODUCTS --
 -------------
@@ -335,20 +352,35 @@ CREATE INDEX version_attrib_idx ON versions USING gin(attrib);
 CREATE UNIQUE INDEX version_creation_order_idx ON versions(creation_order);
 CREATE UNIQUE INDEX version_unique_version_parent ON versions (product_id, version) WHERE (active IS TRUE);
 
--- Version list VIEW
--- Materialized view used as a shorthand to get product versions
+-- Version list
+-- Used as a shorthand to get product versions, the latest and hero version.
+-- Maintained by triggers (see public.sync_version_list)
+
+CREATE TABLE version_list(
+    product_id UUID NOT NULL PRIMARY KEY REFERENCES products(id) ON DELETE CASCADE,
+    ids UUID[] NOT NULL,
+    versions INTEGER[] NOT NULL,
+    latest_id UUID,
+    hero_id UUID,
+    hero_version INTEGER
+);
+
+CREATE INDEX version_list_latest_idx ON version_list(latest_id);
+
+CREATE TRIGGER version_list_insert
+    AFTER INSERT ON versions
+    REFERENCING NEW TABLE AS new_versions
+    FOR EACH STATEMENT EXECUTE FUNCTION public.sync_version_list();
 
-CREATE MATERIALIZED VIEW version_list
-AS
-    SELECT
-        v.product_id AS product_id,
-        array_agg(v.id ORDER BY v.version ) AS ids,
-        array_agg(v.version ORDER BY v.version ) AS versions
-    FROM
-        versions AS v
-    GROUP BY v.product_id;
+CREATE TRIGGER version_list_update
+    AFTER UPDATE ON versions
+    REFERENCING OLD TABLE AS old_versions NEW TABLE AS new_versions
+    FOR EACH STATEMENT EXECUTE FUNCTION public.sync_version_list();
 
-CREATE UNIQUE INDEX version_list_id ON version_list (product_id);
+CREATE TRIGGER version_list_delete
+    AFTER DELETE ON versions
+    REFERENCING OLD TABLE AS old_versions
+    FOR EACH STATEMENT EXECUTE FUNCTION public.sync_version_list();
 
 ---------------------
 -- REPRESENTATIONS --
@@ -447,3 +447,234 @@ BEGIN
     END LOOP;
 END;
 $$ LANGUAGE plpgsql;
+
+
+---------------
+-- HIERARCHY --
+---------------
+
+-- Keeps project_<name>.hierarchy table in sync with the folders table.
+-- Used by AFTER INSERT / UPDATE triggers on folders in every project schema.
+-- Only the changed folder and its descendants are (re)written,
+-- deleted folders are removed by the foreign key cascade.
+
+CREATE OR REPLACE FUNCTION sync_folder_hierarchy()
+RETURNS TRIGGER AS $$
+BEGIN
+    -- Lock hierarchy records of the ancestors (root first), so a concurrent
+    -- rename or move of any of them waits for this transaction (and vice versa)
+
+    EXECUTE format($q$
+        WITH RECURSIVE ancestors AS (
+            SELECT parent_id AS id FROM %1$I.folders
+            WHERE id = $1 AND parent_id IS NOT NULL
+            UNION
+            SELECT f.parent_id AS id FROM %1$I.folders f
+            INNER JOIN ancestors a ON f.id = a.id
+            WHERE f.parent_id IS NOT NULL
+        )
+        SELECT 1 FROM %1$I.hierarchy h
+        WHERE h.id IN (SELECT id FROM ancestors)
+        ORDER BY length(h.path)
+        FOR SHARE OF h
+    $q$, TG_TABLE_SCHEMA) USING NEW.id;
+
+    IF TG_OP = 'UPDATE' THEN
+        EXECUTE format(
+            'SELECT 1 FROM %I.hierarchy WHERE id = $1 FOR UPDATE',
+            TG_TABLE_SCHEMA
+        ) USING NEW.id;
+    END IF;
+
+    EXECUTE format($q$
+        WITH RECURSIVE subtree AS (
+            SELECT f.id, COALESCE(h.path || '/', '') || f.name AS path
+            FROM %1$I.folders f
+            LEFT JOIN %1$I.hierarchy h ON h.id = f.parent_id
+            WHERE f.id = $1
+            UNION ALL
+            SELECT f.id, s.path || '/' || f.name AS path
+            FROM %1$I.folders f
+            INNER JOIN subtree s ON f.parent_id = s.id
+        )
+        INSERT INTO %1$I.hierarchy (id, path)
+        SELECT id, path FROM subtree
+        ON CONFLICT (id) DO UPDATE SET path = EXCLUDED.path
+        WHERE hierarchy.path IS DISTINCT FROM EXCLUDED.path
+    $q$, TG_TABLE_SCHEMA) USING NEW.id;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+
+CREATE OR REPLACE FUNCTION public.sync_version_list()
+RETURNS TRIGGER AS $$
+DECLARE
+    product_ids UUID[];
+BEGIN
+    -- Only products whose versions were added, removed, renumbered
+    -- or moved need their version list recomputed
+
+    IF TG_OP = 'INSERT' THEN
+        SELECT array_agg(DISTINCT product_id) INTO product_ids FROM new_versions;
+    ELSIF TG_OP = 'DELETE' THEN
+        SELECT array_agg(DISTINCT product_id) INTO product_ids FROM old_versions;
+    ELSE
+        SELECT array_agg(DISTINCT pid) INTO product_ids FROM (
+            SELECT unnest(ARRAY[o.product_id, n.product_id]) AS pid
+            FROM new_versions n
+            INNER JOIN old_versions o ON o.id = n.id
+            WHERE n.version IS DISTINCT FROM o.version
+            OR n.product_id IS DISTINCT FROM o.product_id
+        ) changed;
+    END IF;
+
+    IF product_ids IS NULL THEN
+        RETURN NULL;
+    END IF;
+
+    -- Lock the products, so concurrent publishes to the same product
+    -- are applied one after another and each sees the committed versions
+    -- of the previous one
+
+    EXECUTE format($q$
+        SELECT 1 FROM %I.products
+        WHERE id = ANY($1)
+        ORDER BY id
+        FOR NO KEY UPDATE
+    $q$, TG_TABLE_SCHEMA) USING product_ids;
+
+    EXECUTE format($q$
+        DELETE FROM %1$I.version_list l
+        WHERE l.product_id = ANY($1)
+        AND NOT EXISTS (
+            SELECT 1 FROM %1$I.versions v WHERE v.product_id = l.product_id
+        )
+    $q$, TG_TABLE_SCHEMA) USING product_ids;
+
+    EXECUTE format($q$
+        INSERT INTO %1$I.version_list AS l (
+            product_id, ids, versions, latest_id, hero_id, hero_version
+        )
+        SELECT
+            v.product_id,
+            array_agg(v.id ORDER BY v.version),
+            array_agg(v.version ORDER BY v.version),
+            (array_agg(v.id ORDER BY v.version DESC)
+                FILTER (WHERE v.version >= 0))[1],
+            (array_agg(v.id ORDER BY v.version)
+                FILTER (WHERE v.version < 0))[1],
+            -min(v.version) FILTER (WHERE v.version < 0)
+        FROM %1$I.versions v
+        WHERE v.product_id = ANY($1)
+        GROUP BY v.product_id
+        ON CONFLICT (product_id) DO UPDATE SET
+            ids = EXCLUDED.ids,
+            versions = EXCLUDED.versions,
+            latest_id = EXCLUDED.latest_id,
+            hero_id = EXCLUDED.hero_id,
+            hero_version = EXCLUDED.hero_version
+    $q$, TG_TABLE_SCHEMA) USING product_ids;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+
+----------------
+-- TASK INDEX --
+----------------
+
+-- Cross-project index of tasks used by the Kanban board,
+-- so it doesn't need to query every project schema.
+-- Maintained by statement-level triggers on tasks and hierarchy tables
+-- of every project schema. Rows of deleted projects are removed by
+-- the foreign key cascade.
+
+CREATE TABLE IF NOT EXISTS public.task_index(
+    project_name VARCHAR NOT NULL
+        REFERENCES public.projects(name) ON DELETE CASCADE ON UPDATE CASCADE,
+    task_id UUID NOT NULL,
+    assignees VARCHAR[] NOT NULL DEFAULT ARRAY[]::VARCHAR[],
+    status VARCHAR,
+    due_date VARCHAR,
+    priority VARCHAR,
+    folder_path VARCHAR,
+    updated_at TIMESTAMPTZ,
+    PRIMARY KEY (project_name, task_id)
+);
+
+CREATE INDEX IF NOT EXISTS task_index_assignees_idx
+    ON public.task_index USING gin(assignees);
+CREATE INDEX IF NOT EXISTS task_index_order_idx
+    ON public.task_index(due_date DESC NULLS LAST, updated_at DESC);
+
+CREATE OR REPLACE FUNCTION public.sync_task_index()
+RETURNS TRIGGER AS $$
+DECLARE
+    pname VARCHAR;
+BEGIN
+    SELECT name INTO pname FROM public.projects
+    WHERE 'project_' || lower(name) = TG_TABLE_SCHEMA;
+
+    IF pname IS NULL THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP = 'DELETE' THEN
+        EXECUTE $q$
+            DELETE FROM public.task_index
+            WHERE project_name = $1
+            AND task_id IN (SELECT id FROM old_tasks)
+        $q$ USING pname;
+        RETURN NULL;
+    END IF;
+
+    EXECUTE format($q$
+        INSERT INTO public.task_index AS ti (
+            project_name, task_id, assignees, status,
+            due_date, priority, folder_path, updated_at
+        )
+        SELECT
+            $1, t.id, t.assignees, t.status,
+            t.attrib->>'endDate', t.attrib->>'priority', h.path, t.updated_at
+        FROM new_tasks t
+        LEFT JOIN %I.hierarchy h ON h.id = t.folder_id
+        ON CONFLICT (project_name, task_id) DO UPDATE SET
+            assignees = EXCLUDED.assignees,
+            status = EXCLUDED.status,
+            due_date = EXCLUDED.due_date,
+            priority = EXCLUDED.priority,
+            folder_path = EXCLUDED.folder_path,
+            updated_at = EXCLUDED.updated_at
+    $q$, TG_TABLE_SCHEMA) USING pname;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION public.sync_task_index_paths()
+RETURNS TRIGGER AS $$
+DECLARE
+    pname VARCHAR;
+BEGIN
+    SELECT name INTO pname FROM public.projects
+    WHERE 'project_' || lower(name) = TG_TABLE_SCHEMA;
+
+    IF pname IS NULL THEN
+        RETURN NULL;
+    END IF;
+
+    EXECUTE format($q$
+        UPDATE public.task_index ti SET folder_path = p.path
+        FROM new_paths p
+        INNER JOIN %I.tasks t ON t.folder_id = p.id
+        WHERE ti.project_name = $1
+        AND ti.task_id = t.id
+        AND ti.folder_path IS DISTINCT FROM p.path
+    $q$, TG_TABLE_SCHEMA) USING pname;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,159 @@
+"""Bulk creation of project level entities (without a database)"""
+
+import asyncio
+import os
+import sys
+from contextlib import asynccontextmanager
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from ayon_server.entities import FolderEntity
+from ayon_server.lib.postgres import Postgres
+from ayon_server.operations.project_level.entity_bulk_create import BulkCreate
+from ayon_server.operations.project_level.models import OperationModel
+from ayon_server.utils import create_uuid
+
+PRODUCT_ID = create_uuid()
+
+
+class FakeConnection:
+    @asynccontextmanager
+    async def transaction(self):
+        yield
+
+
+@pytest.fixture
+def no_database(monkeypatch):
+    @asynccontextmanager
+    async def transaction(*args, **kwargs):
+        yield FakeConnection()
+
+    async def get_default_status(self) -> str:
+        return "Not ready"
+
+    monkeypatch.setattr(Postgres, "transaction", transaction)
+    monkeypatch.setattr(FolderEntity, "get_default_status", get_default_status)
+
+
+@pytest.fixture
+def inserted(monkeypatch, no_database) -> list[list[str]]:
+    """Record the ids of the entities of each inserted run"""
+    runs: list[list[str]] = []
+
+    async def _insert(self, entity_type, run) -> None:
+        runs.append([entity.id for _, entity, _ in run])
+
+    monkeypatch.setattr(BulkCreate, "_insert", _insert)
+    return runs
+
+
+def folder_op(name: str, folder_type: str | None = "Folder") -> OperationModel:
+    data = {"name": name}
+    if folder_type:
+        data["folderType"] = folder_type
+    return OperationModel(type="create", entity_type="folder", data=data)
+
+
+def version_op(version: int) -> OperationModel:
+    return OperationModel(
+        type="create",
+        entity_type="version",
+        data={"version": version, "productId": PRODUCT_ID},
+    )
+
+
+class TestBulkCreate:
+    def test_bulk_path(self, inserted):
+        operations = [folder_op(f"folder{i}") for i in range(5)]
+        bulk = BulkCreate("test", {})
+        asyncio.run(bulk.process(operations))
+
+        assert len(inserted) == 1
+        assert len(inserted[0]) == 5
+        for operation in operations:
+            _, response = bulk.results[operation.id]
+            assert response.success
+            assert response.status == 201
+            assert not bulk.should_process(operation)
+
+    def test_run_ends_at_other_entity_type(self, inserted):
+        operations = [folder_op("a"), folder_op("b"), version_op(1), folder_op("c")]
+        bulk = BulkCreate("test", {})
+        asyncio.run(bulk.process(operations))
+
+        assert len(inserted[0]) == 2
+        assert set(bulk.results) == {operations[0].id, operations[1].id}
+
+    def test_second_hero_version_ends_run(self, inserted):
+        operations = [version_op(-1), version_op(1), version_op(-1), version_op(2)]
+        bulk = BulkCreate("test", {})
+        asyncio.run(bulk.process(operations))
+
+        assert set(bulk.results) == {operations[0].id, operations[1].id}
+        # The second hero version starts the next run, so it is checked
+        # against the hero version inserted by the first one
+        assert bulk.should_process(operations[2])
+
+    def test_fallback_path(self, monkeypatch, no_database):
+        async def _insert(self, entity_type, run) -> None:
+            raise Postgres.UniqueViolationError("duplicate key")
+
+        monkeypatch.setattr(BulkCreate, "_insert", _insert)
+
+        operations = [folder_op(f"folder{i}") for i in range(3)]
+        bulk = BulkCreate("test", {})
+        asyncio.run(bulk.process(operations))
+
+        # Nothing is reported as created, the operations are processed
+        # one by one, reusing the built entities
+        assert not bulk.results
+        for operation in operations:
+            assert operation.id in bulk.entities
+            assert operation.id in bulk.access_checked
+            assert not bulk.should_process(operation)
+
+    def test_validation_error_ends_run(self, inserted):
+        operations = [folder_op("a"), folder_op("b"), folder_op("c")]
+        operations[1].data = {"name": "b", "parentId": "not an id"}
+        bulk = BulkCreate("test", {})
+        asyncio.run(bulk.process(operations))
+
+        # A single valid operation is not worth a bulk insert
+        assert not inserted
+        assert operations[1].id in bulk.errors
+
+    def test_defaults_loaded_once(self, monkeypatch, no_database):
+        calls: list[str] = []
+
+        async def get_default_folder_type(self) -> str:
+            calls.append("folder_type")
+            return "Asset"
+
+        async def get_default_status(self) -> str:
+            calls.append("status")
+            return "Not ready"
+
+        async def executemany(query: str, rows, **kwargs) -> None:
+            executed.append((query, rows))
+
+        executed: list[tuple[str, list]] = []
+        monkeypatch.setattr(
+            FolderEntity, "get_default_folder_type", get_default_folder_type
+        )
+        monkeypatch.setattr(FolderEntity, "get_default_status", get_default_status)
+        monkeypatch.setattr(Postgres, "executemany", executemany)
+
+        operations = [folder_op(f"folder{i}", folder_type=None) for i in range(10)]
+        bulk = BulkCreate("test", {})
+        asyncio.run(bulk.process(operations))
+
+        assert sorted(calls) == ["folder_type", "status"]
+        assert len(executed) == 1
+        query, rows = executed[0]
+        assert "INSERT INTO project_test.folders" in query
+        assert len(rows) == 10
+        for operation in operations:
+            assert bulk.entities[operation.id].folder_type == "Asset"
+            assert bulk.entities[operation.id].status == "Not ready"
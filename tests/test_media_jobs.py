@@ -0,0 +1,211 @@
+"""Media job scheduler ordering and deduplication"""
+
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from ayon_server.helpers.media_jobs import MediaJobScheduler
+
+
+class Jobs:
+    """Record the order in which the jobs run"""
+
+    def __init__(self) -> None:
+        self.started: list[str] = []
+        self.running = 0
+        self.max_running = 0
+        self.release = asyncio.Event()
+
+    def job(self, name: str, *, block: bool = False, fail: bool = False):
+        async def func() -> str:
+            self.started.append(name)
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            try:
+                if block:
+                    await self.release.wait()
+                else:
+                    await asyncio.sleep(0.01)
+                if fail:
+                    raise ValueError(f"{name} failed")
+                return name
+            finally:
+                self.running -= 1
+
+        return func
+
+
+async def start_blocked(scheduler: MediaJobScheduler, jobs: Jobs) -> asyncio.Task:
+    """Occupy the only slot of the scheduler until jobs.release is set"""
+    task = asyncio.create_task(scheduler.run(jobs.job("blocker", block=True), kind="t"))
+    while not jobs.started:
+        await asyncio.sleep(0)
+    return task
+
+
+def submit(scheduler: MediaJobScheduler, jobs: Jobs, name: str, **kwargs):
+    return asyncio.create_task(scheduler.run(jobs.job(name), kind="t", **kwargs))
+
+
+class TestMediaJobs:
+    def test_priority_order(self):
+        """Interactive jobs start first, then jobs start in submission order"""
+
+        async def _run_test():
+            scheduler = MediaJobScheduler(1)
+            jobs = Jobs()
+            blocker = await start_blocked(scheduler, jobs)
+
+            tasks = [
+                submit(scheduler, jobs, "bg1"),
+                submit(scheduler, jobs, "ui1", priority="interactive"),
+                submit(scheduler, jobs, "bg2"),
+                submit(scheduler, jobs, "ui2", priority="interactive"),
+            ]
+            await asyncio.sleep(0)
+            assert scheduler.queue_depth == {"interactive": 2, "background": 2}
+
+            jobs.release.set()
+            results = await asyncio.gather(blocker, *tasks)
+
+            assert results == ["blocker", "bg1", "ui1", "bg2", "ui2"]
+            assert jobs.started == ["blocker", "ui1", "ui2", "bg1", "bg2"]
+            assert scheduler.queue_depth == {"interactive": 0, "background": 0}
+            assert scheduler.stats["t"].completed == 5
+
+        asyncio.run(_run_test())
+
+    def test_concurrency_limit(self):
+        async def _run_test():
+            scheduler = MediaJobScheduler(2)
+            jobs = Jobs()
+            tasks = [submit(scheduler, jobs, f"job{i}") for i in range(6)]
+            await asyncio.gather(*tasks)
+
+            assert jobs.max_running == 2
+            assert jobs.started == [f"job{i}" for i in range(6)]
+
+        asyncio.run(_run_test())
+
+    def test_same_key_runs_once(self):
+        async def _run_test():
+            scheduler = MediaJobScheduler(1)
+            jobs = Jobs()
+            blocker = await start_blocked(scheduler, jobs)
+
+            first = submit(scheduler, jobs, "first", key="file1")
+            second = submit(scheduler, jobs, "second", key="file1")
+            other = submit(scheduler, jobs, "other", key="file2")
+
+            jobs.release.set()
+            await blocker
+            assert await first == "first"
+            assert await second == "first"
+            assert await other == "other"
+            assert jobs.started == ["blocker", "first", "other"]
+            assert scheduler.stats["t"].deduplicated == 1
+
+            # Finished jobs are not reused
+            assert await submit(scheduler, jobs, "again", key="file1") == "again"
+
+        asyncio.run(_run_test())
+
+    def test_running_job_is_shared(self):
+        async def _run_test():
+            scheduler = MediaJobScheduler(2)
+            jobs = Jobs()
+            first = asyncio.create_task(
+                scheduler.run(jobs.job("first", block=True), kind="t", key="file1")
+            )
+            while not jobs.started:
+                await asyncio.sleep(0)
+
+            second = submit(scheduler, jobs, "second", key="file1")
+            await asyncio.sleep(0.05)
+            jobs.release.set()
+
+            assert await first == await second == "first"
+            assert jobs.started == ["first"]
+
+        asyncio.run(_run_test())
+
+    def test_interactive_request_promotes_waiting_job(self):
+        async def _run_test():
+            scheduler = MediaJobScheduler(1)
+            jobs = Jobs()
+            blocker = await start_blocked(scheduler, jobs)
+
+            other = submit(scheduler, jobs, "other")
+            background = submit(scheduler, jobs, "background", key="file1")
+            interactive = submit(
+                scheduler, jobs, "interactive", key="file1", priority="interactive"
+            )
+            await asyncio.sleep(0)
+            assert scheduler.queue_depth == {"interactive": 1, "background": 1}
+
+            jobs.release.set()
+            await asyncio.gather(blocker, other)
+            assert await background == await interactive == "background"
+
+            # The job runs once, its stale background queue entry is skipped
+            assert jobs.started == ["blocker", "background", "other"]
+            assert scheduler.stats["t"].completed == 3
+
+        asyncio.run(_run_test())
+
+    def test_failure_is_shared(self):
+        async def _run_test():
+            scheduler = MediaJobScheduler(1)
+            jobs = Jobs()
+            failing = asyncio.create_task(
+                scheduler.run(jobs.job("bad", fail=True), kind="t", key="file2")
+            )
+            waiting = submit(scheduler, jobs, "waiting", key="file2")
+            for task in (failing, waiting):
+                with pytest.raises(ValueError):
+                    await task
+            assert jobs.started == ["bad"]
+            assert scheduler.stats["t"].failed == 1
+
+        asyncio.run(_run_test())
+
+    def test_cancelled_caller_does_not_cancel_job(self):
+        async def _run_test():
+            scheduler = MediaJobScheduler(1)
+            jobs = Jobs()
+            first = asyncio.create_task(
+                scheduler.run(jobs.job("first", block=True), kind="t", key="file1")
+            )
+            second = submit(scheduler, jobs, "second", key="file1")
+            while not jobs.started:
+                await asyncio.sleep(0)
+
+            first.cancel()
+            jobs.release.set()
+            assert await second == "first"
+            assert first.cancelled()
+
+        asyncio.run(_run_test())
+
+    def test_cancelled_job_does_not_stop_worker(self):
+        async def _run_test():
+            scheduler = MediaJobScheduler(1)
+            jobs = Jobs()
+
+            async def cancelled_job():
+                raise asyncio.CancelledError
+
+            cancelled = asyncio.create_task(scheduler.run(cancelled_job, kind="t"))
+            with pytest.raises(asyncio.CancelledError):
+                await cancelled
+            assert scheduler.stats["t"].failed == 1
+
+            # The only worker is still running
+            task = submit(scheduler, jobs, "next")
+            assert await asyncio.wait_for(task, timeout=1) == "next"
+
+        asyncio.run(_run_test())
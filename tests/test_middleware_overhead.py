@@ -0,0 +1,303 @@
+"""Benchmark of the per-request overhead of the API middleware stack.
+
+Compares the pure ASGI middleware used by the server with the same
+number of `BaseHTTPMiddleware` layers (the previous implementation)
+on a trivial endpoint and on a streamed download. Also checks how
+the middleware converts exceptions to error responses.
+
+Run with `pytest -s tests/test_middleware_overhead.py` to see the timings.
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import asyncpg
+import httpx
+import pytest
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import ClientDisconnect
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from ayon_server.api.context import RequestContextMiddleware
+from ayon_server.api.logging import LoggingMiddleware
+from ayon_server.exceptions import (
+    ConflictException,
+    ForbiddenException,
+    NotFoundException,
+    UnauthorizedException,
+)
+
+ERRORS: dict[str, Exception] = {
+    "not-found": NotFoundException("Folder not found"),
+    "forbidden": ForbiddenException(),
+    "conflict": ConflictException("Folder exists", folder_id="abc"),
+    "http": HTTPException(status_code=418, detail="I'm a teapot"),
+    "unique": asyncpg.exceptions.PostgresError.new(
+        {
+            "C": "23505",
+            "M": "duplicate key value violates unique constraint",
+            "D": "Key (name)=(sh010) already exists.",
+            "t": "folders",
+        }
+    ),
+    "assertion": AssertionError("Folder must have a parent"),
+    "disconnect": ClientDisconnect(),
+    "unhandled": ValueError("Something broke"),
+}
+
+REQUESTS = 500
+DOWNLOAD_CHUNK = 64 * 1024
+DOWNLOAD_CHUNKS = 256  # 16 MB
+
+
+class AnonymousAuthMiddleware:
+    """Stand-in for AuthMiddleware, which needs Redis and Postgres"""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            scope.setdefault("state", {})["user"] = None
+        await self.app(scope, receive, send)
+
+
+class RejectingAuthMiddleware:
+    """Stand-in for AuthMiddleware failing to authenticate the request"""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        match scope["path"]:
+            case "/api/ping":
+                raise UnauthorizedException("Invalid session")
+            case "/api/error/assertion":
+                raise AssertionError("Session must have a user")
+            case "/api/error/unhandled":
+                raise RuntimeError("Redis is not available")
+        raise HTTPException(status_code=429, detail="Slow down")
+
+
+# Same order as in the server (the last one is the outermost)
+MIDDLEWARE = [RequestContextMiddleware, AnonymousAuthMiddleware, LoggingMiddleware]
+
+
+class PassThroughMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        return await call_next(request)
+
+
+def create_app(middleware: list[type]) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/ping")
+    async def ping() -> PlainTextResponse:
+        return PlainTextResponse("pong")
+
+    @app.get("/api/download")
+    async def download() -> StreamingResponse:
+        async def chunks():
+            for _ in range(DOWNLOAD_CHUNKS):
+                yield b"x" * DOWNLOAD_CHUNK
+
+        return StreamingResponse(chunks(), media_type="application/octet-stream")
+
+    @app.get("/api/error/{kind}")
+    async def error(kind: str) -> PlainTextResponse:
+        raise ERRORS[kind]
+
+    @app.get("/api/broken-download")
+    async def broken_download() -> StreamingResponse:
+        async def chunks():
+            yield b"x" * DOWNLOAD_CHUNK
+            raise RuntimeError("Storage failed")
+
+        return StreamingResponse(chunks(), media_type="application/octet-stream")
+
+    for middleware_class in middleware:
+        app.add_middleware(middleware_class)
+    return app
+
+
+async def measure(app: FastAPI) -> tuple[float, float]:
+    """Return seconds per trivial request and per streamed download"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        start_time = time.perf_counter()
+        for _ in range(REQUESTS):
+            response = await c.get("/api/ping")
+            assert response.status_code == 200
+        ping_time = (time.perf_counter() - start_time) / REQUESTS
+
+        start_time = time.perf_counter()
+        for _ in range(10):
+            response = await c.get("/api/download")
+            assert len(response.content) == DOWNLOAD_CHUNK * DOWNLOAD_CHUNKS
+        download_time = (time.perf_counter() - start_time) / 10
+    return ping_time, download_time
+
+
+class TestMiddlewareOverhead:
+    def test_asgi_middleware_overhead(self):
+        async def _run_test():
+            await measure(create_app([]))  # warm up
+            bare = await measure(create_app([]))
+            legacy = await measure(create_app([PassThroughMiddleware] * 3))
+            current = await measure(create_app(MIDDLEWARE))
+
+            for label, (ping, download) in [
+                ("BaseHTTPMiddleware x3", legacy),
+                ("ASGI middleware", current),
+            ]:
+                print(
+                    f"{label}: "
+                    f"+{(ping - bare[0]) * 1e6:.0f} us per request, "
+                    f"+{(download - bare[1]) * 1e3:.2f} ms per download"
+                )
+
+        asyncio.run(_run_test())
+
+    def test_request_id_header(self):
+        async def _run_test():
+            app = create_app(MIDDLEWARE)
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(
+                transport=transport,
+                base_url="http://test",
+            ) as client:
+                response = await client.get("/api/ping")
+                assert response.text == "pong"
+                assert len(response.headers["X-Request-ID"]) == 16
+
+                response = await client.get("/api/download")
+                assert "X-Request-ID" in response.headers
+
+        asyncio.run(_run_test())
+
+    def test_exception_responses(self):
+        async def _run_test():
+            app = create_app(MIDDLEWARE)
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(
+                transport=transport,
+                base_url="http://test",
+            ) as client:
+                responses = {
+                    kind: await client.get(f"/api/error/{kind}") for kind in ERRORS
+                }
+
+            for response in responses.values():
+                assert len(response.headers["X-Request-ID"]) == 16
+
+            response = responses["not-found"]
+            assert response.status_code == 404
+            assert response.json() == {"code": 404, "detail": "Folder not found"}
+
+            # No additional details for unauthorized and forbidden requests
+            response = responses["forbidden"]
+            assert response.status_code == 403
+            assert response.json() == {"code": 403, "detail": "Forbidden"}
+
+            response = responses["conflict"]
+            assert response.status_code == 409
+            assert response.json() == {
+                "code": 409,
+                "detail": "Folder exists",
+                "folder_id": "abc",
+            }
+
+            # Handled by FastAPI before reaching the middleware
+            response = responses["http"]
+            assert response.status_code == 418
+            assert response.json() == {"detail": "I'm a teapot"}
+
+            response = responses["unique"]
+            assert response.status_code == 500
+            body = response.json()
+            assert body["error"] == "unique-violation"
+            assert body["code"] == 409
+            assert body["detail"] == "Folder with name 'sh010' already exists."
+            assert body["path"] == "[GET] /error/unique"
+            assert body["function"] == "error"
+
+            response = responses["assertion"]
+            assert response.status_code == 500
+            body = response.json()
+            assert body["status"] == 500
+            assert body["detail"] == "Folder must have a parent"
+            assert body["path"] == "[GET] /error/assertion"
+            assert body["function"] == "error"
+
+            assert responses["disconnect"].status_code == 499
+
+            response = responses["unhandled"]
+            assert response.status_code == 500
+            body = response.json()
+            assert body["status"] == 500
+            assert body["detail"] == "ValueError: Something broke"
+            assert "traceback" in body
+
+        asyncio.run(_run_test())
+
+    def test_authentication_error_response(self):
+        """Errors of the authentication are converted as well"""
+
+        async def _run_test():
+            app = create_app(
+                [RequestContextMiddleware, RejectingAuthMiddleware, LoggingMiddleware]
+            )
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(
+                transport=transport,
+                base_url="http://test",
+            ) as client:
+                response = await client.get("/api/ping")
+                assert response.status_code == 401
+                assert response.json() == {"code": 401, "detail": "Invalid session"}
+                assert "X-Request-ID" in response.headers
+
+                response = await client.get("/api/download")
+                assert response.status_code == 429
+                assert response.json() == {
+                    "code": 429,
+                    "detail": "Slow down",
+                    "path": "/api/download",
+                }
+
+                # Failures before the user is known
+                response = await client.get("/api/error/assertion")
+                assert response.status_code == 500
+                body = response.json()
+                assert body["detail"] == "Session must have a user"
+                assert body["path"] == "[GET] /error/assertion"
+                assert "user" not in body
+
+                response = await client.get("/api/error/unhandled")
+                assert response.status_code == 500
+                body = response.json()
+                assert body["detail"] == "RuntimeError: Redis is not available"
+                assert "user" not in body
+
+        asyncio.run(_run_test())
+
+    def test_error_after_response_started(self):
+        """An error during streaming can't be converted to a response"""
+
+        async def _run_test():
+            app = create_app(MIDDLEWARE)
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(
+                transport=transport,
+                base_url="http://test",
+            ) as client:
+                with pytest.raises(RuntimeError, match="Storage failed"):
+                    await client.get("/api/broken-download")
+
+        asyncio.run(_run_test())
@@ -0,0 +1,146 @@
+"""Parallel multipart uploads to S3 (with an in-memory S3 client)"""
+
+import asyncio
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+# ayon_server.settings can't be imported before the entities (circular import)
+import ayon_server.entities  # noqa: F401
+from ayon_server.files.s3 import S3Uploader
+
+BUCKET = "bucket"
+
+
+class MemoryS3Client:
+    """Stand-in for the boto3 S3 client keeping the uploads in memory"""
+
+    def __init__(self, failures: int = 0, delay: float = 0) -> None:
+        self.failures = failures  # number of failing upload_part calls
+        self.delay = delay
+        self.objects: dict[str, bytes] = {}
+        self.uploads: dict[str, dict[int, bytes]] = {}
+        self.events: list[str] = []
+        self.running = 0
+        self.release = threading.Event()
+        self.release.set()
+        self.lock = threading.Lock()
+
+    def create_multipart_upload(self, Bucket: str, Key: str, **kwargs):
+        upload_id = f"upload-{len(self.uploads)}"
+        self.uploads[upload_id] = {}
+        return {"UploadId": upload_id}
+
+    def upload_part(self, Body, Bucket, Key, PartNumber, UploadId):
+        with self.lock:
+            self.running += 1
+            self.events.append(f"start {PartNumber}")
+        try:
+            self.release.wait()
+            time.sleep(self.delay * random.random())
+            with self.lock:
+                if self.failures:
+                    self.failures -= 1
+                    raise ConnectionError(f"Part {PartNumber} failed")
+            self.uploads[UploadId][PartNumber] = Body
+            etag = f"etag-{PartNumber}"
+            return {"ResponseMetadata": {"HTTPHeaders": {"etag": etag}}}
+        finally:
+            with self.lock:
+                self.running -= 1
+                self.events.append(f"done {PartNumber}")
+
+    def complete_multipart_upload(self, Bucket, Key, MultipartUpload, UploadId):
+        parts = self.uploads.pop(UploadId)
+        numbers = [part["PartNumber"] for part in MultipartUpload["Parts"]]
+        assert numbers == sorted(parts), "Parts must be listed in order"
+        for part in MultipartUpload["Parts"]:
+            assert part["ETag"] == f"etag-{part['PartNumber']}"
+        self.objects[Key] = b"".join(parts[i] for i in numbers)
+        self.events.append("complete")
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.uploads.pop(UploadId)
+        self.events.append("abort")
+
+
+def chunks(count: int) -> list[bytes]:
+    return [bytes([i]) * 1024 for i in range(count)]
+
+
+async def upload(uploader: S3Uploader, data: list[bytes]) -> None:
+    await uploader.init_file_upload("key")
+    for chunk in data:
+        await uploader.push_chunk(chunk)
+    await uploader.complete()
+
+
+class TestS3Uploader:
+    def test_parts_are_completed_in_order(self):
+        client = MemoryS3Client(delay=0.01)
+        data = chunks(20)
+        uploader = S3Uploader(client, BUCKET, max_workers=4, max_retries=1)
+        asyncio.run(upload(uploader, data))
+
+        assert client.objects["key"] == b"".join(data)
+        assert not client.uploads
+
+    def test_failed_part_is_retried(self):
+        client = MemoryS3Client(failures=1)
+        data = chunks(3)
+        uploader = S3Uploader(client, BUCKET, max_workers=2, max_retries=2)
+        asyncio.run(upload(uploader, data))
+
+        assert client.objects["key"] == b"".join(data)
+
+    def test_failed_upload_raises(self):
+        client = MemoryS3Client(failures=100)
+        uploader = S3Uploader(client, BUCKET, max_workers=2, max_retries=1)
+
+        async def _run_test():
+            with pytest.raises(ConnectionError):
+                await upload(uploader, chunks(10))
+            await uploader.abort()
+
+        asyncio.run(_run_test())
+        assert "key" not in client.objects
+        assert client.events[-1] == "abort"
+        assert not client.uploads
+
+    def test_abort_waits_for_running_parts(self):
+        client = MemoryS3Client()
+        client.release.clear()
+        uploader = S3Uploader(client, BUCKET, max_workers=3, max_retries=3)
+
+        async def _run_test():
+            await uploader.init_file_upload("key")
+            for chunk in chunks(6):
+                await uploader.push_chunk(chunk)
+            while client.running < 3:
+                await asyncio.sleep(0.01)
+
+            abort_task = asyncio.create_task(uploader.abort())
+            await asyncio.sleep(0.1)
+            # Running parts can't be interrupted, abort must wait for them
+            assert not abort_task.done()
+            assert "abort" not in client.events
+
+            client.release.set()
+            await asyncio.wait_for(abort_task, timeout=5)
+
+        asyncio.run(_run_test())
+
+        # Only the parts that were running when aborting were uploaded,
+        # the rest of the queue was dropped, and the upload was aborted
+        # after all of them finished
+        assert client.events.count("start 1") == 1
+        assert len([e for e in client.events if e.startswith("start")]) == 3
+        assert client.events[-1] == "abort"
+        assert client.running == 0
+        assert not client.uploads
@@ -0,0 +1,266 @@
+"""Schema-relative project queries and the statement cache.
+
+Runs against the database configured by AYON_POSTGRES_URL and is skipped
+when it is not available. Temporary project schemas are created with
+the columns of the `folders` table in two different orders, as in
+projects created from the current schema and in projects upgraded
+by migrations.
+
+Run with `pytest -s tests/test_schema_relative_queries.py` to see
+the statement cache benchmark.
+"""
+
+import asyncio
+import os
+import sys
+import time
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import asyncpg
+import pytest
+
+from ayon_server.config import ayonconfig
+
+
+def postgres_available() -> bool:
+    async def connect() -> None:
+        conn = await asyncpg.connect(ayonconfig.postgres_url, timeout=3)
+        await conn.close()
+
+    try:
+        asyncio.run(connect())
+    except (OSError, TimeoutError, asyncpg.PostgresError):
+        return False
+    return True
+
+
+# ayon_server.graphql loads the attributes from the database when imported
+if not postgres_available():
+    pytest.skip("Postgres is not available", allow_module_level=True)
+
+from ayon_server.graphql.columns import (  # noqa: E402
+    PROJECT_TABLE_COLUMNS,
+    table_columns,
+)
+from ayon_server.lib.postgres import Postgres, postgres_setup  # noqa: E402
+
+STATEMENT_CACHE_SIZE = 100  # asyncpg default
+PROJECTS = 150
+ROUNDS = 4
+ROWS = 20
+
+COLUMN_TYPES = {
+    "id": "UUID PRIMARY KEY",
+    "name": "VARCHAR NOT NULL",
+    "label": "VARCHAR",
+    "folder_type": "VARCHAR",
+    "parent_id": "UUID",
+    "thumbnail_id": "UUID",
+    "attrib": "JSONB",
+    "data": "JSONB",
+    "status": "VARCHAR",
+    "tags": "VARCHAR[]",
+    "active": "BOOLEAN",
+    "created_at": "TIMESTAMPTZ",
+    "updated_at": "TIMESTAMPTZ",
+    "created_by": "VARCHAR",
+    "updated_by": "VARCHAR",
+    "creation_order": "INTEGER",
+}
+
+
+class CountingConnection(asyncpg.Connection):
+    """Connection counting the statements it prepares"""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.prepared = 0
+
+    def _get_unique_id(self, prefix: str) -> str:
+        if prefix == "stmt":
+            self.prepared += 1
+        return super()._get_unique_id(prefix)
+
+
+def project_names(count: int) -> list[str]:
+    return [f"srqtest{i:03d}" for i in range(count)]
+
+
+def folder_columns(migrated: bool) -> list[str]:
+    """Column order of a fresh project or of a migrated one"""
+    columns = list(PROJECT_TABLE_COLUMNS["folders"])
+    if migrated:
+        columns.remove("thumbnail_id")
+        columns.append("thumbnail_id")
+    return columns
+
+
+@asynccontextmanager
+async def project_schemas(count: int) -> AsyncGenerator[list[str]]:
+    """Create temporary project schemas"""
+    conn = await asyncpg.connect(ayonconfig.postgres_url, timeout=3)
+    names = project_names(count)
+    try:
+        for i, name in enumerate(names):
+            columns = ", ".join(
+                f"{col} {COLUMN_TYPES[col]}" for col in folder_columns(i % 2 == 1)
+            )
+            await conn.execute(
+                f"""
+                DROP SCHEMA IF EXISTS project_{name} CASCADE;
+                CREATE SCHEMA project_{name};
+                CREATE TABLE project_{name}.folders ({columns});
+                INSERT INTO project_{name}.folders (id, name, status, active)
+                SELECT gen_random_uuid(), 'folder_' || i, 'ok', TRUE
+                FROM generate_series(1, {ROWS}) AS i;
+                """
+            )
+        yield names
+
+    finally:
+        for name in names:
+            await conn.execute(f"DROP SCHEMA IF EXISTS project_{name} CASCADE")
+        await conn.close()
+
+
+@asynccontextmanager
+async def single_connection() -> AsyncGenerator[None]:
+    """Use a pool of one connection, so all queries share its statement cache"""
+    Postgres.pool = await asyncpg.create_pool(
+        ayonconfig.postgres_url,
+        min_size=1,
+        max_size=1,
+        statement_cache_size=STATEMENT_CACHE_SIZE,
+        init=postgres_setup,
+        connection_class=CountingConnection,
+    )
+    try:
+        yield
+    finally:
+        await Postgres.pool.close()
+        Postgres.pool = None
+
+
+async def run_queries(names: list[str], schema_relative: bool) -> dict[str, float]:
+    """Query each project in turn and return statement cache statistics"""
+    assert Postgres.pool is not None
+    columns = table_columns("folders")
+
+    async with Postgres.pool.acquire() as conn:
+        # Warm up type introspection, which prepares statements too
+        await conn.fetch(f"SELECT {columns} FROM project_{names[0]}.folders LIMIT 1")
+        prepared_before = conn.prepared
+
+    start = time.monotonic()
+    for _ in range(ROUNDS):
+        for name in names:
+            if schema_relative:
+                query = f"SELECT {columns} FROM folders WHERE active = $1"
+                rows = Postgres.iterate(query, True, project_name=name)
+            else:
+                query = (
+                    f"SELECT {columns} FROM project_{name}.folders AS folders "
+                    "WHERE active = $1"
+                )
+                rows = Postgres.iterate(query, True)
+            assert len([row async for row in rows]) == ROWS
+    elapsed = time.monotonic() - start
+
+    async with Postgres.pool.acquire() as conn:
+        prepared = conn.prepared - prepared_before
+        stats = await conn.fetchrow(
+            """
+            SELECT
+                COUNT(*) AS cached,
+                COALESCE(SUM(generic_plans), 0) AS generic_plans,
+                COALESCE(SUM(custom_plans), 0) AS custom_plans
+            FROM pg_prepared_statements
+            WHERE statement LIKE $1
+            """,
+            f"SELECT {columns} FROM % WHERE active = %",
+        )
+
+    executions = ROUNDS * len(names)
+    return {
+        "executions": executions,
+        "prepared": prepared,
+        "hit_rate": 1 - prepared / executions,
+        "cached": stats["cached"],
+        "generic_plans": stats["generic_plans"],
+        "custom_plans": stats["custom_plans"],
+        "elapsed": elapsed,
+    }
+
+
+class TestSchemaRelativeQueries:
+    def test_explicit_columns(self):
+        """Explicit column lists work regardless of the column order"""
+
+        async def _run_test():
+            async with project_schemas(4) as names, single_connection():
+                query = f"""
+                    SELECT {table_columns("folders")}
+                    FROM folders WHERE name = $1
+                """
+                for _ in range(3):
+                    for name in names:
+                        rows = [
+                            row
+                            async for row in Postgres.iterate(
+                                query, "folder_1", project_name=name
+                            )
+                        ]
+                        assert len(rows) == 1
+                        assert list(rows[0]) == list(PROJECT_TABLE_COLUMNS["folders"])
+
+        asyncio.run(_run_test())
+
+    def test_star_columns_change_result_type(self):
+        """`SELECT *` fails once the statement is used in a migrated project"""
+
+        async def _run_test():
+            async with project_schemas(2) as names, single_connection():
+                query = "SELECT folders.* FROM folders WHERE name = $1"
+                with pytest.raises(asyncpg.exceptions.FeatureNotSupportedError):
+                    for name in names:
+                        async for _ in Postgres.iterate(
+                            query, "folder_1", project_name=name
+                        ):
+                            pass
+
+        asyncio.run(_run_test())
+
+    def test_statement_cache_benchmark(self):
+        """Qualified queries thrash the statement cache, relative ones share it"""
+
+        async def _run_test():
+            async with project_schemas(PROJECTS) as names:
+                async with single_connection():
+                    qualified = await run_queries(names, schema_relative=False)
+                async with single_connection():
+                    relative = await run_queries(names, schema_relative=True)
+
+            for label, result in (("qualified", qualified), ("relative", relative)):
+                print(
+                    f"\n{label:>10}: {result['executions']} executions, "
+                    f"{result['prepared']} prepared, "
+                    f"hit rate {result['hit_rate']:.1%}, "
+                    f"{result['cached']} statements cached, "
+                    f"{result['generic_plans']} generic / "
+                    f"{result['custom_plans']} custom plans, "
+                    f"{result['elapsed']:.3f}s"
+                )
+
+            # Round robin over more projects than the cache holds
+            # evicts every statement before it is used again
+            # (one cache slot is taken by the warm-up query)
+            assert qualified["prepared"] == qualified["executions"]
+            assert qualified["cached"] == STATEMENT_CACHE_SIZE - 1
+
+            assert relative["prepared"] == 1
+            assert relative["cached"] == 1
+
+        asyncio.run(_run_test())
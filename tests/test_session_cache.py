@@ -0,0 +1,60 @@
+"""Sessions cached in memory of the server process (without Redis)"""
+
+import asyncio
+import os
+import sys
+import time
+from collections.abc import Generator
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from ayon_server.auth.session import Session, SessionModel
+from ayon_server.lib.local_cache import local_cache
+from ayon_server.lib.redis import Redis
+
+TOKEN = "cachedsessiontoken"
+
+
+@pytest.fixture
+def loads(monkeypatch) -> Generator[list[str]]:
+    """Return the tokens of sessions loaded from Redis"""
+    result: list[str] = []
+    session = SessionModel(
+        user={"name": "artist", "data": {"accessGroups": {"test": ["artist"]}}},
+        token=TOKEN,
+        created=time.time(),
+        last_used=time.time(),
+    )
+
+    async def get_json(namespace: str, key: str):
+        result.append(key)
+        return session.dict() if key == TOKEN else None
+
+    monkeypatch.setattr(Redis, "get_json", get_json)
+    local_cache.invalidate(Session.ns, TOKEN)
+    yield result
+    local_cache.invalidate(Session.ns, TOKEN)
+
+
+class TestSessionCache:
+    def test_cached_session_is_not_shared(self, loads):
+        async def _run_test():
+            first = await Session.check(TOKEN, None)
+            second = await Session.check(TOKEN, None)
+            assert loads == [TOKEN]
+
+            assert first is not second
+            first.is_api_key = True
+            assert not second.is_api_key
+            assert not (await Session.check(TOKEN, None)).is_api_key
+
+            # Nested models are not modified, so they are not copied
+            assert first.user is second.user
+            assert second.user.data == {"accessGroups": {"test": ["artist"]}}
+
+        asyncio.run(_run_test())
+
+    def test_missing_session(self, loads):
+        assert asyncio.run(Session.check("missing", None)) is None
@@ -0,0 +1,99 @@
+"""Compiled settings layers (without a database and Redis)"""
+
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+from pydantic import ValidationError
+
+from ayon_server.addons.addon import BaseServerAddon
+from ayon_server.addons.settings_layers import (
+    apply_site_overrides,
+    get_compiled_settings,
+    uses_layered_settings,
+)
+from ayon_server.lib.redis import Redis
+from ayon_server.settings import BaseSettingsModel, SettingsField
+
+
+class LayersSettings(BaseSettingsModel):
+    name: str = SettingsField("default")
+    count: int = SettingsField(1, ge=0)
+
+
+class LayersAddon(BaseServerAddon):
+    name = "layers"
+    version = "1.0.0"
+    settings_model = LayersSettings
+
+
+@pytest.fixture
+def stored(monkeypatch) -> dict[str, dict]:
+    """Keep the compiled layers in memory instead of Redis"""
+    storage: dict[str, dict] = {}
+
+    async def get_json(namespace: str, key: str):
+        return storage.get(key)
+
+    async def set_json(namespace: str, key: str, value, ttl: int = 0) -> None:
+        storage[key] = value
+
+    monkeypatch.setattr(Redis, "get_json", get_json)
+    monkeypatch.setattr(Redis, "set_json", set_json)
+    return storage
+
+
+def create_addon(studio: dict, project: dict | None = None) -> LayersAddon:
+    addon = LayersAddon(None, "layers")
+
+    # Instance attributes, so the addon still uses the layered settings
+    async def get_studio_overrides(*args, **kwargs):
+        return studio
+
+    async def get_project_overrides(*args, **kwargs):
+        return project or {}
+
+    addon.get_studio_overrides = get_studio_overrides
+    addon.get_project_overrides = get_project_overrides
+    assert uses_layered_settings(addon)
+    return addon
+
+
+class TestSettingsLayers:
+    def test_layers_are_compiled(self, stored):
+        addon = create_addon({"name": "studio"}, {"count": 5})
+        layer = asyncio.run(get_compiled_settings(addon, "production", "test"))
+
+        assert layer.settings == {"name": "studio", "count": 5}
+        assert layer.has_studio_overrides
+        assert layer.has_project_overrides
+        assert set(stored) == {
+            "layers|1.0.0|default",
+            "layers|1.0.0|production",
+            "layers|1.0.0|production|test",
+        }
+
+    def test_invalid_studio_override_is_rejected(self, stored):
+        addon = create_addon({"count": -1})
+        with pytest.raises(ValidationError):
+            asyncio.run(get_compiled_settings(addon, "production"))
+        assert "layers|1.0.0|production" not in stored
+
+    def test_invalid_project_override_is_rejected(self, stored):
+        addon = create_addon({"name": "studio"}, {"count": -1})
+        with pytest.raises(ValidationError):
+            asyncio.run(get_compiled_settings(addon, "production", "test"))
+        assert "layers|1.0.0|production" in stored
+        assert "layers|1.0.0|production|test" not in stored
+
+    def test_invalid_site_override_is_rejected(self, stored):
+        addon = create_addon({"name": "studio"})
+        layer = asyncio.run(get_compiled_settings(addon, "production", "test"))
+
+        data = apply_site_overrides(addon, layer, {"count": 3})
+        assert data == {"name": "studio", "count": 3}
+        with pytest.raises(ValidationError):
+            apply_site_overrides(addon, layer, {"count": -1})
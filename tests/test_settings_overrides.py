@@ -0,0 +1,158 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+from pydantic import ValidationError, root_validator
+
+# ayon_server.settings can't be imported before the entities (circular import)
+import ayon_server.entities  # noqa: F401
+from ayon_server.settings import (
+    BaseSettingsModel,
+    SettingsField,
+    apply_overrides,
+    apply_overrides_dict,
+)
+from ayon_server.settings.overrides import clear_validated_overrides
+
+VALIDATIONS = []
+
+
+class ColorModel(BaseSettingsModel):
+    enabled: bool = SettingsField(True)
+    name: str = SettingsField("red")
+    weight: int = SettingsField(1, ge=0)
+
+
+class RangeModel(BaseSettingsModel):
+    start: int = SettingsField(1)
+    end: int = SettingsField(10)
+
+    @root_validator
+    def validate_range(cls, values):
+        if values.get("start", 0) > values.get("end", 0):
+            raise ValueError("start must not be greater than end")
+        return values
+
+
+class RootModel(BaseSettingsModel):
+    title: str = SettingsField("default")
+    mapping: dict[str, str] = SettingsField(default_factory=lambda: {"a": "b"})
+    count: int = SettingsField(0)
+    tags: list[str] = SettingsField(default_factory=lambda: ["a", "b"])
+    color: ColorModel = SettingsField(default_factory=ColorModel)
+    frames: RangeModel = SettingsField(default_factory=RangeModel)
+    extra: ColorModel | None = SettingsField(None)
+
+    @root_validator
+    def count_validations(cls, values):
+        VALIDATIONS.append(values.get("title"))
+        return values
+
+
+def apply_both(overrides):
+    """Apply the overrides using both functions and check they agree
+
+    The dict based overrides are applied twice, to check the cached
+    overrides give the same result.
+    """
+    clear_validated_overrides()
+    settings = RootModel()
+    data = settings.dict()
+    result = apply_overrides_dict(RootModel, data, overrides)
+    assert data == RootModel().dict(), "Source data must not be modified"
+    assert apply_overrides(settings, overrides).dict() == result
+    assert apply_overrides_dict(RootModel, data, overrides) == result
+    return result
+
+
+class TestApplyOverrides:
+    def test_no_overrides(self):
+        data = RootModel().dict()
+        assert apply_overrides_dict(RootModel, data, {}) == data
+
+    def test_leaf_values(self):
+        result = apply_both({"title": "custom", "tags": ["c"]})
+        assert result["title"] == "custom"
+        assert result["tags"] == ["c"]
+        assert result["count"] == 0
+
+    def test_nested_model_is_merged(self):
+        result = apply_both({"color": {"name": "blue"}})
+        assert result["color"] == {"enabled": True, "name": "blue", "weight": 1}
+
+    def test_unset_nested_model(self):
+        result = apply_both({"extra": {"name": "green"}})
+        assert result["extra"] == {"enabled": True, "name": "green", "weight": 1}
+
+    def test_removed_field_is_ignored(self):
+        result = apply_both({"removed": 1, "color": {"removed": 2}})
+        assert "removed" not in result
+        assert "removed" not in result["color"]
+
+    def test_dict_field_is_replaced(self):
+        result = apply_both({"mapping": {"c": "d"}})
+        assert result["mapping"] == {"c": "d"}
+
+    def test_values_are_coerced(self):
+        result = apply_both({"count": "5", "color": {"enabled": 0}})
+        assert result["count"] == 5
+        assert result["color"]["enabled"] is False
+
+    def test_unconvertible_value_is_dropped(self):
+        result = apply_both({"count": "many", "title": "custom"})
+        assert result["count"] == 0
+        assert result["title"] == "custom"
+
+    def test_invalid_value_is_rejected(self):
+        data = RootModel().dict()
+        with pytest.raises(ValidationError):
+            apply_overrides_dict(RootModel, data, {"color": {"weight": -1}})
+        with pytest.raises(ValidationError):
+            apply_overrides_dict(RootModel, data, {"tags": {"not": "a list"}})
+
+    def test_root_validator_runs(self):
+        data = RootModel().dict()
+        result = apply_overrides_dict(RootModel, data, {"frames": {"start": 5}})
+        assert result["frames"] == {"start": 5, "end": 10}
+
+        with pytest.raises(ValidationError):
+            apply_overrides_dict(RootModel, data, {"frames": {"start": 20}})
+        with pytest.raises(ValidationError):
+            apply_overrides(RootModel(), {"frames": {"start": 20}})
+
+    def test_overrides_are_validated_once(self):
+        clear_validated_overrides()
+        data = RootModel().dict()
+        overrides = {"title": "cached", "color": {"name": "blue"}, "tags": ["c"]}
+        VALIDATIONS.clear()
+
+        result = apply_overrides_dict(RootModel, data, overrides)
+        assert VALIDATIONS == ["cached"]
+
+        # Modifying the result must not modify the cached overrides
+        result["tags"].append("d")
+        result["color"]["name"] = "green"
+
+        for _ in range(3):
+            cached = apply_overrides_dict(RootModel, data, overrides)
+            assert cached["tags"] == ["c"]
+            assert cached["color"]["name"] == "blue"
+        assert VALIDATIONS == ["cached"]
+
+        # Other overrides or settings are validated again
+        apply_overrides_dict(RootModel, data, {"title": "other"})
+        apply_overrides_dict(RootModel, result, overrides, checksum="changed")
+        assert VALIDATIONS == ["cached", "other", "cached"]
+
+    def test_cached_overrides_depend_on_settings(self):
+        clear_validated_overrides()
+        data = RootModel().dict()
+        overrides = {"frames": {"start": 15}}
+        with pytest.raises(ValidationError):
+            apply_overrides_dict(RootModel, data, overrides)
+
+        data["frames"]["end"] = 20
+        result = apply_overrides_dict(RootModel, data, overrides)
+        assert result["frames"] == {"start": 15, "end": 20}
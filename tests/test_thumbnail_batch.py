@@ -0,0 +1,185 @@
+"""Batch retrieval of entity thumbnails (without a database)"""
+
+import asyncio
+import json
+import os
+import struct
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+from pydantic import ValidationError
+
+from ayon_server.access import utils as access_utils
+from ayon_server.helpers.thumbnails import batch
+from ayon_server.helpers.thumbnails.batch import (
+    ThumbnailBatchItem,
+    get_thumbnail_batch,
+)
+from ayon_server.helpers.thumbnails.common import thumbnail_content_hash
+from ayon_server.utils import create_uuid
+
+PROJECT_NAME = "test"
+
+FOLDER_ID = create_uuid()  # with a thumbnail
+HIDDEN_FOLDER_ID = create_uuid()  # with a thumbnail, not accessible
+EMPTY_FOLDER_ID = create_uuid()  # without a thumbnail
+VERSION_ID = create_uuid()  # with a reviewable, but without a thumbnail
+MISSING_ID = create_uuid()  # does not exist
+
+THUMBNAIL_ID = create_uuid()
+HIDDEN_THUMBNAIL_ID = create_uuid()
+FILE_ID = create_uuid()
+
+THUMBNAIL = b"\x89PNG\r\n\x1a\nthumbnail"
+PREVIEW = b"\x89PNG\r\n\x1a\npreview"
+
+INFOS = {
+    "folder": {
+        FOLDER_ID: {"path": "assets/char", "thumbnail_id": THUMBNAIL_ID},
+        HIDDEN_FOLDER_ID: {"path": "shots/sh010", "thumbnail_id": HIDDEN_THUMBNAIL_ID},
+        EMPTY_FOLDER_ID: {"path": "assets/prop", "thumbnail_id": None},
+    },
+    "version": {
+        VERSION_ID: {"path": "assets/char", "thumbnail_id": None, "file_id": FILE_ID},
+    },
+}
+
+
+class User:
+    def __init__(self, is_manager: bool) -> None:
+        self.name = "user"
+        self.is_manager = is_manager
+
+
+@pytest.fixture
+def loaded(monkeypatch) -> dict[str, list]:
+    """Return the IDs of loaded thumbnails and previews"""
+    result: dict[str, list] = {"thumbnails": [], "previews": []}
+
+    async def resolve_thumbnail_infos(project_name, entity_type, entity_ids):
+        infos = INFOS.get(entity_type, {})
+        return {
+            entity_id: {"project_name": project_name, **infos[entity_id]}
+            for entity_id in entity_ids
+            if entity_id in infos
+        }
+
+    async def get_thumbnail_hashes(project_name, thumbnail_ids):
+        return {
+            THUMBNAIL_ID: thumbnail_content_hash(THUMBNAIL),
+            HIDDEN_THUMBNAIL_ID: thumbnail_content_hash(THUMBNAIL),
+        }
+
+    async def retrieve_thumbnails(project_name, thumbnail_ids, hashes):
+        result["thumbnails"].extend(thumbnail_ids)
+        return {
+            thumbnail_id: (THUMBNAIL, hashes[thumbnail_id])
+            for thumbnail_id in thumbnail_ids
+        }
+
+    async def get_previews(project_name, file_ids):
+        result["previews"].extend(file_ids)
+        return dict.fromkeys(file_ids, PREVIEW)
+
+    async def folder_access_list(user, project_name, access_type):
+        return ['"assets/%"']
+
+    monkeypatch.setattr(batch, "resolve_thumbnail_infos", resolve_thumbnail_infos)
+    monkeypatch.setattr(batch, "get_thumbnail_hashes", get_thumbnail_hashes)
+    monkeypatch.setattr(batch, "retrieve_thumbnails", retrieve_thumbnails)
+    monkeypatch.setattr(batch, "_get_previews", get_previews)
+    monkeypatch.setattr(access_utils, "folder_access_list", folder_access_list)
+    return result
+
+
+def request(items: list[tuple[str, str, str | None]], is_manager: bool = False):
+    """Request thumbnails and return the header and payloads"""
+    batch_items = [
+        ThumbnailBatchItem(entity_type=entity_type, entity_id=entity_id, etag=etag)
+        for entity_type, entity_id, etag in items
+    ]
+    user = User(is_manager)
+    data = asyncio.run(get_thumbnail_batch(PROJECT_NAME, batch_items, user))
+
+    (header_size,) = struct.unpack(">I", data[:4])
+    header = json.loads(data[4 : 4 + header_size])
+    payloads = []
+    offset = 4 + header_size
+    for entry in header:
+        if entry["status"] == 200:
+            payloads.append(data[offset : offset + entry["size"]])
+            offset += entry["size"]
+    assert offset == len(data)
+    return header, payloads
+
+
+class TestThumbnailBatch:
+    def test_item_validation(self):
+        item = ThumbnailBatchItem(entity_type="folder", entity_id=FOLDER_ID)
+        assert item.entity_id == FOLDER_ID
+
+        dashed = f"{FOLDER_ID[:8]}-{FOLDER_ID[8:12]}-{FOLDER_ID[12:]}"
+        item = ThumbnailBatchItem(entity_type="folder", entity_id=dashed)
+        assert item.entity_id == FOLDER_ID
+
+        for entity_id in (None, "", "not-an-id"):
+            with pytest.raises(ValidationError):
+                ThumbnailBatchItem(entity_type="folder", entity_id=entity_id)
+
+    def test_batch(self, loaded):
+        header, payloads = request(
+            [
+                ("folder", FOLDER_ID, None),
+                ("folder", HIDDEN_FOLDER_ID, None),
+                ("folder", EMPTY_FOLDER_ID, None),
+                ("version", VERSION_ID, None),
+                ("folder", MISSING_ID, None),
+            ]
+        )
+
+        assert [entry["entityId"] for entry in header] == [
+            FOLDER_ID,
+            HIDDEN_FOLDER_ID,
+            EMPTY_FOLDER_ID,
+            VERSION_ID,
+            MISSING_ID,
+        ]
+        assert [entry["status"] for entry in header] == [200, 403, 404, 200, 404]
+        assert payloads == [THUMBNAIL, PREVIEW]
+        assert header[0]["etag"] == f'"{thumbnail_content_hash(THUMBNAIL)}"'
+        assert header[3]["etag"] == f'"{thumbnail_content_hash(PREVIEW)}"'
+        assert header[0]["size"] == len(THUMBNAIL)
+
+        # Thumbnails of inaccessible entities are not loaded at all
+        assert loaded["thumbnails"] == [THUMBNAIL_ID]
+        assert loaded["previews"] == [FILE_ID]
+
+    def test_manager_has_access_to_all(self, loaded):
+        header, payloads = request([("folder", HIDDEN_FOLDER_ID, None)], True)
+        assert header[0]["status"] == 200
+        assert payloads == [THUMBNAIL]
+
+    def test_not_modified(self, loaded):
+        thumbnail_etag = f'"{thumbnail_content_hash(THUMBNAIL)}"'
+        preview_etag = f'"{thumbnail_content_hash(PREVIEW)}"'
+        header, payloads = request(
+            [
+                ("folder", FOLDER_ID, thumbnail_etag),
+                ("version", VERSION_ID, preview_etag),
+                ("folder", HIDDEN_FOLDER_ID, thumbnail_etag),
+            ]
+        )
+
+        assert [entry["status"] for entry in header] == [304, 304, 403]
+        assert header[0]["etag"] == thumbnail_etag
+        assert header[1]["etag"] == preview_etag
+        assert "etag" not in header[2]
+        assert not payloads
+        assert not loaded["thumbnails"]
+
+    def test_changed_thumbnail(self, loaded):
+        header, payloads = request([("folder", FOLDER_ID, '"outdated"')])
+        assert header[0]["status"] == 200
+        assert payloads == [THUMBNAIL]
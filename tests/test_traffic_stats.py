@@ -0,0 +1,74 @@
+"""Traffic accounting (without a database)"""
+
+import asyncio
+import datetime
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from ayon_server.helpers import statistics
+from ayon_server.helpers.statistics import TrafficStats
+from ayon_server.lib.postgres import Postgres
+
+
+class FixedDatetime(datetime.datetime):
+    """Late evening in UTC-10, which is the next day in UTC"""
+
+    @classmethod
+    def now(cls, tz=None):
+        local = datetime.datetime(
+            2026, 3, 1, 22, 0, tzinfo=datetime.timezone(datetime.timedelta(hours=-10))
+        )
+        return local.astimezone(tz) if tz else local.replace(tzinfo=None)
+
+
+@pytest.fixture
+def writes(monkeypatch) -> list[tuple]:
+    """Return the arguments of the traffic_stats writes"""
+    result: list[tuple] = []
+
+    async def execute(query: str, *args) -> None:
+        assert "traffic_stats" in query
+        result.append(args)
+
+    monkeypatch.setattr(Postgres, "execute", execute)
+    return result
+
+
+class TestTrafficStats:
+    def test_traffic_is_counted_per_utc_day(self, monkeypatch, writes):
+        monkeypatch.setattr(statistics.datetime, "datetime", FixedDatetime)
+        stats = TrafficStats()
+        stats.record("ingress", 100, "ayon")
+        stats.record("egress", 50, "ayon")
+        stats.record("egress", 10, "ayon")
+
+        assert list(stats.pending) == [(datetime.date(2026, 3, 2), "ayon")]
+        assert stats.pending_bytes("ingress") == 100
+        assert stats.pending_bytes("egress") == 60
+
+        asyncio.run(stats.flush())
+        assert writes == [([datetime.date(2026, 3, 2)], ["ayon"], [100], [60])]
+        assert not stats.pending
+        assert stats.flushed_bytes == 160
+
+    def test_failed_flush_keeps_traffic(self, monkeypatch):
+        async def execute(query: str, *args) -> None:
+            raise ConnectionError("Postgres is not available")
+
+        monkeypatch.setattr(Postgres, "execute", execute)
+        stats = TrafficStats()
+        stats.record("ingress", 100, "ayon")
+        with pytest.raises(ConnectionError):
+            asyncio.run(stats.flush())
+
+        stats.record("ingress", 20, "ayon")
+        assert stats.pending_bytes("ingress") == 120
+        assert stats.failed_flushes == 1
+
+    def test_invalid_usage_type(self):
+        with pytest.raises(ValueError):
+            TrafficStats().record("sideways", 1, "ayon")  # type: ignore[arg-type]
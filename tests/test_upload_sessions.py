@@ -0,0 +1,235 @@
+"""Resumable uploads of project files (local storage, no database and Redis)"""
+
+import asyncio
+import os
+import sys
+from contextlib import asynccontextmanager
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+# ayon_server.settings can't be imported before the entities (circular import)
+import ayon_server.entities  # noqa: F401
+from ayon_server.exceptions import (
+    BadRequestException,
+    ConflictException,
+    NotFoundException,
+)
+from ayon_server.files import Storages, upload_sessions
+from ayon_server.files.project_storage import ProjectStorage
+from ayon_server.files.upload_sessions import (
+    UPLOAD_SESSION_TTL,
+    abort_upload_session,
+    create_upload_session,
+    finalize_upload_session,
+    get_upload_session,
+    write_upload_chunk,
+)
+from ayon_server.lib.postgres import Postgres
+from ayon_server.lib.redis import Redis
+from ayon_server.utils import create_uuid
+
+PROJECT_NAME = "test"
+DATA = b"0123456789"  # three chunks: 4 + 4 + 2 bytes
+CHUNK_SIZE = 4
+
+
+@pytest.fixture
+def files(monkeypatch, tmp_path) -> dict[str, dict]:
+    """Return file records, the file data is stored in tmp_path"""
+    records: dict[str, dict] = {}
+    redis: dict[str, str] = {}
+
+    async def get_root(self) -> str:
+        return str(tmp_path)
+
+    async def redis_get(namespace: str, key: str):
+        return redis.get(f"{namespace}:{key}")
+
+    async def redis_set(namespace: str, key: str, value, **kwargs) -> None:
+        redis[f"{namespace}:{key}"] = value
+
+    async def redis_delete(namespace: str, key: str) -> None:
+        redis.pop(f"{namespace}:{key}", None)
+
+    async def try_lock(namespace: str, key: str, ttl: float) -> str:
+        return "token"
+
+    async def unlock(namespace: str, key: str, token: str) -> None:
+        pass
+
+    @asynccontextmanager
+    async def transaction(*args, **kwargs):
+        yield
+
+    async def fetchrow(query: str, file_id: str):
+        assert f"project_{PROJECT_NAME}.files" in query
+        return {"id": file_id} if file_id in records else None
+
+    async def create_project_file_record(project_name, file_name, **kwargs):
+        records[kwargs["file_id"]] = {"filename": file_name, **kwargs}
+
+    async def update_traffic_stats(*args, **kwargs) -> None:
+        pass
+
+    storage = ProjectStorage(PROJECT_NAME, "local", str(tmp_path))
+    monkeypatch.setattr(ProjectStorage, "get_root", get_root)
+    monkeypatch.setitem(Storages.project_storage_overrides, PROJECT_NAME, storage)
+    monkeypatch.setattr(Redis, "get", redis_get)
+    monkeypatch.setattr(Redis, "set", redis_set)
+    monkeypatch.setattr(Redis, "delete", redis_delete)
+    monkeypatch.setattr(Redis, "try_lock", try_lock)
+    monkeypatch.setattr(Redis, "unlock", unlock)
+    monkeypatch.setattr(Postgres, "transaction", transaction)
+    monkeypatch.setattr(Postgres, "fetchrow", fetchrow)
+    monkeypatch.setattr(
+        upload_sessions, "create_project_file_record", create_project_file_record
+    )
+    monkeypatch.setattr(upload_sessions, "update_traffic_stats", update_traffic_stats)
+    monkeypatch.setattr(upload_sessions, "MIN_CHUNK_SIZE", CHUNK_SIZE)
+    return records
+
+
+async def file_path(file_id: str) -> str:
+    storage = await Storages.project(PROJECT_NAME)
+    return await storage.get_path(file_id)
+
+
+async def create_session(file_id: str | None = None):
+    return await create_upload_session(
+        PROJECT_NAME,
+        "data.bin",
+        len(DATA),
+        user_name="admin",
+        file_id=file_id,
+    )
+
+
+async def write_chunk(session, offset: int):
+    data = DATA[offset : offset + CHUNK_SIZE]
+    return await write_upload_chunk(session, offset, data)
+
+
+class TestUploadSessions:
+    def test_chunked_upload(self, files):
+        async def _run_test():
+            session = await create_session()
+            assert session.chunk_size == CHUNK_SIZE
+            assert session.missing_offsets == [0, 4, 8]
+
+            # Chunks may arrive in any order and may be sent again
+            await write_chunk(session, 8)
+            await write_chunk(session, 0)
+            await write_chunk(session, 0)
+            session = await get_upload_session(PROJECT_NAME, session.id)
+            assert session.received == 6
+            assert session.missing_offsets == [4]
+
+            with pytest.raises(BadRequestException):
+                await finalize_upload_session(session)
+
+            session = await write_chunk(session, 4)
+            assert session.received == len(DATA)
+
+            file_id = await finalize_upload_session(session)
+            path = await file_path(file_id)
+            with open(path, "rb") as f:
+                assert f.read() == DATA
+            assert not os.path.exists(f"{path}.part")
+            assert files[file_id]["size"] == len(DATA)
+
+            with pytest.raises(NotFoundException):
+                await get_upload_session(PROJECT_NAME, session.id)
+
+        asyncio.run(_run_test())
+
+    def test_invalid_chunks(self, files):
+        async def _run_test():
+            session = await create_session()
+            with pytest.raises(BadRequestException):
+                await write_upload_chunk(session, 2, DATA[2:6])
+            with pytest.raises(BadRequestException):
+                await write_upload_chunk(session, 12, DATA[:2])
+            with pytest.raises(BadRequestException):
+                await write_upload_chunk(session, 0, DATA[:3])
+            assert session.missing_offsets == [0, 4, 8]
+
+        asyncio.run(_run_test())
+
+    def test_session_in_progress(self, files):
+        async def _run_test():
+            session = await create_session()
+            with pytest.raises(ConflictException):
+                await create_session(session.id)
+
+        asyncio.run(_run_test())
+
+    def test_existing_file_is_rejected(self, files):
+        async def _run_test():
+            file_id = create_uuid()
+            files[file_id] = {"size": 42}
+            with pytest.raises(ConflictException):
+                await create_session(file_id)
+            assert not os.path.exists(f"{await file_path(file_id)}.part")
+
+        asyncio.run(_run_test())
+
+    def test_file_created_during_upload(self, files):
+        async def _run_test():
+            file_id = create_uuid()
+            session = await create_session(file_id)
+            for offset in session.missing_offsets:
+                session = await write_chunk(session, offset)
+
+            path = await file_path(file_id)
+            files[file_id] = {"size": 3}
+            with open(path, "wb") as f:
+                f.write(b"abc")
+
+            with pytest.raises(ConflictException):
+                await finalize_upload_session(session)
+
+            # The existing file is left untouched
+            with open(path, "rb") as f:
+                assert f.read() == b"abc"
+            assert files[file_id] == {"size": 3}
+
+        asyncio.run(_run_test())
+
+    def test_expiration(self, files, monkeypatch):
+        async def _run_test():
+            now = 1_000_000.0
+            monkeypatch.setattr(upload_sessions.time, "time", lambda: now)
+            session = await create_session()
+            assert session.expires_in == UPLOAD_SESSION_TTL
+
+            # Reading the session does not extend it
+            now += 3600
+            session = await get_upload_session(PROJECT_NAME, session.id)
+            assert session.expires_in == UPLOAD_SESSION_TTL - 3600
+
+            # Writing a chunk does
+            session = await write_chunk(session, 0)
+            assert session.expires_in == UPLOAD_SESSION_TTL
+            now += 60
+            session = await get_upload_session(PROJECT_NAME, session.id)
+            assert session.expires_in == UPLOAD_SESSION_TTL - 60
+
+        asyncio.run(_run_test())
+
+    def test_abort(self, files):
+        async def _run_test():
+            session = await create_session()
+            await write_chunk(session, 0)
+            path = await file_path(session.id)
+            assert os.path.exists(f"{path}.part")
+
+            await abort_upload_session(session)
+            assert not os.path.exists(f"{path}.part")
+            assert not os.path.exists(path)
+            assert session.id not in files
+            with pytest.raises(NotFoundException):
+                await get_upload_session(PROJECT_NAME, session.id)
+
+        asyncio.run(_run_test())
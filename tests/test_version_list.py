@@ -0,0 +1,314 @@
+"""Trigger-maintained version lists of products.
+
+Runs against the database configured by AYON_POSTGRES_URL and is skipped
+when it is not available. A temporary project schema is created from
+schemas/schema.project.sql, so the triggers calling
+public.sync_version_list are the ones used by the server.
+
+Run with `pytest -s tests/test_version_list.py` to see the publish
+latency benchmark.
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+import uuid
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import asyncpg
+import pytest
+
+from ayon_server.config import ayonconfig
+
+PROJECT_NAME = "vltest"
+SCHEMA_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "schemas", "schema.project.sql"
+)
+
+# Project sizes of the benchmark (products with VERSIONS_PER_PRODUCT each)
+PROJECT_SIZES = [100, 1000, 10000]
+VERSIONS_PER_PRODUCT = 10
+PUBLISHES = 20
+
+# The materialized view refreshed after each publish before the triggers
+REFRESHED_VIEW = """
+CREATE MATERIALIZED VIEW refreshed_version_list AS
+    SELECT
+        v.product_id AS product_id,
+        array_agg(v.id ORDER BY v.version) AS ids,
+        array_agg(v.version ORDER BY v.version) AS versions
+    FROM versions AS v
+    GROUP BY v.product_id;
+
+CREATE UNIQUE INDEX refreshed_version_list_id
+ON refreshed_version_list (product_id);
+"""
+
+
+@asynccontextmanager
+async def project_schema() -> AsyncGenerator[asyncpg.Connection]:
+    """Create a temporary project with one folder, return a connection to it"""
+    try:
+        conn = await asyncpg.connect(ayonconfig.postgres_url, timeout=3)
+    except (OSError, TimeoutError, asyncpg.PostgresError):
+        pytest.skip("Postgres is not available")
+
+    schema = f"project_{PROJECT_NAME}"
+    try:
+        with open(SCHEMA_PATH) as f:
+            schema_sql = f.read()
+        await conn.execute(
+            f"""
+            DROP SCHEMA IF EXISTS {schema} CASCADE;
+            CREATE SCHEMA {schema};
+            SET search_path TO {schema}, public;
+            """
+        )
+        await conn.execute(schema_sql)
+        await conn.execute(
+            """
+            INSERT INTO folder_types (name) VALUES ('Asset');
+            INSERT INTO statuses (name) VALUES ('ok');
+            INSERT INTO folders (id, name, folder_type, status)
+            VALUES ('00000000-0000-0000-0000-000000000001', 'assets', 'Asset', 'ok');
+            """
+        )
+        yield conn
+
+    finally:
+        await conn.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")
+        await conn.close()
+
+
+async def create_products(conn: asyncpg.Connection, count: int) -> list[str]:
+    rows = await conn.fetch(
+        """
+        INSERT INTO products (id, name, folder_id, product_type, status)
+        SELECT
+            gen_random_uuid(),
+            'product_' || gen_random_uuid(),
+            '00000000-0000-0000-0000-000000000001',
+            'model',
+            'ok'
+        FROM generate_series(1, $1)
+        RETURNING id
+        """,
+        count,
+    )
+    return [row["id"] for row in rows]
+
+
+async def create_version(
+    conn: asyncpg.Connection,
+    product_id: str,
+    version: int,
+) -> uuid.UUID:
+    version_id = uuid.uuid4()
+    await conn.execute(
+        """
+        INSERT INTO versions (id, version, product_id, status)
+        VALUES ($1, $2, $3, 'ok')
+        """,
+        version_id,
+        version,
+        product_id,
+    )
+    return version_id
+
+
+async def version_list(conn: asyncpg.Connection, product_id: str) -> dict | None:
+    row = await conn.fetchrow(
+        "SELECT * FROM version_list WHERE product_id = $1",
+        product_id,
+    )
+    return dict(row) if row else None
+
+
+class TestVersionList:
+    def test_insert(self):
+        async def _run_test():
+            async with project_schema() as conn:
+                (product_id,) = await create_products(conn, 1)
+                assert await version_list(conn, product_id) is None
+
+                v1 = await create_version(conn, product_id, 1)
+                v3 = await create_version(conn, product_id, 3)
+                v2 = await create_version(conn, product_id, 2)
+
+                row = await version_list(conn, product_id)
+                assert row["ids"] == [v1, v2, v3]
+                assert row["versions"] == [1, 2, 3]
+                assert row["latest_id"] == v3
+                assert row["hero_id"] is None
+                assert row["hero_version"] is None
+
+                hero = await create_version(conn, product_id, -2)
+                row = await version_list(conn, product_id)
+                assert row["ids"] == [hero, v1, v2, v3]
+                assert row["latest_id"] == v3
+                assert row["hero_id"] == hero
+                assert row["hero_version"] == 2
+
+        asyncio.run(_run_test())
+
+    def test_renumber(self):
+        async def _run_test():
+            async with project_schema() as conn:
+                (product_id,) = await create_products(conn, 1)
+                v1 = await create_version(conn, product_id, 1)
+                v2 = await create_version(conn, product_id, 2)
+                hero = await create_version(conn, product_id, -2)
+
+                await conn.execute("UPDATE versions SET version = 5 WHERE id = $1", v1)
+                await conn.execute(
+                    "UPDATE versions SET version = -5 WHERE id = $1", hero
+                )
+
+                row = await version_list(conn, product_id)
+                assert row["ids"] == [hero, v2, v1]
+                assert row["versions"] == [-5, 2, 5]
+                assert row["latest_id"] == v1
+                assert row["hero_id"] == hero
+                assert row["hero_version"] == 5
+
+        asyncio.run(_run_test())
+
+    def test_move_to_another_product(self):
+        async def _run_test():
+            async with project_schema() as conn:
+                source_id, target_id = await create_products(conn, 2)
+                v1 = await create_version(conn, source_id, 1)
+                v2 = await create_version(conn, source_id, 2)
+                hero = await create_version(conn, source_id, -2)
+                t1 = await create_version(conn, target_id, 1)
+
+                await conn.execute(
+                    "UPDATE versions SET product_id = $1, version = 2 WHERE id = $2",
+                    target_id,
+                    v2,
+                )
+
+                source = await version_list(conn, source_id)
+                assert source["ids"] == [hero, v1]
+                assert source["latest_id"] == v1
+                assert source["hero_id"] == hero
+
+                target = await version_list(conn, target_id)
+                assert target["ids"] == [t1, v2]
+                assert target["latest_id"] == v2
+                assert target["hero_id"] is None
+
+                # Moving all versions away removes the list of the product
+                await conn.execute(
+                    "UPDATE versions SET product_id = $1, version = version + 10"
+                    " WHERE product_id = $2",
+                    target_id,
+                    source_id,
+                )
+                assert await version_list(conn, source_id) is None
+                target = await version_list(conn, target_id)
+                assert target["versions"] == [1, 2, 8, 11]
+                assert target["latest_id"] == v1
+                assert target["hero_id"] is None
+
+        asyncio.run(_run_test())
+
+    def test_delete(self):
+        async def _run_test():
+            async with project_schema() as conn:
+                (product_id,) = await create_products(conn, 1)
+                v1 = await create_version(conn, product_id, 1)
+                v2 = await create_version(conn, product_id, 2)
+                hero = await create_version(conn, product_id, -2)
+
+                await conn.execute("DELETE FROM versions WHERE id = $1", v2)
+                row = await version_list(conn, product_id)
+                assert row["ids"] == [hero, v1]
+                assert row["latest_id"] == v1
+                assert row["hero_id"] == hero
+
+                await conn.execute("DELETE FROM versions WHERE id = $1", hero)
+                row = await version_list(conn, product_id)
+                assert row["ids"] == [v1]
+                assert row["hero_id"] is None
+                assert row["hero_version"] is None
+
+                await conn.execute("DELETE FROM versions WHERE id = $1", v1)
+                assert await version_list(conn, product_id) is None
+
+        asyncio.run(_run_test())
+
+    def test_other_updates_are_ignored(self):
+        async def _run_test():
+            async with project_schema() as conn:
+                (product_id,) = await create_products(conn, 1)
+                await create_version(conn, product_id, 1)
+                query = "SELECT xmin::text FROM version_list WHERE product_id = $1"
+                xmin = await conn.fetchval(query, product_id)
+
+                await conn.execute("UPDATE versions SET author = 'admin'")
+                assert await conn.fetchval(query, product_id) == xmin
+
+        asyncio.run(_run_test())
+
+    def test_publish_latency_benchmark(self):
+        """Publishing a version costs the same regardless of the project size
+
+        For comparison, the refresh of the materialized view which was
+        used before grows with the number of versions in the project.
+        """
+
+        async def _run_test():
+            results: list[tuple[int, float, float]] = []
+            async with project_schema() as conn:
+                await conn.execute(REFRESHED_VIEW)
+                product_count = 0
+                for size in PROJECT_SIZES:
+                    product_ids = await create_products(conn, size - product_count)
+                    product_count = size
+                    await conn.execute(
+                        """
+                        INSERT INTO versions (id, version, product_id, status)
+                        SELECT gen_random_uuid(), v, p, 'ok'
+                        FROM unnest($1::uuid[]) AS p,
+                        generate_series(1, $2) AS v
+                        """,
+                        product_ids,
+                        VERSIONS_PER_PRODUCT,
+                    )
+                    await conn.execute("ANALYZE versions; ANALYZE version_list")
+
+                    (product_id,) = await create_products(conn, 1)
+                    product_count += 1
+                    timings = []
+                    for i in range(PUBLISHES):
+                        start_time = time.perf_counter()
+                        await create_version(conn, product_id, i + 1)
+                        timings.append(time.perf_counter() - start_time)
+
+                    row = await version_list(conn, product_id)
+                    assert row["versions"] == list(range(1, PUBLISHES + 1))
+                    start_time = time.perf_counter()
+                    await conn.execute(
+                        "REFRESH MATERIALIZED VIEW CONCURRENTLY refreshed_version_list"
+                    )
+                    refresh_time = time.perf_counter() - start_time
+
+                    versions = await conn.fetchval("SELECT count(*) FROM versions")
+                    results.append((versions, statistics.median(timings), refresh_time))
+
+            for versions, latency, refresh_time in results:
+                print(
+                    f"\n{versions:>7} versions: publish {latency * 1000:.2f} ms, "
+                    f"view refresh {refresh_time * 1000:.2f} ms"
+                )
+
+            # 100x more versions in the project, about the same publish cost
+            assert results[-1][1] < results[0][1] * 3
+
+        asyncio.run(_run_test())